@@ -12,6 +12,8 @@ from shared.infrastructure.database.connection import Base
 from shared.infrastructure.database.models.user_model import UserModel
 from shared.infrastructure.database.models.patient_model import PatientModel
 from shared.infrastructure.database.models.appointment_model import AppointmentModel
+from shared.infrastructure.database.models.appointment_stats_model import AppointmentDailyStatsModel
+from shared.infrastructure.database.models.email_outbox_model import EmailOutboxModel
 
 # Chargement des variables d'environnement
 load_dotenv()
@@ -0,0 +1,48 @@
+"""email outbox
+
+Boîte d'envoi des emails : les emails sont enregistrés avec la transaction
+qui les produit puis envoyés en arrière-plan, par lots et avec reprises.
+
+Revision ID: 2b9d6f4e8a17
+Revises: 7a4c2e9b1d53
+Create Date: 2026-10-18 19:04:37.218546
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2b9d6f4e8a17'
+down_revision = '7a4c2e9b1d53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS : les bases créées avec init.sql possèdent déjà la table
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS email_outbox (
+          id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+          to_email VARCHAR(255) NOT NULL,
+          cc VARCHAR[] NOT NULL DEFAULT '{}',
+          bcc VARCHAR[] NOT NULL DEFAULT '{}',
+          subject VARCHAR(255) NOT NULL,
+          body TEXT NOT NULL,
+          html_body TEXT,
+          status VARCHAR(20) NOT NULL DEFAULT 'PENDING',
+          attempts INTEGER NOT NULL DEFAULT 0,
+          next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+          last_error TEXT,
+          created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+          sent_at TIMESTAMP
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_email_outbox_pending "
+        "ON email_outbox (next_attempt_at) WHERE status = 'PENDING'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS email_outbox")
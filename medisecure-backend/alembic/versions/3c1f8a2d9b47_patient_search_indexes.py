@@ -0,0 +1,52 @@
+"""patient search indexes
+
+Colonnes de recherche calculées et index GIN (plein texte et trigrammes)
+pour la recherche de patients par nom, email et téléphone.
+
+Revision ID: 3c1f8a2d9b47
+Revises: 
+Create Date: 2026-10-18 09:12:04.318552
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3c1f8a2d9b47'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS : les bases créées avec init.sql possèdent déjà ces objets
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute("""
+        ALTER TABLE patients
+            ADD COLUMN IF NOT EXISTS search_name TEXT
+                GENERATED ALWAYS AS (lower(first_name || ' ' || last_name)) STORED,
+            ADD COLUMN IF NOT EXISTS phone_digits TEXT
+                GENERATED ALWAYS AS (regexp_replace(coalesce(phone_number, ''), '[^0-9]', '', 'g')) STORED,
+            ADD COLUMN IF NOT EXISTS search_email TEXT
+                GENERATED ALWAYS AS (lower(coalesce(email, ''))) STORED,
+            ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+                GENERATED ALWAYS AS (to_tsvector('simple', first_name || ' ' || last_name || ' ' || coalesce(email, ''))) STORED
+    """)
+
+    op.execute("CREATE INDEX IF NOT EXISTS idx_patients_search_vector ON patients USING gin (search_vector)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_patients_search_name_trgm ON patients USING gin (search_name gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_patients_phone_digits_trgm ON patients USING gin (phone_digits gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_patients_search_email_trgm ON patients USING gin (search_email gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.drop_index('idx_patients_search_email_trgm', table_name='patients')
+    op.drop_index('idx_patients_phone_digits_trgm', table_name='patients')
+    op.drop_index('idx_patients_search_name_trgm', table_name='patients')
+    op.drop_index('idx_patients_search_vector', table_name='patients')
+
+    op.drop_column('patients', 'search_vector')
+    op.drop_column('patients', 'search_email')
+    op.drop_column('patients', 'phone_digits')
+    op.drop_column('patients', 'search_name')
@@ -0,0 +1,64 @@
+"""composite and partial indexes
+
+Index composites (médecin ou patient, puis date décroissante) pour les
+listes de rendez-vous, index partiel sur les rendez-vous actifs pour le
+calendrier et index de tri de la liste des patients.
+Les index mono-colonnes sur doctor_id et patient_id, couverts par les
+index composites, sont supprimés.
+
+Les index sont créés avec CONCURRENTLY pour ne pas bloquer les écritures :
+chaque instruction s'exécute hors transaction.
+
+Revision ID: 5d7a3e9c2f18
+Revises: 8e2b4f6a1c35
+Create Date: 2026-10-18 14:03:51.226704
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7a3e9c2f18'
+down_revision = '8e2b4f6a1c35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS : les bases créées avec init.sql possèdent déjà ces index
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_appointments_doctor_start "
+            "ON appointments (doctor_id, start_time DESC, id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_appointments_patient_start "
+            "ON appointments (patient_id, start_time DESC, id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_appointments_active_start "
+            "ON appointments (start_time, id) WHERE is_active"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_patients_last_name "
+            "ON patients (last_name, id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_appointments_doctor_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_appointments_patient_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_appointments_doctor_id "
+            "ON appointments (doctor_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_appointments_patient_id "
+            "ON appointments (patient_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_patients_last_name")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_appointments_active_start")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_appointments_patient_start")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_appointments_doctor_start")
@@ -0,0 +1,95 @@
+"""appointment daily stats
+
+Table d'agrégats des rendez-vous actifs par médecin, jour et statut,
+tenue à jour par un trigger sur appointments, et remplissage initial
+depuis les rendez-vous existants.
+
+Revision ID: 7a4c2e9b1d53
+Revises: 5d7a3e9c2f18
+Create Date: 2026-10-18 18:22:09.614230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a4c2e9b1d53'
+down_revision = '5d7a3e9c2f18'
+branch_labels = None
+depends_on = None
+
+# Copie figée du SQL de shared/infrastructure/database/models/appointment_stats_model.py
+REFRESH_STATS_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_appointment_daily_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.is_active THEN
+    UPDATE appointment_daily_stats
+       SET appointment_count = appointment_count - 1,
+           booked_minutes = booked_minutes - (EXTRACT(EPOCH FROM (OLD.end_time - OLD.start_time)) / 60)::INTEGER
+     WHERE doctor_id = OLD.doctor_id AND day = OLD.start_time::DATE AND status = OLD.status;
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.is_active THEN
+    INSERT INTO appointment_daily_stats (doctor_id, day, status, appointment_count, booked_minutes)
+    VALUES (
+      NEW.doctor_id, NEW.start_time::DATE, NEW.status, 1,
+      (EXTRACT(EPOCH FROM (NEW.end_time - NEW.start_time)) / 60)::INTEGER
+    )
+    ON CONFLICT (doctor_id, day, status) DO UPDATE
+       SET appointment_count = appointment_daily_stats.appointment_count + 1,
+           booked_minutes = appointment_daily_stats.booked_minutes + EXCLUDED.booked_minutes;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+REFRESH_STATS_TRIGGER = """
+CREATE TRIGGER refresh_appointment_daily_stats
+  AFTER INSERT OR UPDATE OF doctor_id, start_time, end_time, status, is_active OR DELETE ON appointments
+  FOR EACH ROW
+  EXECUTE FUNCTION refresh_appointment_daily_stats();
+"""
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS : les bases créées avec init.sql possèdent déjà la table et le trigger
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS appointment_daily_stats (
+          doctor_id UUID NOT NULL,
+          day DATE NOT NULL,
+          status appointmentstatus NOT NULL,
+          appointment_count INTEGER NOT NULL DEFAULT 0,
+          booked_minutes INTEGER NOT NULL DEFAULT 0,
+          PRIMARY KEY (doctor_id, day, status)
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_appointment_daily_stats_day "
+        "ON appointment_daily_stats (day)"
+    )
+    op.execute(REFRESH_STATS_FUNCTION)
+    op.execute("DROP TRIGGER IF EXISTS refresh_appointment_daily_stats ON appointments")
+
+    # Remplissage et pose du trigger dans la même transaction, table verrouillée :
+    # aucune écriture ne peut se glisser entre les deux
+    op.execute("LOCK TABLE appointments IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("TRUNCATE appointment_daily_stats")
+    op.execute("""
+        INSERT INTO appointment_daily_stats (doctor_id, day, status, appointment_count, booked_minutes)
+        SELECT doctor_id, start_time::DATE, status, COUNT(*),
+               SUM((EXTRACT(EPOCH FROM (end_time - start_time)) / 60)::INTEGER)
+          FROM appointments
+         WHERE is_active
+         GROUP BY doctor_id, start_time::DATE, status
+    """)
+    op.execute(REFRESH_STATS_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS refresh_appointment_daily_stats ON appointments")
+    op.execute("DROP FUNCTION IF EXISTS refresh_appointment_daily_stats()")
+    op.execute("DROP TABLE IF EXISTS appointment_daily_stats")
@@ -0,0 +1,45 @@
+"""appointment overlap constraint
+
+Contrainte d'exclusion GiST interdisant deux rendez-vous actifs
+(SCHEDULED, CONFIRMED) qui se chevauchent pour un même médecin.
+La migration échoue si des chevauchements existent déjà : ils doivent
+être corrigés (annulation ou replanification) avant de l'appliquer.
+
+Revision ID: 8e2b4f6a1c35
+Revises: 3c1f8a2d9b47
+Create Date: 2026-10-18 10:41:27.905113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e2b4f6a1c35'
+down_revision = '3c1f8a2d9b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # btree_gist permet de combiner l'égalité sur doctor_id et le chevauchement de plages
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # Les bases créées avec init.sql possèdent déjà la contrainte
+    op.execute("""
+        DO $$
+        BEGIN
+          IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint WHERE conname = 'appointments_doctor_no_overlap'
+          ) THEN
+            ALTER TABLE appointments
+              ADD CONSTRAINT appointments_doctor_no_overlap
+              EXCLUDE USING gist (doctor_id WITH =, tsrange(start_time, end_time, '[)') WITH &&)
+              WHERE (status IN ('SCHEDULED', 'CONFIRMED'));
+          END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE appointments DROP CONSTRAINT IF EXISTS appointments_doctor_no_overlap")
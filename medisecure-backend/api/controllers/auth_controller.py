@@ -7,6 +7,8 @@ from shared.infrastructure.config.settings import get_settings
 from shared.container.container import get_container
 from shared.application.dtos.common_dtos import TokenResponseDTO
 from shared.application.services.auth_service import AuthenticationService
+from shared.infrastructure.services.password_hasher import PasswordHasherOverloadedException
+from shared.infrastructure.monitoring.timed_route import TimedRoute
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -15,7 +17,7 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # Créer un router pour les endpoints d'authentification
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=TimedRoute)
 
 # Injection de dépendance pour le service d'authentification
 def get_auth_service() -> AuthenticationService:
@@ -64,6 +66,13 @@ async def login(
     except HTTPException:
         # Re-lever les HTTPException telles quelles
         raise
+    except PasswordHasherOverloadedException as e:
+        logger.warning(f"Connexion refusée, pool de hachage saturé: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         logger.error(f"Erreur inattendue lors de la connexion: {str(e)}")
         raise HTTPException(
@@ -1,7 +1,9 @@
 from fastapi import FastAPI, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 from contextlib import asynccontextmanager
@@ -9,6 +11,11 @@ from datetime import datetime
 
 from shared.infrastructure.config.settings import get_settings, Settings
 from shared.infrastructure.database.connection import get_db
+from shared.infrastructure.database.engine_registry import engine_registry
+from shared.infrastructure.database.query_instrumentation import get_query_instrumentation
+from shared.infrastructure.services.password_hasher import get_password_hasher
+from shared.infrastructure.services.outbox_worker import get_outbox_worker
+from shared.infrastructure.services.smtp_mailer import get_smtp_pool
 from api.handlers.exception_handlers import (
     AppException, 
     app_exception_handler, 
@@ -16,6 +23,11 @@ from api.handlers.exception_handlers import (
     validation_exception_handler
 )
 from api.middlewares.authentication_middleware import AuthenticationMiddleware
+from api.middlewares.read_routing_middleware import ReadRoutingMiddleware
+from api.middlewares.timing_middleware import TimingMiddleware
+from shared.infrastructure.monitoring.metrics import get_metrics_registry
+from shared.infrastructure.monitoring.timed_route import TimedRoute
+from shared.infrastructure.serialization import ORJSONResponse
 
 # Importer les routers
 from patient_management.infrastructure.adapters.primary.controllers.patient_controller import router as patient_router
@@ -51,9 +63,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environnement: {settings.server.environment}")
     logger.info(f"Mode debug: {settings.server.debug}")
     logger.info(f"Préfixe API: {API_PREFIX}")
+    if settings.mail.outbox_worker_enabled and not settings.testing:
+        get_outbox_worker().start()
     yield
     # Shutdown
     logger.info("=== Arrêt de MediSecure API ===")
+    await get_outbox_worker().stop()
+    get_smtp_pool().close()
+    await engine_registry.dispose()
+    get_password_hasher().shutdown()
 
 app = FastAPI(
     title=settings.app_name,
@@ -62,9 +80,14 @@ app = FastAPI(
     docs_url=f"{API_PREFIX}/docs",
     redoc_url=f"{API_PREFIX}/redoc",
     openapi_url=f"{API_PREFIX}/openapi.json",
+    # Rendu JSON par orjson pour toutes les routes
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Routes chronométrées par étape (dépendances, endpoint, sérialisation)
+app.router.route_class = TimedRoute
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.server.cors_origins + (["*"] if settings.is_development() else []),
@@ -73,8 +96,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Middleware d'authentification
-app.middleware("http")(AuthenticationMiddleware())
+# Middleware d'authentification (ASGI pur : ni tâche ni file par requête)
+app.add_middleware(AuthenticationMiddleware)
+
+# Routage des lectures vers les réplicas (requêtes GET)
+app.add_middleware(ReadRoutingMiddleware)
+
+# Chronométrage des requêtes (ajouté en dernier : enveloppe toute la pile)
+app.add_middleware(TimingMiddleware)
+
+# Instrumentation des requêtes SQL de tous les moteurs (durée, lignes, requêtes lentes)
+get_query_instrumentation().install(Engine)
 
 # Enregistrement des gestionnaires d'exceptions
 app.add_exception_handler(AppException, app_exception_handler)
@@ -156,6 +188,17 @@ async def readiness_probe(db: AsyncSession = Depends(get_db)):
             }
         )
 
+@app.get(f"{API_PREFIX}/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Latences par route et par étape, au format texte de Prometheus.
+    Les compteurs sont propres au processus : chaque worker est collecté séparément.
+    """
+    return PlainTextResponse(
+        get_metrics_registry().render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -1,91 +1,120 @@
 # medisecure-backend/api/middlewares/authentication_middleware.py
 
-from fastapi import Request, Response
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from typing import Optional, Dict, Any
-import os
-from datetime import datetime
+from jose import JWTError, ExpiredSignatureError
+from starlette.types import ASGIApp, Receive, Scope, Send
 import logging
 
+from api.middlewares.path_matcher import PathMatcher
+from shared.infrastructure.monitoring.timing import span
+from shared.services.authenticator.token_verifier import get_token_verifier
+
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
-security = HTTPBearer()
+# Chemins exemptés d'authentification, compilés au chargement du module
+EXEMPT_PATHS = PathMatcher(
+    exact=[
+        "/",
+        "/api/auth/login",
+        "/api/auth/logout",
+    ],
+    subtrees=[
+        "/api/health",
+        "/api/metrics",
+        "/api/docs",
+        "/api/redoc",
+        "/api/openapi.json",
+        "/docs",
+        "/redoc",
+        "/openapi.json",
+    ]
+)
+
+# Réponse aux requêtes CORS preflight, construite une seule fois
+_PREFLIGHT_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"access-control-allow-origin", b"*"),
+        (b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS"),
+        (b"access-control-allow-headers", b"Authorization, Content-Type"),
+        (b"content-length", b"0"),
+    ],
+}
+_PREFLIGHT_BODY = {"type": "http.response.body", "body": b""}
 
 class AuthenticationMiddleware:
-    """Middleware pour vérifier l'authentification JWT"""
-    
-    def __init__(self):
-        self.jwt_secret = os.getenv("JWT_SECRET_KEY", "default_secret_key")
-        self.algorithm = os.getenv("JWT_ALGORITHM", "HS256")
-        
-    async def __call__(self, request: Request, call_next):
+    """
+    Middleware ASGI pour vérifier l'authentification JWT.
+
+    Les claims d'un token valide sont posées dans l'état de la requête
+    (`request.state.user`) ; une requête sans token valide continue sans
+    utilisateur et ce sont les dépendances des routes qui la refusent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialise le middleware.
+
+        Args:
+            app: L'application ASGI suivante
+        """
+        self.app = app
+        # Vérificateur partagé avec extract_token_payload (clé lue une seule fois, cache des tokens)
+        self.token_verifier = get_token_verifier()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Vérifie le token JWT et ajoute l'utilisateur à la requête"""
-        
-        # Chemins exemptés d'authentification
-        exempt_paths = [
-            "/api/health", 
-            "/api/docs", 
-            "/api/redoc", 
-            "/api/openapi.json", 
-            "/api/auth/login", 
-            "/api/auth/logout",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/"
-        ]
-        
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Méthode OPTIONS pour les requêtes CORS preflight - TOUJOURS autoriser
-        if request.method == "OPTIONS":
-            response = Response()
-            response.headers["Access-Control-Allow-Origin"] = "*"
-            response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-            response.headers["Access-Control-Allow-Headers"] = "Authorization, Content-Type"
-            return response
-            
-        # Vérifier si le chemin est exempté
-        request_path = str(request.url.path)
-        if any(request_path.startswith(path) for path in exempt_paths):
-            logger.debug(f"Chemin exempté: {request_path}")
-            return await call_next(request)
-        
+        if scope["method"] == "OPTIONS":
+            await send(_PREFLIGHT_START)
+            await send(_PREFLIGHT_BODY)
+            return
+
+        # Chemin exempté : aucun traitement
+        request_path = scope["path"]
+        if EXEMPT_PATHS.matches(request_path):
+            await self.app(scope, receive, send)
+            return
+
         # Récupérer le token d'autorisation
-        auth_header = request.headers.get("Authorization")
+        auth_header = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value.decode("latin-1")
+                break
+
         if not auth_header:
-            logger.info(f"Pas de token d'autorisation pour: {request_path}")
+            logger.debug(f"Pas de token d'autorisation pour: {request_path}")
             # Pour les autres endpoints, continuer sans authentification pour le moment
-            return await call_next(request)
-        
+            await self.app(scope, receive, send)
+            return
+
         try:
             # Extraction du token
             scheme, token = auth_header.split(" ", 1)
             if scheme.lower() != "bearer":
                 logger.warning(f"Schéma d'autorisation invalide: {scheme}")
-                return await call_next(request)
-                
-            # Validation du token
-            payload = jwt.decode(token, self.jwt_secret, algorithms=[self.algorithm])
-            
-            # Vérification de l'expiration
-            exp = payload.get("exp")
-            if exp and datetime.utcnow() > datetime.fromtimestamp(exp):
-                logger.warning(f"Token expiré pour: {request_path}")
-                return await call_next(request)
-            
-            # Ajout de l'utilisateur à la requête
-            request.state.user = payload
-            logger.debug(f"Utilisateur authentifié: {payload.get('email')} accède à {request_path}")
-            
-            return await call_next(request)
-            
+            else:
+                # Validation du token (signature et expiration)
+                with span("authentication"):
+                    payload = self.token_verifier.verify(token)
+
+                # Ajout de l'utilisateur à la requête (lu par request.state)
+                scope.setdefault("state", {})["user"] = payload
+                logger.debug(f"Utilisateur authentifié: {payload.get('email')} accède à {request_path}")
+
+        except ExpiredSignatureError:
+            logger.warning(f"Token expiré pour: {request_path}")
         except JWTError as e:
             logger.warning(f"Erreur JWT pour {request_path}: {str(e)}")
-            return await call_next(request)
         except ValueError as e:
             logger.warning(f"Erreur de format du token pour {request_path}: {str(e)}")
-            return await call_next(request)
         except Exception as e:
             logger.error(f"Erreur d'authentification pour {request_path}: {str(e)}")
-            return await call_next(request)
\ No newline at end of file
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,61 @@
+# medisecure-backend/api/middlewares/path_matcher.py
+
+from typing import Any, Dict, Iterable
+
+# Marqueurs des nœuds terminaux (plus longs qu'un caractère : aucune collision avec le chemin)
+_EXACT = "<exact>"
+_SUBTREE = "<subtree>"
+
+
+class PathMatcher:
+    """
+    Reconnaît un ensemble de chemins, exacts ou avec tous leurs sous-chemins.
+
+    Les chemins sont compilés une fois pour toutes dans un arbre préfixe par
+    caractère. La recherche suit le chemin de la requête et s'arrête à la
+    première divergence, sans découper ni copier la chaîne.
+
+    Exemple:
+        matcher = PathMatcher(exact=["/"], subtrees=["/api/docs"])
+        matcher.matches("/api/docs/oauth2-redirect")  # True
+        matcher.matches("/api/docsx")                 # False
+    """
+
+    def __init__(self, exact: Iterable[str] = (), subtrees: Iterable[str] = ()):
+        """
+        Initialise l'arbre.
+
+        Args:
+            exact: Les chemins reconnus uniquement tels quels
+            subtrees: Les chemins reconnus avec leurs sous-chemins (frontière de segment « / »)
+        """
+        self._root: Dict[str, Any] = {}
+        for path in exact:
+            self._insert(path, _EXACT)
+        for path in subtrees:
+            self._insert(path.rstrip("/"), _SUBTREE)
+
+    def _insert(self, path: str, marker: str) -> None:
+        node = self._root
+        for char in path:
+            node = node.setdefault(char, {})
+        node[marker] = True
+
+    def matches(self, path: str) -> bool:
+        """
+        Indique si le chemin est reconnu.
+
+        Args:
+            path: Le chemin de la requête
+
+        Returns:
+            bool: True si le chemin, ou l'un de ses préfixes de type sous-arbre, est reconnu
+        """
+        node = self._root
+        for char in path:
+            if char == "/" and _SUBTREE in node:
+                return True
+            node = node.get(char)
+            if node is None:
+                return False
+        return _EXACT in node or _SUBTREE in node
@@ -0,0 +1,115 @@
+# medisecure-backend/api/middlewares/read_routing_middleware.py
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Optional
+import hashlib
+import logging
+import math
+import time
+
+from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.database.read_routing import (
+    ReadYourWritesTracker,
+    allow_replica_reads,
+    mark_recent_writer,
+    reset_recent_writer,
+    reset_replica_reads
+)
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class ReadRoutingMiddleware:
+    """
+    Middleware ASGI qui autorise les lectures sur réplica pour les requêtes GET.
+    Un client qui vient d'écrire lit sur le primaire, sans passer par les
+    caches, pendant une courte fenêtre pour retrouver ses propres modifications
+    malgré le retard des réplicas.
+
+    L'heure de la dernière écriture est renvoyée au client dans un cookie de
+    courte durée : sa lecture suivante peut arriver sur un autre worker ou un
+    autre pod, dont la mémoire ne connaît pas l'écriture.
+    """
+
+    # Méthodes sans écriture
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    # Cookie portant l'heure (epoch, secondes) de la dernière écriture du client
+    WRITE_COOKIE = "medisecure_last_write"
+
+    def __init__(self, app: ASGIApp, window_seconds: Optional[float] = None):
+        """
+        Initialise le middleware.
+
+        Args:
+            app: L'application ASGI suivante
+            window_seconds: La fenêtre de lecture de ses écritures (configuration par défaut)
+        """
+        self.app = app
+        if window_seconds is None:
+            window_seconds = get_settings().database.read_your_writes_seconds
+        self.window_seconds = window_seconds
+        self.tracker = ReadYourWritesTracker(window_seconds)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Choisit la base des lectures de la requête et mémorise les écritures"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_key = self._client_key(scope)
+
+        if scope["method"] in self.SAFE_METHODS:
+            wrote_recently = self.tracker.wrote_recently(client_key) or self._cookie_is_recent(scope)
+            if wrote_recently:
+                logger.debug(f"Lecture sur le primaire après écriture pour {scope['path']}")
+            token = allow_replica_reads(not wrote_recently)
+            writer_token = mark_recent_writer(wrote_recently)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                reset_recent_writer(writer_token)
+                reset_replica_reads(token)
+            return
+
+        async def send_and_record(message: Message) -> None:
+            # L'écriture est mémorisée dès l'envoi du statut, avant le corps
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                self.tracker.record_write(client_key)
+                MutableHeaders(scope=message).append("set-cookie", self._write_cookie())
+            await send(message)
+
+        await self.app(scope, receive, send_and_record)
+
+    def _write_cookie(self) -> str:
+        """Construit le cookie marquant une écriture, expirant avec la fenêtre"""
+        return (
+            f"{self.WRITE_COOKIE}={time.time():.3f}; Max-Age={max(1, math.ceil(self.window_seconds))}; "
+            "Path=/; HttpOnly; SameSite=Lax"
+        )
+
+    def _cookie_is_recent(self, scope: Scope) -> bool:
+        """Indique si le cookie d'écriture du client date de moins que la fenêtre"""
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                written_at = cookie_parser(value.decode("latin-1")).get(self.WRITE_COOKIE)
+                if written_at is None:
+                    continue
+                try:
+                    elapsed = time.time() - float(written_at)
+                except ValueError:
+                    return False
+                # Un cookie falsifié ne fait que renvoyer ce client sur le primaire
+                return 0 <= elapsed < self.window_seconds
+        return False
+
+    @staticmethod
+    def _client_key(scope: Scope) -> str:
+        """Identifie le client par son token (haché) ou, à défaut, par son adresse"""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                return hashlib.sha256(value).hexdigest()
+        client = scope.get("client")
+        return client[0] if client else "anonymous"
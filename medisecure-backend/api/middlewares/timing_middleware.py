@@ -0,0 +1,75 @@
+# medisecure-backend/api/middlewares/timing_middleware.py
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import logging
+import time
+
+from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.monitoring.metrics import MetricsRegistry, get_metrics_registry
+from shared.infrastructure.monitoring.timing import current_timer, start_request_timer, stop_request_timer
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Libellé des requêtes qui ne correspondent à aucune route (cardinalité bornée)
+UNMATCHED_ROUTE = "<unmatched>"
+
+class TimingMiddleware:
+    """
+    Middleware ASGI de chronométrage des requêtes.
+
+    Placé en tête de la pile, il démarre le chronomètre de la requête, que
+    les étapes (authentification, dépendances, repositories, sérialisation)
+    alimentent, puis enregistre le tout par route à la fin de la réponse,
+    corps en flux compris. Une requête qui émet plus de requêtes SQL que
+    le budget autorisé est signalée (N+1 probable).
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = None, max_queries: int = None):
+        """
+        Initialise le middleware.
+
+        Args:
+            app: L'application ASGI suivante
+            registry: Le registre des métriques (celui du processus par défaut)
+            max_queries: Le budget de requêtes SQL par requête (configuration par défaut)
+        """
+        self.app = app
+        self.registry = registry or get_metrics_registry()
+        if max_queries is None:
+            max_queries = get_settings().database.max_queries_per_request
+        self.max_queries = max_queries
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request_timer()
+        timer = current_timer()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - timer.started_at
+            stop_request_timer(token)
+            route = timer.route or UNMATCHED_ROUTE
+            over_query_budget = timer.queries > self.max_queries
+            if over_query_budget:
+                operations = sorted(timer.query_operations.items(), key=lambda item: item[1], reverse=True)
+                logger.warning(
+                    f"{timer.queries} requêtes SQL pour {scope['method']} {route} "
+                    f"(budget {self.max_queries}), N+1 probable : "
+                    + ", ".join(f"{operation} x{count}" for operation, count in operations[:5])
+                )
+            self.registry.observe_request(
+                scope["method"], route, status_code, elapsed, timer.spans,
+                queries=timer.queries, over_query_budget=over_query_budget
+            )
@@ -1,7 +1,7 @@
 # medisecure-backend/appointment_management/application/dtos/appointment_dtos.py
-from typing import Optional, List
+from typing import Optional, List, Dict
 from pydantic import BaseModel, Field, validator
-from datetime import datetime, timezone
+from datetime import datetime, date, timezone
 from uuid import UUID
 import logging
 logger = logging.getLogger(__name__)
@@ -152,10 +152,87 @@ class AppointmentResponseDTO(BaseModel):
 class AppointmentListResponseDTO(BaseModel):
     """DTO pour la réponse avec une liste de rendez-vous"""
     appointments: List[AppointmentResponseDTO]
-    total: int
+    # None lorsque le client a demandé count=none
+    total: Optional[int]
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
     
     class Config:
         # Permettre les conversions arbitraires de types
-        arbitrary_types_allowed = True
\ No newline at end of file
+        arbitrary_types_allowed = True
+
+# DTOs pour la planification en masse
+class AppointmentBatchCreateDTO(BaseModel):
+    """DTO pour la création de plusieurs rendez-vous en une seule requête"""
+    appointments: List[AppointmentCreateDTO] = Field(..., min_items=1, max_items=500)
+
+class AppointmentBatchItemResultDTO(BaseModel):
+    """DTO pour le résultat de la création d'un rendez-vous du lot"""
+    # Position de la demande dans le lot
+    index: int
+    # "created", "conflict", "patient_not_found" ou "invalid"
+    status: str
+    appointment: Optional[AppointmentResponseDTO] = None
+    error: Optional[str] = None
+
+class AppointmentBatchResponseDTO(BaseModel):
+    """DTO pour la réponse à une création de rendez-vous en masse"""
+    created: int
+    rejected: int
+    results: List[AppointmentBatchItemResultDTO]
+
+
+# DTOs pour les disponibilités
+class AvailabilitySlotDTO(BaseModel):
+    """DTO pour un créneau libre"""
+    start_time: datetime
+    end_time: datetime
+
+class AvailabilityDayDTO(BaseModel):
+    """DTO pour les créneaux libres d'une journée"""
+    date: date
+    slots: List[AvailabilitySlotDTO]
+
+class DoctorAvailabilityResponseDTO(BaseModel):
+    """DTO pour la réponse avec les disponibilités d'un médecin"""
+    doctor_id: UUID
+    start_date: date
+    end_date: date
+    slot_minutes: int
+    days: List[AvailabilityDayDTO]
+
+class ClinicSlotDTO(BaseModel):
+    """DTO pour un créneau libre d'un médecin de la clinique"""
+    doctor_id: UUID
+    doctor_name: str
+    start_time: datetime
+    end_time: datetime
+
+class ClinicAvailabilityResponseDTO(BaseModel):
+    """DTO pour la réponse avec les premiers créneaux libres de la clinique"""
+    start_date: date
+    end_date: date
+    duration_minutes: int
+    doctors_considered: int
+    slots: List[ClinicSlotDTO]
+
+# DTOs pour les tableaux de bord
+class OccupancyDTO(BaseModel):
+    """DTO pour l'occupation d'un médecin sur un jour (ou sur toute la période si `day` est absent)"""
+    doctor_id: UUID
+    day: Optional[date] = None
+    # Nombre de rendez-vous par statut
+    counts: Dict[str, int]
+    booked_minutes: int
+    working_minutes: int
+    occupancy_rate: Optional[float] = None
+    utilisation_rate: Optional[float] = None
+    no_show_rate: Optional[float] = None
+
+class AppointmentStatsResponseDTO(BaseModel):
+    """DTO pour la réponse avec les statistiques de rendez-vous d'une période"""
+    start_date: date
+    end_date: date
+    doctors: List[OccupancyDTO]
+    days: List[OccupancyDTO]
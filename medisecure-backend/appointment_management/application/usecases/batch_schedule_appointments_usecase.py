@@ -0,0 +1,162 @@
+# medisecure-backend/appointment_management/application/usecases/batch_schedule_appointments_usecase.py
+from collections import defaultdict
+from typing import Dict, List, Set
+from uuid import UUID
+import logging
+
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.services.appointment_service import AppointmentService
+from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from appointment_management.application.dtos.appointment_dtos import (
+    AppointmentCreateDTO,
+    AppointmentResponseDTO,
+    AppointmentBatchItemResultDTO,
+    AppointmentBatchResponseDTO
+)
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
+from shared.ports.primary.id_generator_protocol import IdGeneratorProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class BatchScheduleAppointmentsUseCase:
+    """
+    Cas d'utilisation pour la planification de plusieurs rendez-vous en une fois
+    (consultations récurrentes, import d'une journée).
+    Le nombre de requêtes ne dépend pas de la taille du lot : une pour les patients,
+    une pour les rendez-vous existants sur la plage et une insertion multi-lignes.
+    """
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepositoryProtocol,
+        patient_repository: PatientRepositoryProtocol,
+        appointment_service: AppointmentService,
+        id_generator: IdGeneratorProtocol
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            appointment_repository: Le repository des rendez-vous
+            patient_repository: Le repository des patients
+            appointment_service: Le service du domaine pour les rendez-vous
+            id_generator: Le générateur d'identifiants
+        """
+        self.appointment_repository = appointment_repository
+        self.patient_repository = patient_repository
+        self.appointment_service = appointment_service
+        self.id_generator = id_generator
+
+    async def execute(self, items: List[AppointmentCreateDTO]) -> AppointmentBatchResponseDTO:
+        """
+        Exécute le cas d'utilisation.
+        Chaque demande reçoit son propre résultat ; en cas de chevauchement entre deux
+        demandes du lot, la première dans l'ordre du lot est retenue.
+
+        Args:
+            items: Les demandes de rendez-vous
+
+        Returns:
+            AppointmentBatchResponseDTO: Le résultat de chaque demande
+
+        Raises:
+            AppointmentConflictException: Si la base refuse l'insertion (réservation concurrente)
+        """
+        logger.info(f"Planification en masse de {len(items)} rendez-vous")
+        results: Dict[int, AppointmentBatchItemResultDTO] = {}
+
+        # Valider les heures de chaque demande
+        valid: List[int] = []
+        for index, item in enumerate(items):
+            try:
+                self.appointment_service.validate_appointment_times(item.start_time, item.end_time)
+                valid.append(index)
+            except ValueError as e:
+                results[index] = AppointmentBatchItemResultDTO(index=index, status="invalid", error=str(e))
+
+        existing_patients: Set[UUID] = set()
+        booked: Dict[UUID, List[Appointment]] = defaultdict(list)
+        if valid:
+            # Tous les patients du lot en une seule requête
+            existing_patients = await self.patient_repository.find_existing_ids(
+                [items[index].patient_id for index in valid]
+            )
+
+            # Tous les rendez-vous actifs des médecins concernés sur la plage du lot, en une seule requête
+            existing_appointments = await self.appointment_repository.get_blocking_in_range(
+                [items[index].doctor_id for index in valid],
+                min(items[index].start_time for index in valid),
+                max(items[index].end_time for index in valid)
+            )
+            for appointment in existing_appointments:
+                booked[appointment.doctor_id].append(appointment)
+
+        accepted: Dict[int, Appointment] = {}
+        for index in valid:
+            item = items[index]
+
+            if item.patient_id not in existing_patients:
+                results[index] = AppointmentBatchItemResultDTO(
+                    index=index,
+                    status="patient_not_found",
+                    error=str(PatientNotFoundException(item.patient_id))
+                )
+                continue
+
+            # Les demandes déjà retenues du lot occupent leur créneau comme les rendez-vous en base
+            if self.appointment_service.check_appointment_overlap(booked[item.doctor_id], item.start_time, item.end_time):
+                results[index] = AppointmentBatchItemResultDTO(
+                    index=index,
+                    status="conflict",
+                    error=str(AppointmentConflictException(item.doctor_id, item.start_time, item.end_time))
+                )
+                continue
+
+            appointment = Appointment(
+                id=self.id_generator.generate_id(),
+                patient_id=item.patient_id,
+                doctor_id=item.doctor_id,
+                start_time=item.start_time,
+                end_time=item.end_time,
+                status=AppointmentStatus.SCHEDULED,
+                reason=item.reason or "Consultation",
+                notes=item.notes
+            )
+            booked[item.doctor_id].append(appointment)
+            accepted[index] = appointment
+
+        # Une seule insertion multi-lignes pour tous les rendez-vous retenus
+        created = await self.appointment_repository.bulk_create(list(accepted.values()))
+        for index, appointment in zip(accepted, created):
+            results[index] = AppointmentBatchItemResultDTO(
+                index=index,
+                status="created",
+                appointment=self._to_response(appointment)
+            )
+
+        logger.info(f"Planification en masse : {len(created)} rendez-vous créés, {len(items) - len(created)} refusés")
+        return AppointmentBatchResponseDTO(
+            created=len(created),
+            rejected=len(items) - len(created),
+            results=[results[index] for index in range(len(items))]
+        )
+
+    @staticmethod
+    def _to_response(appointment: Appointment) -> AppointmentResponseDTO:
+        """Convertit un rendez-vous créé en DTO de réponse"""
+        return AppointmentResponseDTO(
+            id=appointment.id,
+            patient_id=appointment.patient_id,
+            doctor_id=appointment.doctor_id,
+            start_time=appointment.start_time,
+            end_time=appointment.end_time,
+            status=appointment.status.value,
+            reason=appointment.reason,
+            notes=appointment.notes,
+            created_at=appointment.created_at,
+            updated_at=appointment.updated_at,
+            is_active=appointment.is_active
+        )
@@ -0,0 +1,109 @@
+# medisecure-backend/appointment_management/application/usecases/find_clinic_availability_usecase.py
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+import logging
+
+from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from appointment_management.domain.services.availability_engine import AvailabilityEngine, Interval
+from appointment_management.application.dtos.appointment_dtos import ClinicSlotDTO, ClinicAvailabilityResponseDTO
+from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
+from shared.domain.enums.roles import UserRole
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class FindClinicAvailabilityUseCase:
+    """
+    Cas d'utilisation pour trouver les premiers créneaux libres parmi tous les médecins.
+    Deux requêtes au plus, quel que soit le nombre de médecins : la liste des
+    médecins (servie par le cache des utilisateurs) et les plages occupées de
+    tous les médecins sur la plage de dates.
+    """
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepositoryProtocol,
+        user_repository: UserRepositoryProtocol,
+        availability_engine: AvailabilityEngine
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            appointment_repository: Le repository des rendez-vous
+            user_repository: Le repository des utilisateurs
+            availability_engine: Le moteur de calcul des créneaux libres
+        """
+        self.appointment_repository = appointment_repository
+        self.user_repository = user_repository
+        self.availability_engine = availability_engine
+
+    async def execute(
+        self,
+        start_date: date,
+        end_date: date,
+        duration_minutes: int,
+        limit: int = 10,
+        doctor_ids: Optional[List[UUID]] = None
+    ) -> ClinicAvailabilityResponseDTO:
+        """
+        Exécute le cas d'utilisation.
+
+        Args:
+            start_date: Le premier jour de la plage
+            end_date: Le dernier jour de la plage (inclus)
+            duration_minutes: La durée du rendez-vous à placer
+            limit: Le nombre maximum de créneaux retournés
+            doctor_ids: Restreindre la recherche à ces médecins (tous les médecins actifs sinon)
+
+        Returns:
+            ClinicAvailabilityResponseDTO: Les créneaux libres classés par heure de début
+
+        Raises:
+            ValueError: Si la plage de dates ou la durée est invalide
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must be on or after start_date")
+        if duration_minutes <= 0:
+            raise ValueError("duration_minutes must be positive")
+
+        doctors = {
+            user.id: user
+            for user in await self.user_repository.list_by_role(UserRole.DOCTOR.value)
+            if user.is_active and (doctor_ids is None or user.id in doctor_ids)
+        }
+
+        busy_by_doctor: Dict[UUID, List[Interval]] = defaultdict(list)
+        if doctors:
+            window_start, window_end = self.availability_engine.working_window(start_date, end_date)
+            for doctor_id, start, end in await self.appointment_repository.get_busy_intervals(
+                list(doctors), window_start, window_end
+            ):
+                busy_by_doctor[doctor_id].append((start, end))
+
+        slots = self.availability_engine.earliest_slots(
+            {doctor_id: busy_by_doctor[doctor_id] for doctor_id in doctors},
+            start_date,
+            end_date,
+            duration=timedelta(minutes=duration_minutes),
+            limit=limit
+        )
+        logger.debug(f"{len(slots)} créneaux libres trouvés parmi {len(doctors)} médecins")
+
+        return ClinicAvailabilityResponseDTO(
+            start_date=start_date,
+            end_date=end_date,
+            duration_minutes=duration_minutes,
+            doctors_considered=len(doctors),
+            slots=[
+                ClinicSlotDTO(
+                    doctor_id=doctor_id,
+                    doctor_name=doctors[doctor_id].full_name,
+                    start_time=start,
+                    end_time=end
+                )
+                for start, end, doctor_id in slots
+            ]
+        )
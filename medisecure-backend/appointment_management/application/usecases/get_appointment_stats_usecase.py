@@ -0,0 +1,90 @@
+# medisecure-backend/appointment_management/application/usecases/get_appointment_stats_usecase.py
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from appointment_management.domain.entities.appointment_stats import Occupancy
+from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from appointment_management.domain.services.availability_engine import WorkingHours
+from appointment_management.application.dtos.appointment_dtos import OccupancyDTO, AppointmentStatsResponseDTO
+
+class GetAppointmentStatsUseCase:
+    """
+    Cas d'utilisation pour les tableaux de bord : occupation, taux d'absence et
+    utilisation par médecin et par jour, calculés depuis les agrégats journaliers
+    (une seule lecture indexée, quel que soit le nombre de rendez-vous).
+    """
+
+    def __init__(self, appointment_repository: AppointmentRepositoryProtocol, working_hours: WorkingHours):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            appointment_repository: Le repository des rendez-vous
+            working_hours: Les horaires de consultation, base du temps disponible
+        """
+        self.appointment_repository = appointment_repository
+        self.working_hours = working_hours
+
+    async def execute(self, start_date: date, end_date: date, doctor_id: Optional[UUID] = None) -> AppointmentStatsResponseDTO:
+        """
+        Exécute le cas d'utilisation.
+
+        Args:
+            start_date: Le premier jour de la période
+            end_date: Le dernier jour de la période (inclus)
+            doctor_id: Restreindre à un médecin (tous les médecins ayant des rendez-vous sinon)
+
+        Returns:
+            AppointmentStatsResponseDTO: Les indicateurs par médecin et par jour
+
+        Raises:
+            ValueError: Si la période est invalide
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must be on or after start_date")
+
+        day_minutes = int((
+            datetime.combine(date.min, self.working_hours.end) - datetime.combine(date.min, self.working_hours.start)
+        ).total_seconds() // 60)
+        working_days = sum(
+            1 for offset in range((end_date - start_date).days + 1)
+            if (start_date + timedelta(days=offset)).weekday() in self.working_hours.weekdays
+        )
+
+        doctors: Dict[UUID, Occupancy] = {}
+        days: Dict[Tuple[UUID, date], Occupancy] = {}
+        for stats in await self.appointment_repository.get_daily_stats(start_date, end_date, doctor_id):
+            doctor = doctors.setdefault(
+                stats.doctor_id,
+                Occupancy(stats.doctor_id, working_minutes=day_minutes * working_days)
+            )
+            day = days.setdefault(
+                (stats.doctor_id, stats.day),
+                Occupancy(
+                    stats.doctor_id,
+                    working_minutes=day_minutes if stats.day.weekday() in self.working_hours.weekdays else 0,
+                    day=stats.day
+                )
+            )
+            doctor.add(stats)
+            day.add(stats)
+
+        return AppointmentStatsResponseDTO(
+            start_date=start_date,
+            end_date=end_date,
+            doctors=[self._to_dto(occupancy) for occupancy in doctors.values()],
+            days=[self._to_dto(occupancy) for occupancy in days.values()]
+        )
+
+    def _to_dto(self, occupancy: Occupancy) -> OccupancyDTO:
+        return OccupancyDTO(
+            doctor_id=occupancy.doctor_id,
+            day=occupancy.day,
+            counts={status.value: count for status, count in occupancy.counts.items()},
+            booked_minutes=occupancy.booked_minutes,
+            working_minutes=occupancy.working_minutes,
+            occupancy_rate=occupancy.occupancy_rate,
+            utilisation_rate=occupancy.utilisation_rate,
+            no_show_rate=occupancy.no_show_rate
+        )
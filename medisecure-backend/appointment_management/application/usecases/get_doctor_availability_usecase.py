@@ -0,0 +1,77 @@
+# medisecure-backend/appointment_management/application/usecases/get_doctor_availability_usecase.py
+from datetime import date
+from uuid import UUID
+import logging
+
+from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from appointment_management.domain.services.availability_engine import AvailabilityEngine
+from appointment_management.application.dtos.appointment_dtos import (
+    AvailabilitySlotDTO,
+    AvailabilityDayDTO,
+    DoctorAvailabilityResponseDTO
+)
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class GetDoctorAvailabilityUseCase:
+    """
+    Cas d'utilisation pour récupérer les créneaux libres d'un médecin sur une plage de dates.
+    Une seule requête lit les plages occupées de la plage, le reste est calculé en mémoire.
+    """
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepositoryProtocol,
+        availability_engine: AvailabilityEngine
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            appointment_repository: Le repository des rendez-vous
+            availability_engine: Le moteur de calcul des créneaux libres
+        """
+        self.appointment_repository = appointment_repository
+        self.availability_engine = availability_engine
+
+    async def execute(self, doctor_id: UUID, start_date: date, end_date: date) -> DoctorAvailabilityResponseDTO:
+        """
+        Exécute le cas d'utilisation.
+
+        Args:
+            doctor_id: L'ID du médecin
+            start_date: Le premier jour de la plage
+            end_date: Le dernier jour de la plage (inclus)
+
+        Returns:
+            DoctorAvailabilityResponseDTO: Les créneaux libres de chaque jour travaillé
+
+        Raises:
+            ValueError: Si la plage de dates est invalide
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must be on or after start_date")
+
+        window_start, window_end = self.availability_engine.working_window(start_date, end_date)
+        busy = await self.appointment_repository.get_busy_intervals([doctor_id], window_start, window_end)
+        days = self.availability_engine.free_slots(
+            ((start, end) for _, start, end in busy),
+            start_date,
+            end_date
+        )
+        logger.debug(f"Disponibilités du médecin {doctor_id} calculées sur {len(days)} jours ({len(busy)} plages occupées)")
+
+        return DoctorAvailabilityResponseDTO(
+            doctor_id=doctor_id,
+            start_date=start_date,
+            end_date=end_date,
+            slot_minutes=int(self.availability_engine.slot.total_seconds() // 60),
+            days=[
+                AvailabilityDayDTO(
+                    date=day,
+                    slots=[AvailabilitySlotDTO(start_time=start, end_time=end) for start, end in slots]
+                )
+                for day, slots in days.items()
+            ]
+        )
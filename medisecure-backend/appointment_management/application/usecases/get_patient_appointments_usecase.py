@@ -1,10 +1,11 @@
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
 from appointment_management.application.dtos.appointment_dtos import AppointmentResponseDTO, AppointmentListResponseDTO
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
+from shared.domain.enums.count_mode import CountMode
 
 class GetPatientAppointmentsUseCase:
     """
@@ -26,7 +27,13 @@ class GetPatientAppointmentsUseCase:
         self.appointment_repository = appointment_repository
         self.patient_repository = patient_repository
     
-    async def execute(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> AppointmentListResponseDTO:
+    async def execute(
+        self,
+        patient_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> AppointmentListResponseDTO:
         """
         Exécute le cas d'utilisation.
         
@@ -34,6 +41,7 @@ class GetPatientAppointmentsUseCase:
             patient_id: L'ID du patient
             skip: Le nombre de rendez-vous à sauter
             limit: Le nombre maximum de rendez-vous à retourner
+            cursor: Le curseur renvoyé par la page précédente
             
         Returns:
             AppointmentListResponseDTO: La liste des rendez-vous du patient
@@ -46,11 +54,15 @@ class GetPatientAppointmentsUseCase:
         if not patient:
             raise PatientNotFoundException(patient_id)
         
-        # Récupérer les rendez-vous du patient
-        appointments = await self.appointment_repository.get_by_patient(patient_id, skip, limit)
-        
-        # Compter le nombre total de rendez-vous (approximatif sans pagination)
-        total = len(appointments)
+        # Récupérer les rendez-vous du patient et leur nombre total en une requête
+        page = await self.appointment_repository.list_page(
+            cursor,
+            limit,
+            patient_id=patient_id,
+            count=CountMode.EXACT,
+            skip=skip
+        )
+        appointments, next_cursor, total = page.items, page.next_cursor, page.total
         
         # Convertir les entités en DTOs de réponse
         appointment_dtos = []
@@ -76,5 +88,6 @@ class GetPatientAppointmentsUseCase:
             appointments=appointment_dtos,
             total=total,
             skip=skip,
-            limit=limit
+            limit=limit,
+            next_cursor=next_cursor
         )
\ No newline at end of file
@@ -10,6 +10,7 @@ from appointment_management.application.dtos.appointment_dtos import Appointment
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from shared.ports.primary.id_generator_protocol import IdGeneratorProtocol
 from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -53,6 +54,7 @@ class ScheduleAppointmentUseCase:
             
         Raises:
             PatientNotFoundException: Si le patient n'est pas trouvé
+            AppointmentConflictException: Si le créneau est déjà occupé
             ValueError: Si les heures de début et de fin sont invalides
         """
         try:
@@ -87,19 +89,10 @@ class ScheduleAppointmentUseCase:
           
             # Vérifier si le créneau est disponible (aucun chevauchement)
             logger.debug(f"Vérification de la disponibilité du créneau pour le médecin {doctor_id}")
-            existing_appointments = await self.appointment_repository.get_by_doctor(
-                doctor_id, 
-                skip=0, 
-                limit=1000
-            )
-            
-            if self.appointment_service.check_appointment_overlap(
-                existing_appointments, 
-                data.start_time, 
-                data.end_time
-            ):
+            # (la contrainte d'exclusion en base reste la garantie face aux réservations concurrentes)
+            if await self.appointment_repository.has_conflict(doctor_id, data.start_time, data.end_time):
                 logger.warning("Chevauchement de rendez-vous détecté")
-                raise ValueError("Ce créneau horaire est déjà occupé par un autre rendez-vous")
+                raise AppointmentConflictException(doctor_id, data.start_time, data.end_time)
             
             # Générer un ID pour le rendez-vous
             logger.debug("Génération de l'ID du rendez-vous")
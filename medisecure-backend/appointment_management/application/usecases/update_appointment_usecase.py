@@ -6,6 +6,7 @@ from typing import Optional
 
 from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
 from appointment_management.domain.services.appointment_service import AppointmentService
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
 from appointment_management.application.dtos.appointment_dtos import AppointmentUpdateDTO, AppointmentResponseDTO
 
@@ -43,6 +44,7 @@ class UpdateAppointmentUseCase:
             
         Raises:
             AppointmentNotFoundException: Si le rendez-vous n'est pas trouvé
+            AppointmentConflictException: Si le nouveau créneau est déjà occupé
             ValueError: Si les heures de début et de fin sont invalides
         """
         # Récupérer le rendez-vous existant
@@ -57,19 +59,13 @@ class UpdateAppointmentUseCase:
             self.appointment_service.validate_appointment_times(data.start_time, data.end_time)
             
             # Vérifier si le nouveau créneau est disponible
-            existing_appointments = await self.appointment_repository.get_by_doctor(
-                appointment.doctor_id, 
-                skip=0, 
-                limit=1000
-            )
-            
-            if self.appointment_service.check_appointment_overlap(
-                existing_appointments, 
-                data.start_time, 
+            if await self.appointment_repository.has_conflict(
+                appointment.doctor_id,
+                data.start_time,
                 data.end_time,
                 appointment_id
             ):
-                raise ValueError("Ce créneau horaire est déjà occupé par un autre rendez-vous")
+                raise AppointmentConflictException(appointment.doctor_id, data.start_time, data.end_time)
             
             # Mettre à jour les heures
             appointment.start_time = data.start_time
@@ -83,19 +79,13 @@ class UpdateAppointmentUseCase:
             self.appointment_service.validate_appointment_times(start_time, end_time)
             
             # Vérifier si le nouveau créneau est disponible
-            existing_appointments = await self.appointment_repository.get_by_doctor(
-                appointment.doctor_id, 
-                skip=0, 
-                limit=1000
-            )
-            
-            if self.appointment_service.check_appointment_overlap(
-                existing_appointments, 
-                start_time, 
+            if await self.appointment_repository.has_conflict(
+                appointment.doctor_id,
+                start_time,
                 end_time,
                 appointment_id
             ):
-                raise ValueError("Ce créneau horaire est déjà occupé par un autre rendez-vous")
+                raise AppointmentConflictException(appointment.doctor_id, start_time, end_time)
             
             # Mettre à jour les heures
             appointment.start_time = start_time
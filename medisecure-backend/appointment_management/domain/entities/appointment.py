@@ -12,6 +12,9 @@ class AppointmentStatus(str, Enum):
     COMPLETED = "COMPLETED"
     MISSED = "MISSED"
 
+# Statuts pour lesquels un rendez-vous occupe le créneau du médecin
+BLOCKING_STATUSES = (AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED)
+
 @dataclass
 class Appointment:
     """
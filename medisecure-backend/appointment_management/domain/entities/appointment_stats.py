@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Optional
+from uuid import UUID
+
+from appointment_management.domain.entities.appointment import AppointmentStatus
+
+@dataclass
+class DailyAppointmentStats:
+    """
+    Agrégat des rendez-vous actifs d'un médecin pour un jour et un statut.
+    """
+    doctor_id: UUID
+    day: date
+    status: AppointmentStatus
+    appointment_count: int
+    booked_minutes: int
+
+@dataclass
+class Occupancy:
+    """
+    Occupation d'un médecin sur un jour ou sur une période.
+    """
+    doctor_id: UUID
+    working_minutes: int
+    day: Optional[date] = None
+    counts: Dict[AppointmentStatus, int] = field(default_factory=dict)
+    minutes: Dict[AppointmentStatus, int] = field(default_factory=dict)
+
+    def add(self, stats: DailyAppointmentStats) -> None:
+        """Ajoute un agrégat jour/statut"""
+        self.counts[stats.status] = self.counts.get(stats.status, 0) + stats.appointment_count
+        self.minutes[stats.status] = self.minutes.get(stats.status, 0) + stats.booked_minutes
+
+    @property
+    def booked_minutes(self) -> int:
+        """Minutes réservées, hors rendez-vous annulés"""
+        return sum(minutes for status, minutes in self.minutes.items() if status != AppointmentStatus.CANCELLED)
+
+    @property
+    def occupancy_rate(self) -> Optional[float]:
+        """Part du temps de consultation réservée"""
+        if not self.working_minutes:
+            return None
+        return round(self.booked_minutes / self.working_minutes, 4)
+
+    @property
+    def utilisation_rate(self) -> Optional[float]:
+        """Part du temps de consultation effectivement honorée (rendez-vous terminés)"""
+        if not self.working_minutes:
+            return None
+        return round(self.minutes.get(AppointmentStatus.COMPLETED, 0) / self.working_minutes, 4)
+
+    @property
+    def no_show_rate(self) -> Optional[float]:
+        """Part des rendez-vous passés auxquels le patient ne s'est pas présenté"""
+        completed = self.counts.get(AppointmentStatus.COMPLETED, 0)
+        missed = self.counts.get(AppointmentStatus.MISSED, 0)
+        if not completed + missed:
+            return None
+        return round(missed / (completed + missed), 4)
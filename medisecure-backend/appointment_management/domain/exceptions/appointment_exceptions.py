@@ -0,0 +1,10 @@
+from shared.domain.exceptions.shared_exceptions import DomainException
+
+class AppointmentConflictException(DomainException):
+    """Exception levée lorsqu'un créneau chevauche un autre rendez-vous du médecin"""
+    def __init__(self, doctor_id, start_time, end_time):
+        self.doctor_id = doctor_id
+        self.start_time = start_time
+        self.end_time = end_time
+        message = f"Doctor {doctor_id} already has an appointment between {start_time} and {end_time}"
+        super().__init__(message)
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple, AsyncIterator
 from uuid import UUID
 from datetime import datetime, date
 
 from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.entities.appointment_stats import DailyAppointmentStats
+from shared.domain.entities.cursor_page import CursorPage
+from shared.domain.enums.count_mode import CountMode
 
 class AppointmentRepositoryProtocol(ABC):
     """
@@ -77,6 +80,37 @@ class AppointmentRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[Appointment]:
+        """
+        Liste les rendez-vous par pagination keyset, du plus récent au plus ancien
+        (tri par start_time puis id décroissants).
+        La page et le total sont lus dans la même requête.
+        
+        Args:
+            cursor: Le curseur renvoyé par la page précédente (None pour la première page)
+            limit: Le nombre maximum de rendez-vous à retourner
+            patient_id: Filtrer sur un patient (optionnel)
+            doctor_id: Filtrer sur un médecin (optionnel)
+            count: Le mode de calcul du total (toujours exact si la liste est filtrée)
+            skip: Le nombre de rendez-vous à sauter (anciens clients paginés par décalage)
+            
+        Returns:
+            CursorPage[Appointment]: La page de rendez-vous, le curseur de la page suivante et le total
+            
+        Raises:
+            InvalidCursorException: Si le curseur est invalide
+        """
+        pass
+    
     @abstractmethod
     async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
@@ -123,6 +157,154 @@ class AppointmentRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_by_date_range_page(
+        self,
+        start_date: date,
+        end_date: date,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> CursorPage[Appointment]:
+        """
+        Récupère les rendez-vous actifs d'une plage de dates par pagination keyset,
+        dans l'ordre chronologique (tri par start_time puis id croissants).
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin
+            cursor: Le curseur renvoyé par la page précédente (None pour la première page)
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            CursorPage[Appointment]: La page de rendez-vous et le curseur de la page suivante
+            
+        Raises:
+            InvalidCursorException: Si le curseur est invalide
+        """
+        pass
+    
+    @abstractmethod
+    def stream_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        batch_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """
+        Parcourt sans limite les rendez-vous actifs d'une plage de dates, par ordre
+        chronologique, en les lisant par lots depuis un curseur côté serveur.
+        La mémoire utilisée ne dépend que de `batch_size`.
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin (incluse)
+            batch_size: Le nombre de lignes lues à la fois
+            
+        Returns:
+            AsyncIterator[Appointment]: Les rendez-vous, au fil de leur lecture
+        """
+        pass
+    
+    @abstractmethod
+    async def has_conflict(
+        self,
+        doctor_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_appointment_id: Optional[UUID] = None
+    ) -> bool:
+        """
+        Vérifie si un médecin a déjà un rendez-vous actif qui chevauche un créneau.
+        
+        Args:
+            doctor_id: L'ID du médecin
+            start_time: L'heure de début du créneau
+            end_time: L'heure de fin du créneau
+            exclude_appointment_id: L'ID du rendez-vous à ignorer (pour les mises à jour)
+            
+        Returns:
+            bool: True si le créneau est déjà occupé, False sinon
+        """
+        pass
+    
+    @abstractmethod
+    async def get_blocking_in_range(
+        self,
+        doctor_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Appointment]:
+        """
+        Récupère en une seule requête les rendez-vous actifs de plusieurs médecins
+        qui chevauchent une plage horaire.
+        
+        Args:
+            doctor_ids: Les IDs des médecins
+            start_time: Le début de la plage
+            end_time: La fin de la plage
+            
+        Returns:
+            List[Appointment]: Les rendez-vous qui occupent un créneau de la plage
+        """
+        pass
+    
+    @abstractmethod
+    async def get_busy_intervals(
+        self,
+        doctor_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Tuple[UUID, datetime, datetime]]:
+        """
+        Récupère uniquement les plages occupées (médecin, début, fin) par les
+        rendez-vous actifs qui chevauchent une plage horaire.
+        
+        Args:
+            doctor_ids: Les IDs des médecins
+            start_time: Le début de la plage
+            end_time: La fin de la plage
+            
+        Returns:
+            List[Tuple[UUID, datetime, datetime]]: Les plages occupées, triées par début
+        """
+        pass
+    
+    @abstractmethod
+    async def bulk_create(self, appointments: List[Appointment]) -> List[Appointment]:
+        """
+        Crée plusieurs rendez-vous en une seule insertion multi-lignes.
+        
+        Args:
+            appointments: Les rendez-vous à créer
+            
+        Returns:
+            List[Appointment]: Les rendez-vous créés
+            
+        Raises:
+            AppointmentConflictException: Si la base refuse un chevauchement
+        """
+        pass
+    
+    @abstractmethod
+    async def get_daily_stats(
+        self,
+        start_date: date,
+        end_date: date,
+        doctor_id: Optional[UUID] = None
+    ) -> List[DailyAppointmentStats]:
+        """
+        Récupère les agrégats des rendez-vous actifs par médecin, jour et statut.
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin (incluse)
+            doctor_id: Restreindre à un médecin (tous les médecins sinon)
+            
+        Returns:
+            List[DailyAppointmentStats]: Les agrégats, triés par médecin puis par jour
+        """
+        pass
+    
     @abstractmethod
     async def count(self) -> int:
         """
@@ -1,10 +1,11 @@
 # medisecure-backend/appointment_management/domain/services/appointment_service.py
 from typing import Optional, List, Dict
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from uuid import UUID
 import logging
 
-from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus, BLOCKING_STATUSES
+from appointment_management.domain.services.availability_engine import AvailabilityEngine, WorkingHours
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -70,12 +71,8 @@ class AppointmentService:
             if appointment_id and appointment.id == appointment_id:
                 continue
                 
-            # Ignorer les rendez-vous annulés
-            if appointment.status == AppointmentStatus.CANCELLED:
-                continue
-            
-            # Ignorer les rendez-vous terminés
-            if appointment.status == AppointmentStatus.COMPLETED:
+            # Ignorer les rendez-vous qui n'occupent plus le créneau (annulés, terminés, manqués)
+            if appointment.status not in BLOCKING_STATUSES:
                 continue
                 
             # Vérifier si les plages horaires se chevauchent
@@ -111,35 +108,18 @@ class AppointmentService:
         Returns:
             List[Dict]: Liste des créneaux disponibles avec heure de début et de fin
         """
-        # Filtrer les rendez-vous pour la date spécifiée
-        date_appointments = [
-            appointment for appointment in existing_appointments
+        # Rendez-vous non annulés de cette date, sous forme d'intervalles
+        busy = [
+            (appointment.start_time, appointment.end_time)
+            for appointment in existing_appointments
             if appointment.start_time.date() == date_to_check
             and appointment.status != AppointmentStatus.CANCELLED
         ]
         
-        # Créer des créneaux pour toute la journée
-        all_slots = []
-        current_time = datetime.combine(date_to_check, datetime.min.time().replace(hour=start_hour))
-        end_time = datetime.combine(date_to_check, datetime.min.time().replace(hour=end_hour))
-        
-        while current_time < end_time:
-            slot_end = current_time + timedelta(minutes=slot_duration_minutes)
-            all_slots.append({
-                "start": current_time,
-                "end": slot_end,
-                "available": True
-            })
-            current_time = slot_end
-        
-        # Marquer les créneaux occupés
-        for appointment in date_appointments:
-            for slot in all_slots:
-                # Si le rendez-vous chevauche le créneau, marquer comme non disponible
-                if (appointment.start_time < slot["end"] and appointment.end_time > slot["start"]):
-                    slot["available"] = False
-        
-        # Retourner uniquement les créneaux disponibles
-        available_slots = [slot for slot in all_slots if slot["available"]]
+        engine = AvailabilityEngine(
+            WorkingHours(start=time(start_hour), end=time(end_hour), weekdays=tuple(range(7))),
+            slot_duration_minutes
+        )
+        free = engine.free_slots(busy, date_to_check, date_to_check)[date_to_check]
         
-        return available_slots
\ No newline at end of file
+        return [{"start": start, "end": end, "available": True} for start, end in free]
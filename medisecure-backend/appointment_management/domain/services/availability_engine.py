@@ -0,0 +1,175 @@
+# medisecure-backend/appointment_management/domain/services/availability_engine.py
+from dataclasses import dataclass
+from datetime import datetime, date, time, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+import heapq
+
+# Intervalle [début, fin)
+Interval = Tuple[datetime, datetime]
+
+@dataclass(frozen=True)
+class WorkingHours:
+    """Plage de consultation d'une journée et jours travaillés (0 = lundi)"""
+    start: time = time(8, 0)
+    end: time = time(18, 0)
+    weekdays: Tuple[int, ...] = (0, 1, 2, 3, 4)
+
+    def __post_init__(self):
+        if self.end <= self.start:
+            raise ValueError("L'heure de fin de journée doit être après l'heure de début")
+        if any(day not in range(7) for day in self.weekdays):
+            raise ValueError("Les jours travaillés vont de 0 (lundi) à 6 (dimanche)")
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """
+    Fusionne des intervalles qui se chevauchent ou se touchent.
+
+    Args:
+        intervals: Les intervalles, dans un ordre quelconque
+
+    Returns:
+        List[Interval]: Les intervalles disjoints, triés par début
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class AvailabilityEngine:
+    """
+    Calcul des créneaux libres d'un médecin sur une plage de dates.
+
+    Les créneaux suivent une grille fixe depuis le début de la journée de
+    travail. Les rendez-vous sont fusionnés en intervalles disjoints et triés,
+    puis parcourus une seule fois en même temps que les créneaux : le coût
+    est linéaire en nombre de créneaux et de rendez-vous, quelle que soit la
+    longueur de la plage.
+    """
+
+    def __init__(self, working_hours: WorkingHours = WorkingHours(), slot_minutes: int = 30):
+        """
+        Initialise le moteur.
+
+        Args:
+            working_hours: La plage de consultation et les jours travaillés
+            slot_minutes: La durée d'un créneau en minutes
+        """
+        if slot_minutes <= 0:
+            raise ValueError("La durée d'un créneau doit être positive")
+        self.working_hours = working_hours
+        self.slot = timedelta(minutes=slot_minutes)
+
+    def working_window(self, start_date: date, end_date: date) -> Interval:
+        """Plage horaire couvrant les journées de travail de `start_date` à `end_date` incluses"""
+        return (
+            datetime.combine(start_date, self.working_hours.start),
+            datetime.combine(end_date, self.working_hours.end)
+        )
+
+    def free_slots(self, busy: Iterable[Interval], start_date: date, end_date: date) -> Dict[date, List[Interval]]:
+        """
+        Calcule les créneaux libres de chaque jour travaillé de la plage.
+
+        Args:
+            busy: Les intervalles occupés (rendez-vous), dans un ordre quelconque
+            start_date: Le premier jour de la plage
+            end_date: Le dernier jour de la plage (inclus)
+
+        Returns:
+            Dict[date, List[Interval]]: Les créneaux libres par jour, dans l'ordre chronologique
+        """
+        days: Dict[date, List[Interval]] = {
+            day: [] for day in self._working_days(start_date, end_date)
+        }
+        for slot in self.iter_free_slots(busy, start_date, end_date):
+            days[slot[0].date()].append(slot)
+        return days
+
+    def iter_free_slots(
+        self,
+        busy: Iterable[Interval],
+        start_date: date,
+        end_date: date,
+        duration: Optional[timedelta] = None
+    ) -> Iterator[Interval]:
+        """
+        Produit à la demande, dans l'ordre chronologique, les créneaux libres de la plage.
+
+        Args:
+            busy: Les intervalles occupés (rendez-vous), dans un ordre quelconque
+            start_date: Le premier jour de la plage
+            end_date: Le dernier jour de la plage (inclus)
+            duration: La durée demandée (la durée d'un créneau par défaut) ; les
+                débuts restent alignés sur la grille des créneaux
+
+        Yields:
+            Interval: Les créneaux libres
+        """
+        length = duration or self.slot
+        merged = merge_intervals(busy)
+        position = 0
+
+        for day in self._working_days(start_date, end_date):
+            slot_start = datetime.combine(day, self.working_hours.start)
+            day_end = datetime.combine(day, self.working_hours.end)
+
+            while slot_start + length <= day_end:
+                slot_end = slot_start + length
+                # Écarter les intervalles terminés avant ce créneau (jamais revisités)
+                while position < len(merged) and merged[position][1] <= slot_start:
+                    position += 1
+                if position == len(merged) or merged[position][0] >= slot_end:
+                    yield slot_start, slot_end
+                    slot_start += self.slot
+                else:
+                    # Créneau occupé : reprendre à la grille après la fin de l'intervalle
+                    busy_end = merged[position][1]
+                    skipped = -(-(busy_end - slot_start) // self.slot)
+                    slot_start += self.slot * max(skipped, 1)
+
+    def earliest_slots(
+        self,
+        busy_by_doctor: Dict[UUID, List[Interval]],
+        start_date: date,
+        end_date: date,
+        duration: Optional[timedelta] = None,
+        limit: int = 10
+    ) -> List[Tuple[datetime, datetime, UUID]]:
+        """
+        Classe les créneaux libres de plusieurs médecins par heure de début.
+
+        Les créneaux de chaque médecin sont produits à la demande et fusionnés
+        par un tas : seuls les `limit` premiers sont calculés, quel que soit
+        le nombre de médecins et la longueur de la plage.
+
+        Args:
+            busy_by_doctor: Les intervalles occupés de chaque médecin (liste vide si aucun)
+            start_date: Le premier jour de la plage
+            end_date: Le dernier jour de la plage (inclus)
+            duration: La durée demandée
+            limit: Le nombre maximum de créneaux retournés
+
+        Returns:
+            List[Tuple[datetime, datetime, UUID]]: (début, fin, médecin), du plus tôt au plus tard
+        """
+        def doctor_slots(doctor_id: UUID, busy: List[Interval]) -> Iterator[Tuple[datetime, datetime, UUID]]:
+            for start, end in self.iter_free_slots(busy, start_date, end_date, duration):
+                yield start, end, doctor_id
+
+        streams = [doctor_slots(doctor_id, busy) for doctor_id, busy in busy_by_doctor.items()]
+        return list(islice(heapq.merge(*streams, key=lambda slot: (slot[0], str(slot[2]))), limit))
+
+    def _working_days(self, start_date: date, end_date: date) -> Iterator[date]:
+        day = start_date
+        while day <= end_date:
+            if day.weekday() in self.working_hours.weekdays:
+                yield day
+            day += timedelta(days=1)
@@ -1,29 +1,49 @@
 # medisecure-backend/appointment_management/infrastructure/adapters/primary/controllers/appointment_controller.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from datetime import date, timedelta, datetime
+from fastapi.responses import StreamingResponse
+from datetime import date, time, timedelta, datetime
 import logging
 
 from shared.services.authenticator.extract_token import extract_token_payload
 from shared.container.container import Container
+from shared.infrastructure.monitoring.timed_route import TimedRoute
+from shared.infrastructure.serialization import ORJSONResponse, ResponseSerializer, dumps
+from shared.infrastructure.config.settings import get_settings
 from appointment_management.application.dtos.appointment_dtos import (
     AppointmentCreateDTO,
     AppointmentUpdateDTO,
     AppointmentResponseDTO,
-    AppointmentListResponseDTO
+    AppointmentListResponseDTO,
+    AppointmentBatchCreateDTO,
+    AppointmentBatchResponseDTO,
+    DoctorAvailabilityResponseDTO,
+    ClinicAvailabilityResponseDTO,
+    AppointmentStatsResponseDTO
 )
 from appointment_management.application.usecases.schedule_appointment_usecase import ScheduleAppointmentUseCase
+from appointment_management.application.usecases.batch_schedule_appointments_usecase import BatchScheduleAppointmentsUseCase
 from appointment_management.application.usecases.update_appointment_usecase import UpdateAppointmentUseCase
 from appointment_management.application.usecases.get_patient_appointments_usecase import GetPatientAppointmentsUseCase
-from appointment_management.domain.entities.appointment import AppointmentStatus
+from appointment_management.application.usecases.get_doctor_availability_usecase import GetDoctorAvailabilityUseCase
+from appointment_management.application.usecases.find_clinic_availability_usecase import FindClinicAvailabilityUseCase
+from appointment_management.application.usecases.get_appointment_stats_usecase import GetAppointmentStatsUseCase
+from appointment_management.domain.services.availability_engine import AvailabilityEngine, WorkingHours
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
 from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
+from shared.domain.exceptions.shared_exceptions import InvalidCursorException
+from shared.domain.enums.count_mode import CountMode
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
 # Créer un router pour les endpoints des rendez-vous
-router = APIRouter(prefix="/appointments", tags=["appointments"])
+router = APIRouter(prefix="/appointments", tags=["appointments"], route_class=TimedRoute)
+
+# Sérialiseur des listes de rendez-vous (entités des repositories, sans revalidation)
+APPOINTMENT_SERIALIZER = ResponseSerializer(AppointmentResponseDTO)
 
 def check_role_permission(role: str, allowed_roles: list) -> bool:
     """
@@ -51,6 +71,74 @@ def get_container():
     """
     return Container()
 
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """Premier et dernier jour d'un mois"""
+    start_date = date(year, month, 1)
+    if month == 12:
+        end_date = date(year + 1, 1, 1) - timedelta(days=1)
+    else:
+        end_date = date(year, month + 1, 1) - timedelta(days=1)
+    return start_date, end_date
+
+def appointment_to_json_line(appointment: Appointment) -> bytes:
+    """Sérialise un rendez-vous en une ligne NDJSON (mêmes champs que AppointmentResponseDTO)"""
+    return APPOINTMENT_SERIALIZER.json_line(appointment)
+
+async def calendar_json_chunks(
+    appointments: AsyncIterator[Appointment],
+    batch_size: int = 100
+) -> AsyncIterator[bytes]:
+    """
+    Produit, morceau par morceau, le JSON d'AppointmentListResponseDTO pour
+    une suite de rendez-vous lue en flux. Le total n'est connu qu'à la fin :
+    il est écrit après la liste.
+    """
+    yield b'{"appointments":['
+    total = 0
+    batch: List[bytes] = []
+    async for appointment in appointments:
+        batch.append(dumps(APPOINTMENT_SERIALIZER.one(appointment)))
+        total += 1
+        if len(batch) >= batch_size:
+            yield (b"," if total > len(batch) else b"") + b",".join(batch)
+            batch = []
+    if batch:
+        yield (b"," if total > len(batch) else b"") + b",".join(batch)
+    yield b'],' + dumps({"total": total, "skip": 0, "limit": total, "next_cursor": None})[1:]
+
+def build_availability_engine(
+    slot_minutes: Optional[int] = None,
+    day_start: Optional[time] = None,
+    day_end: Optional[time] = None
+) -> AvailabilityEngine:
+    """
+    Construit le moteur de disponibilités depuis la configuration,
+    avec les précisions éventuelles de la requête.
+    """
+    scheduling = get_settings().scheduling
+    return AvailabilityEngine(
+        WorkingHours(
+            start=day_start or scheduling.working_day_start,
+            end=day_end or scheduling.working_day_end,
+            weekdays=scheduling.get_working_days()
+        ),
+        slot_minutes or scheduling.slot_minutes
+    )
+
+def check_availability_range(start_date: date, end_date: date) -> None:
+    """
+    Vérifie la longueur d'une plage de recherche de disponibilités.
+    
+    Raises:
+        HTTPException: Si la plage dépasse la limite configurée
+    """
+    max_days = get_settings().scheduling.availability_max_days
+    if (end_date - start_date).days + 1 > max_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The range cannot exceed {max_days} days"
+        )
+
 @router.post("/", response_model=AppointmentResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_appointment(
     data: AppointmentCreateDTO,
@@ -74,14 +162,6 @@ async def create_appointment(
                 detail="You don't have permission to create appointments"
             )
         
-        # Créer le cas d'utilisation avec les dépendances nécessaires
-        use_case = ScheduleAppointmentUseCase(
-            appointment_repository=container.appointment_repository(),
-            patient_repository=container.patient_repository(),
-            appointment_service=container.appointment_service(),
-            id_generator=container.id_generator()
-        )
-        
         # Valider les dates avant de les envoyer au cas d'utilisation
         try:
             # Vérifier et formater les dates si nécessaire
@@ -101,7 +181,15 @@ async def create_appointment(
         # Exécuter le cas d'utilisation
         try:
             logger.info("Tentative d'exécution du cas d'utilisation ScheduleAppointmentUseCase")
-            result = await use_case.execute(data)
+            # Une seule session et une seule transaction pour toute la réservation
+            async with container.unit_of_work() as uow:
+                use_case = ScheduleAppointmentUseCase(
+                    appointment_repository=container.appointment_repository(session_factory=uow),
+                    patient_repository=container.patient_repository(session_factory=uow),
+                    appointment_service=container.appointment_service(),
+                    id_generator=container.id_generator()
+                )
+                result = await use_case.execute(data)
             logger.info(f"Rendez-vous créé avec succès: {result.id}")
             return result
         except Exception as e:
@@ -115,6 +203,13 @@ async def create_appointment(
             detail=str(e)
         )
     
+    except AppointmentConflictException as e:
+        logger.warning(f"Créneau déjà occupé: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ce créneau horaire est déjà occupé par un autre rendez-vous"
+        )
+    
     except ValueError as e:
         logger.error(f"Erreur de validation: {str(e)}")
         raise HTTPException(
@@ -129,15 +224,71 @@ async def create_appointment(
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
+@router.post("/batch", response_model=AppointmentBatchResponseDTO)
+async def create_appointments_batch(
+    data: AppointmentBatchCreateDTO,
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Crée plusieurs rendez-vous en une seule requête, avec un résultat par rendez-vous.
+    """
+    try:
+        # Vérifier si l'utilisateur a le droit de créer des rendez-vous
+        user_role = token_payload.get("role", "")
+        allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
+        
+        if not check_role_permission(user_role, allowed_roles):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to create appointments"
+            )
+        
+        # Une seule session et une seule transaction pour tout le lot
+        async with container.unit_of_work() as uow:
+            use_case = BatchScheduleAppointmentsUseCase(
+                appointment_repository=container.appointment_repository(session_factory=uow),
+                patient_repository=container.patient_repository(session_factory=uow),
+                appointment_service=container.appointment_service(),
+                id_generator=container.id_generator()
+            )
+            result = await use_case.execute(data.appointments)
+        
+        logger.info(f"Lot de rendez-vous traité: {result.created} créés, {result.rejected} refusés")
+        return result
+    
+    except HTTPException:
+        raise
+    
+    except AppointmentConflictException as e:
+        logger.warning(f"Lot refusé par la base (réservation concurrente): {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A slot of the batch was booked concurrently, no appointment was created"
+        )
+    
+    except Exception as e:
+        logger.exception(f"Erreur inattendue lors de la création des rendez-vous en masse: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
 @router.get("/calendar/", response_model=AppointmentListResponseDTO)
 async def get_calendar(
     year: int = Query(..., description="Year to fetch the calendar for"),
     month: int = Query(..., description="Month to fetch the calendar for"),
+    limit: Optional[int] = Query(None, description="Page size (whole month when omitted)"),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
     """
     Récupère les rendez-vous pour un mois spécifique (pour l'affichage calendrier).
+    
+    Sans `limit`, le mois entier est envoyé en flux (JSON par morceaux, mémoire
+    bornée) ; avec `limit`, les rendez-vous sont paginés par curseur dans
+    l'ordre chronologique.
     """
     try:
         # Vérifier les permissions
@@ -151,42 +302,37 @@ async def get_calendar(
             )
         
         # Déterminer les dates de début et de fin du mois
-        start_date = date(year, month, 1)
-        if month == 12:
-            end_date = date(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = date(year, month + 1, 1) - timedelta(days=1)
+        start_date, end_date = month_bounds(year, month)
         
         # Récupérer le repository
         appointment_repository = container.appointment_repository()
         
-        # Récupérer les rendez-vous dans cette plage de dates
-        appointments = await appointment_repository.get_by_date_range(start_date, end_date)
-        
-        # Convertir en DTOs
-        appointment_dtos = [
-            AppointmentResponseDTO(
-                id=appointment.id,
-                patient_id=appointment.patient_id,
-                doctor_id=appointment.doctor_id,
-                start_time=appointment.start_time,
-                end_time=appointment.end_time,
-                status=appointment.status.value,
-                reason=appointment.reason,
-                notes=appointment.notes,
-                created_at=appointment.created_at,
-                updated_at=appointment.updated_at,
-                is_active=appointment.is_active
+        if limit is None and not cursor:
+            # Mois entier, sans troncature : envoyé au fil du curseur côté serveur.
+            # Une erreur en cours de flux interrompt la réponse (corps incomplet)
+            return StreamingResponse(
+                calendar_json_chunks(appointment_repository.stream_by_date_range(start_date, end_date)),
+                media_type="application/json"
             )
-            for appointment in appointments
-        ]
         
-        # Construire la réponse
-        return AppointmentListResponseDTO(
-            appointments=appointment_dtos,
-            total=len(appointments),
-            skip=0,
-            limit=len(appointments)
+        # Récupérer une page de rendez-vous dans cette plage de dates
+        page = await appointment_repository.get_by_date_range_page(
+            start_date, end_date, cursor, limit or 100
+        )
+        
+        # Construire la réponse, sérialisée sans revalidation des entités
+        return ORJSONResponse({
+            "appointments": APPOINTMENT_SERIALIZER.many(page.items),
+            "total": len(page.items),
+            "skip": 0,
+            "limit": limit or 100,
+            "next_cursor": page.next_cursor
+        })
+        
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
         
     except Exception as e:
@@ -196,7 +342,217 @@ async def get_calendar(
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
+@router.get("/availability", response_model=DoctorAvailabilityResponseDTO)
+async def get_availability(
+    doctor_id: UUID = Query(..., description="The ID of the doctor"),
+    start_date: date = Query(..., description="First day of the range"),
+    end_date: Optional[date] = Query(None, description="Last day of the range, inclusive (start_date when omitted)"),
+    slot_minutes: Optional[int] = Query(None, ge=5, le=240, description="Slot length in minutes"),
+    day_start: Optional[time] = Query(None, description="Start of the working day"),
+    day_end: Optional[time] = Query(None, description="End of the working day"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Récupère les créneaux libres d'un médecin, jour par jour, sur une plage de dates.
+    
+    Les horaires, les jours travaillés et la durée des créneaux viennent de la
+    configuration ; la durée et les horaires peuvent être précisés par la requête.
+    """
+    try:
+        # Vérifier les permissions
+        user_role = token_payload.get("role", "")
+        allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
+        
+        if not check_role_permission(user_role, allowed_roles):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to view availability"
+            )
+        
+        end_date = end_date or start_date
+        check_availability_range(start_date, end_date)
+        
+        use_case = GetDoctorAvailabilityUseCase(
+            appointment_repository=container.appointment_repository(),
+            availability_engine=build_availability_engine(slot_minutes, day_start, day_end)
+        )
+        
+        return await use_case.execute(doctor_id, start_date, end_date)
+    
+    except HTTPException:
+        raise
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    except Exception as e:
+        logger.exception(f"Erreur inattendue lors du calcul des disponibilités: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+@router.get("/availability/clinic", response_model=ClinicAvailabilityResponseDTO)
+async def get_clinic_availability(
+    start_date: date = Query(..., description="First day of the range"),
+    end_date: Optional[date] = Query(None, description="Last day of the range, inclusive (one week when omitted)"),
+    duration_minutes: Optional[int] = Query(None, ge=5, le=480, description="Length of the appointment to place"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of slots to return"),
+    doctor_id: Optional[List[UUID]] = Query(None, description="Restrict the search to these doctors"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Trouve les premiers créneaux libres parmi tous les médecins actifs,
+    classés par heure de début.
+    """
+    try:
+        # Vérifier les permissions
+        user_role = token_payload.get("role", "")
+        allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
+        
+        if not check_role_permission(user_role, allowed_roles):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to view availability"
+            )
+        
+        end_date = end_date or start_date + timedelta(days=6)
+        check_availability_range(start_date, end_date)
+        
+        use_case = FindClinicAvailabilityUseCase(
+            appointment_repository=container.appointment_repository(),
+            user_repository=container.user_repository(),
+            availability_engine=build_availability_engine()
+        )
+        
+        return await use_case.execute(
+            start_date,
+            end_date,
+            duration_minutes or get_settings().scheduling.slot_minutes,
+            limit=limit,
+            doctor_ids=doctor_id
+        )
+    
+    except HTTPException:
+        raise
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    except Exception as e:
+        logger.exception(f"Erreur inattendue lors de la recherche de créneaux dans la clinique: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
 # Ajout des autres routes nécessaires
+@router.get("/calendar/stream")
+async def stream_calendar(
+    year: int = Query(..., description="Year to fetch the calendar for"),
+    month: Optional[int] = Query(None, description="Month to fetch the calendar for (whole year when omitted)"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Diffuse les rendez-vous d'un mois (ou d'une année) au format NDJSON, un
+    rendez-vous par ligne, par ordre chronologique.
+    
+    Les lignes sont envoyées au fil de la lecture du curseur côté serveur :
+    la mémoire utilisée ne dépend pas du nombre de rendez-vous.
+    """
+    # Vérifier les permissions
+    user_role = token_payload.get("role", "")
+    allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
+    
+    if not check_role_permission(user_role, allowed_roles):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view the calendar"
+        )
+    
+    try:
+        if month is None:
+            start_date, end_date = date(year, 1, 1), date(year, 12, 31)
+        else:
+            start_date, end_date = month_bounds(year, month)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    appointment_repository = container.appointment_repository()
+    
+    async def lines():
+        # Une erreur en cours de flux interrompt la réponse : le client reçoit
+        # un corps incomplet plutôt qu'un calendrier tronqué silencieusement
+        async for appointment in appointment_repository.stream_by_date_range(start_date, end_date):
+            yield appointment_to_json_line(appointment)
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.get("/stats", response_model=AppointmentStatsResponseDTO)
+async def get_appointment_stats(
+    year: int = Query(..., description="Year of the period"),
+    month: int = Query(..., description="Month of the period"),
+    doctor_id: Optional[UUID] = Query(None, description="Restrict the statistics to one doctor"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Récupère, pour un mois, l'occupation, le taux d'absence et l'utilisation
+    de chaque médecin, au total et jour par jour.
+    """
+    try:
+        # Vérifier les permissions
+        user_role = token_payload.get("role", "")
+        allowed_roles = ["admin", "doctor"]
+        
+        if not check_role_permission(user_role, allowed_roles):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to view appointment statistics"
+            )
+        
+        start_date, end_date = month_bounds(year, month)
+        scheduling = get_settings().scheduling
+        
+        use_case = GetAppointmentStatsUseCase(
+            appointment_repository=container.appointment_repository(),
+            working_hours=WorkingHours(
+                start=scheduling.working_day_start,
+                end=scheduling.working_day_end,
+                weekdays=scheduling.get_working_days()
+            )
+        )
+        
+        return await use_case.execute(start_date, end_date, doctor_id)
+    
+    except HTTPException:
+        raise
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    except Exception as e:
+        logger.exception(f"Erreur inattendue lors du calcul des statistiques de rendez-vous: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
 @router.get("/{appointment_id}", response_model=AppointmentResponseDTO)
 async def get_appointment(
     appointment_id: UUID = Path(..., description="The ID of the appointment to get"),
@@ -264,17 +620,23 @@ async def update_appointment(
                 detail="You don't have permission to update appointments"
             )
         
-        # Créer le cas d'utilisation
-        use_case = UpdateAppointmentUseCase(
-            appointment_repository=container.appointment_repository(),
-            appointment_service=container.appointment_service()
-        )
-        
-        # Exécuter le cas d'utilisation
-        result = await use_case.execute(appointment_id, data or AppointmentUpdateDTO())
+        # Exécuter le cas d'utilisation dans une seule transaction
+        async with container.unit_of_work() as uow:
+            use_case = UpdateAppointmentUseCase(
+                appointment_repository=container.appointment_repository(session_factory=uow),
+                appointment_service=container.appointment_service()
+            )
+            result = await use_case.execute(appointment_id, data or AppointmentUpdateDTO())
         
         return result
         
+    except AppointmentConflictException as e:
+        logger.warning(f"Créneau déjà occupé: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ce créneau horaire est déjà occupé par un autre rendez-vous"
+        )
+    
     except ValueError as e:
         logger.error(f"Erreur de validation: {str(e)}")
         raise HTTPException(
@@ -294,6 +656,7 @@ async def get_patient_appointments(
     patient_id: UUID = Path(..., description="The ID of the patient"),
     skip: int = Query(0, description="Number of appointments to skip"),
     limit: int = Query(100, description="Maximum number of appointments to return"),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
@@ -301,14 +664,13 @@ async def get_patient_appointments(
     Récupère les rendez-vous d'un patient.
     """
     try:
-        # Créer le cas d'utilisation
-        use_case = GetPatientAppointmentsUseCase(
-            appointment_repository=container.appointment_repository(),
-            patient_repository=container.patient_repository()
-        )
-        
-        # Exécuter le cas d'utilisation
-        result = await use_case.execute(patient_id, skip, limit)
+        # Exécuter le cas d'utilisation avec une seule connexion
+        async with container.unit_of_work() as uow:
+            use_case = GetPatientAppointmentsUseCase(
+                appointment_repository=container.appointment_repository(session_factory=uow),
+                patient_repository=container.patient_repository(session_factory=uow)
+            )
+            result = await use_case.execute(patient_id, skip, limit, cursor)
         
         return result
         
@@ -319,6 +681,12 @@ async def get_patient_appointments(
             detail=str(e)
         )
     
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
     except Exception as e:
         logger.exception(f"Erreur inattendue lors de la récupération des rendez-vous: {str(e)}")
         raise HTTPException(
@@ -330,11 +698,16 @@ async def get_patient_appointments(
 async def list_appointments(
     skip: int = Query(0, description="Number of appointments to skip"),
     limit: int = Query(100, description="Maximum number of appointments to return"),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    count: CountMode = Query(CountMode.EXACT, description="How to compute the total: exact, estimated or none"),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
     """
     Liste tous les rendez-vous avec pagination.
+    
+    La page et le total sont lus en une seule requête. La pagination par
+    curseur est à privilégier ; `skip` reste accepté pour les clients existants.
     """
     try:
         # Vérifier les permissions
@@ -351,33 +724,22 @@ async def list_appointments(
         appointment_repository = container.appointment_repository()
         
         # Récupérer les rendez-vous
-        appointments = await appointment_repository.list_all(skip, limit)
-        total = await appointment_repository.count()
-        
-        # Convertir en DTOs
-        appointment_dtos = [
-            AppointmentResponseDTO(
-                id=appointment.id,
-                patient_id=appointment.patient_id,
-                doctor_id=appointment.doctor_id,
-                start_time=appointment.start_time,
-                end_time=appointment.end_time,
-                status=appointment.status.value,
-                reason=appointment.reason,
-                notes=appointment.notes,
-                created_at=appointment.created_at,
-                updated_at=appointment.updated_at,
-                is_active=appointment.is_active
-            )
-            for appointment in appointments
-        ]
-        
-        # Construire la réponse
-        return AppointmentListResponseDTO(
-            appointments=appointment_dtos,
-            total=total,
-            skip=skip,
-            limit=limit
+        page = await appointment_repository.list_page(cursor, limit, count=count, skip=skip)
+        appointments, next_cursor, total = page.items, page.next_cursor, page.total
+        
+        # Construire la réponse, sérialisée sans revalidation des entités
+        return ORJSONResponse({
+            "appointments": APPOINTMENT_SERIALIZER.many(appointments),
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "next_cursor": next_cursor
+        })
+        
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
         
     except Exception as e:
@@ -1,10 +1,13 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple, AsyncIterator
 from uuid import UUID
 from datetime import datetime, date
 from copy import deepcopy
 
-from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.entities.appointment import Appointment, BLOCKING_STATUSES
+from appointment_management.domain.entities.appointment_stats import DailyAppointmentStats
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from shared.domain.entities.cursor_page import CursorPage, decode_cursor
+from shared.domain.enums.count_mode import CountMode
 
 class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
     """
@@ -86,9 +89,51 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         Returns:
             List[Appointment]: La liste des rendez-vous
         """
-        appointments = list(self.appointments.values())
+        appointments = sorted(
+            self.appointments.values(),
+            key=lambda appointment: (appointment.start_time, appointment.id),
+            reverse=True
+        )
         return [deepcopy(appointment) for appointment in appointments[skip:skip + limit]]
     
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[Appointment]:
+        """
+        Liste les rendez-vous par page, du plus récent au plus ancien.
+        
+        Args:
+            cursor: Le curseur renvoyé par la page précédente
+            limit: Le nombre maximum de rendez-vous à retourner
+            patient_id: Filtre optionnel sur le patient
+            doctor_id: Filtre optionnel sur le médecin
+            count: Le mode de calcul du total (toujours exact en mémoire)
+            skip: Le nombre de rendez-vous à sauter
+            
+        Returns:
+            CursorPage[Appointment]: La page de rendez-vous, le curseur suivant et le total
+        """
+        key = lambda appointment: (appointment.start_time, appointment.id)
+        appointments = [
+            appointment for appointment in self.appointments.values()
+            if (patient_id is None or appointment.patient_id == patient_id)
+            and (doctor_id is None or appointment.doctor_id == doctor_id)
+        ]
+        appointments.sort(key=key, reverse=True)
+        total = None if count == CountMode.NONE else len(appointments)
+        
+        if cursor:
+            last_key = tuple(decode_cursor(cursor, datetime.fromisoformat, UUID))
+            appointments = [appointment for appointment in appointments if key(appointment) < last_key]
+        
+        return CursorPage.from_rows(appointments[skip:skip + limit + 1], limit, key=key, mapper=deepcopy, total=total)
+    
     async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
         Récupère les rendez-vous d'un patient.
@@ -150,6 +195,190 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         ]
         return [deepcopy(appointment) for appointment in date_range_appointments[skip:skip + limit]]
     
+    async def get_by_date_range_page(
+        self,
+        start_date: date,
+        end_date: date,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> CursorPage[Appointment]:
+        """
+        Récupère par page les rendez-vous actifs dans une plage de dates, par ordre chronologique.
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin
+            cursor: Le curseur renvoyé par la page précédente
+            limit: Le nombre maximum de rendez-vous à retourner
+            
+        Returns:
+            CursorPage[Appointment]: La page de rendez-vous et le curseur suivant
+        """
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+        
+        key = lambda appointment: (appointment.start_time, appointment.id)
+        appointments = sorted(
+            (
+                appointment for appointment in self.appointments.values()
+                if appointment.is_active
+                and appointment.start_time <= end_datetime
+                and appointment.end_time >= start_datetime
+            ),
+            key=key
+        )
+        
+        if cursor:
+            last_key = tuple(decode_cursor(cursor, datetime.fromisoformat, UUID))
+            appointments = [appointment for appointment in appointments if key(appointment) > last_key]
+        
+        return CursorPage.from_rows(appointments[:limit + 1], limit, key=key, mapper=deepcopy)
+    
+    async def stream_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        batch_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        """
+        Parcourt les rendez-vous actifs d'une plage de dates, par ordre chronologique.
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin (incluse)
+            batch_size: Sans effet en mémoire
+            
+        Returns:
+            AsyncIterator[Appointment]: Les rendez-vous de la plage
+        """
+        page = await self.get_by_date_range_page(start_date, end_date, limit=len(self.appointments))
+        for appointment in page.items:
+            yield appointment
+    
+    async def has_conflict(
+        self,
+        doctor_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_appointment_id: Optional[UUID] = None
+    ) -> bool:
+        """
+        Vérifie si un médecin a déjà un rendez-vous actif qui chevauche un créneau.
+        
+        Args:
+            doctor_id: L'ID du médecin
+            start_time: L'heure de début du créneau
+            end_time: L'heure de fin du créneau
+            exclude_appointment_id: L'ID du rendez-vous à ignorer (pour les mises à jour)
+            
+        Returns:
+            bool: True si le créneau est déjà occupé, False sinon
+        """
+        return any(
+            appointment.doctor_id == doctor_id
+            and appointment.id != exclude_appointment_id
+            and appointment.status in BLOCKING_STATUSES
+            and appointment.start_time < end_time
+            and appointment.end_time > start_time
+            for appointment in self.appointments.values()
+        )
+    
+    async def get_blocking_in_range(
+        self,
+        doctor_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Appointment]:
+        """
+        Récupère les rendez-vous actifs de plusieurs médecins qui chevauchent une plage horaire.
+        
+        Args:
+            doctor_ids: Les IDs des médecins
+            start_time: Le début de la plage
+            end_time: La fin de la plage
+            
+        Returns:
+            List[Appointment]: Les rendez-vous qui occupent un créneau de la plage
+        """
+        doctors = set(doctor_ids)
+        return [
+            deepcopy(appointment)
+            for appointment in self.appointments.values()
+            if appointment.doctor_id in doctors
+            and appointment.status in BLOCKING_STATUSES
+            and appointment.start_time < end_time
+            and appointment.end_time > start_time
+        ]
+    
+    async def get_busy_intervals(
+        self,
+        doctor_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Tuple[UUID, datetime, datetime]]:
+        """
+        Récupère les plages occupées par les rendez-vous actifs qui chevauchent une plage horaire.
+        
+        Args:
+            doctor_ids: Les IDs des médecins
+            start_time: Le début de la plage
+            end_time: La fin de la plage
+            
+        Returns:
+            List[Tuple[UUID, datetime, datetime]]: Les plages occupées, triées par début
+        """
+        return sorted(
+            (
+                (appointment.doctor_id, appointment.start_time, appointment.end_time)
+                for appointment in await self.get_blocking_in_range(doctor_ids, start_time, end_time)
+            ),
+            key=lambda interval: interval[1]
+        )
+    
+    async def bulk_create(self, appointments: List[Appointment]) -> List[Appointment]:
+        """
+        Crée plusieurs rendez-vous.
+        
+        Args:
+            appointments: Les rendez-vous à créer
+            
+        Returns:
+            List[Appointment]: Les rendez-vous créés
+        """
+        for appointment in appointments:
+            self.appointments[appointment.id] = deepcopy(appointment)
+        return [deepcopy(appointment) for appointment in appointments]
+    
+    async def get_daily_stats(
+        self,
+        start_date: date,
+        end_date: date,
+        doctor_id: Optional[UUID] = None
+    ) -> List[DailyAppointmentStats]:
+        """
+        Calcule les agrégats des rendez-vous actifs par médecin, jour et statut.
+        
+        Args:
+            start_date: La date de début
+            end_date: La date de fin (incluse)
+            doctor_id: Restreindre à un médecin (tous les médecins sinon)
+            
+        Returns:
+            List[DailyAppointmentStats]: Les agrégats, triés par médecin puis par jour
+        """
+        stats: Dict[Tuple, DailyAppointmentStats] = {}
+        for appointment in self.appointments.values():
+            day = appointment.start_time.date()
+            if not appointment.is_active or not start_date <= day <= end_date:
+                continue
+            if doctor_id and appointment.doctor_id != doctor_id:
+                continue
+            key = (appointment.doctor_id, day, appointment.status)
+            entry = stats.setdefault(key, DailyAppointmentStats(appointment.doctor_id, day, appointment.status, 0, 0))
+            entry.appointment_count += 1
+            entry.booked_minutes += appointment.duration_minutes
+        return sorted(stats.values(), key=lambda entry: (str(entry.doctor_id), entry.day, entry.status.value))
+    
     async def count(self) -> int:
         """
         Compte le nombre total de rendez-vous.
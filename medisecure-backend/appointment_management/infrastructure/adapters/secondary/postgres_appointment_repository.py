@@ -1,19 +1,30 @@
 # medisecure-backend/appointment_management/infrastructure/adapters/secondary/postgres_appointment_repository.py
-from typing import Optional, List
+from typing import Optional, List, Tuple, AsyncIterator
 from uuid import UUID
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete, and_, or_, func, text
+from sqlalchemy import update, delete, insert, and_, or_, func, text, tuple_, exists
+from sqlalchemy.exc import IntegrityError
 import logging
 
 from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.entities.appointment_stats import DailyAppointmentStats
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
-from shared.infrastructure.database.models.appointment_model import AppointmentModel
+from shared.infrastructure.database.models.appointment_model import AppointmentModel, BLOCKING_STATUS_CLAUSE
+from shared.infrastructure.database.models.appointment_stats_model import AppointmentDailyStatsModel
+from shared.infrastructure.database.unit_of_work import commit_or_flush
+from shared.infrastructure.database.read_routing import select_read_factory
+from shared.infrastructure.monitoring.timing import timed_methods
+from shared.domain.entities.cursor_page import CursorPage, decode_cursor
+from shared.domain.enums.count_mode import CountMode
+from shared.infrastructure.database.counting import total_column, execute_with_total
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+@timed_methods("repository")
 class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
 
     @staticmethod
@@ -40,19 +51,21 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
     Implémente le port AppointmentRepositoryProtocol.
     """
     
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, read_session_factory=None):
         """
         Initialise le repository avec une factory de session SQLAlchemy.
         
         Args:
             session_factory: La factory de session SQLAlchemy à utiliser
+            read_session_factory: La factory des lectures (réplica si disponible), session_factory par défaut
         """
         self.session_factory = session_factory
+        self.read_session_factory = select_read_factory(session_factory, read_session_factory)
     
     async def get_by_id(self, appointment_id: UUID) -> Optional[Appointment]:
         try:
             logger.debug(f"Récupération du rendez-vous avec ID: {appointment_id}")
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 query = select(AppointmentModel).where(AppointmentModel.id == appointment_id)
                 result = await session.execute(query)
                 appointment_model = result.scalar_one_or_none()
@@ -95,7 +108,11 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
                 )
                 
                 session.add(appointment_model)
-                await session.commit()
+                try:
+                    await commit_or_flush(session)
+                except IntegrityError as e:
+                    self._raise_if_overlap(e, appointment)
+                    raise
                 await session.refresh(appointment_model)
                 
                 logger.info(f"Rendez-vous créé avec succès: {appointment_model.id}")
@@ -148,15 +165,19 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             
             # Exécuter la mise à jour
             try:
-                await self.session.execute(query)
-                await self.session.commit()
+                async with self.session_factory() as session:
+                    try:
+                        await session.execute(query)
+                        await commit_or_flush(session)
+                    except IntegrityError as e:
+                        self._raise_if_overlap(e, appointment)
+                        raise
                 
                 # Récupérer le rendez-vous mis à jour
                 updated_appointment = await self.get_by_id(appointment.id)
                 logger.info(f"Rendez-vous {appointment.id} mis à jour avec succès")
                 return updated_appointment
             except Exception as e:
-                await self.session.rollback()
                 logger.error(f"Erreur lors de la mise à jour en base de données: {str(e)}")
                 raise
                 
@@ -188,8 +209,9 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             
             # Exécuter la suppression
             try:
-                result = await self.session.execute(query)
-                await self.session.commit()
+                async with self.session_factory() as session:
+                    result = await session.execute(query)
+                    await commit_or_flush(session)
                 
                 if result.rowcount == 0:
                     logger.warning(f"Aucune ligne affectée lors de la suppression du rendez-vous {appointment_id}")
@@ -198,7 +220,6 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
                 logger.info(f"Rendez-vous {appointment_id} supprimé avec succès")
                 return True
             except Exception as e:
-                await self.session.rollback()
                 logger.error(f"Erreur lors de la suppression en base de données: {str(e)}")
                 raise
                 
@@ -211,10 +232,15 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             logger.debug(f"Liste de tous les rendez-vous (skip={skip}, limit={limit})")
             
             # Construire la requête avec pagination
-            query = select(AppointmentModel).order_by(AppointmentModel.start_time.desc()).offset(skip).limit(limit)
+            query = (
+                select(AppointmentModel)
+                .order_by(AppointmentModel.start_time.desc(), AppointmentModel.id.desc())
+                .offset(skip)
+                .limit(limit)
+            )
             
             # Exécuter la requête
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 result = await session.execute(query)
                 appointment_models = result.scalars().all()
             
@@ -224,6 +250,63 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             logger.exception(f"Erreur lors de la récupération de la liste des rendez-vous: {str(e)}")
             raise
     
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[Appointment]:
+        try:
+            logger.debug(f"Récupération d'une page de rendez-vous (cursor={cursor}, limit={limit}, patient_id={patient_id}, doctor_id={doctor_id}, count={count})")
+            
+            filters = []
+            if patient_id:
+                filters.append(AppointmentModel.patient_id == patient_id)
+            if doctor_id:
+                filters.append(AppointmentModel.doctor_id == doctor_id)
+            
+            query = (
+                select(AppointmentModel)
+                .where(*filters)
+                .order_by(AppointmentModel.start_time.desc(), AppointmentModel.id.desc())
+            )
+            
+            # Reprendre avant la clé de tri du dernier rendez-vous de la page précédente
+            if cursor:
+                last_start, last_id = decode_cursor(cursor, datetime.fromisoformat, UUID)
+                query = query.where(
+                    tuple_(AppointmentModel.start_time, AppointmentModel.id) < tuple_(last_start, last_id)
+                )
+            
+            # Lire une ligne de plus pour savoir s'il existe une page suivante
+            query = query.offset(skip).limit(limit + 1)
+            
+            # Le total porte sur les mêmes filtres, sans le curseur
+            total = total_column(
+                select(func.count()).select_from(AppointmentModel).where(*filters),
+                AppointmentModel.__tablename__,
+                count,
+                filtered=bool(filters)
+            )
+            
+            async with self.read_session_factory() as session:
+                appointment_models, total_count = await execute_with_total(session, query, total)
+            
+            logger.debug(f"Nombre de rendez-vous récupérés: {min(len(appointment_models), limit)} (total: {total_count})")
+            return CursorPage.from_rows(
+                appointment_models,
+                limit,
+                key=lambda model: (model.start_time, model.id),
+                mapper=self._map_to_entity,
+                total=total_count
+            )
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération d'une page de rendez-vous: {str(e)}")
+            raise
+    
     async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
         try:
             logger.debug(f"Récupération des rendez-vous du patient {patient_id}")
@@ -241,7 +324,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             )
             
             # Exécuter la requête
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 result = await session.execute(query)
                 appointment_models = result.scalars().all()
             
@@ -268,7 +351,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             )
             
             # Exécuter la requête
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 result = await session.execute(query)
                 appointment_models = result.scalars().all()
             
@@ -311,7 +394,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             )
             
             # Exécuter la requête
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 result = await session.execute(query)
                 appointment_models = result.scalars().all()
             
@@ -321,10 +404,270 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             logger.exception(f"Erreur lors de la récupération des rendez-vous par plage de dates: {str(e)}")
             raise
     
+    async def get_by_date_range_page(
+        self,
+        start_date: date,
+        end_date: date,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> CursorPage[Appointment]:
+        try:
+            logger.debug(f"Récupération d'une page de rendez-vous entre {start_date} et {end_date} (cursor={cursor})")
+            
+            start_datetime = datetime.combine(start_date, datetime.min.time())
+            end_datetime = datetime.combine(end_date, datetime.max.time())
+            
+            # Un rendez-vous chevauche la plage s'il commence avant sa fin et se termine après son début.
+            # Le filtre sur is_active reprend le prédicat de l'index partiel du calendrier.
+            query = (
+                select(AppointmentModel)
+                .where(
+                    AppointmentModel.is_active == True,
+                    AppointmentModel.start_time <= end_datetime,
+                    AppointmentModel.end_time >= start_datetime
+                )
+                .order_by(AppointmentModel.start_time, AppointmentModel.id)
+            )
+            
+            if cursor:
+                last_start, last_id = decode_cursor(cursor, datetime.fromisoformat, UUID)
+                query = query.where(
+                    tuple_(AppointmentModel.start_time, AppointmentModel.id) > tuple_(last_start, last_id)
+                )
+            
+            query = query.limit(limit + 1)
+            
+            async with self.read_session_factory() as session:
+                result = await session.execute(query)
+                appointment_models = result.scalars().all()
+            
+            logger.debug(f"Nombre de rendez-vous récupérés entre {start_date} et {end_date}: {min(len(appointment_models), limit)}")
+            return CursorPage.from_rows(
+                appointment_models,
+                limit,
+                key=lambda model: (model.start_time, model.id),
+                mapper=self._map_to_entity
+            )
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération d'une page de rendez-vous par plage de dates: {str(e)}")
+            raise
+    
+    async def stream_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        batch_size: int = 500
+    ) -> AsyncIterator[Appointment]:
+        logger.debug(f"Lecture en flux des rendez-vous entre {start_date} et {end_date}")
+        
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+        
+        # Même prédicat et même ordre que la pagination du calendrier (index partiel)
+        query = (
+            select(AppointmentModel)
+            .where(
+                AppointmentModel.is_active == True,
+                AppointmentModel.start_time <= end_datetime,
+                AppointmentModel.end_time >= start_datetime
+            )
+            .order_by(AppointmentModel.start_time, AppointmentModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        
+        count = 0
+        try:
+            async with self.read_session_factory() as session:
+                # Curseur côté serveur : les lignes arrivent par lots de batch_size
+                result = await session.stream(query)
+                async for models in result.scalars().partitions():
+                    for model in models:
+                        yield self._map_to_entity(model)
+                    # La session ne garde que des références faibles : les lots déjà
+                    # envoyés sont libérés au fil de l'eau
+                    count += len(models)
+        except Exception as e:
+            logger.exception(f"Erreur lors de la lecture en flux des rendez-vous: {str(e)}")
+            raise
+        
+        logger.debug(f"{count} rendez-vous lus en flux entre {start_date} et {end_date}")
+    
+    async def has_conflict(
+        self,
+        doctor_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_appointment_id: Optional[UUID] = None
+    ) -> bool:
+        try:
+            logger.debug(f"Recherche de conflit pour le médecin {doctor_id} entre {start_time} et {end_time}")
+            
+            # Même expression et même prédicat que la contrainte d'exclusion,
+            # pour que la requête soit servie par son index GiST
+            conditions = [
+                AppointmentModel.doctor_id == doctor_id,
+                text(BLOCKING_STATUS_CLAUSE),
+                func.tsrange(AppointmentModel.start_time, AppointmentModel.end_time, text("'[)'")).op("&&")(
+                    func.tsrange(start_time, end_time, text("'[)'"))
+                )
+            ]
+            if exclude_appointment_id:
+                conditions.append(AppointmentModel.id != exclude_appointment_id)
+            
+            query = select(exists().where(*conditions))
+            
+            async with self.session_factory() as session:
+                result = await session.execute(query)
+                conflict = bool(result.scalar())
+            
+            logger.debug(f"Conflit détecté: {conflict}")
+            return conflict
+        except Exception as e:
+            logger.exception(f"Erreur lors de la recherche de conflit pour le médecin {doctor_id}: {str(e)}")
+            raise
+    
+    async def get_blocking_in_range(
+        self,
+        doctor_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Appointment]:
+        if not doctor_ids:
+            return []
+        
+        try:
+            logger.debug(f"Recherche des rendez-vous actifs de {len(set(doctor_ids))} médecins entre {start_time} et {end_time}")
+            
+            # Même expression et même prédicat que la contrainte d'exclusion (index GiST)
+            query = select(AppointmentModel).where(
+                AppointmentModel.doctor_id.in_(set(doctor_ids)),
+                text(BLOCKING_STATUS_CLAUSE),
+                func.tsrange(AppointmentModel.start_time, AppointmentModel.end_time, text("'[)'")).op("&&")(
+                    func.tsrange(start_time, end_time, text("'[)'"))
+                )
+            )
+            
+            async with self.session_factory() as session:
+                result = await session.execute(query)
+                appointments = [self._map_to_entity(model) for model in result.scalars().all()]
+            
+            logger.debug(f"{len(appointments)} rendez-vous actifs trouvés dans la plage")
+            return appointments
+        except Exception as e:
+            logger.exception(f"Erreur lors de la recherche des rendez-vous actifs: {str(e)}")
+            raise
+    
+    async def get_busy_intervals(
+        self,
+        doctor_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Tuple[UUID, datetime, datetime]]:
+        if not doctor_ids:
+            return []
+        
+        try:
+            # Seules les trois colonnes utiles sont lues, sans construire d'entités
+            query = (
+                select(AppointmentModel.doctor_id, AppointmentModel.start_time, AppointmentModel.end_time)
+                .where(
+                    AppointmentModel.doctor_id.in_(set(doctor_ids)),
+                    text(BLOCKING_STATUS_CLAUSE),
+                    func.tsrange(AppointmentModel.start_time, AppointmentModel.end_time, text("'[)'")).op("&&")(
+                        func.tsrange(start_time, end_time, text("'[)'"))
+                    )
+                )
+                .order_by(AppointmentModel.start_time)
+            )
+            
+            async with self.read_session_factory() as session:
+                result = await session.execute(query)
+                return [tuple(row) for row in result.all()]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la recherche des plages occupées: {str(e)}")
+            raise
+    
+    async def bulk_create(self, appointments: List[Appointment]) -> List[Appointment]:
+        if not appointments:
+            return []
+        
+        try:
+            logger.info(f"Création de {len(appointments)} rendez-vous en une seule insertion")
+            rows = [
+                {
+                    "id": appointment.id,
+                    "patient_id": appointment.patient_id,
+                    "doctor_id": appointment.doctor_id,
+                    "start_time": appointment.start_time,
+                    "end_time": appointment.end_time,
+                    "status": appointment.status.value,
+                    "reason": appointment.reason,
+                    "notes": appointment.notes,
+                    "created_at": appointment.created_at,
+                    "updated_at": appointment.updated_at,
+                    "is_active": appointment.is_active
+                }
+                for appointment in appointments
+            ]
+            
+            async with self.session_factory() as session:
+                # Un seul INSERT ... VALUES (...), (...) : tout le lot ou rien
+                try:
+                    await session.execute(insert(AppointmentModel).values(rows))
+                    await commit_or_flush(session)
+                except IntegrityError as e:
+                    # Une réservation concurrente a pris un des créneaux entre la vérification
+                    # et l'insertion : le lot entier est refusé
+                    self._raise_if_overlap(e, appointments[0])
+                    raise
+            
+            logger.info(f"{len(appointments)} rendez-vous créés avec succès")
+            return appointments
+        except Exception as e:
+            logger.exception(f"Erreur lors de la création des rendez-vous en masse: {str(e)}")
+            raise
+    
+    async def get_daily_stats(
+        self,
+        start_date: date,
+        end_date: date,
+        doctor_id: Optional[UUID] = None
+    ) -> List[DailyAppointmentStats]:
+        try:
+            # Lecture des agrégats tenus à jour par trigger : une ligne par médecin, jour
+            # et statut, au lieu de l'ensemble des rendez-vous de la période
+            query = (
+                select(AppointmentDailyStatsModel)
+                .where(
+                    AppointmentDailyStatsModel.day >= start_date,
+                    AppointmentDailyStatsModel.day <= end_date,
+                    AppointmentDailyStatsModel.appointment_count > 0
+                )
+                .order_by(AppointmentDailyStatsModel.doctor_id, AppointmentDailyStatsModel.day)
+            )
+            if doctor_id:
+                query = query.where(AppointmentDailyStatsModel.doctor_id == doctor_id)
+            
+            async with self.read_session_factory() as session:
+                result = await session.execute(query)
+                return [
+                    DailyAppointmentStats(
+                        doctor_id=model.doctor_id,
+                        day=model.day,
+                        status=self._map_status(model.status),
+                        appointment_count=model.appointment_count,
+                        booked_minutes=model.booked_minutes
+                    )
+                    for model in result.scalars().all()
+                ]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la lecture des agrégats de rendez-vous: {str(e)}")
+            raise
+    
     async def count(self) -> int:
         try:
             logger.debug("Comptage du nombre total de rendez-vous")
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 query = select(func.count()).select_from(AppointmentModel)
                 result = await session.execute(query)
                 count = result.scalar_one_or_none() or 0
@@ -334,9 +677,23 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             logger.exception(f"Erreur lors du comptage des rendez-vous: {str(e)}")
             raise
     
+    @staticmethod
+    def _raise_if_overlap(error: IntegrityError, appointment: Appointment) -> None:
+        """
+        Traduit une violation de la contrainte d'exclusion en exception du domaine.
+        Les autres erreurs d'intégrité sont laissées à l'appelant.
+        """
+        if "appointments_doctor_no_overlap" in str(error.orig):
+            logger.warning(f"Chevauchement refusé par la base pour le médecin {appointment.doctor_id}")
+            raise AppointmentConflictException(
+                appointment.doctor_id,
+                appointment.start_time,
+                appointment.end_time
+            ) from error
+    
     def _map_to_entity(self, appointment_model: AppointmentModel) -> Appointment:
         try:
-            logger.warning(f"[READ] Status lu depuis la BDD: {getattr(appointment_model, 'status', None)}")
+            logger.debug(f"[READ] Status lu depuis la BDD: {getattr(appointment_model, 'status', None)}")
             # Conversion robuste du statut
             status = self._map_status(appointment_model.status)
             return Appointment(
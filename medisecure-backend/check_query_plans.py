@@ -0,0 +1,37 @@
+# medisecure-backend/check_query_plans.py
+#!/usr/bin/env python
+"""
+Vérifie que les requêtes fréquentes de l'application s'appuient sur un index.
+Utilisation : python check_query_plans.py (après alembic upgrade head)
+"""
+
+import asyncio
+import sys
+
+from shared.infrastructure.database.engine_registry import engine_registry, get_engine
+from shared.infrastructure.database.query_plans import HOT_QUERIES, check_hot_queries
+
+async def check_query_plans() -> int:
+    """
+    Analyse le plan de chaque requête fréquente et affiche celles en défaut.
+
+    Returns:
+        int: Le code de sortie (1 si une requête fait encore un parcours séquentiel)
+    """
+    try:
+        flagged = await check_hot_queries(get_engine())
+    finally:
+        await engine_registry.dispose()
+
+    for query in HOT_QUERIES:
+        tables = flagged.get(query.name)
+        print(f"{'SEQ SCAN' if tables else 'OK':<9} {query.name}" + (f" ({', '.join(tables)})" if tables else ""))
+
+    return 1 if flagged else 0
+
+def main():
+    """Fonction principale du script."""
+    sys.exit(asyncio.run(check_query_plans()))
+
+if __name__ == "__main__":
+    main()
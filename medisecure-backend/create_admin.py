@@ -4,6 +4,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from shared.services.authenticator.basic_authenticator import BasicAuthenticator
+from shared.infrastructure.services.password_hasher import get_password_hasher
 from shared.infrastructure.database.models.user_model import UserModel, UserRole
 
 def create_admin_user():
@@ -24,8 +25,8 @@ def create_admin_user():
         admin_password = 'Admin123!'
         admin_id = uuid.uuid4()
         
-        # Générer le hash du mot de passe
-        hashed_password = authenticator.get_password_hash(admin_password)
+        # Générer le hash du mot de passe (pool de hachage partagé avec l'API)
+        hashed_password = get_password_hasher().hash_blocking(admin_password)
         
         # Créer l'utilisateur admin
         admin_user = UserModel(
@@ -67,6 +68,7 @@ def create_admin_user():
         print(f'Erreur lors de la création de l\'utilisateur admin: {str(e)}')
     finally:
         session.close()
+        get_password_hasher().shutdown()
 
 if __name__ == '__main__':
     create_admin_user()
\ No newline at end of file
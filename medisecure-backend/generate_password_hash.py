@@ -5,10 +5,11 @@ Script pour générer des hash de mots de passe compatibles avec bcrypt.
 Utilisation : python generate_password_hash.py
 """
 
-import bcrypt
 import sys
 from passlib.context import CryptContext
 
+from shared.infrastructure.services.password_hasher import get_password_hasher
+
 def generate_password_hash(password: str) -> str:
     """
     Génère un hash bcrypt pour un mot de passe donné.
@@ -19,17 +20,16 @@ def generate_password_hash(password: str) -> str:
     Returns:
         str: Le hash du mot de passe
     """
-    # Méthode 1 : Utiliser bcrypt directement
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    hash_string = hashed.decode('utf-8')
+    # Méthode 1 : Utiliser le pool de hachage bcrypt (comme dans l'application)
+    hasher = get_password_hasher()
+    hash_string = hasher.hash_blocking(password)
     
-    # Méthode 2 : Utiliser passlib (comme dans l'application)
+    # Méthode 2 : Utiliser passlib (comme BasicAuthenticator)
     pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     hash_passlib = pwd_context.hash(password)
     
     # Vérifier que les deux méthodes fonctionnent
-    verify_bcrypt = bcrypt.checkpw(password.encode('utf-8'), hashed)
+    verify_bcrypt = hasher.verify_blocking(password, hash_string)
     verify_passlib = pwd_context.verify(password, hash_passlib)
     
     print(f"\n=== Génération de hash pour le mot de passe : {password} ===")
@@ -60,7 +60,7 @@ def verify_password_hash(password: str, hashed_password: str) -> bool:
     """
     try:
         # Méthode 1 : bcrypt
-        is_valid_bcrypt = bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+        is_valid_bcrypt = get_password_hasher().verify_blocking(password, hashed_password)
         
         # Méthode 2 : passlib
         pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -101,4 +101,7 @@ def main():
         print(f"\nUPDATE users SET hashed_password = '{hash_pwd}' WHERE email = '{email}';")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    finally:
+        get_password_hasher().shutdown()
\ No newline at end of file
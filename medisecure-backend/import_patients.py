@@ -0,0 +1,68 @@
+# medisecure-backend/import_patients.py
+#!/usr/bin/env python
+"""
+Script d'import en masse de patients depuis un fichier CSV ou NDJSON.
+Utilisation : python import_patients.py patients.csv [--format csv|ndjson] [--batch-size 5000]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from shared.container.container import Container
+from shared.infrastructure.database.engine_registry import engine_registry
+from patient_management.application.usecases.import_patients_usecase import ImportPatientsUseCase
+from patient_management.infrastructure.adapters.primary.patient_import_reader import detect_format, read_patient_rows
+
+async def import_patients(path: str, file_format: str, batch_size: int) -> int:
+    """
+    Importe les patients d'un fichier et affiche le rapport.
+
+    Args:
+        path: Le chemin du fichier à importer
+        file_format: Le format du fichier ("csv" ou "ndjson")
+        batch_size: Le nombre de lignes chargées par lot
+
+    Returns:
+        int: Le code de sortie (1 si des lignes ont été rejetées)
+    """
+    container = Container()
+
+    try:
+        # Tous les lots dans une seule transaction : un échec n'importe rien
+        async with container.unit_of_work() as uow:
+            use_case = ImportPatientsUseCase(
+                patient_repository=container.patient_repository(session_factory=uow),
+                patient_service=container.patient_service(),
+                id_generator=container.id_generator(),
+                batch_size=batch_size
+            )
+            with open(path, "rb") as stream:
+                report = await use_case.execute(read_patient_rows(stream, file_format))
+    finally:
+        await engine_registry.dispose()
+
+    print(f"Lignes lues : {report.total_rows}")
+    print(f"Patients importés : {report.imported}")
+    print(f"Lignes rejetées : {report.rejected}")
+    for error in report.errors:
+        email = f" ({error.email})" if error.email else ""
+        print(f"  ligne {error.row}{email} : {error.error}")
+    if report.rejected > len(report.errors):
+        print(f"  ... {report.rejected - len(report.errors)} autres erreurs non affichées")
+
+    return 1 if report.rejected else 0
+
+def main():
+    """Fonction principale du script."""
+    parser = argparse.ArgumentParser(description="Import en masse de patients MediSecure")
+    parser.add_argument("path", help="Fichier CSV (avec en-tête) ou NDJSON à importer")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Format du fichier (déduit de l'extension par défaut)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Nombre de lignes chargées par lot")
+    args = parser.parse_args()
+
+    file_format = detect_format(args.path, args.format)
+    sys.exit(asyncio.run(import_patients(args.path, file_format, args.batch_size)))
+
+if __name__ == "__main__":
+    main()
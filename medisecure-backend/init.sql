@@ -2,12 +2,19 @@
 -- Script d'initialisation de la base de données MediSecure
 
 -- Suppression des types et tables existants pour une réinitialisation propre
+DROP TABLE IF EXISTS email_outbox CASCADE;
+DROP TABLE IF EXISTS appointment_daily_stats CASCADE;
 DROP TABLE IF EXISTS appointments CASCADE;
 DROP TABLE IF EXISTS patients CASCADE;
 DROP TABLE IF EXISTS users CASCADE;
 DROP TYPE IF EXISTS appointmentstatus CASCADE;
 DROP TYPE IF EXISTS userrole CASCADE;
 
+-- Extension nécessaire aux index trigrammes de la recherche de patients
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+-- Extension nécessaire à la contrainte d'exclusion des rendez-vous
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
 -- Création des types enum
 CREATE TYPE userrole AS ENUM ('ADMIN', 'DOCTOR', 'NURSE', 'PATIENT', 'RECEPTIONIST');
 CREATE TYPE appointmentstatus AS ENUM ('SCHEDULED', 'CONFIRMED', 'CANCELLED', 'COMPLETED', 'missed');
@@ -51,7 +58,12 @@ CREATE TABLE patients (
   notes TEXT,
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-  is_active BOOLEAN DEFAULT TRUE
+  is_active BOOLEAN DEFAULT TRUE,
+  -- Colonnes de recherche calculées (voir alembic/versions/3c1f8a2d9b47)
+  search_name TEXT GENERATED ALWAYS AS (lower(first_name || ' ' || last_name)) STORED,
+  phone_digits TEXT GENERATED ALWAYS AS (regexp_replace(coalesce(phone_number, ''), '[^0-9]', '', 'g')) STORED,
+  search_email TEXT GENERATED ALWAYS AS (lower(coalesce(email, ''))) STORED,
+  search_vector TSVECTOR GENERATED ALWAYS AS (to_tsvector('simple', first_name || ' ' || last_name || ' ' || coalesce(email, ''))) STORED
 );
 
 -- Création de la table appointments
@@ -67,17 +79,61 @@ CREATE TABLE appointments (
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   is_active BOOLEAN DEFAULT TRUE,
-  CONSTRAINT check_appointment_times CHECK (end_time > start_time)
+  CONSTRAINT check_appointment_times CHECK (end_time > start_time),
+  -- Un médecin ne peut pas avoir deux rendez-vous actifs qui se chevauchent
+  CONSTRAINT appointments_doctor_no_overlap EXCLUDE USING gist (
+    doctor_id WITH =,
+    tsrange(start_time, end_time, '[)') WITH &&
+  ) WHERE (status IN ('SCHEDULED', 'CONFIRMED'))
+);
+
+-- Agrégats des rendez-vous actifs par médecin, jour et statut (tableaux de bord),
+-- tenus à jour par le trigger refresh_appointment_daily_stats
+CREATE TABLE appointment_daily_stats (
+  doctor_id UUID NOT NULL,
+  day DATE NOT NULL,
+  status appointmentstatus NOT NULL,
+  appointment_count INTEGER NOT NULL DEFAULT 0,
+  booked_minutes INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (doctor_id, day, status)
+);
+
+-- Boîte d'envoi des emails, vidée en arrière-plan par le worker d'envoi
+CREATE TABLE email_outbox (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  to_email VARCHAR(255) NOT NULL,
+  cc VARCHAR[] NOT NULL DEFAULT '{}',
+  bcc VARCHAR[] NOT NULL DEFAULT '{}',
+  subject VARCHAR(255) NOT NULL,
+  body TEXT NOT NULL,
+  html_body TEXT,
+  status VARCHAR(20) NOT NULL DEFAULT 'PENDING',
+  attempts INTEGER NOT NULL DEFAULT 0,
+  next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  last_error TEXT,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  sent_at TIMESTAMP
 );
 
 -- Création des index pour améliorer les performances
 CREATE INDEX idx_users_email ON users(email);
 CREATE INDEX idx_patients_email ON patients(email);
 CREATE INDEX idx_patients_user_id ON patients(user_id);
-CREATE INDEX idx_appointments_patient_id ON appointments(patient_id);
-CREATE INDEX idx_appointments_doctor_id ON appointments(doctor_id);
+CREATE INDEX idx_patients_search_vector ON patients USING gin (search_vector);
+CREATE INDEX idx_patients_search_name_trgm ON patients USING gin (search_name gin_trgm_ops);
+CREATE INDEX idx_patients_phone_digits_trgm ON patients USING gin (phone_digits gin_trgm_ops);
+CREATE INDEX idx_patients_search_email_trgm ON patients USING gin (search_email gin_trgm_ops);
+CREATE INDEX idx_patients_last_name ON patients(last_name, id);
+-- Index composites : filtre sur le médecin ou le patient puis tri par date décroissante
+CREATE INDEX idx_appointments_doctor_start ON appointments(doctor_id, start_time DESC, id DESC);
+CREATE INDEX idx_appointments_patient_start ON appointments(patient_id, start_time DESC, id DESC);
 CREATE INDEX idx_appointments_start_time ON appointments(start_time);
+-- Index partiel du calendrier (rendez-vous actifs uniquement)
+CREATE INDEX idx_appointments_active_start ON appointments(start_time, id) WHERE is_active;
 CREATE INDEX idx_appointments_status ON appointments(status);
+CREATE INDEX idx_appointment_daily_stats_day ON appointment_daily_stats(day);
+-- Index partiel de la boîte d'envoi (emails en attente uniquement)
+CREATE INDEX idx_email_outbox_pending ON email_outbox(next_attempt_at) WHERE status = 'PENDING';
 
 -- Création des triggers pour mettre à jour updated_at
 CREATE OR REPLACE FUNCTION update_updated_at()
@@ -103,6 +159,37 @@ CREATE TRIGGER update_appointments_updated_at
   FOR EACH ROW
   EXECUTE FUNCTION update_updated_at();
 
+-- Maintien incrémental des agrégats de rendez-vous
+CREATE OR REPLACE FUNCTION refresh_appointment_daily_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.is_active THEN
+    UPDATE appointment_daily_stats
+       SET appointment_count = appointment_count - 1,
+           booked_minutes = booked_minutes - (EXTRACT(EPOCH FROM (OLD.end_time - OLD.start_time)) / 60)::INTEGER
+     WHERE doctor_id = OLD.doctor_id AND day = OLD.start_time::DATE AND status = OLD.status;
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.is_active THEN
+    INSERT INTO appointment_daily_stats (doctor_id, day, status, appointment_count, booked_minutes)
+    VALUES (
+      NEW.doctor_id, NEW.start_time::DATE, NEW.status, 1,
+      (EXTRACT(EPOCH FROM (NEW.end_time - NEW.start_time)) / 60)::INTEGER
+    )
+    ON CONFLICT (doctor_id, day, status) DO UPDATE
+       SET appointment_count = appointment_daily_stats.appointment_count + 1,
+           booked_minutes = appointment_daily_stats.booked_minutes + EXCLUDED.booked_minutes;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER refresh_appointment_daily_stats
+  AFTER INSERT OR UPDATE OF doctor_id, start_time, end_time, status, is_active OR DELETE ON appointments
+  FOR EACH ROW
+  EXECUTE FUNCTION refresh_appointment_daily_stats();
+
 -- Insertion de l'utilisateur admin avec le bon hash de mot de passe
 -- Le hash correspond au mot de passe "Admin123!"
 INSERT INTO users (id, email, hashed_password, first_name, last_name, role, is_active, created_at, updated_at)
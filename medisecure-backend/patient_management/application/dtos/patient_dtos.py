@@ -3,6 +3,7 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, EmailStr, Field, validator
 from datetime import date, datetime
 from uuid import UUID
+from shared.domain.enums.list_view import ListView
 
 # DTOs pour la création et la mise à jour de patients
 class PatientCreateDTO(BaseModel):
@@ -123,16 +124,60 @@ class PatientResponseDTO(BaseModel):
 class PatientListResponseDTO(BaseModel):
     """DTO pour la réponse avec une liste de patients"""
     patients: List[PatientResponseDTO]
-    total: int
+    # None lorsque le client a demandé count=none
+    total: Optional[int]
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
+
+class PatientSummaryDTO(BaseModel):
+    """DTO pour la réponse avec le résumé d'un patient (vues de liste)"""
+    id: UUID
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    gender: str
+    city: Optional[str] = None
+    phone_number: Optional[str] = None
+    email: Optional[str] = None
+    is_active: bool
+    
+    class Config:
+        orm_mode = True
+
+class PatientSummaryListResponseDTO(BaseModel):
+    """DTO pour la réponse avec une liste de résumés de patients (view=summary)"""
+    patients: List[PatientSummaryDTO]
+    # None lorsque le client a demandé count=none
+    total: Optional[int]
+    skip: int
+    limit: int
+    next_cursor: Optional[str] = None
+
+# DTOs pour l'import en masse
+class PatientImportErrorDTO(BaseModel):
+    """DTO pour une ligne rejetée lors d'un import de patients"""
+    row: int
+    email: Optional[str] = None
+    error: str
+
+class PatientImportReportDTO(BaseModel):
+    """DTO pour le rapport d'un import de patients"""
+    total_rows: int
+    imported: int
+    rejected: int
+    # Limité aux premières erreurs pour garder un rapport de taille raisonnable
+    errors: List[PatientImportErrorDTO]
 
 # DTOs pour la recherche
 class PatientSearchDTO(BaseModel):
     """DTO pour la recherche de patients"""
     name: Optional[str] = None
     date_of_birth: Optional[date] = None
-    email: Optional[EmailStr] = None
+    # Chaîne libre : un début d'adresse suffit (recherche par préfixe)
+    email: Optional[str] = None
     phone: Optional[str] = None
     skip: int = 0
-    limit: int = 100
\ No newline at end of file
+    limit: int = 100
+    # Champs renvoyés : dossiers complets ou résumés
+    view: ListView = ListView.FULL
\ No newline at end of file
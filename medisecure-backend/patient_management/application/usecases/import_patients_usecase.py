@@ -0,0 +1,208 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import asyncio
+import logging
+
+from pydantic import ValidationError
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from patient_management.domain.exceptions.patient_exceptions import PatientAlreadyExistsException
+from patient_management.application.dtos.patient_dtos import (
+    PatientCreateDTO,
+    PatientImportErrorDTO,
+    PatientImportReportDTO
+)
+from shared.domain.exceptions.shared_exceptions import DomainException
+from shared.ports.primary.id_generator_protocol import IdGeneratorProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Une ligne à importer : son numéro dans le fichier et ses données (None si illisible)
+ImportRow = Tuple[int, Optional[Dict[str, Any]]]
+
+# Une ligne rejetée à la validation : son numéro, son email et le motif
+Rejection = Tuple[int, Optional[str], str]
+
+class ImportPatientsUseCase:
+    """
+    Cas d'utilisation pour l'import en masse de patients.
+    Les lignes sont validées et chargées par lots : une requête pour les
+    emails déjà utilisés et un COPY par lot, quelle que soit sa taille.
+
+    La lecture et la validation d'un lot (entrées/sorties fichier et calcul)
+    se font dans un thread pour ne pas bloquer la boucle d'événements ; seuls
+    les accès à la base restent sur la boucle. Pour un import tout ou rien,
+    le repository doit être lié à une unité de travail.
+    """
+
+    # Nombre maximum d'erreurs détaillées dans le rapport
+    MAX_REPORTED_ERRORS = 1000
+
+    def __init__(
+        self,
+        patient_repository: PatientRepositoryProtocol,
+        patient_service: PatientService,
+        id_generator: IdGeneratorProtocol,
+        batch_size: int = 5000
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            patient_repository: Le repository des patients
+            patient_service: Le service du domaine pour les patients
+            id_generator: Le générateur d'identifiants
+            batch_size: Le nombre de lignes validées et chargées ensemble
+        """
+        self.patient_repository = patient_repository
+        self.patient_service = patient_service
+        self.id_generator = id_generator
+        self.batch_size = batch_size
+
+    async def execute(self, rows: Iterable[ImportRow]) -> PatientImportReportDTO:
+        """
+        Exécute le cas d'utilisation.
+
+        Args:
+            rows: Les lignes à importer, lues au fil de l'eau
+
+        Returns:
+            PatientImportReportDTO: Le rapport d'import avec les erreurs par ligne
+        """
+        total_rows = 0
+        imported = 0
+        rejected = 0
+        errors: List[PatientImportErrorDTO] = []
+        # Emails importés par les lots précédents (doublons internes au fichier)
+        seen_emails: Set[str] = set()
+
+        def reject(row_number: int, email: Optional[str], message: str) -> None:
+            nonlocal rejected
+            rejected += 1
+            if len(errors) < self.MAX_REPORTED_ERRORS:
+                errors.append(PatientImportErrorDTO(row=row_number, email=email, error=message))
+
+        batches = self._batches(rows)
+        while True:
+            # Lire et valider le lot suivant hors de la boucle d'événements
+            prepared = await asyncio.to_thread(self._prepare_next_batch, batches)
+            if prepared is None:
+                break
+            batch_size, candidates, rejections = prepared
+            total_rows += batch_size
+            for row_number, email, message in rejections:
+                reject(row_number, email, message)
+
+            # Doublons d'email : dans le fichier puis en base, en une seule requête
+            batch_emails = [patient.email for _, patient in candidates if patient.email]
+            existing_emails = await self.patient_repository.find_existing_emails(batch_emails)
+
+            patients: List[Patient] = []
+            for row_number, patient in candidates:
+                if patient.email:
+                    if patient.email in existing_emails or patient.email in seen_emails:
+                        reject(row_number, patient.email, str(PatientAlreadyExistsException("email", patient.email)))
+                        continue
+                    seen_emails.add(patient.email)
+                patients.append(patient)
+
+            imported += await self.patient_repository.bulk_create(patients)
+            logger.info(f"Import de patients : {total_rows} lignes lues, {imported} importées, {rejected} rejetées")
+
+        return PatientImportReportDTO(
+            total_rows=total_rows,
+            imported=imported,
+            rejected=rejected,
+            errors=sorted(errors, key=lambda error: error.row)
+        )
+
+    def _prepare_next_batch(
+        self,
+        batches: Iterator[List[ImportRow]]
+    ) -> Optional[Tuple[int, List[Tuple[int, Patient]], List[Rejection]]]:
+        """
+        Lit le lot suivant et valide chacune de ses lignes (exécuté dans un thread).
+
+        Returns:
+            Optional[Tuple[int, List[Tuple[int, Patient]], List[Rejection]]]: Le nombre
+                de lignes lues, les patients valides et les lignes rejetées, None à la fin du fichier
+        """
+        batch = next(batches, None)
+        if batch is None:
+            return None
+
+        candidates: List[Tuple[int, Patient]] = []
+        rejections: List[Rejection] = []
+        for row_number, data in batch:
+            try:
+                candidates.append((row_number, self._build_patient(data)))
+            except ValidationError as e:
+                rejections.append((row_number, (data or {}).get("email"), self._format_validation_error(e)))
+            except (DomainException, ValueError) as e:
+                rejections.append((row_number, (data or {}).get("email"), str(e)))
+        return len(batch), candidates, rejections
+
+    def _batches(self, rows: Iterable[ImportRow]) -> Iterator[List[ImportRow]]:
+        """Découpe les lignes en lots de `batch_size`"""
+        iterator = iter(rows)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _build_patient(self, data: Optional[Dict[str, Any]]) -> Patient:
+        """
+        Valide une ligne comme le fait la création unitaire d'un patient.
+
+        Raises:
+            ValidationError: Si la ligne ne respecte pas le format attendu
+            DomainException: Si une règle métier n'est pas respectée
+            ValueError: Si la ligne est illisible ou invalide
+        """
+        if data is None:
+            raise ValueError("Unreadable row")
+
+        dto = PatientCreateDTO.parse_obj(data)
+        self.patient_service.validate_patient_data(
+            dto.first_name,
+            dto.last_name,
+            dto.date_of_birth,
+            dto.gender
+        )
+
+        patient = Patient(
+            id=self.id_generator.generate_id(),
+            first_name=dto.first_name,
+            last_name=dto.last_name,
+            date_of_birth=dto.date_of_birth,
+            gender=dto.gender,
+            address=dto.address,
+            city=dto.city,
+            postal_code=dto.postal_code,
+            country=dto.country,
+            phone_number=dto.phone_number,
+            email=dto.email,
+            blood_type=dto.blood_type,
+            allergies=dto.allergies or {},
+            chronic_diseases=dto.chronic_diseases or {},
+            current_medications=dto.current_medications or {},
+            has_consent=dto.has_consent,
+            gdpr_consent=dto.gdpr_consent,
+            insurance_provider=dto.insurance_provider,
+            insurance_id=dto.insurance_id,
+            notes=dto.notes
+        )
+        self.patient_service.check_consent_for_minor(patient, dto.has_guardian_consent)
+        return patient
+
+    @staticmethod
+    def _format_validation_error(error: ValidationError) -> str:
+        """Résume les erreurs pydantic d'une ligne en un seul message"""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+            for item in error.errors()
+        )
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from patient_management.domain.entities.patient import Patient
+
+@dataclass
+class PatientSummary:
+    """
+    Projection d'un patient pour les vues de liste : identité et coordonnées,
+    sans les informations médicales ni les notes.
+    """
+    id: UUID
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    gender: str
+    city: Optional[str] = None
+    phone_number: Optional[str] = None
+    email: Optional[str] = None
+    is_active: bool = True
+    
+    @classmethod
+    def from_patient(cls, patient: Patient) -> "PatientSummary":
+        """Construit la projection d'un patient complet"""
+        return cls(
+            id=patient.id,
+            first_name=patient.first_name,
+            last_name=patient.last_name,
+            date_of_birth=patient.date_of_birth,
+            gender=patient.gender,
+            city=patient.city,
+            phone_number=patient.phone_number,
+            email=patient.email,
+            is_active=patient.is_active
+        )
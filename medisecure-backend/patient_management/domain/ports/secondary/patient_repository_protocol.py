@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List 
+from typing import Optional, List, Set
 from uuid import UUID
 from datetime import date
 
 from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+from shared.domain.entities.cursor_page import CursorPage
+from shared.domain.enums.count_mode import CountMode
 
 class PatientRepositoryProtocol(ABC):
     """
@@ -50,6 +53,45 @@ class PatientRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def bulk_create(self, patients: List[Patient]) -> int:
+        """
+        Crée plusieurs patients en une seule opération.
+        
+        Args:
+            patients: Les patients à créer (déjà validés)
+            
+        Returns:
+            int: Le nombre de patients créés
+        """
+        pass
+    
+    @abstractmethod
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """
+        Indique, en une seule requête, lesquels des emails fournis sont déjà utilisés.
+        
+        Args:
+            emails: Les emails à vérifier
+            
+        Returns:
+            Set[str]: Les emails déjà attribués à un patient
+        """
+        pass
+    
+    @abstractmethod
+    async def find_existing_ids(self, patient_ids: List[UUID]) -> Set[UUID]:
+        """
+        Indique, en une seule requête, lesquels des IDs fournis correspondent à un patient.
+        
+        Args:
+            patient_ids: Les IDs à vérifier
+            
+        Returns:
+            Set[UUID]: Les IDs des patients existants
+        """
+        pass
+    
     @abstractmethod
     async def update(self, patient: Patient) -> Patient:
         """
@@ -90,6 +132,32 @@ class PatientRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[Patient]:
+        """
+        Liste les patients par pagination keyset, triés par (last_name, id).
+        La page et le total sont lus dans la même requête.
+        
+        Args:
+            cursor: Le curseur renvoyé par la page précédente (None pour la première page)
+            limit: Le nombre maximum de patients à retourner
+            count: Le mode de calcul du total
+            skip: Le nombre de patients à sauter (anciens clients paginés par décalage)
+            
+        Returns:
+            CursorPage[Patient]: La page de patients, le curseur de la page suivante et le total
+            
+        Raises:
+            InvalidCursorException: Si le curseur est invalide
+        """
+        pass
+    
     @abstractmethod
     async def search(
         self,
@@ -102,12 +170,13 @@ class PatientRepositoryProtocol(ABC):
     ) -> List[Patient]:
         """
         Recherche des patients selon différents critères.
+        Les résultats sont triés par pertinence lorsqu'un nom est fourni.
         
         Args:
-            name: Le nom ou prénom du patient (recherche partielle)
+            name: Le nom, prénom ou email du patient (préfixes et fautes de frappe tolérés)
             date_of_birth: La date de naissance du patient
-            email: L'email du patient (recherche exacte)
-            phone: Le numéro de téléphone du patient (recherche partielle)
+            email: Le début de l'email du patient (insensible à la casse)
+            phone: Le numéro de téléphone du patient (recherche partielle, séparateurs ignorés)
             skip: Le nombre de patients à sauter
             limit: Le nombre maximum de patients à retourner
             
@@ -116,6 +185,57 @@ class PatientRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_summary_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[PatientSummary]:
+        """
+        Comme list_page, mais ne lit que les colonnes de la projection PatientSummary.
+        
+        Args:
+            cursor: Le curseur renvoyé par la page précédente (None pour la première page)
+            limit: Le nombre maximum de patients à retourner
+            count: Le mode de calcul du total
+            skip: Le nombre de patients à sauter
+            
+        Returns:
+            CursorPage[PatientSummary]: La page de résumés, le curseur de la page suivante et le total
+            
+        Raises:
+            InvalidCursorException: Si le curseur est invalide
+        """
+        pass
+    
+    @abstractmethod
+    async def search_summaries(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[PatientSummary]:
+        """
+        Comme search, mais ne lit que les colonnes de la projection PatientSummary.
+        
+        Args:
+            name: Le nom, prénom ou email du patient (préfixes et fautes de frappe tolérés)
+            date_of_birth: La date de naissance du patient
+            email: Le début de l'email du patient (insensible à la casse)
+            phone: Le numéro de téléphone du patient (recherche partielle, séparateurs ignorés)
+            skip: Le nombre de patients à sauter
+            limit: Le nombre maximum de patients à retourner
+            
+        Returns:
+            List[PatientSummary]: Les résumés des patients correspondant aux critères
+        """
+        pass
+    
     @abstractmethod
     async def count(self) -> int:
         """
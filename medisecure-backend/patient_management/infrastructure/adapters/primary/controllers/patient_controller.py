@@ -1,22 +1,29 @@
 # medisecure-backend/patient_management/infrastructure/adapters/primary/controllers/patient_controller.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, status, UploadFile, File
 from datetime import date
 import logging
 
 from shared.services.authenticator.extract_token import extract_token_payload
 from shared.container.container import Container
+from shared.infrastructure.monitoring.timed_route import TimedRoute
+from shared.infrastructure.serialization import ORJSONResponse, ResponseSerializer
 from patient_management.application.dtos.patient_dtos import (
     PatientCreateDTO,
     PatientUpdateDTO,
     PatientResponseDTO,
     PatientListResponseDTO,
-    PatientSearchDTO
+    PatientSummaryDTO,
+    PatientSummaryListResponseDTO,
+    PatientSearchDTO,
+    PatientImportReportDTO
 )
 from patient_management.application.usecases.create_patient_folder_usercase import CreatePatientFolderUseCase
 from patient_management.application.usecases.update_patient_usecase import UpdatePatientUseCase
 from patient_management.application.usecases.get_patient_usecase import GetPatientUseCase
+from patient_management.application.usecases.import_patients_usecase import ImportPatientsUseCase
+from patient_management.infrastructure.adapters.primary.patient_import_reader import detect_format, read_patient_rows
 from patient_management.domain.exceptions.patient_exceptions import (
     PatientNotFoundException,
     PatientAlreadyExistsException,
@@ -24,13 +31,20 @@ from patient_management.domain.exceptions.patient_exceptions import (
     MissingRequiredFieldException,
     MissingGuardianConsentException
 )
+from shared.domain.exceptions.shared_exceptions import InvalidCursorException
+from shared.domain.enums.count_mode import CountMode
+from shared.domain.enums.list_view import ListView
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
 # Créer un router pour les endpoints des patients
 # IMPORTANT: Ne pas inclure /api dans le préfixe, il sera ajouté dans main.py
-router = APIRouter(prefix="/patients", tags=["patients"])
+router = APIRouter(prefix="/patients", tags=["patients"], route_class=TimedRoute)
+
+# Sérialiseur des listes de patients (entités des repositories, sans revalidation)
+PATIENT_SERIALIZER = ResponseSerializer(PatientResponseDTO)
+PATIENT_SUMMARY_SERIALIZER = ResponseSerializer(PatientSummaryDTO)
 
 def check_role_permission(role: str, allowed_roles: list) -> bool:
     """
@@ -93,16 +107,15 @@ async def create_patient(
         # Log des données reçues
         logger.info(f"Création d'un nouveau patient avec les données: {data}")
         
-        # Créer le cas d'utilisation avec les dépendances nécessaires
-        use_case = CreatePatientFolderUseCase(
-            patient_repository=container.patient_repository(),
-            patient_service=container.patient_service(),
-            id_generator=container.id_generator()
-        )
-        
-        # Exécuter le cas d'utilisation
+        # Exécuter le cas d'utilisation dans une seule transaction
         try:
-            result = await use_case.execute(data)
+            async with container.unit_of_work() as uow:
+                use_case = CreatePatientFolderUseCase(
+                    patient_repository=container.patient_repository(session_factory=uow),
+                    patient_service=container.patient_service(),
+                    id_generator=container.id_generator()
+                )
+                result = await use_case.execute(data)
             logger.info(f"Patient créé avec succès: {result.id}")
             return result
         except Exception as e:
@@ -242,14 +255,13 @@ async def update_patient(
         # Log des données reçues
         logger.info(f"Mise à jour du patient {patient_id} avec les données: {data}")
         
-        # Créer le cas d'utilisation avec les dépendances nécessaires
-        use_case = UpdatePatientUseCase(
-            patient_repository=container.patient_repository(),
-            patient_service=container.patient_service()
-        )
-        
-        # Exécuter le cas d'utilisation
-        result = await use_case.execute(patient_id, data or PatientUpdateDTO())
+        # Exécuter le cas d'utilisation dans une seule transaction
+        async with container.unit_of_work() as uow:
+            use_case = UpdatePatientUseCase(
+                patient_repository=container.patient_repository(session_factory=uow),
+                patient_service=container.patient_service()
+            )
+            result = await use_case.execute(patient_id, data or PatientUpdateDTO())
         
         logger.info(f"Patient {patient_id} mis à jour avec succès")
         return result
@@ -315,8 +327,9 @@ async def delete_patient(
         logger.info(f"Suppression du patient {patient_id}")
         
         # Exécuter la suppression directement (pas besoin d'un cas d'utilisation dédié)
-        patient_repository = container.patient_repository()
-        success = await patient_repository.delete(patient_id)
+        async with container.unit_of_work() as uow:
+            patient_repository = container.patient_repository(session_factory=uow)
+            success = await patient_repository.delete(patient_id)
         
         if not success:
             raise PatientNotFoundException(patient_id)
@@ -338,14 +351,76 @@ async def delete_patient(
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
-@router.get("/", response_model=PatientListResponseDTO)
+@router.post("/import", response_model=PatientImportReportDTO)
+async def import_patients(
+    file: UploadFile = File(..., description="CSV (with header) or NDJSON file"),
+    format: Optional[str] = Query(None, description="csv or ndjson (guessed from the file name when omitted)"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Importe en masse des patients depuis un fichier CSV ou NDJSON.
+    Les lignes invalides ou en doublon sont rejetées et détaillées dans le rapport.
+    L'import est tout ou rien : une erreur en cours de chargement annule tous les lots.
+    """
+    try:
+        # Vérification des permissions : l'import concerne toute la patientèle
+        user_role = token_payload.get("role", "").lower()
+        allowed_roles = ["admin"]
+        
+        if not check_role_permission(user_role, allowed_roles):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to import patients"
+            )
+        
+        try:
+            file_format = detect_format(file.filename, format)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        logger.info(f"Import de patients depuis {file.filename} (format {file_format})")
+        # Tous les lots dans une seule transaction
+        async with container.unit_of_work() as uow:
+            use_case = ImportPatientsUseCase(
+                patient_repository=container.patient_repository(session_factory=uow),
+                patient_service=container.patient_service(),
+                id_generator=container.id_generator()
+            )
+            report = await use_case.execute(read_patient_rows(file.file, file_format))
+        logger.info(f"Import terminé: {report.imported} patients importés, {report.rejected} lignes rejetées")
+        return report
+    
+    except HTTPException:
+        raise
+    
+    except Exception as e:
+        logger.exception(f"Erreur inattendue lors de l'import de patients: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+@router.get("/", response_model=Union[PatientListResponseDTO, PatientSummaryListResponseDTO])
 async def list_patients(
     skip: int = Query(0, description="Number of patients to skip"),
     limit: int = Query(100, description="Maximum number of patients to return"),
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    count: CountMode = Query(CountMode.EXACT, description="How to compute the total: exact, estimated or none"),
+    view: ListView = Query(ListView.FULL, description="Fields to return: full records or summary (identity and contact details)"),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
-    """Liste tous les patients avec pagination."""
+    """
+    Liste tous les patients avec pagination.
+    
+    La page et le total sont lus en une seule requête. La pagination par
+    curseur est à privilégier ; `skip` reste accepté pour les clients existants.
+    Avec `view=summary`, seules les colonnes affichées dans les listes sont lues.
+    """
     try:
         # Vérification des permissions
         user_role = token_payload.get("role", "").lower()  # Get role and convert to lowercase
@@ -363,8 +438,15 @@ async def list_patients(
         # Récupération des patients
         patient_repository = container.patient_repository()
         try:
-            patients = await patient_repository.list_all(skip, limit)
-            total = await patient_repository.count()
+            if view == ListView.SUMMARY:
+                page = await patient_repository.list_summary_page(cursor, limit, count=count, skip=skip)
+                serializer = PATIENT_SUMMARY_SERIALIZER
+            else:
+                page = await patient_repository.list_page(cursor, limit, count=count, skip=skip)
+                serializer = PATIENT_SERIALIZER
+            patients, next_cursor, total = page.items, page.next_cursor, page.total
+        except InvalidCursorException:
+            raise
         except Exception as e:
             logger.error(f"Database error: {str(e)}")
             raise HTTPException(
@@ -372,43 +454,19 @@ async def list_patients(
                 detail="Database error occurred"
             )
         
-        # Conversion en DTOs
-        patient_dtos = [
-            PatientResponseDTO(
-                id=patient.id,
-                first_name=patient.first_name,
-                last_name=patient.last_name,
-                date_of_birth=patient.date_of_birth,
-                gender=patient.gender,
-                address=patient.address,
-                city=patient.city,
-                postal_code=patient.postal_code,
-                country=patient.country,
-                phone_number=patient.phone_number,
-                email=patient.email,
-                blood_type=patient.blood_type,
-                allergies=patient.allergies,
-                chronic_diseases=patient.chronic_diseases,
-                current_medications=patient.current_medications,
-                has_consent=patient.has_consent,
-                gdpr_consent=patient.gdpr_consent,
-                consent_date=patient.consent_date,
-                insurance_provider=patient.insurance_provider,
-                insurance_id=patient.insurance_id,
-                notes=patient.notes,
-                created_at=patient.created_at,
-                updated_at=patient.updated_at,
-                is_active=patient.is_active
-            )
-            for patient in patients
-        ]
-        
-        # Construction de la réponse
-        return PatientListResponseDTO(
-            patients=patient_dtos,
-            total=total,
-            skip=skip,
-            limit=limit
+        # Construction de la réponse, sérialisée sans revalidation des entités
+        return ORJSONResponse({
+            "patients": serializer.many(patients),
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "next_cursor": next_cursor
+        })
+    
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     
     except Exception as e:
@@ -418,7 +476,7 @@ async def list_patients(
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
-@router.post("/search", response_model=PatientListResponseDTO)
+@router.post("/search", response_model=Union[PatientListResponseDTO, PatientSummaryListResponseDTO])
 async def search_patients(
     search_criteria: PatientSearchDTO,
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
@@ -436,9 +494,13 @@ async def search_patients(
                 detail="You don't have permission to search patients"
             )
         
-        # Recherche des patients
+        # Recherche des patients (dossiers complets ou résumés)
         patient_repository = container.patient_repository()
-        patients = await patient_repository.search(
+        if search_criteria.view == ListView.SUMMARY:
+            search, serializer = patient_repository.search_summaries, PATIENT_SUMMARY_SERIALIZER
+        else:
+            search, serializer = patient_repository.search, PATIENT_SERIALIZER
+        patients = await search(
             name=search_criteria.name,
             date_of_birth=search_criteria.date_of_birth,
             email=search_criteria.email,
@@ -450,44 +512,14 @@ async def search_patients(
         # Compte approximatif pour la pagination
         total = len(patients)
         
-        # Conversion en DTOs
-        patient_dtos = [
-            PatientResponseDTO(
-                id=patient.id,
-                first_name=patient.first_name,
-                last_name=patient.last_name,
-                date_of_birth=patient.date_of_birth,
-                gender=patient.gender,
-                address=patient.address,
-                city=patient.city,
-                postal_code=patient.postal_code,
-                country=patient.country,
-                phone_number=patient.phone_number,
-                email=patient.email,
-                blood_type=patient.blood_type,
-                allergies=patient.allergies,
-                chronic_diseases=patient.chronic_diseases,
-                current_medications=patient.current_medications,
-                has_consent=patient.has_consent,
-                gdpr_consent=patient.gdpr_consent,
-                consent_date=patient.consent_date,
-                insurance_provider=patient.insurance_provider,
-                insurance_id=patient.insurance_id,
-                notes=patient.notes,
-                created_at=patient.created_at,
-                updated_at=patient.updated_at,
-                is_active=patient.is_active
-            )
-            for patient in patients
-        ]
-        
-        # Construction de la réponse
-        return PatientListResponseDTO(
-            patients=patient_dtos,
-            total=total,
-            skip=search_criteria.skip,
-            limit=search_criteria.limit
-        )
+        # Construction de la réponse, sérialisée sans revalidation des entités
+        return ORJSONResponse({
+            "patients": serializer.many(patients),
+            "total": total,
+            "skip": search_criteria.skip,
+            "limit": search_criteria.limit,
+            "next_cursor": None
+        })
     
     except Exception as e:
         logger.exception(f"Erreur inattendue lors de la recherche de patients: {str(e)}")
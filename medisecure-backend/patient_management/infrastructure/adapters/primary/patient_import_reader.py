@@ -0,0 +1,96 @@
+# patient_management/infrastructure/adapters/primary/patient_import_reader.py
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+import csv
+import io
+import json
+
+# Formats de fichier acceptés pour l'import de patients
+CSV = "csv"
+NDJSON = "ndjson"
+SUPPORTED_FORMATS = (CSV, NDJSON)
+
+# Colonnes CSV contenant un objet JSON
+_JSON_COLUMNS = ("allergies", "chronic_diseases", "current_medications")
+
+
+def detect_format(filename: Optional[str], requested: Optional[str] = None) -> str:
+    """
+    Détermine le format d'un fichier d'import.
+
+    Args:
+        filename: Le nom du fichier reçu
+        requested: Le format demandé explicitement, prioritaire
+
+    Returns:
+        str: "csv" ou "ndjson"
+
+    Raises:
+        ValueError: Si le format n'est pas supporté
+    """
+    if requested:
+        file_format = requested.lower()
+    elif filename and filename.lower().endswith((".ndjson", ".jsonl")):
+        file_format = NDJSON
+    else:
+        file_format = CSV
+
+    if file_format not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported import format: {file_format}")
+    return file_format
+
+
+def read_patient_rows(stream: BinaryIO, file_format: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """
+    Lit un fichier d'import ligne par ligne, sans le charger en mémoire.
+
+    Args:
+        stream: Le fichier binaire (UTF-8, BOM toléré)
+        file_format: "csv" ou "ndjson"
+
+    Yields:
+        Tuple[int, Optional[Dict[str, Any]]]: Le numéro de ligne et ses données,
+            None si la ligne est illisible
+    """
+    # newline="" : le module csv gère lui-même les retours à la ligne des champs entre guillemets
+    lines = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if file_format == NDJSON:
+            yield from _read_ndjson(lines)
+        else:
+            yield from _read_csv(lines)
+    finally:
+        # Rendre le flux à l'appelant sans le fermer
+        lines.detach()
+
+
+def _read_ndjson(lines) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            data = None
+        yield line_number, data if isinstance(data, dict) else None
+
+
+def _read_csv(lines) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    reader = csv.DictReader(lines)
+    for row in reader:
+        data: Dict[str, Any] = {}
+        for column, value in row.items():
+            if column is None:
+                # Valeurs surnuméraires sans en-tête
+                continue
+            value = value.strip() if isinstance(value, str) else value
+            # Une cellule vide correspond à une valeur absente
+            if value in ("", None):
+                continue
+            if column in _JSON_COLUMNS:
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    pass
+            data[column.strip()] = value
+        # line_num pointe sur la dernière ligne physique lue (champs multilignes compris)
+        yield reader.line_num, data
@@ -0,0 +1,219 @@
+from typing import Optional, List, Set, Dict, Any
+from uuid import UUID
+from datetime import date, datetime
+from dataclasses import asdict
+import json
+import threading
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from shared.domain.entities.cursor_page import CursorPage
+from shared.domain.enums.count_mode import CountMode
+from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.database.read_routing import is_recent_writer
+from shared.infrastructure.database.unit_of_work import UnitOfWork
+from shared.infrastructure.services.record_cache import RecordCache, get_cache_backend
+
+class CachedPatientRepository(PatientRepositoryProtocol):
+    """
+    Adaptateur secondaire plaçant un cache devant un autre repository des patients.
+    Les lectures par ID passent par le cache ; create, update et delete
+    délèguent puis invalident les entrées des patients concernés, après la
+    validation de l'unité de travail s'il y en a une.
+    """
+
+    def __init__(
+        self,
+        repository: PatientRepositoryProtocol,
+        cache: RecordCache,
+        unit_of_work: Optional[UnitOfWork] = None
+    ):
+        """
+        Initialise le repository.
+
+        Args:
+            repository: Le repository interrogé en cas d'absence dans le cache
+            cache: Le cache des dossiers patients
+            unit_of_work: L'unité de travail des écritures (invalidation au commit)
+        """
+        self.repository = repository
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+        # Patients modifiés via cette instance : dans une unité de travail non
+        # encore validée, leur lecture ne doit ni venir du cache ni l'alimenter
+        self._written: Set[UUID] = set()
+
+    async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
+        """
+        Récupère un patient par son ID, depuis le cache si possible.
+
+        Args:
+            patient_id: L'ID du patient à récupérer
+
+        Returns:
+            Optional[Patient]: Le patient trouvé ou None si non trouvé
+        """
+        # Un client qui vient d'écrire lit sur le primaire, sans passer par le cache
+        if patient_id in self._written or is_recent_writer():
+            return await self.repository.get_by_id(patient_id)
+
+        raw = await self.cache.get(str(patient_id))
+        if raw is not None:
+            return _patient_from_dict(json.loads(raw))
+
+        patient = await self.repository.get_by_id(patient_id)
+        if patient is not None:
+            await self.cache.set(str(patient_id), json.dumps(_patient_to_dict(patient)))
+        return patient
+
+    async def get_by_email(self, email: str) -> Optional[Patient]:
+        return await self.repository.get_by_email(email)
+
+    async def create(self, patient: Patient) -> Patient:
+        created = await self.repository.create(patient)
+        await self._invalidate(created.id)
+        return created
+
+    async def bulk_create(self, patients: List[Patient]) -> int:
+        created = await self.repository.bulk_create(patients)
+        await self._invalidate(*[patient.id for patient in patients])
+        return created
+
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        return await self.repository.find_existing_emails(emails)
+
+    async def find_existing_ids(self, patient_ids: List[UUID]) -> Set[UUID]:
+        return await self.repository.find_existing_ids(patient_ids)
+
+    async def update(self, patient: Patient) -> Patient:
+        updated = await self.repository.update(patient)
+        await self._invalidate(patient.id)
+        return updated
+
+    async def delete(self, patient_id: UUID) -> bool:
+        deleted = await self.repository.delete(patient_id)
+        await self._invalidate(patient_id)
+        return deleted
+
+    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Patient]:
+        return await self.repository.list_all(skip, limit)
+
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[Patient]:
+        return await self.repository.list_page(cursor=cursor, limit=limit, count=count, skip=skip)
+
+    async def search(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Patient]:
+        return await self.repository.search(
+            name=name,
+            date_of_birth=date_of_birth,
+            email=email,
+            phone=phone,
+            skip=skip,
+            limit=limit
+        )
+
+    async def list_summary_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[PatientSummary]:
+        return await self.repository.list_summary_page(cursor=cursor, limit=limit, count=count, skip=skip)
+
+    async def search_summaries(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[PatientSummary]:
+        return await self.repository.search_summaries(
+            name=name,
+            date_of_birth=date_of_birth,
+            email=email,
+            phone=phone,
+            skip=skip,
+            limit=limit
+        )
+
+    async def count(self) -> int:
+        return await self.repository.count()
+
+    async def _invalidate(self, *patient_ids: UUID) -> None:
+        """
+        Invalide les patients écrits et les exclut du cache pour la suite de l'instance.
+        Dans une unité de travail, l'invalidation attend le commit : faite avant,
+        une lecture concurrente remettrait l'ancienne ligne en cache.
+        """
+        if not patient_ids:
+            return
+        self._written.update(patient_ids)
+        keys = [str(patient_id) for patient_id in patient_ids]
+        if self.unit_of_work is not None:
+            self.unit_of_work.after_commit(lambda: self.cache.delete(*keys))
+        else:
+            await self.cache.delete(*keys)
+
+
+_DATETIME_FIELDS = ("consent_date", "created_at", "updated_at")
+
+
+def _patient_to_dict(patient: Patient) -> Dict[str, Any]:
+    data = asdict(patient)
+    data["id"] = str(patient.id)
+    data["date_of_birth"] = patient.date_of_birth.isoformat()
+    for name in _DATETIME_FIELDS:
+        if data[name] is not None:
+            data[name] = data[name].isoformat()
+    return data
+
+
+def _patient_from_dict(data: Dict[str, Any]) -> Patient:
+    data["id"] = UUID(data["id"])
+    data["date_of_birth"] = date.fromisoformat(data["date_of_birth"])
+    for name in _DATETIME_FIELDS:
+        if data[name] is not None:
+            data[name] = datetime.fromisoformat(data[name])
+    return Patient(**data)
+
+
+# Instance globale, créée à la première utilisation
+_patient_cache: Optional[RecordCache] = None
+_patient_cache_lock = threading.Lock()
+
+
+def get_patient_cache() -> RecordCache:
+    """Obtenir le cache des dossiers patients partagé par le processus"""
+    global _patient_cache
+    if _patient_cache is None:
+        with _patient_cache_lock:
+            if _patient_cache is None:
+                cache_settings = get_settings().cache
+                _patient_cache = RecordCache(
+                    "patient",
+                    ttl_seconds=cache_settings.patient_ttl_seconds,
+                    max_entries=cache_settings.patient_size,
+                    max_bytes=cache_settings.patient_max_bytes,
+                    backend=get_cache_backend(),
+                    # Les réplicas peuvent encore servir l'ancienne version pendant ce délai
+                    invalidation_window_seconds=get_settings().database.read_your_writes_seconds,
+                    local_ttl_seconds=cache_settings.local_ttl_seconds
+                )
+    return _patient_cache
@@ -1,10 +1,14 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 from uuid import UUID
 from datetime import date
 from copy import deepcopy
 
 from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from shared.domain.entities.cursor_page import CursorPage, decode_cursor
+from shared.domain.enums.count_mode import CountMode
+from patient_management.infrastructure.adapters.secondary.patient_search import normalize_phone
 
 class InMemoryPatientRepository(PatientRepositoryProtocol):
     """
@@ -74,6 +78,44 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         
         return deepcopy(patient)
     
+    async def bulk_create(self, patients: List[Patient]) -> int:
+        """
+        Crée plusieurs patients.
+        
+        Args:
+            patients: Les patients à créer
+            
+        Returns:
+            int: Le nombre de patients créés
+        """
+        for patient in patients:
+            await self.create(patient)
+        return len(patients)
+    
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """
+        Indique lesquels des emails fournis sont déjà utilisés.
+        
+        Args:
+            emails: Les emails à vérifier
+            
+        Returns:
+            Set[str]: Les emails déjà attribués à un patient
+        """
+        return {email for email in emails if email in self.email_index}
+    
+    async def find_existing_ids(self, patient_ids: List[UUID]) -> Set[UUID]:
+        """
+        Indique lesquels des IDs fournis correspondent à un patient.
+        
+        Args:
+            patient_ids: Les IDs à vérifier
+            
+        Returns:
+            Set[UUID]: Les IDs des patients existants
+        """
+        return {patient_id for patient_id in patient_ids if patient_id in self.patients}
+    
     async def update(self, patient: Patient) -> Patient:
         """
         Met à jour un patient existant.
@@ -136,7 +178,7 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         Returns:
             List[Patient]: La liste des patients
         """
-        patients = list(self.patients.values())
+        patients = sorted(self.patients.values(), key=lambda patient: (patient.last_name, patient.id))
         
         # Appliquer la pagination
         paginated_patients = patients[skip:skip + limit]
@@ -144,6 +186,35 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         # Retourner des copies des patients pour éviter les modifications non contrôlées
         return [deepcopy(patient) for patient in paginated_patients]
     
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[Patient]:
+        """
+        Liste les patients par page, triés par nom puis par ID.
+        
+        Args:
+            cursor: Le curseur renvoyé par la page précédente
+            limit: Le nombre maximum de patients à retourner
+            count: Le mode de calcul du total (toujours exact en mémoire)
+            skip: Le nombre de patients à sauter
+            
+        Returns:
+            CursorPage[Patient]: La page de patients, le curseur suivant et le total
+        """
+        key = lambda patient: (patient.last_name, patient.id)
+        patients = sorted(self.patients.values(), key=key)
+        
+        if cursor:
+            last_key = tuple(decode_cursor(cursor, str, UUID))
+            patients = [patient for patient in patients if key(patient) > last_key]
+        
+        total = None if count == CountMode.NONE else len(self.patients)
+        return CursorPage.from_rows(patients[skip:skip + limit + 1], limit, key=key, mapper=deepcopy, total=total)
+    
     async def search(
         self,
         name: Optional[str] = None,
@@ -159,8 +230,8 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         Args:
             name: Le nom ou prénom du patient (recherche partielle)
             date_of_birth: La date de naissance du patient
-            email: L'email du patient (recherche exacte)
-            phone: Le numéro de téléphone du patient (recherche partielle)
+            email: Le début de l'email du patient (insensible à la casse)
+            phone: Le numéro de téléphone du patient (recherche partielle, séparateurs ignorés)
             skip: Le nombre de patients à sauter
             limit: Le nombre maximum de patients à retourner
             
@@ -185,13 +256,14 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         if email:
             filtered_patients = [
                 p for p in filtered_patients
-                if p.email == email
+                if p.email and p.email.lower().startswith(email.lower())
             ]
         
         if phone:
+            digits = normalize_phone(phone)
             filtered_patients = [
                 p for p in filtered_patients
-                if p.phone_number and phone.lower() in p.phone_number.lower()
+                if p.phone_number and digits in normalize_phone(p.phone_number)
             ]
         
         # Appliquer la pagination
@@ -200,6 +272,46 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         # Retourner des copies des patients pour éviter les modifications non contrôlées
         return [deepcopy(patient) for patient in paginated_patients]
     
+    async def list_summary_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[PatientSummary]:
+        """
+        Liste les résumés des patients par page, triés par nom puis par ID.
+        
+        Returns:
+            CursorPage[PatientSummary]: La page de résumés, le curseur suivant et le total
+        """
+        page = await self.list_page(cursor=cursor, limit=limit, count=count, skip=skip)
+        return CursorPage(
+            items=[PatientSummary.from_patient(patient) for patient in page.items],
+            next_cursor=page.next_cursor,
+            total=page.total
+        )
+    
+    async def search_summaries(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[PatientSummary]:
+        """
+        Recherche les résumés des patients selon différents critères (voir search).
+        
+        Returns:
+            List[PatientSummary]: Les résumés des patients correspondant aux critères
+        """
+        patients = await self.search(
+            name=name, date_of_birth=date_of_birth, email=email, phone=phone, skip=skip, limit=limit
+        )
+        return [PatientSummary.from_patient(patient) for patient in patients]
+    
     async def count(self) -> int:
         """
         Compte le nombre total de patients.
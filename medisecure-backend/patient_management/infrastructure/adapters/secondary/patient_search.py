@@ -0,0 +1,65 @@
+# patient_management/infrastructure/adapters/secondary/patient_search.py
+from typing import Optional
+import re
+
+# Caractères spéciaux du motif LIKE à échapper dans une saisie utilisateur
+_LIKE_SPECIAL_CHARS = re.compile(r"([\\%_])")
+
+# Mots retenus pour la requête plein texte (lettres, chiffres, accents)
+_WORD = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def escape_like(value: str) -> str:
+    """
+    Échappe une saisie utilisateur pour l'utiliser dans un motif LIKE.
+
+    Args:
+        value: La saisie à échapper
+
+    Returns:
+        str: La saisie dont les caractères %, _ et \\ sont échappés
+    """
+    return _LIKE_SPECIAL_CHARS.sub(r"\\\1", value)
+
+
+def normalize_phone(value: Optional[str]) -> str:
+    """
+    Réduit un numéro de téléphone à ses chiffres significatifs.
+
+    Les séparateurs sont supprimés, ainsi que le préfixe national (0) ou
+    international (+33 / 0033), pour que "06 12 34 56 78" et
+    "+33 6 12 34 56 78" donnent tous deux "612345678".
+
+    Args:
+        value: Le numéro saisi
+
+    Returns:
+        str: Les chiffres significatifs du numéro (chaîne vide si aucun)
+    """
+    digits = re.sub(r"\D", "", value or "")
+    if digits.startswith("0033"):
+        digits = digits[4:]
+    elif digits.startswith("33") and len(digits) == 11:
+        digits = digits[2:]
+    elif digits.startswith("0"):
+        digits = digits[1:]
+    return digits
+
+
+def build_prefix_tsquery(text: str) -> Optional[str]:
+    """
+    Construit une requête tsquery de préfixes à partir d'une saisie libre.
+
+    Chaque mot devient un préfixe (`mot:*`) et tous les mots sont requis,
+    ce qui permet de retrouver "Sophie Bernard" en tapant "soph ber".
+
+    Args:
+        text: La saisie libre
+
+    Returns:
+        Optional[str]: La requête tsquery, ou None si la saisie ne contient aucun mot
+    """
+    words = _WORD.findall(text.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
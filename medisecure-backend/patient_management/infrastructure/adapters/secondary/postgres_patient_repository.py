@@ -1,39 +1,69 @@
 # medisecure-backend/patient_management/infrastructure/adapters/secondary/postgres_patient_repository.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 from uuid import UUID
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete, or_, and_, func
+from sqlalchemy import update, delete, or_, and_, func, tuple_, cast
+from sqlalchemy.dialects.postgresql import REGCONFIG
+import json
 import logging
 
 from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from shared.infrastructure.database.models.patient_model import PatientModel
+from shared.infrastructure.database.unit_of_work import commit_or_flush
+from shared.infrastructure.database.read_routing import select_read_factory
+from shared.infrastructure.monitoring.timing import timed_methods
+from shared.domain.entities.cursor_page import CursorPage, decode_cursor
+from shared.domain.enums.count_mode import CountMode
+from shared.infrastructure.database.counting import total_column, execute_with_total
+from patient_management.infrastructure.adapters.secondary.patient_search import (
+    build_prefix_tsquery,
+    escape_like,
+    normalize_phone
+)
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Colonnes de la projection PatientSummary, dans l'ordre de ses champs
+_SUMMARY_COLUMNS = (
+    PatientModel.id,
+    PatientModel.first_name,
+    PatientModel.last_name,
+    PatientModel.date_of_birth,
+    PatientModel.gender,
+    PatientModel.city,
+    PatientModel.phone_number,
+    PatientModel.email,
+    PatientModel.is_active
+)
+
+@timed_methods("repository")
 class PostgresPatientRepository(PatientRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des patients avec PostgreSQL.
     Implémente le port PatientRepositoryProtocol.
     """
     
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, read_session_factory=None):
         """
         Initialise le repository avec une factory de session SQLAlchemy.
         
         Args:
             session_factory: La factory de session SQLAlchemy à utiliser
+            read_session_factory: La factory des lectures (réplica si disponible), session_factory par défaut
         """
         self.session_factory = session_factory
+        self.read_session_factory = select_read_factory(session_factory, read_session_factory)
     
     async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
         """..."""
         try:
             logger.debug(f"Récupération du patient avec ID: {patient_id}")
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 query = select(PatientModel).where(PatientModel.id == patient_id)
                 result = await session.execute(query)
                 patient_model = result.scalar_one_or_none()
@@ -51,7 +81,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
     async def get_by_email(self, email: str) -> Optional[Patient]:
         try:
             logger.debug(f"Récupération du patient avec email: {email}")
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 query = select(PatientModel).where(PatientModel.email == email)
                 result = await session.execute(query)
                 patient_model = result.scalar_one_or_none()
@@ -100,7 +130,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
                 )
                 
                 session.add(patient_model)
-                await session.commit()
+                await commit_or_flush(session)
                 await session.refresh(patient_model)
                 
                 logger.info(f"Patient créé avec succès: {patient_model.id}")
@@ -109,6 +139,93 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             logger.exception(f"Erreur lors de la création du patient: {str(e)}")
             raise
     
+    # Colonnes chargées par COPY (les colonnes de recherche sont calculées par PostgreSQL)
+    _COPY_COLUMNS = [
+        "id", "first_name", "last_name", "date_of_birth", "gender",
+        "address", "city", "postal_code", "country", "phone_number", "email",
+        "blood_type", "allergies", "chronic_diseases", "current_medications",
+        "has_consent", "consent_date", "gdpr_consent",
+        "insurance_provider", "insurance_id", "notes",
+        "created_at", "updated_at", "is_active"
+    ]
+    
+    async def bulk_create(self, patients: List[Patient]) -> int:
+        """
+        Crée plusieurs patients avec le protocole COPY de PostgreSQL,
+        bien plus rapide qu'une suite d'INSERT pour les gros volumes.
+        """
+        if not patients:
+            return 0
+        
+        try:
+            logger.info(f"Import de {len(patients)} patients via COPY")
+            records = [
+                (
+                    patient.id, patient.first_name, patient.last_name, patient.date_of_birth, patient.gender,
+                    patient.address, patient.city, patient.postal_code, patient.country,
+                    patient.phone_number, patient.email, patient.blood_type,
+                    # asyncpg attend le texte JSON pour les colonnes JSONB
+                    json.dumps(patient.allergies or {}),
+                    json.dumps(patient.chronic_diseases or {}),
+                    json.dumps(patient.current_medications or {}),
+                    patient.has_consent, patient.consent_date, patient.gdpr_consent,
+                    patient.insurance_provider, patient.insurance_id, patient.notes,
+                    patient.created_at, patient.updated_at, patient.is_active
+                )
+                for patient in patients
+            ]
+            
+            async with self.session_factory() as session:
+                # COPY passe par la connexion asyncpg sous-jacente, dans la transaction de la session
+                connection = await session.connection()
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    PatientModel.__tablename__,
+                    records=records,
+                    columns=self._COPY_COLUMNS
+                )
+                await commit_or_flush(session)
+            
+            logger.info(f"{len(records)} patients importés")
+            return len(records)
+        except Exception as e:
+            logger.exception(f"Erreur lors de l'import en masse des patients: {str(e)}")
+            raise
+    
+    async def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        if not emails:
+            return set()
+        
+        try:
+            logger.debug(f"Vérification de {len(emails)} emails existants")
+            async with self.session_factory() as session:
+                query = select(PatientModel.email).where(PatientModel.email.in_(emails))
+                result = await session.execute(query)
+                existing = set(result.scalars().all())
+            
+            logger.debug(f"{len(existing)} emails déjà utilisés")
+            return existing
+        except Exception as e:
+            logger.exception(f"Erreur lors de la vérification des emails existants: {str(e)}")
+            raise
+    
+    async def find_existing_ids(self, patient_ids: List[UUID]) -> Set[UUID]:
+        if not patient_ids:
+            return set()
+        
+        try:
+            logger.debug(f"Vérification de {len(patient_ids)} patients existants")
+            async with self.session_factory() as session:
+                query = select(PatientModel.id).where(PatientModel.id.in_(set(patient_ids)))
+                result = await session.execute(query)
+                existing = set(result.scalars().all())
+            
+            logger.debug(f"{len(existing)} patients trouvés")
+            return existing
+        except Exception as e:
+            logger.exception(f"Erreur lors de la vérification des patients existants: {str(e)}")
+            raise
+    
     async def update(self, patient: Patient) -> Patient:
         """
         Met à jour un patient existant.
@@ -151,8 +268,9 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
                 )
             )
             
-            await self.session.execute(query)
-            await self.session.commit()
+            async with self.session_factory() as session:
+                await session.execute(query)
+                await commit_or_flush(session)
             
             # Récupérer le patient mis à jour pour le retourner
             updated_patient = await self.get_by_id(patient.id)
@@ -160,7 +278,6 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             return updated_patient
         except Exception as e:
             logger.exception(f"Erreur lors de la mise à jour du patient {patient.id}: {str(e)}")
-            await self.session.rollback()
             raise
     
     async def delete(self, patient_id: UUID) -> bool:
@@ -184,26 +301,33 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             
             # Supprimer le patient
             query = delete(PatientModel).where(PatientModel.id == patient_id)
-            result = await self.session.execute(query)
-            
-            if result.rowcount == 0:
-                logger.warning(f"Aucune ligne affectée lors de la suppression du patient {patient_id}")
-                return False
+            async with self.session_factory() as session:
+                result = await session.execute(query)
+                
+                if result.rowcount == 0:
+                    logger.warning(f"Aucune ligne affectée lors de la suppression du patient {patient_id}")
+                    return False
+                
+                await commit_or_flush(session)
             
-            await self.session.commit()
             logger.info(f"Patient {patient_id} supprimé avec succès")
             return True
         except Exception as e:
             logger.exception(f"Erreur lors de la suppression du patient {patient_id}: {str(e)}")
-            await self.session.rollback()
             raise
     
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Patient]:
         """..."""
         try:
             logger.debug(f"Récupération de la liste des patients (skip={skip}, limit={limit})")
-            async with self.session_factory() as session:
-                query = select(PatientModel).offset(skip).limit(limit)
+            async with self.read_session_factory() as session:
+                # Même ordre que list_page pour que les deux modes de pagination concordent
+                query = (
+                    select(PatientModel)
+                    .order_by(PatientModel.last_name, PatientModel.id)
+                    .offset(skip)
+                    .limit(limit)
+                )
                 result = await session.execute(query)
                 patient_models = result.scalars().all()
                 
@@ -213,6 +337,82 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             logger.exception(f"Erreur lors de la récupération de la liste des patients: {str(e)}")
             raise
     
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[Patient]:
+        """..."""
+        try:
+            logger.debug(f"Récupération d'une page de patients (cursor={cursor}, limit={limit}, count={count})")
+            query = self._page_query(select(PatientModel), cursor, limit, skip)
+            
+            async with self.read_session_factory() as session:
+                patient_models, total_count = await execute_with_total(session, query, self._total_column(count))
+            
+            logger.debug(f"Nombre de patients récupérés: {min(len(patient_models), limit)} (total: {total_count})")
+            return CursorPage.from_rows(
+                patient_models,
+                limit,
+                key=lambda model: (model.last_name, model.id),
+                mapper=self._map_to_entity,
+                total=total_count
+            )
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération d'une page de patients: {str(e)}")
+            raise
+    
+    async def list_summary_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count: CountMode = CountMode.NONE,
+        skip: int = 0
+    ) -> CursorPage[PatientSummary]:
+        """..."""
+        try:
+            logger.debug(f"Récupération d'une page de résumés de patients (cursor={cursor}, limit={limit}, count={count})")
+            query = self._page_query(select(*_SUMMARY_COLUMNS), cursor, limit, skip)
+            
+            async with self.read_session_factory() as session:
+                rows, total_count = await execute_with_total(session, query, self._total_column(count))
+            
+            logger.debug(f"Nombre de patients récupérés: {min(len(rows), limit)} (total: {total_count})")
+            return CursorPage.from_rows(
+                rows,
+                limit,
+                key=lambda row: (row[2], row[0]),
+                mapper=lambda row: PatientSummary(*row),
+                total=total_count
+            )
+        except Exception as e:
+            logger.exception(f"Erreur lors de la récupération d'une page de résumés de patients: {str(e)}")
+            raise
+    
+    def _page_query(self, query, cursor: Optional[str], limit: int, skip: int):
+        """Ordonne et pagine (keyset par (last_name, id)) une requête de liste"""
+        query = query.order_by(PatientModel.last_name, PatientModel.id)
+        
+        # Reprendre après la clé de tri du dernier patient de la page précédente
+        if cursor:
+            last_name, last_id = decode_cursor(cursor, str, UUID)
+            query = query.where(
+                tuple_(PatientModel.last_name, PatientModel.id) > tuple_(last_name, last_id)
+            )
+        
+        # Lire une ligne de plus pour savoir s'il existe une page suivante
+        return query.offset(skip).limit(limit + 1)
+    
+    def _total_column(self, count: CountMode):
+        """Sous-requête du total de la liste des patients"""
+        return total_column(
+            select(func.count()).select_from(PatientModel),
+            PatientModel.__tablename__,
+            count
+        )
+    
     async def search(
         self,
         name: Optional[str] = None,
@@ -224,39 +424,10 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
     ) -> List[Patient]:
         try:
             logger.debug(f"Recherche de patients avec critères: name={name}, date_of_birth={date_of_birth}, email={email}, phone={phone}")
-            
-            # Construire la requête de base
-            query = select(PatientModel)
-            
-            # Ajouter les filtres si fournis
-            filters = []
-            
-            if name:
-                filters.append(
-                    or_(
-                        PatientModel.first_name.ilike(f"%{name}%"),
-                        PatientModel.last_name.ilike(f"%{name}%")
-                    )
-                )
-            
-            if date_of_birth:
-                filters.append(PatientModel.date_of_birth == date_of_birth)
-            
-            if email:
-                filters.append(PatientModel.email == email)
-            
-            if phone:
-                filters.append(PatientModel.phone_number.ilike(f"%{phone}%"))
-            
-            # Ajouter tous les filtres à la requête
-            if filters:
-                query = query.where(and_(*filters))
-            
-            # Ajouter la pagination
-            query = query.offset(skip).limit(limit)
+            query = self._search_query(select(PatientModel), name, date_of_birth, email, phone, skip, limit)
             
             # Exécuter la requête
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 result = await session.execute(query)
                 patient_models = result.scalars().all()
             
@@ -265,11 +436,97 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
         except Exception as e:
             logger.exception(f"Erreur lors de la recherche de patients: {str(e)}")
             raise
+    
+    async def search_summaries(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[PatientSummary]:
+        try:
+            logger.debug(f"Recherche de résumés de patients avec critères: name={name}, date_of_birth={date_of_birth}, email={email}, phone={phone}")
+            query = self._search_query(select(*_SUMMARY_COLUMNS), name, date_of_birth, email, phone, skip, limit)
+            
+            async with self.read_session_factory() as session:
+                result = await session.execute(query)
+                rows = result.all()
+            
+            logger.debug(f"Nombre de patients trouvés: {len(rows)}")
+            return [PatientSummary(*row) for row in rows]
+        except Exception as e:
+            logger.exception(f"Erreur lors de la recherche de résumés de patients: {str(e)}")
+            raise
+    
+    def _search_query(
+        self,
+        query,
+        name: Optional[str],
+        date_of_birth: Optional[date],
+        email: Optional[str],
+        phone: Optional[str],
+        skip: int,
+        limit: int
+    ):
+        """Ajoute à une requête les filtres, l'ordre de pertinence et la pagination d'une recherche"""
+        # Ajouter les filtres si fournis. Chaque filtre textuel porte sur une
+        # colonne calculée couverte par un index GIN (plein texte ou trigrammes).
+        filters = []
+        rank = None
+        
+        if name:
+            term = name.strip().lower()
+            prefix_query = build_prefix_tsquery(term)
+            name_filters = [
+                # Tolérance aux fautes de frappe (similarité trigramme)
+                PatientModel.search_name.bool_op("%")(term),
+                PatientModel.search_name.like(f"%{escape_like(term)}%")
+            ]
+            rank = func.similarity(PatientModel.search_name, term)
+            
+            if prefix_query:
+                ts_query = func.to_tsquery(cast("simple", REGCONFIG), prefix_query)
+                name_filters.append(PatientModel.search_vector.bool_op("@@")(ts_query))
+                rank = func.greatest(func.ts_rank(PatientModel.search_vector, ts_query), rank)
+            
+            filters.append(or_(*name_filters))
+        
+        if date_of_birth:
+            filters.append(PatientModel.date_of_birth == date_of_birth)
+        
+        if email:
+            email_term = email.strip().lower()
+            filters.append(
+                or_(
+                    PatientModel.search_email.like(f"{escape_like(email_term)}%"),
+                    PatientModel.search_email.bool_op("%")(email_term)
+                )
+            )
+        
+        if phone:
+            digits = normalize_phone(phone)
+            if digits:
+                filters.append(PatientModel.phone_digits.like(f"%{digits}%"))
+        
+        # Ajouter tous les filtres à la requête
+        if filters:
+            query = query.where(and_(*filters))
+        
+        # Les meilleurs résultats d'abord, puis un ordre stable
+        if rank is not None:
+            query = query.order_by(rank.desc(), PatientModel.last_name, PatientModel.id)
+        else:
+            query = query.order_by(PatientModel.last_name, PatientModel.id)
+        
+        # Ajouter la pagination
+        return query.offset(skip).limit(limit)
         
     async def count(self) -> int:
         try:
             logger.debug("Comptage du nombre total de patients")
-            async with self.session_factory() as session:
+            async with self.read_session_factory() as session:
                 query = select(func.count()).select_from(PatientModel)
                 result = await session.execute(query)
                 count = result.scalar_one()
@@ -0,0 +1,91 @@
+from typing import Optional, List, Tuple
+from uuid import UUID
+
+from shared.domain.entities.user import User
+from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
+from shared.infrastructure.services.principal_cache import PrincipalCache
+
+class CachedUserRepository(UserRepositoryProtocol):
+    """
+    Adaptateur secondaire plaçant un cache devant un autre repository des utilisateurs.
+    Les lectures par ID et par rôle passent par le cache ; les écritures
+    délèguent puis invalident les entrées de l'utilisateur concerné.
+    """
+
+    def __init__(self, repository: UserRepositoryProtocol, cache: PrincipalCache):
+        """
+        Initialise le repository.
+
+        Args:
+            repository: Le repository interrogé en cas d'absence dans le cache
+            cache: Le cache des utilisateurs
+        """
+        self.repository = repository
+        self.cache = cache
+
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        """
+        Récupère un utilisateur par son ID, depuis le cache si possible.
+
+        Args:
+            user_id: L'ID de l'utilisateur à récupérer
+
+        Returns:
+            Optional[User]: L'utilisateur trouvé ou None si non trouvé
+        """
+        found, user = await self.cache.get_user(user_id)
+        if found:
+            return user
+
+        user = await self.repository.get_by_id(user_id)
+        await self.cache.set_user(user_id, user)
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self.repository.get_by_email(email)
+
+    async def get_with_password_hash_by_email(self, email: str) -> Optional[Tuple[User, Optional[str]]]:
+        # Jamais en cache : la connexion doit voir le hash et l'état courants
+        return await self.repository.get_with_password_hash_by_email(email)
+
+    async def create(self, user: User) -> User:
+        created = await self.repository.create(user)
+        await self.cache.invalidate_user(created.id)
+        return created
+
+    async def update(self, user: User) -> User:
+        updated = await self.repository.update(user)
+        await self.cache.invalidate_user(user.id)
+        return updated
+
+    async def delete(self, user_id: UUID) -> bool:
+        deleted = await self.repository.delete(user_id)
+        await self.cache.invalidate_user(user_id)
+        return deleted
+
+    async def list_all(self) -> List[User]:
+        return await self.repository.list_all()
+
+    async def list_by_role(self, role: str) -> List[User]:
+        """
+        Liste les utilisateurs par rôle, depuis le cache si possible.
+
+        Args:
+            role: Le rôle des utilisateurs à lister
+
+        Returns:
+            List[User]: La liste des utilisateurs ayant le rôle spécifié
+        """
+        found, users = await self.cache.get_role(role)
+        if found:
+            return users
+
+        users = await self.repository.list_by_role(role)
+        await self.cache.set_role(role, users)
+        return users
+
+    async def get_hashed_password_by_id(self, user_id: UUID) -> Optional[str]:
+        return await self.repository.get_hashed_password_by_id(user_id)
+
+    async def get_hashed_password_by_email(self, email: str) -> Optional[str]:
+        return await self.repository.get_hashed_password_by_email(email)
@@ -0,0 +1,43 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Dict, List
+from uuid import UUID
+
+from shared.domain.entities.outbox_email import OutboxEmail, OutboxEmailStatus
+from shared.ports.secondary.email_outbox_repository_protocol import EmailOutboxRepositoryProtocol
+
+class InMemoryEmailOutboxRepository(EmailOutboxRepositoryProtocol):
+    """
+    Adaptateur secondaire pour la boîte d'envoi des emails en mémoire (pour les tests).
+    Implémente le port EmailOutboxRepositoryProtocol.
+    """
+
+    def __init__(self):
+        """
+        Initialise le repository avec une boîte d'envoi vide.
+        """
+        self.emails: Dict[UUID, OutboxEmail] = {}
+
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        self.emails[email.id] = replace(email)
+        return email
+
+    async def claim_due(self, limit: int, lease_seconds: int) -> List[OutboxEmail]:
+        now = datetime.utcnow()
+        due = sorted(
+            (
+                email for email in self.emails.values()
+                if email.status == OutboxEmailStatus.PENDING and email.next_attempt_at <= now
+            ),
+            key=lambda email: email.next_attempt_at
+        )[:limit]
+        for email in due:
+            email.next_attempt_at = now + timedelta(seconds=lease_seconds)
+        return sorted((replace(email) for email in due), key=lambda email: email.created_at)
+
+    async def save_results(self, emails: List[OutboxEmail]) -> None:
+        for email in emails:
+            self.emails[email.id] = replace(email)
+
+    async def count_pending(self) -> int:
+        return sum(1 for email in self.emails.values() if email.status == OutboxEmailStatus.PENDING)
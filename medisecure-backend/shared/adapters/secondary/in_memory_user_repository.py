@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from uuid import UUID
 from shared.domain.entities.user import User
 from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
@@ -15,6 +15,7 @@ class InMemoryUserRepository(UserRepositoryProtocol):
         """
         self.users: Dict[UUID, User] = {}
         self.email_index: Dict[str, UUID] = {}
+        self.password_hashes: Dict[UUID, str] = {}
     
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """
@@ -44,6 +45,22 @@ class InMemoryUserRepository(UserRepositoryProtocol):
         
         return self.users.get(user_id)
     
+    async def get_with_password_hash_by_email(self, email: str) -> Optional[Tuple[User, Optional[str]]]:
+        """
+        Récupère un utilisateur et le hash de son mot de passe.
+        
+        Args:
+            email: L'email de l'utilisateur à récupérer
+            
+        Returns:
+            Optional[Tuple[User, Optional[str]]]: L'utilisateur et son hash, ou None si non trouvé
+        """
+        user = await self.get_by_email(email)
+        if not user:
+            return None
+        
+        return user, self.password_hashes.get(user.id)
+    
     async def create(self, user: User) -> User:
         """
         Crée un nouvel utilisateur.
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta
+from typing import List
+from sqlalchemy import func, select, update
+
+from shared.domain.entities.outbox_email import OutboxEmail, OutboxEmailStatus
+from shared.infrastructure.database.models.email_outbox_model import EmailOutboxModel
+from shared.ports.secondary.email_outbox_repository_protocol import EmailOutboxRepositoryProtocol
+from shared.infrastructure.database.unit_of_work import commit_or_flush
+
+class PostgresEmailOutboxRepository(EmailOutboxRepositoryProtocol):
+    """
+    Adaptateur secondaire pour la boîte d'envoi des emails avec PostgreSQL.
+    Implémente le port EmailOutboxRepositoryProtocol.
+
+    Passé avec `session_factory=uow`, l'email est enregistré dans la même
+    transaction que les changements qui le déclenchent.
+    """
+
+    def __init__(self, session_factory):
+        """
+        Initialise le repository avec une factory de session SQLAlchemy.
+
+        Args:
+            session_factory: La factory de session SQLAlchemy à utiliser
+        """
+        self.session_factory = session_factory
+
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        async with self.session_factory() as session:
+            session.add(EmailOutboxModel(
+                id=email.id,
+                to_email=email.to_email,
+                cc=email.cc,
+                bcc=email.bcc,
+                subject=email.subject,
+                body=email.body,
+                html_body=email.html_body,
+                status=email.status.value,
+                attempts=email.attempts,
+                next_attempt_at=email.next_attempt_at,
+                created_at=email.created_at
+            ))
+            await commit_or_flush(session)
+        return email
+
+    async def claim_due(self, limit: int, lease_seconds: int) -> List[OutboxEmail]:
+        now = datetime.utcnow()
+        # SKIP LOCKED : plusieurs workers se partagent la file sans s'attendre
+        due = (
+            select(EmailOutboxModel.id)
+            .where(
+                EmailOutboxModel.status == OutboxEmailStatus.PENDING.value,
+                EmailOutboxModel.next_attempt_at <= now
+            )
+            .order_by(EmailOutboxModel.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        query = (
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(due))
+            .values(next_attempt_at=now + timedelta(seconds=lease_seconds))
+            .returning(EmailOutboxModel)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            models = result.scalars().all()
+            await commit_or_flush(session)
+            emails = [self._map_to_entity(model) for model in models]
+
+        return sorted(emails, key=lambda email: email.created_at)
+
+    async def save_results(self, emails: List[OutboxEmail]) -> None:
+        if not emails:
+            return
+
+        # Mise à jour groupée par clé primaire (un seul executemany)
+        async with self.session_factory() as session:
+            await session.execute(update(EmailOutboxModel), [
+                {
+                    "id": email.id,
+                    "status": email.status.value,
+                    "attempts": email.attempts,
+                    "next_attempt_at": email.next_attempt_at,
+                    "last_error": email.last_error,
+                    "sent_at": email.sent_at
+                }
+                for email in emails
+            ])
+            await commit_or_flush(session)
+
+    async def count_pending(self) -> int:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(func.count())
+                .select_from(EmailOutboxModel)
+                .where(EmailOutboxModel.status == OutboxEmailStatus.PENDING.value)
+            )
+            return result.scalar_one()
+
+    def _map_to_entity(self, model: EmailOutboxModel) -> OutboxEmail:
+        return OutboxEmail(
+            id=model.id,
+            to_email=model.to_email,
+            subject=model.subject,
+            body=model.body,
+            html_body=model.html_body,
+            cc=list(model.cc or []),
+            bcc=list(model.bcc or []),
+            status=OutboxEmailStatus(model.status),
+            attempts=model.attempts,
+            next_attempt_at=model.next_attempt_at,
+            last_error=model.last_error,
+            created_at=model.created_at,
+            sent_at=model.sent_at
+        )
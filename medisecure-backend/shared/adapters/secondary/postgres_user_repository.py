@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -8,24 +8,30 @@ from shared.domain.entities.user import User
 from shared.domain.enums.roles import UserRole
 from shared.infrastructure.database.models.user_model import UserModel
 from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
+from shared.infrastructure.database.unit_of_work import commit_or_flush
+from shared.infrastructure.database.read_routing import select_read_factory
+from shared.infrastructure.monitoring.timing import timed_methods
 
+@timed_methods("repository")
 class PostgresUserRepository(UserRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des utilisateurs avec PostgreSQL.
     Implémente le port UserRepositoryProtocol.
     """
     
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, read_session_factory=None):
         """
         Initialise le repository avec une factory de session SQLAlchemy.
         
         Args:
             session_factory: La factory de session SQLAlchemy à utiliser
+            read_session_factory: La factory des lectures (réplica si disponible), session_factory par défaut
         """
         self.session_factory = session_factory
+        self.read_session_factory = select_read_factory(session_factory, read_session_factory)
     
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
-        async with self.session_factory() as session:
+        async with self.read_session_factory() as session:
             query = select(UserModel).where(UserModel.id == user_id)
             result = await session.execute(query)
             user_model = result.scalar_one_or_none()
@@ -45,7 +51,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
         Returns:
             Optional[User]: L'utilisateur trouvé ou None si non trouvé
         """
-        async with self.session_factory() as session:
+        async with self.read_session_factory() as session:
             query = select(UserModel).where(UserModel.email == email)
             result = await session.execute(query)
             user_model = result.scalar_one_or_none()
@@ -55,6 +61,26 @@ class PostgresUserRepository(UserRepositoryProtocol):
             
             return self._map_to_entity(user_model)
     
+    async def get_with_password_hash_by_email(self, email: str) -> Optional[Tuple[User, Optional[str]]]:
+        """
+        Récupère en une seule requête un utilisateur et le hash de son mot de passe.
+        
+        Args:
+            email: L'email de l'utilisateur à récupérer
+            
+        Returns:
+            Optional[Tuple[User, Optional[str]]]: L'utilisateur et son hash, ou None si non trouvé
+        """
+        async with self.read_session_factory() as session:
+            query = select(UserModel).where(UserModel.email == email)
+            result = await session.execute(query)
+            user_model = result.scalar_one_or_none()
+            
+            if not user_model:
+                return None
+            
+            return self._map_to_entity(user_model), user_model.hashed_password
+    
     async def create(self, user: User) -> User:
         """
         Crée un nouvel utilisateur.
@@ -78,7 +104,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
             )
             
             session.add(user_model)
-            await session.commit()
+            await commit_or_flush(session)
             await session.refresh(user_model)
             
             return self._map_to_entity(user_model)
@@ -106,8 +132,9 @@ class PostgresUserRepository(UserRepositoryProtocol):
             )
         )
         
-        await self.session.execute(query)
-        await self.session.commit()
+        async with self.session_factory() as session:
+            await session.execute(query)
+            await commit_or_flush(session)
         
         return user
     
@@ -122,12 +149,13 @@ class PostgresUserRepository(UserRepositoryProtocol):
             bool: True si l'utilisateur a été supprimé, False sinon
         """
         query = delete(UserModel).where(UserModel.id == user_id)
-        result = await self.session.execute(query)
-        
-        if result.rowcount == 0:
-            return False
-        
-        await self.session.commit()
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            
+            if result.rowcount == 0:
+                return False
+            
+            await commit_or_flush(session)
         return True
     
     async def list_all(self) -> List[User]:
@@ -138,8 +166,9 @@ class PostgresUserRepository(UserRepositoryProtocol):
             List[User]: La liste de tous les utilisateurs
         """
         query = select(UserModel)
-        result = await self.session.execute(query)
-        user_models = result.scalars().all()
+        async with self.read_session_factory() as session:
+            result = await session.execute(query)
+            user_models = result.scalars().all()
         
         return [self._map_to_entity(user_model) for user_model in user_models]
     
@@ -154,8 +183,9 @@ class PostgresUserRepository(UserRepositoryProtocol):
             List[User]: La liste des utilisateurs ayant le rôle spécifié
         """
         query = select(UserModel).where(UserModel.role == role)
-        result = await self.session.execute(query)
-        user_models = result.scalars().all()
+        async with self.read_session_factory() as session:
+            result = await session.execute(query)
+            user_models = result.scalars().all()
         
         return [self._map_to_entity(user_model) for user_model in user_models]
     
@@ -190,7 +220,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
         Returns:
             Optional[str]: Le mot de passe hashé ou None si non trouvé
         """
-        async with self.session_factory() as session:
+        async with self.read_session_factory() as session:
             query = select(UserModel.hashed_password).where(UserModel.id == user_id)
             result = await session.execute(query)
             hashed_password = result.scalar_one_or_none()
@@ -206,7 +236,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
         Returns:
             Optional[str]: Le mot de passe hashé ou None si non trouvé
         """
-        async with self.session_factory() as session:
+        async with self.read_session_factory() as session:
             query = select(UserModel.hashed_password).where(UserModel.email == email)
             result = await session.execute(query)
             hashed_password = result.scalar_one_or_none()
@@ -2,13 +2,18 @@
 from typing import Optional
 from datetime import datetime, timedelta
 import logging
-import bcrypt
 from jose import jwt, JWTError
 
 from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.services.password_hasher import (
+    PasswordHasher,
+    PasswordHasherOverloadedException,
+    get_password_hasher
+)
 from shared.domain.entities.user import User
 from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
 from shared.application.dtos.common_dtos import TokenResponseDTO
+from shared.services.authenticator.token_verifier import get_token_verifier
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +26,16 @@ class AuthenticationService:
     le repository des utilisateurs pour l'accès aux données.
     """
     
-    def __init__(self, user_repository: UserRepositoryProtocol):
+    def __init__(self, user_repository: UserRepositoryProtocol, password_hasher: Optional[PasswordHasher] = None):
         """
         Initialise le service d'authentification.
         
         Args:
             user_repository: Repository des utilisateurs injecté
+            password_hasher: Pool de hachage des mots de passe (pool partagé par défaut)
         """
         self.user_repository = user_repository
+        self.password_hasher = password_hasher or get_password_hasher()
         self.settings = get_settings()
     
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
@@ -45,31 +52,24 @@ class AuthenticationService:
         try:
             logger.info(f"Tentative d'authentification pour: {email}")
             
-            # Récupérer l'utilisateur par email via le repository
-            user = await self.user_repository.get_by_email(email)
-            if not user:
+            # Récupérer l'utilisateur et son mot de passe hashé en une seule requête
+            credentials = await self.user_repository.get_with_password_hash_by_email(email)
+            if not credentials:
                 logger.warning(f"Utilisateur non trouvé: {email}")
                 return None
+            user, hashed_password = credentials
             
             # Vérifier si l'utilisateur est actif
             if not user.is_active:
                 logger.warning(f"Utilisateur inactif: {email}")
                 return None
             
-            # Récupérer le mot de passe hashé (méthode spécifique au repository)
-            if hasattr(self.user_repository, 'get_hashed_password_by_email'):
-                hashed_password = await self.user_repository.get_hashed_password_by_email(email)
-            else:
-                # Fallback pour les repositories qui n'ont pas cette méthode
-                logger.warning("Repository doesn't support get_hashed_password_by_email, using fallback")
-                return None
-            
             if not hashed_password:
                 logger.warning(f"Pas de mot de passe hashé trouvé pour: {email}")
                 return None
             
             # Vérifier le mot de passe
-            is_password_valid = self._verify_password(password, hashed_password)
+            is_password_valid = await self._verify_password(password, hashed_password)
             
             # Pour le développement : accepter aussi le mot de passe par défaut
             if not is_password_valid and self.settings.is_development():
@@ -84,6 +84,9 @@ class AuthenticationService:
             logger.info(f"Authentification réussie pour: {email}")
             return user
             
+        except PasswordHasherOverloadedException:
+            # Surcharge : à signaler au client, ce n'est pas un échec d'authentification
+            raise
         except Exception as e:
             logger.error(f"Erreur lors de l'authentification: {str(e)}")
             return None
@@ -174,13 +177,15 @@ class AuthenticationService:
                 }
             )
             
+        except PasswordHasherOverloadedException:
+            raise
         except Exception as e:
             logger.error(f"Erreur lors du processus de connexion: {str(e)}")
             return None
     
-    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
-        Vérifie un mot de passe contre son hash.
+        Vérifie un mot de passe contre son hash, sur le pool de hachage.
         
         Args:
             plain_password: Mot de passe en clair
@@ -188,28 +193,26 @@ class AuthenticationService:
             
         Returns:
             bool: True si le mot de passe est valide
+            
+        Raises:
+            PasswordHasherOverloadedException: Si le pool de hachage est saturé
         """
-        try:
-            return bcrypt.checkpw(
-                plain_password.encode('utf-8'), 
-                hashed_password.encode('utf-8')
-            )
-        except Exception as e:
-            logger.error(f"Erreur lors de la vérification du mot de passe: {e}")
-            return False
+        return await self.password_hasher.verify(plain_password, hashed_password)
     
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """
-        Hash un mot de passe avec la configuration sécurisée.
+        Hash un mot de passe avec la configuration sécurisée, sur le pool de hachage.
         
         Args:
             password: Mot de passe en clair
             
         Returns:
             str: Hash du mot de passe
+            
+        Raises:
+            PasswordHasherOverloadedException: Si le pool de hachage est saturé
         """
-        salt = bcrypt.gensalt(rounds=self.settings.security.bcrypt_rounds)
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        return await self.password_hasher.hash(password)
     
     def verify_token(self, token: str) -> Optional[dict]:
         """
@@ -222,12 +225,7 @@ class AuthenticationService:
             Optional[dict]: Payload du token si valide, None sinon
         """
         try:
-            payload = jwt.decode(
-                token,
-                self.settings.security.jwt_secret_key,
-                algorithms=[self.settings.security.jwt_algorithm]
-            )
-            return payload
+            return get_token_verifier().verify(token)
         except JWTError as e:
             logger.warning(f"Token invalide: {str(e)}")
             return None
\ No newline at end of file
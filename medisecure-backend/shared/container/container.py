@@ -1,26 +1,42 @@
 # medisecure-backend/shared/container/container.py
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 from contextlib import asynccontextmanager
 import logging
 
 from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.database.engine_registry import get_engine, get_session_factory
+from shared.infrastructure.database.unit_of_work import UnitOfWork
+from shared.infrastructure.database.read_routing import get_read_session_factory
 from shared.adapters.primary.uuid_generator import UuidGenerator
 from shared.adapters.secondary.postgres_user_repository import PostgresUserRepository
 from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
-from shared.infrastructure.services.smtp_mailer import SmtpMailer
+from shared.adapters.secondary.cached_user_repository import CachedUserRepository
+from shared.adapters.secondary.postgres_email_outbox_repository import PostgresEmailOutboxRepository
+from shared.adapters.secondary.in_memory_email_outbox_repository import InMemoryEmailOutboxRepository
+from shared.infrastructure.services.outbox_mailer import OutboxMailer
+from shared.infrastructure.services.outbox_worker import get_outbox_worker
+from shared.infrastructure.services.password_hasher import get_password_hasher
+from shared.infrastructure.services.principal_cache import get_principal_cache
 from shared.services.authenticator.basic_authenticator import BasicAuthenticator
 from shared.application.services.auth_service import AuthenticationService
 
 from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
 from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from patient_management.infrastructure.adapters.secondary.cached_patient_repository import CachedPatientRepository, get_patient_cache
 from patient_management.domain.services.patient_service import PatientService
 
 from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import PostgresAppointmentRepository
 from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
 from appointment_management.domain.services.appointment_service import AppointmentService
 
+def _cached_patient_repository(session_factory, read_session_factory, cache) -> CachedPatientRepository:
+    """Repository PostgreSQL des patients derrière le cache (accepte `session_factory=uow`)"""
+    return CachedPatientRepository(
+        PostgresPatientRepository(session_factory=session_factory, read_session_factory=read_session_factory),
+        cache,
+        unit_of_work=session_factory if isinstance(session_factory, UnitOfWork) else None
+    )
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -47,25 +63,20 @@ class Container(containers.DeclarativeContainer):
     
     _log_database_config()
     
-    # Création du moteur avec configuration centralisée
-    engine = providers.Singleton(
-        create_async_engine,
-        providers.Factory(lambda s: s.get_database_url(), settings),
-        echo=providers.Factory(lambda s: s.database.echo or s.server.debug, settings),
-        pool_size=providers.Factory(lambda s: s.database.pool_size, settings),
-        max_overflow=providers.Factory(lambda s: s.database.max_overflow, settings),
-        pool_pre_ping=True,  # Vérifier la connexion avant de l'utiliser
-        pool_recycle=providers.Factory(lambda s: s.database.pool_recycle, settings),
-    )
+    # Moteur et factory de session partagés via le registre : un seul pool
+    # par processus, même si plusieurs containers sont instanciés
+    engine = providers.Callable(get_engine)
+    
+    async_session_factory = providers.Callable(get_session_factory)
     
-    # Création de la factory de session
-    async_session_factory = providers.Singleton(
-        sessionmaker,
-        bind=engine,
-        class_=AsyncSession,
-        autocommit=False,
-        autoflush=False,
-        expire_on_commit=False
+    # Factory des lectures : réplica pendant les requêtes GET, primaire sinon
+    read_session_factory = providers.Callable(get_read_session_factory)
+    
+    # Unité de travail : une session et une transaction partagées par les
+    # repositories d'un cas d'utilisation (à passer en `session_factory`)
+    unit_of_work = providers.Factory(
+        UnitOfWork,
+        session_factory=async_session_factory
     )
     
     # Gestionnaire de contexte pour les sessions
@@ -90,25 +101,43 @@ class Container(containers.DeclarativeContainer):
     # Adaptateurs secondaires - Repositories (doivent être définis avant les services qui les utilisent)
 
     # Pour production :
+    # Cache des utilisateurs, partagé par le processus
+    principal_cache = providers.Callable(get_principal_cache)
+    
     user_repository = providers.Factory(
-        PostgresUserRepository,
-        session_factory=async_session_factory
+        CachedUserRepository,
+        repository=providers.Factory(
+            PostgresUserRepository,
+            session_factory=async_session_factory,
+            read_session_factory=read_session_factory
+        ),
+        cache=principal_cache
     )
 
+    # Cache des dossiers patients, partagé par le processus
+    patient_cache = providers.Callable(get_patient_cache)
+    
     patient_repository = providers.Factory(
-        PostgresPatientRepository,
-        session_factory=async_session_factory
+        _cached_patient_repository,
+        session_factory=async_session_factory,
+        read_session_factory=read_session_factory,
+        cache=patient_cache
     )
 
     appointment_repository = providers.Factory(
         PostgresAppointmentRepository,
-        session_factory=async_session_factory
+        session_factory=async_session_factory,
+        read_session_factory=read_session_factory
     )
     
     # Services d'application
+    # Pool de hachage des mots de passe, partagé par le processus
+    password_hasher = providers.Callable(get_password_hasher)
+    
     auth_service = providers.Factory(
         AuthenticationService,
-        user_repository=user_repository
+        user_repository=user_repository,
+        password_hasher=password_hasher
     )
     
     # Services du domaine
@@ -119,9 +148,21 @@ class Container(containers.DeclarativeContainer):
     user_repository_in_memory = providers.Singleton(InMemoryUserRepository)
     patient_repository_in_memory = providers.Singleton(InMemoryPatientRepository)
     appointment_repository_in_memory = providers.Singleton(InMemoryAppointmentRepository)
+    email_outbox_repository_in_memory = providers.Singleton(InMemoryEmailOutboxRepository)
     
     # Services d'infrastructure
-    mailer = providers.Factory(SmtpMailer)
+    # Boîte d'envoi des emails (accepte `session_factory=uow` pour un envoi transactionnel)
+    email_outbox_repository = providers.Factory(
+        PostgresEmailOutboxRepository,
+        session_factory=async_session_factory
+    )
+    
+    # Les emails sont enregistrés dans la boîte d'envoi puis envoyés en arrière-plan
+    mailer = providers.Factory(
+        OutboxMailer,
+        outbox_repository=email_outbox_repository,
+        worker=providers.Callable(get_outbox_worker)
+    )
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
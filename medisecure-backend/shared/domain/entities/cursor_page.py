@@ -0,0 +1,96 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+import base64
+import json
+
+from shared.domain.exceptions.shared_exceptions import InvalidCursorException
+
+T = TypeVar("T")
+
+@dataclass
+class CursorPage(Generic[T]):
+    """
+    Page de résultats paginée par curseur (keyset).
+    `next_cursor` vaut None lorsqu'il n'y a plus de page suivante,
+    `total` vaut None lorsqu'aucun comptage n'a été demandé.
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Any],
+        limit: int,
+        key: Callable[[Any], Tuple[Any, ...]],
+        mapper: Callable[[Any], T],
+        total: Optional[int] = None
+    ) -> "CursorPage[T]":
+        """
+        Construit une page à partir de `limit + 1` lignes lues en base :
+        la ligne supplémentaire indique seulement qu'une page suivante existe.
+
+        Args:
+            rows: Les lignes lues (au plus limit + 1)
+            limit: La taille de page demandée
+            key: Extrait la clé de tri d'une ligne
+            mapper: Convertit une ligne en élément de la page
+            total: Le nombre total d'éléments, s'il a été calculé
+
+        Returns:
+            CursorPage[T]: La page construite
+        """
+        page_rows = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit and page_rows:
+            next_cursor = encode_cursor(*key(page_rows[-1]))
+        return cls(items=[mapper(row) for row in page_rows], next_cursor=next_cursor, total=total)
+
+def _to_json_value(value: Any) -> Any:
+    """Convertit une valeur de clé de tri en valeur sérialisable"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode une clé de tri en curseur opaque.
+
+    Args:
+        values: Les valeurs de la clé de tri du dernier élément de la page
+
+    Returns:
+        str: Le curseur encodé en base64 URL-safe
+    """
+    payload = json.dumps([_to_json_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> List[Any]:
+    """
+    Décode un curseur opaque et convertit chaque valeur.
+
+    Args:
+        cursor: Le curseur reçu du client
+        parsers: Une fonction de conversion par valeur de la clé de tri
+
+    Returns:
+        List[Any]: Les valeurs de la clé de tri converties
+
+    Raises:
+        InvalidCursorException: Si le curseur est mal formé
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("nombre de valeurs inattendu")
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except InvalidCursorException:
+        raise
+    except Exception as e:
+        raise InvalidCursorException(cursor) from e
@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+class OutboxEmailStatus(str, Enum):
+    """Énumération des états d'un email de la file d'envoi"""
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+@dataclass
+class OutboxEmail:
+    """
+    Entité email en attente d'envoi (boîte d'envoi persistante).
+    L'email est enregistré avec la transaction qui le produit puis envoyé
+    en arrière-plan ; `next_attempt_at` porte à la fois la date de la
+    prochaine tentative et le délai de réservation par un worker.
+    """
+    id: UUID
+    to_email: str
+    subject: str
+    body: str
+    html_body: Optional[str] = None
+    cc: List[str] = field(default_factory=list)
+    bcc: List[str] = field(default_factory=list)
+    status: OutboxEmailStatus = OutboxEmailStatus.PENDING
+    attempts: int = 0
+    next_attempt_at: datetime = field(default_factory=datetime.utcnow)
+    last_error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    sent_at: Optional[datetime] = None
+
+    @property
+    def recipients(self) -> List[str]:
+        """Retourne tous les destinataires de l'enveloppe SMTP (copies comprises)"""
+        return [self.to_email, *self.cc, *self.bcc]
+
+    def mark_sent(self, now: datetime) -> None:
+        """Enregistre un envoi réussi"""
+        self.status = OutboxEmailStatus.SENT
+        self.attempts += 1
+        self.sent_at = now
+        self.last_error = None
+
+    def mark_failed(self, error: str, now: datetime, retry_delay: Optional[timedelta]) -> None:
+        """
+        Enregistre un échec d'envoi.
+
+        Args:
+            error: Le message d'erreur du serveur SMTP
+            now: La date de la tentative
+            retry_delay: Le délai avant la prochaine tentative, None si l'échec est définitif
+        """
+        self.attempts += 1
+        self.last_error = error
+        if retry_delay is None:
+            self.status = OutboxEmailStatus.FAILED
+        else:
+            self.next_attempt_at = now + retry_delay
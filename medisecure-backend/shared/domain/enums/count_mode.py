@@ -0,0 +1,7 @@
+from enum import Enum
+
+class CountMode(str, Enum):
+    """Mode de calcul du nombre total d'éléments renvoyé avec une page"""
+    EXACT = "exact"          # count(*) exact, coûteux sur les très grandes tables
+    ESTIMATED = "estimated"  # estimation des statistiques PostgreSQL (pg_class.reltuples)
+    NONE = "none"            # aucun total
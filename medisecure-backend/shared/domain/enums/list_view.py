@@ -0,0 +1,6 @@
+from enum import Enum
+
+class ListView(str, Enum):
+    """Champs renvoyés par un endpoint de liste"""
+    FULL = "full"        # enregistrements complets
+    SUMMARY = "summary"  # projection réduite aux champs affichés dans les listes
@@ -20,4 +20,11 @@ class AuthorizationException(DomainException):
 
 class BusinessRuleException(DomainException):
     """Exception levée lorsqu'une règle métier est violée"""
-    pass
\ No newline at end of file
+    pass
+
+class InvalidCursorException(ValidationException):
+    """Exception levée lorsqu'un curseur de pagination est invalide"""
+    def __init__(self, cursor):
+        self.cursor = cursor
+        message = f"Invalid pagination cursor: {cursor}"
+        super().__init__(message)
@@ -1,10 +1,26 @@
 # shared/infrastructure/config/settings.py
 from pydantic import BaseSettings, Field, validator
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from datetime import time
 import os
 from pathlib import Path
 
 
+def normalize_database_url(url: str) -> str:
+    """S'assurer qu'une URL de base de données utilise le driver asyncpg et le bon hôte"""
+    if "postgresql://" in url and "asyncpg" not in url:
+        url = url.replace("postgresql://", "postgresql+asyncpg://")
+    
+    # Auto-détection de l'environnement Kubernetes
+    if os.getenv("KUBERNETES_SERVICE_HOST"):
+        url = url.replace("@localhost:", "@db-service:")
+    # Auto-détection de l'environnement Docker
+    elif os.getenv("ENVIRONMENT") == "docker" or os.path.exists("/.dockerenv"):
+        url = url.replace("@localhost:", "@medisecure-db:")
+    
+    return url
+
+
 class DatabaseSettings(BaseSettings):
     """Configuration de la base de données"""
     
@@ -20,25 +36,41 @@ class DatabaseSettings(BaseSettings):
         description="URL de connexion à la base de données de test"
     )
     
+    # Réplicas en lecture seule, séparés par des virgules (aucun par défaut)
+    replica_urls: str = Field(
+        default="",
+        env="DATABASE_REPLICA_URLS",
+        description="URLs de connexion aux réplicas en lecture"
+    )
+    
+    # Durée pendant laquelle un client qui vient d'écrire lit sur le primaire
+    read_your_writes_seconds: int = Field(default=5, env="DB_READ_YOUR_WRITES_SECONDS")
+    # Durée d'écartement d'un réplica après un échec de connexion
+    replica_retry_seconds: int = Field(default=30, env="DB_REPLICA_RETRY_SECONDS")
+    
     pool_size: int = Field(default=10, env="DB_POOL_SIZE")
     max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    pool_timeout: int = Field(default=30, env="DB_POOL_TIMEOUT")
     pool_recycle: int = Field(default=3600, env="DB_POOL_RECYCLE")
     echo: bool = Field(default=False, env="DB_ECHO")
     
+    # Seuil au-delà duquel une requête SQL est journalisée comme lente
+    slow_query_ms: int = Field(default=200, env="DB_SLOW_QUERY_MS")
+    # Nombre de requêtes SQL par requête HTTP au-delà duquel un N+1 est signalé
+    max_queries_per_request: int = Field(default=25, env="DB_MAX_QUERIES_PER_REQUEST")
+    
     @validator("url", pre=True)
     def ensure_asyncpg_driver(cls, v):
         """S'assurer que l'URL utilise le driver asyncpg"""
-        if "postgresql://" in v and "asyncpg" not in v:
-            v = v.replace("postgresql://", "postgresql+asyncpg://")
-        
-        # Auto-détection de l'environnement Kubernetes
-        if os.getenv("KUBERNETES_SERVICE_HOST"):
-            v = v.replace("@localhost:", "@db-service:")
-        # Auto-détection de l'environnement Docker
-        elif os.getenv("ENVIRONMENT") == "docker" or os.path.exists("/.dockerenv"):
-            v = v.replace("@localhost:", "@medisecure-db:")
-        
-        return v
+        return normalize_database_url(v)
+    
+    def get_replica_urls(self) -> List[str]:
+        """Obtenir la liste des URLs des réplicas configurés"""
+        return [
+            normalize_database_url(url.strip())
+            for url in (self.replica_urls or "").split(",")
+            if url.strip()
+        ]
 
 
 class SecuritySettings(BaseSettings):
@@ -57,10 +89,18 @@ class SecuritySettings(BaseSettings):
         env="ACCESS_TOKEN_EXPIRE_MINUTES"
     )
     
+    # Cache des tokens déjà vérifiés (borné en taille et en durée)
+    token_cache_size: int = Field(default=1024, env="TOKEN_CACHE_SIZE")
+    token_cache_ttl_seconds: int = Field(default=300, env="TOKEN_CACHE_TTL_SECONDS")
+    
     password_min_length: int = Field(default=8, env="PASSWORD_MIN_LENGTH")
     
     bcrypt_rounds: int = Field(default=12, env="BCRYPT_ROUNDS")
     
+    # Pool de threads dédié au hachage bcrypt (hors boucle d'événements)
+    password_hash_workers: int = Field(default=4, env="PASSWORD_HASH_WORKERS")
+    password_hash_max_queue: int = Field(default=32, env="PASSWORD_HASH_MAX_QUEUE")
+    
     @validator("jwt_secret_key")
     def validate_jwt_secret(cls, v):
         """Valider la clé secrète JWT"""
@@ -74,6 +114,69 @@ class SecuritySettings(BaseSettings):
         return v
 
 
+class CacheSettings(BaseSettings):
+    """Configuration des caches d'enregistrements"""
+    
+    # Stockage partagé entre processus : redis://..., memory:// (local) ou vide (aucun).
+    # PRINCIPAL_CACHE_URL, l'ancien nom, reste accepté
+    url: Optional[str] = Field(default=None, env=["CACHE_URL", "PRINCIPAL_CACHE_URL"])
+    # Avec un stockage partagé, une entrée en mémoire d'un processus ne vit pas plus
+    # longtemps : une invalidation faite par un autre processus ne l'atteint pas
+    local_ttl_seconds: float = Field(default=2, env="CACHE_LOCAL_TTL_SECONDS")
+    
+    # Cache des utilisateurs (identité, rôle, état du compte)
+    principal_size: int = Field(default=1024, env="PRINCIPAL_CACHE_SIZE")
+    principal_ttl_seconds: int = Field(default=60, env="PRINCIPAL_CACHE_TTL_SECONDS")
+    
+    # Cache des dossiers patients, borné en entrées et en octets par processus
+    patient_size: int = Field(default=2048, env="PATIENT_CACHE_SIZE")
+    patient_max_bytes: int = Field(default=8 * 1024 * 1024, env="PATIENT_CACHE_MAX_BYTES")
+    patient_ttl_seconds: int = Field(default=120, env="PATIENT_CACHE_TTL_SECONDS")
+
+
+class MailSettings(BaseSettings):
+    """Configuration de l'envoi des emails"""
+    
+    smtp_host: str = Field(default="smtp.example.com", env="SMTP_HOST")
+    smtp_port: int = Field(default=587, env="SMTP_PORT")
+    # Sans utilisateur, aucune authentification n'est tentée (serveur local de test)
+    smtp_user: Optional[str] = Field(default="user@example.com", env="SMTP_USER")
+    smtp_password: str = Field(default="your_password_here", env="SMTP_PASSWORD")
+    smtp_starttls: bool = Field(default=True, env="SMTP_STARTTLS")
+    smtp_timeout_seconds: int = Field(default=10, env="SMTP_TIMEOUT_SECONDS")
+    email_from: str = Field(default="noreply@medisecure.com", env="EMAIL_FROM")
+    
+    # Connexions SMTP authentifiées conservées entre deux envois
+    smtp_pool_size: int = Field(default=2, env="SMTP_POOL_SIZE")
+    # Une connexion inutilisée depuis plus longtemps est vérifiée (NOOP) avant réutilisation
+    smtp_keepalive_seconds: int = Field(default=60, env="SMTP_KEEPALIVE_SECONDS")
+    
+    # Boîte d'envoi : les emails sont envoyés en arrière-plan, par lots, avec reprises
+    outbox_worker_enabled: bool = Field(default=True, env="MAIL_OUTBOX_WORKER")
+    outbox_batch_size: int = Field(default=50, env="MAIL_OUTBOX_BATCH_SIZE")
+    outbox_poll_seconds: int = Field(default=5, env="MAIL_OUTBOX_POLL_SECONDS")
+    outbox_lease_seconds: int = Field(default=120, env="MAIL_OUTBOX_LEASE_SECONDS")
+    outbox_max_attempts: int = Field(default=6, env="MAIL_OUTBOX_MAX_ATTEMPTS")
+    outbox_retry_base_seconds: int = Field(default=30, env="MAIL_OUTBOX_RETRY_BASE_SECONDS")
+
+
+class SchedulingSettings(BaseSettings):
+    """Configuration de la prise de rendez-vous"""
+    
+    # Plage de consultation par défaut et jours travaillés (0 = lundi)
+    working_day_start: time = Field(default=time(8, 0), env="WORKING_DAY_START")
+    working_day_end: time = Field(default=time(18, 0), env="WORKING_DAY_END")
+    working_days: str = Field(default="0,1,2,3,4", env="WORKING_DAYS")
+    
+    slot_minutes: int = Field(default=30, env="SLOT_MINUTES")
+    # Nombre maximum de jours par demande de disponibilités
+    availability_max_days: int = Field(default=62, env="AVAILABILITY_MAX_DAYS")
+    
+    def get_working_days(self) -> Tuple[int, ...]:
+        """Obtenir les jours travaillés"""
+        return tuple(int(day) for day in self.working_days.split(",") if day.strip())
+
+
 class ServerSettings(BaseSettings):
     """Configuration du serveur"""
     
@@ -146,6 +249,9 @@ class Settings(BaseSettings):
     # Sous-configurations
     database: DatabaseSettings = DatabaseSettings()
     security: SecuritySettings = SecuritySettings()
+    cache: CacheSettings = CacheSettings()
+    mail: MailSettings = MailSettings()
+    scheduling: SchedulingSettings = SchedulingSettings()
     server: ServerSettings = ServerSettings()
     logging: LoggingSettings = LoggingSettings()
     
@@ -172,6 +278,12 @@ class Settings(BaseSettings):
             return self.database.test_url
         return self.database.url
     
+    def get_replica_urls(self) -> List[str]:
+        """Obtenir les URLs des réplicas en lecture (aucun en mode test)"""
+        if self.testing:
+            return []
+        return self.database.get_replica_urls()
+    
     def is_development(self) -> bool:
         """Vérifier si on est en mode développement"""
         return self.server.environment == "development"
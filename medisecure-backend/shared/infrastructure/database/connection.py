@@ -1,11 +1,11 @@
 # medisecure-backend/shared/infrastructure/database/connection.py
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import declarative_base
 import logging
 from typing import AsyncGenerator
 
 from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.database.engine_registry import get_engine, get_session_factory
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -13,28 +13,9 @@ logger = logging.getLogger(__name__)
 # Récupérer les settings centralisées
 settings = get_settings()
 
-# Configuration optimisée du moteur asynchrone
-engine = create_async_engine(
-    settings.get_database_url(),
-    echo=settings.database.echo,
-    pool_size=settings.database.pool_size,
-    max_overflow=settings.database.max_overflow,
-    pool_pre_ping=True,  # Vérifier la connexion avant de l'utiliser
-    pool_recycle=settings.database.pool_recycle,  # Recycler les connexions
-    # Optimisations pour les performances async
-    future=True,  # Utiliser la nouvelle API SQLAlchemy 2.0
-    # Pour les tests, on peut utiliser NullPool pour éviter les problèmes de concurrence
-    poolclass=NullPool if settings.testing else None,
-)
-
-# Création de la session asynchrone optimisée
-AsyncSessionLocal = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,  # Important pour async : ne pas expirer les objets après commit
-)
+# Moteur et factory de session partagés via le registre (un seul pool par processus)
+engine = get_engine()
+AsyncSessionLocal = get_session_factory()
 
 # Classe de base pour les modèles
 Base = declarative_base()
@@ -49,7 +30,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession: Session de base de données asynchrone
     """
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
         except Exception:
@@ -66,7 +47,7 @@ def create_async_session_factory():
     Factory pour créer des sessions asynchrones.
     Utilisée par le container d'injection de dépendances.
     """
-    return AsyncSessionLocal
+    return get_session_factory()
 
 # Fonction utilitaire pour les tests
 async def create_test_session() -> AsyncSession:
@@ -79,7 +60,7 @@ async def create_test_session() -> AsyncSession:
     if not settings.testing:
         logger.warning("create_test_session() appelée en dehors du contexte de test")
     
-    return AsyncSessionLocal()
+    return get_session_factory()()
 
 # Log de la configuration au démarrage
 def log_database_config():
@@ -92,6 +73,7 @@ def log_database_config():
     logger.info(f"Driver: asyncpg (PostgreSQL async)")
     logger.info(f"Pool size: {settings.database.pool_size}")
     logger.info(f"Max overflow: {settings.database.max_overflow}")
+    logger.info(f"Pool timeout: {settings.database.pool_timeout}s")
     logger.info(f"Pool recycle: {settings.database.pool_recycle}s")
     logger.info(f"Echo SQL: {settings.database.echo}")
     logger.info(f"Testing mode: {settings.testing}")
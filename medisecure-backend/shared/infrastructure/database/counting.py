@@ -0,0 +1,84 @@
+# shared/infrastructure/database/counting.py
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import BigInteger, Select, cast, column, func, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import ScalarSelect
+
+from shared.domain.enums.count_mode import CountMode
+
+# Vue minimale du catalogue PostgreSQL utilisée pour l'estimation
+_pg_class = table("pg_class", column("oid"), column("reltuples"))
+
+
+def total_column(
+    count_query: Select,
+    table_name: str,
+    mode: CountMode,
+    filtered: bool = False
+) -> Optional[ScalarSelect]:
+    """
+    Construit la sous-requête scalaire qui calcule le total d'une liste.
+
+    Elle est ajoutée comme colonne à la requête de la page : la page et
+    le total sont ainsi lus dans le même aller-retour.
+
+    Args:
+        count_query: La requête count(*) exacte (avec les filtres de la liste)
+        table_name: La table listée, pour l'estimation
+        mode: Le mode de comptage demandé
+        filtered: Si la liste est filtrée ; l'estimation ne porte que sur la
+            table entière, le total reste alors exact
+
+    Returns:
+        Optional[ScalarSelect]: La sous-requête, ou None si aucun total n'est demandé
+    """
+    if mode == CountMode.NONE:
+        return None
+
+    if mode == CountMode.ESTIMATED and not filtered:
+        # reltuples vaut -1 tant que la table n'a jamais été analysée
+        return (
+            select(cast(func.greatest(_pg_class.c.reltuples, 0), BigInteger))
+            .where(_pg_class.c.oid == func.to_regclass(table_name))
+            .scalar_subquery()
+        )
+
+    return count_query.scalar_subquery()
+
+
+async def execute_with_total(
+    session: AsyncSession,
+    query: Select,
+    total: Optional[ScalarSelect]
+) -> Tuple[List[Any], Optional[int]]:
+    """
+    Exécute la requête d'une page en y ajoutant la colonne du total.
+
+    Args:
+        session: La session à utiliser
+        query: La requête de la page (une entité, ou une projection de colonnes)
+        total: La sous-requête du total (voir total_column), ou None
+
+    Returns:
+        Tuple[List[Any], Optional[int]]: Les modèles de la page (ou, pour une
+        projection, les tuples de valeurs) et le total
+    """
+    width = len(query.column_descriptions)
+
+    if total is None:
+        result = await session.execute(query)
+        if width == 1:
+            return list(result.scalars().all()), None
+        return [tuple(row) for row in result.all()], None
+
+    result = await session.execute(query.add_columns(total.label("total")))
+    rows = result.all()
+    if rows:
+        if width == 1:
+            return [row[0] for row in rows], int(rows[0][1])
+        return [tuple(row[:width]) for row in rows], int(rows[0][width])
+
+    # Page vide : aucune ligne n'a pu porter le total, on le lit seul
+    result = await session.execute(select(total))
+    return [], int(result.scalar() or 0)
@@ -0,0 +1,282 @@
+# shared/infrastructure/database/engine_registry.py
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+import itertools
+import logging
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from shared.infrastructure.config.settings import get_settings, Settings
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+PRIMARY = "primary"
+# Préfixe des réplicas en lecture : "replica_1", "replica_2", ...
+REPLICA = "replica"
+
+
+@dataclass
+class PoolStatistics:
+    """Compteurs cumulés sur l'acquisition des connexions d'un pool"""
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    failures: int = 0
+    # Instant (time.monotonic) du dernier échec de connexion
+    last_failure_at: Optional[float] = None
+
+    def record_wait(self, wait_ms: float) -> None:
+        """Enregistre le temps passé à attendre une connexion"""
+        self.checkouts += 1
+        self.total_wait_ms += wait_ms
+        if wait_ms > self.max_wait_ms:
+            self.max_wait_ms = wait_ms
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Temps d'attente moyen par acquisition"""
+        if not self.checkouts:
+            return 0.0
+        return self.total_wait_ms / self.checkouts
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool asynchrone qui mesure le temps d'attente des connexions
+    et compte les timeouts d'acquisition.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.statistics.timeouts += 1
+            logger.warning("Timeout lors de l'acquisition d'une connexion du pool")
+            raise
+        except Exception:
+            self.statistics.failures += 1
+            self.statistics.last_failure_at = time.monotonic()
+            raise
+        finally:
+            self.statistics.record_wait((time.perf_counter() - start) * 1000)
+
+
+class EngineRegistry:
+    """
+    Registre des moteurs SQLAlchemy de l'application.
+
+    Garantit un seul moteur (et donc un seul pool de connexions) par base
+    de données et par processus, partagé par get_db et par le container.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """
+        Initialise le registre.
+
+        Args:
+            settings: La configuration à utiliser (settings globales par défaut)
+        """
+        self._settings = settings
+        self._engines: Dict[str, AsyncEngine] = {}
+        self._session_factories: Dict[str, sessionmaker] = {}
+        self._lock = threading.Lock()
+        self._replica_cycle = itertools.count()
+        # Instant (time.monotonic) du dernier échec signalé par base
+        self._failures: Dict[str, float] = {}
+
+    @property
+    def settings(self) -> Settings:
+        return self._settings or get_settings()
+
+    def _urls(self) -> Dict[str, str]:
+        """Retourne les URLs de connexion connues, indexées par nom"""
+        urls = {PRIMARY: self.settings.get_database_url()}
+        for index, url in enumerate(self.settings.get_replica_urls(), start=1):
+            urls[f"{REPLICA}_{index}"] = url
+        return urls
+
+    def replica_names(self) -> List[str]:
+        """Retourne les noms des réplicas configurés"""
+        return [name for name in self._urls() if name.startswith(REPLICA)]
+
+    def mark_unavailable(self, name: str) -> None:
+        """
+        Écarte une base après un échec de connexion constaté hors du pool.
+
+        Args:
+            name: Le nom de la base (ex. "replica_1")
+        """
+        self._failures[name] = time.monotonic()
+
+    def _is_available(self, name: str) -> bool:
+        """Un réplica est écarté pendant un temps après un échec de connexion"""
+        failures = [self._failures.get(name)]
+        engine = self._engines.get(name)
+        if engine is not None and isinstance(engine.pool, InstrumentedAsyncQueuePool):
+            failures.append(engine.pool.statistics.last_failure_at)
+        failures = [failed_at for failed_at in failures if failed_at is not None]
+        if not failures:
+            return True
+        return time.monotonic() - max(failures) >= self.settings.database.replica_retry_seconds
+
+    def pick_replica(self) -> Optional[str]:
+        """
+        Choisit un réplica disponible, à tour de rôle.
+
+        Returns:
+            Optional[str]: Le nom du réplica, ou None si aucun n'est disponible
+        """
+        replicas = self.replica_names()
+        if not replicas:
+            return None
+
+        start = next(self._replica_cycle)
+        for offset in range(len(replicas)):
+            name = replicas[(start + offset) % len(replicas)]
+            if self._is_available(name):
+                return name
+
+        logger.warning("Aucun réplica disponible, lecture sur le primaire")
+        return None
+
+    def _create_engine(self, url: str) -> AsyncEngine:
+        """Crée un moteur asynchrone avec la configuration centralisée"""
+        database = self.settings.database
+
+        if self.settings.testing:
+            # Pour les tests, NullPool évite les problèmes de concurrence
+            return create_async_engine(
+                url,
+                echo=database.echo,
+                poolclass=NullPool,
+                future=True,
+            )
+
+        return create_async_engine(
+            url,
+            echo=database.echo,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=database.pool_size,
+            max_overflow=database.max_overflow,
+            pool_timeout=database.pool_timeout,
+            pool_pre_ping=True,  # Vérifier la connexion avant de l'utiliser
+            pool_recycle=database.pool_recycle,  # Recycler les connexions
+            future=True,
+        )
+
+    def get_engine(self, name: str = PRIMARY) -> AsyncEngine:
+        """
+        Retourne le moteur associé à un nom, en le créant au premier appel.
+
+        Args:
+            name: Le nom de la base de données ("primary" par défaut)
+
+        Returns:
+            AsyncEngine: Le moteur partagé
+        """
+        engine = self._engines.get(name)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            if name not in self._engines:
+                urls = self._urls()
+                if name not in urls:
+                    raise KeyError(f"Base de données inconnue: {name}")
+                self._engines[name] = self._create_engine(urls[name])
+                logger.info(f"Moteur de base de données '{name}' créé")
+            return self._engines[name]
+
+    def get_session_factory(self, name: str = PRIMARY) -> sessionmaker:
+        """
+        Retourne la factory de sessions liée au moteur demandé.
+
+        Args:
+            name: Le nom de la base de données ("primary" par défaut)
+
+        Returns:
+            sessionmaker: La factory de sessions asynchrones partagée
+        """
+        factory = self._session_factories.get(name)
+        if factory is None:
+            factory = sessionmaker(
+                self.get_engine(name),
+                class_=AsyncSession,
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,  # Important pour async : ne pas expirer les objets après commit
+            )
+            self._session_factories[name] = factory
+        return factory
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retourne l'état des pools de connexions des moteurs déjà créés.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistiques par base de données
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        for name, engine in list(self._engines.items()):
+            pool = engine.pool
+            if not isinstance(pool, InstrumentedAsyncQueuePool):
+                stats[name] = {"pool": type(pool).__name__}
+                continue
+
+            statistics = pool.statistics
+            stats[name] = {
+                "pool": type(pool).__name__,
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": self.settings.database.max_overflow,
+                "checkouts": statistics.checkouts,
+                "timeouts": statistics.timeouts,
+                "avg_wait_ms": round(statistics.avg_wait_ms, 3),
+                "max_wait_ms": round(statistics.max_wait_ms, 3),
+                "failures": statistics.failures,
+            }
+        return stats
+
+    async def dispose(self) -> None:
+        """Ferme toutes les connexions et vide le registre"""
+        with self._lock:
+            engines = list(self._engines.items())
+            self._engines.clear()
+            self._session_factories.clear()
+
+        for name, engine in engines:
+            await engine.dispose()
+            logger.info(f"Moteur de base de données '{name}' fermé")
+
+
+# Instance globale du registre
+engine_registry = EngineRegistry()
+
+
+def get_engine(name: str = PRIMARY) -> AsyncEngine:
+    """Obtenir le moteur partagé"""
+    return engine_registry.get_engine(name)
+
+
+def get_session_factory(name: str = PRIMARY) -> sessionmaker:
+    """Obtenir la factory de sessions partagée"""
+    return engine_registry.get_session_factory(name)
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Obtenir les statistiques des pools de connexions"""
+    return engine_registry.pool_stats()
@@ -2,5 +2,7 @@
 from shared.infrastructure.database.models.user_model import UserModel
 from shared.infrastructure.database.models.patient_model import PatientModel
 from shared.infrastructure.database.models.appointment_model import AppointmentModel
+from shared.infrastructure.database.models.appointment_stats_model import AppointmentDailyStatsModel
+from shared.infrastructure.database.models.email_outbox_model import EmailOutboxModel
 
-# Cet ordre est important pour résoudre les dépendances circulaires
\ No newline at end of file
+# Cet ordre est important pour résoudre les dépendances circulaires
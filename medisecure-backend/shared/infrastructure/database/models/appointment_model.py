@@ -1,6 +1,6 @@
 # shared/infrastructure/database/models/appointment_model.py
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Enum, Index, DDL, event, func, text
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
@@ -16,6 +16,10 @@ class AppointmentStatus(str, enum.Enum):
     COMPLETED = "COMPLETED"
     MISSED = "MISSED"
 
+# Prédicat des rendez-vous qui occupent le créneau du médecin. Il est écrit en clair
+# (sans paramètres) pour que le planificateur puisse utiliser l'index partiel.
+BLOCKING_STATUS_CLAUSE = "status IN ('SCHEDULED', 'CONFIRMED')"
+
 class AppointmentModel(Base):
     """Modèle SQLAlchemy pour la table des rendez-vous"""
     __tablename__ = "appointments"
@@ -36,9 +40,33 @@ class AppointmentModel(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
     
+    __table_args__ = (
+        # Un médecin ne peut pas avoir deux rendez-vous actifs qui se chevauchent.
+        # L'index GiST de la contrainte sert aussi la recherche de conflits du repository.
+        ExcludeConstraint(
+            (doctor_id, "="),
+            (func.tsrange(start_time, end_time, text("'[)'")), "&&"),
+            name="appointments_doctor_no_overlap",
+            using="gist",
+            where=text(BLOCKING_STATUS_CLAUSE)
+        ),
+        # Listes d'un médecin ou d'un patient, du plus récent au plus ancien (pagination keyset)
+        Index("idx_appointments_doctor_start", doctor_id, start_time.desc(), id.desc()),
+        Index("idx_appointments_patient_start", patient_id, start_time.desc(), id.desc()),
+        # Calendrier : rendez-vous actifs par ordre chronologique
+        Index("idx_appointments_active_start", start_time, id, postgresql_where=text("is_active")),
+    )
+    
     # Relations
     patient = relationship("PatientModel", back_populates="appointments")
     doctor = relationship("UserModel", foreign_keys=[doctor_id])
     
     def __repr__(self):
-        return f"<Appointment {self.id} for patient {self.patient_id}>"
\ No newline at end of file
+        return f"<Appointment {self.id} for patient {self.patient_id}>"
+
+# La contrainte d'exclusion combine un UUID (=) et une plage (&&) : btree_gist est requis
+event.listen(
+    AppointmentModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist")
+)
\ No newline at end of file
@@ -0,0 +1,67 @@
+# shared/infrastructure/database/models/appointment_stats_model.py
+from sqlalchemy import Column, Date, Integer, Enum, Index, DDL, event
+from sqlalchemy.dialects.postgresql import UUID
+
+from shared.infrastructure.database.connection import Base
+from shared.infrastructure.database.models.appointment_model import AppointmentModel, AppointmentStatus
+
+# Agrégats tenus à jour par un trigger sur appointments : chaque insertion,
+# modification ou suppression retire l'ancienne contribution de la ligne et
+# ajoute la nouvelle. Seuls les rendez-vous actifs (is_active) sont comptés.
+# Le même SQL est repris par init.sql et par la migration 7a4c2e9b1d53.
+REFRESH_STATS_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_appointment_daily_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.is_active THEN
+    UPDATE appointment_daily_stats
+       SET appointment_count = appointment_count - 1,
+           booked_minutes = booked_minutes - (EXTRACT(EPOCH FROM (OLD.end_time - OLD.start_time)) / 60)::INTEGER
+     WHERE doctor_id = OLD.doctor_id AND day = OLD.start_time::DATE AND status = OLD.status;
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.is_active THEN
+    INSERT INTO appointment_daily_stats (doctor_id, day, status, appointment_count, booked_minutes)
+    VALUES (
+      NEW.doctor_id, NEW.start_time::DATE, NEW.status, 1,
+      (EXTRACT(EPOCH FROM (NEW.end_time - NEW.start_time)) / 60)::INTEGER
+    )
+    ON CONFLICT (doctor_id, day, status) DO UPDATE
+       SET appointment_count = appointment_daily_stats.appointment_count + 1,
+           booked_minutes = appointment_daily_stats.booked_minutes + EXCLUDED.booked_minutes;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+REFRESH_STATS_TRIGGER = """
+CREATE TRIGGER refresh_appointment_daily_stats
+  AFTER INSERT OR UPDATE OF doctor_id, start_time, end_time, status, is_active OR DELETE ON appointments
+  FOR EACH ROW
+  EXECUTE FUNCTION refresh_appointment_daily_stats();
+"""
+
+class AppointmentDailyStatsModel(Base):
+    """Modèle SQLAlchemy pour les agrégats de rendez-vous par médecin, jour et statut"""
+    __tablename__ = "appointment_daily_stats"
+    
+    doctor_id = Column(UUID(as_uuid=True), primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(Enum(AppointmentStatus), primary_key=True)
+    appointment_count = Column(Integer, nullable=False, default=0)
+    booked_minutes = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        # Tableau de bord de la clinique : tous les médecins sur une plage de jours
+        Index("idx_appointment_daily_stats_day", day),
+    )
+    
+    def __repr__(self):
+        return f"<AppointmentDailyStats {self.doctor_id} {self.day} {self.status}>"
+
+# Le trigger est posé sur appointments ; le corps de la fonction n'est résolu
+# qu'à l'exécution, l'ordre de création des deux tables est donc indifférent
+event.listen(AppointmentModel.__table__, "after_create", DDL(REFRESH_STATS_FUNCTION))
+event.listen(AppointmentModel.__table__, "after_create", DDL(REFRESH_STATS_TRIGGER))
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text, Index, text
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
+import uuid
+from datetime import datetime
+
+from shared.infrastructure.database.connection import Base
+
+class EmailOutboxModel(Base):
+    """Modèle SQLAlchemy pour la boîte d'envoi des emails"""
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    to_email = Column(String(255), nullable=False)
+    cc = Column(ARRAY(String), nullable=False, server_default="{}")
+    bcc = Column(ARRAY(String), nullable=False, server_default="{}")
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    html_body = Column(Text)
+    status = Column(String(20), nullable=False, default="PENDING")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime)
+
+    __table_args__ = (
+        # Seuls les emails en attente sont parcourus par les workers
+        Index(
+            "idx_email_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING'")
+        ),
+    )
+
+    def __repr__(self):
+        return f"<EmailOutbox {self.to_email} {self.status}>"
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Date, ForeignKey, DateTime, Boolean, Text
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Date, ForeignKey, DateTime, Boolean, Text, Computed, Index, DDL, event
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
@@ -46,10 +46,56 @@ class PatientModel(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
     
+    # Colonnes de recherche calculées par PostgreSQL (jamais écrites par l'application)
+    search_name = Column(
+        Text,
+        Computed("lower(first_name || ' ' || last_name)", persisted=True)
+    )
+    phone_digits = Column(
+        Text,
+        Computed("regexp_replace(coalesce(phone_number, ''), '[^0-9]', '', 'g')", persisted=True)
+    )
+    search_email = Column(
+        Text,
+        Computed("lower(coalesce(email, ''))", persisted=True)
+    )
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', first_name || ' ' || last_name || ' ' || coalesce(email, ''))",
+            persisted=True
+        )
+    )
+    
+    __table_args__ = (
+        # Liste des patients par nom (pagination keyset)
+        Index("idx_patients_last_name", "last_name", "id"),
+        Index("idx_patients_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_patients_search_name_trgm", "search_name",
+            postgresql_using="gin", postgresql_ops={"search_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "idx_patients_phone_digits_trgm", "phone_digits",
+            postgresql_using="gin", postgresql_ops={"phone_digits": "gin_trgm_ops"}
+        ),
+        Index(
+            "idx_patients_search_email_trgm", "search_email",
+            postgresql_using="gin", postgresql_ops={"search_email": "gin_trgm_ops"}
+        ),
+    )
+    
     # Relations
     user = relationship("UserModel", foreign_keys=[user_id])
     # Utiliser une chaîne simple pour éviter les imports circulaires
     appointments = relationship("AppointmentModel", back_populates="patient")
     
     def __repr__(self):
-        return f"<Patient {self.first_name} {self.last_name}>"
\ No newline at end of file
+        return f"<Patient {self.first_name} {self.last_name}>"
+
+# Les index trigrammes nécessitent l'extension pg_trgm
+event.listen(
+    PatientModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
\ No newline at end of file
@@ -0,0 +1,148 @@
+# shared/infrastructure/database/query_instrumentation.py
+from typing import Optional
+import logging
+import re
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.monitoring.metrics import MetricsRegistry, get_metrics_registry
+from shared.infrastructure.monitoring.timing import current_operation, current_timer
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Opération attribuée aux requêtes émises hors d'un repository (migrations, health check, ...)
+UNKNOWN_OPERATION = "<unknown>"
+
+# Longueur maximale du SQL normalisé dans les logs
+MAX_SQL_LENGTH = 500
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"\$\d+(?:::[\w\[\]]+)?|%\(\w+\)s|\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+# Clé des instants de début des requêtes en cours dans Connection.info
+_STARTED_AT = "query_instrumentation_started_at"
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Normalise une requête SQL pour les logs : littéraux et paramètres sont
+    remplacés par `?`, les listes IN (...) sont repliées. Deux exécutions
+    de la même requête produisent ainsi le même texte, sans données patient.
+
+    Args:
+        statement: La requête telle qu'envoyée au driver
+
+    Returns:
+        str: La requête normalisée
+    """
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _IN_LIST.sub("(...)", sql)
+    if len(sql) > MAX_SQL_LENGTH:
+        sql = sql[:MAX_SQL_LENGTH] + "..."
+    return sql
+
+
+class QueryInstrumentation:
+    """
+    Instrumentation des requêtes SQL par les événements du moteur SQLAlchemy.
+
+    Chaque requête est mesurée (durée, lignes) et attribuée à la méthode de
+    repository qui l'a émise (voir timed_methods). Les requêtes lentes sont
+    journalisées avec leur SQL normalisé ; les compteurs alimentent le
+    registre des métriques et le chronomètre de la requête HTTP en cours,
+    qui en déduit le nombre de requêtes SQL par requête HTTP.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, slow_query_ms: float = 200):
+        """
+        Initialise l'instrumentation.
+
+        Args:
+            registry: Le registre des métriques (celui du processus par défaut)
+            slow_query_ms: Le seuil des requêtes lentes, en millisecondes
+        """
+        self.registry = registry or get_metrics_registry()
+        self.slow_query_ms = slow_query_ms
+
+    def install(self, engine) -> None:
+        """
+        Branche l'instrumentation sur un moteur (synchrone ou asynchrone),
+        ou sur la classe Engine pour instrumenter tous les moteurs du processus.
+
+        Args:
+            engine: Le moteur à instrumenter
+        """
+        sync_engine: Engine = getattr(engine, "sync_engine", engine)
+        if event.contains(sync_engine, "before_cursor_execute", self._before_cursor_execute):
+            return
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get(_STARTED_AT)
+        if not started:
+            return
+        seconds = time.perf_counter() - started.pop()
+        # -1 quand le driver ne connaît pas le nombre de lignes (curseur serveur)
+        rowcount = getattr(cursor, "rowcount", -1)
+        self.record(statement, seconds, rowcount if isinstance(rowcount, int) else -1)
+
+    def _handle_error(self, exception_context) -> None:
+        conn = exception_context.connection
+        started = conn.info.get(_STARTED_AT) if conn is not None else None
+        if started:
+            seconds = time.perf_counter() - started.pop()
+            self.record(exception_context.statement or "", seconds, -1)
+
+    def record(self, statement: str, seconds: float, rowcount: int) -> None:
+        """
+        Enregistre une requête exécutée.
+
+        Args:
+            statement: La requête SQL
+            seconds: Sa durée d'exécution
+            rowcount: Le nombre de lignes lues ou modifiées (-1 si inconnu)
+        """
+        operation = current_operation() or UNKNOWN_OPERATION
+        slow = seconds * 1000 >= self.slow_query_ms
+        if slow:
+            logger.warning(
+                f"Requête SQL lente ({seconds * 1000:.1f} ms, {operation}): {normalize_sql(statement)}"
+            )
+
+        self.registry.observe_query(operation, seconds, rowcount, slow)
+        timer = current_timer()
+        if timer is not None:
+            timer.record_query(operation, seconds)
+
+
+# Instance globale de l'instrumentation
+_query_instrumentation: Optional[QueryInstrumentation] = None
+_query_instrumentation_lock = threading.Lock()
+
+
+def get_query_instrumentation() -> QueryInstrumentation:
+    """Obtenir l'instrumentation SQL partagée"""
+    global _query_instrumentation
+    if _query_instrumentation is None:
+        with _query_instrumentation_lock:
+            if _query_instrumentation is None:
+                _query_instrumentation = QueryInstrumentation(
+                    slow_query_ms=get_settings().database.slow_query_ms
+                )
+    return _query_instrumentation
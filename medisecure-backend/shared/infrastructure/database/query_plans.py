@@ -0,0 +1,127 @@
+# shared/infrastructure/database/query_plans.py
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Union
+from uuid import UUID
+import json
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class HotQuery:
+    """Requête fréquente dont le plan d'exécution doit s'appuyer sur un index"""
+    name: str
+    sql: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+# Requêtes fréquentes de l'application, écrites comme les génèrent les repositories.
+# Les valeurs des paramètres n'ont pas d'importance : seul le plan est examiné.
+_SAMPLE_ID = UUID("00000000-0000-0000-0000-000000000000")
+_SAMPLE_START = datetime(2030, 1, 7, 0, 0)
+_SAMPLE_END = datetime(2030, 1, 13, 23, 59, 59)
+
+HOT_QUERIES: List[HotQuery] = [
+    HotQuery(
+        "appointments_by_doctor",
+        "SELECT * FROM appointments WHERE doctor_id = :doctor_id "
+        "ORDER BY start_time DESC, id DESC LIMIT 101",
+        {"doctor_id": _SAMPLE_ID}
+    ),
+    HotQuery(
+        "appointments_by_patient",
+        "SELECT * FROM appointments WHERE patient_id = :patient_id "
+        "ORDER BY start_time DESC, id DESC LIMIT 101",
+        {"patient_id": _SAMPLE_ID}
+    ),
+    HotQuery(
+        "appointments_calendar",
+        "SELECT * FROM appointments WHERE is_active = true "
+        "AND start_time <= :end_time AND end_time >= :start_time "
+        "ORDER BY start_time, id LIMIT 101",
+        {"start_time": _SAMPLE_START, "end_time": _SAMPLE_END}
+    ),
+    HotQuery(
+        "appointments_doctor_conflict",
+        "SELECT EXISTS (SELECT 1 FROM appointments WHERE doctor_id = :doctor_id "
+        "AND status IN ('SCHEDULED', 'CONFIRMED') "
+        "AND tsrange(start_time, end_time, '[)') && tsrange(:start_time, :end_time, '[)'))",
+        {"doctor_id": _SAMPLE_ID, "start_time": _SAMPLE_START, "end_time": _SAMPLE_END}
+    ),
+    HotQuery(
+        "appointment_daily_stats_month",
+        "SELECT * FROM appointment_daily_stats WHERE day >= :start_day AND day <= :end_day "
+        "AND appointment_count > 0 ORDER BY doctor_id, day",
+        {"start_day": _SAMPLE_START.date(), "end_day": _SAMPLE_END.date()}
+    ),
+    HotQuery(
+        "patients_page",
+        "SELECT * FROM patients ORDER BY last_name, id LIMIT 101"
+    ),
+    HotQuery(
+        "patients_by_email",
+        "SELECT * FROM patients WHERE email = :email",
+        {"email": "john.doe@example.com"}
+    ),
+    HotQuery(
+        "patients_search_name",
+        "SELECT * FROM patients WHERE search_name LIKE :pattern LIMIT 20",
+        {"pattern": "%dupon%"}
+    ),
+]
+
+def find_seq_scans(plan: Union[str, List[Dict[str, Any]], Dict[str, Any]]) -> List[str]:
+    """
+    Liste les tables parcourues séquentiellement dans un plan EXPLAIN (FORMAT JSON).
+
+    Args:
+        plan: Le plan, tel que renvoyé par PostgreSQL (texte JSON ou structure décodée)
+
+    Returns:
+        List[str]: Les noms des tables lues par un Seq Scan, dans l'ordre du plan
+    """
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    if isinstance(plan, list):
+        return [table for item in plan for table in find_seq_scans(item)]
+
+    node = plan.get("Plan", plan)
+    tables = []
+    if node.get("Node Type") == "Seq Scan":
+        tables.append(node.get("Relation Name", "?"))
+    for child in node.get("Plans", []):
+        tables.extend(find_seq_scans(child))
+    return tables
+
+async def check_hot_queries(engine: AsyncEngine, queries: List[HotQuery] = HOT_QUERIES) -> Dict[str, List[str]]:
+    """
+    Signale les requêtes fréquentes dont le plan contient encore un parcours séquentiel.
+
+    Les parcours séquentiels sont désactivés pendant l'analyse : sur une petite base le
+    planificateur les préfère même quand un index existe, alors qu'une requête qui en
+    garde un malgré tout n'a aucun index utilisable.
+
+    Args:
+        engine: Le moteur de la base à analyser
+        queries: Les requêtes à analyser
+
+    Returns:
+        Dict[str, List[str]]: Pour chaque requête en défaut, les tables parcourues séquentiellement
+    """
+    flagged: Dict[str, List[str]] = {}
+    async with engine.connect() as connection:
+        # SET LOCAL : le réglage disparaît avec la transaction, la connexion revient intacte au pool
+        async with connection.begin() as transaction:
+            await connection.execute(text("SET LOCAL enable_seqscan = off"))
+            for query in queries:
+                result = await connection.execute(text(f"EXPLAIN (FORMAT JSON) {query.sql}"), query.params)
+                tables = find_seq_scans(result.scalar())
+                if tables:
+                    logger.warning(f"Parcours séquentiel pour {query.name}: {', '.join(tables)}")
+                    flagged[query.name] = tables
+            await transaction.rollback()
+    return flagged
@@ -0,0 +1,184 @@
+# shared/infrastructure/database/read_routing.py
+from contextvars import ContextVar, Token
+from typing import Dict, Optional
+import logging
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.infrastructure.database.engine_registry import EngineRegistry, engine_registry, PRIMARY
+from shared.infrastructure.database.unit_of_work import UnitOfWork
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Les lectures ne partent sur un réplica que si la requête en cours l'autorise
+# (requêtes GET). Hors requête HTTP (scripts, tâches), tout reste sur le primaire.
+_replica_reads_allowed: ContextVar[bool] = ContextVar("replica_reads_allowed", default=False)
+
+
+# Vrai pendant les requêtes d'un client qui vient d'écrire : ses lectures
+# doivent refléter ses écritures et contournent donc aussi les caches.
+_recent_writer: ContextVar[bool] = ContextVar("recent_writer", default=False)
+
+
+def allow_replica_reads(allowed: bool = True) -> Token:
+    """
+    Autorise (ou non) les lectures sur réplica pour le contexte courant.
+
+    Returns:
+        Token: Le jeton à passer à reset_replica_reads
+    """
+    return _replica_reads_allowed.set(allowed)
+
+
+def reset_replica_reads(token: Token) -> None:
+    """Restaure l'autorisation précédente"""
+    _replica_reads_allowed.reset(token)
+
+
+def replica_reads_allowed() -> bool:
+    """Indique si les lectures du contexte courant peuvent partir sur un réplica"""
+    return _replica_reads_allowed.get()
+
+
+def mark_recent_writer(recent: bool = True) -> Token:
+    """
+    Signale que la requête en cours vient d'un client qui vient d'écrire.
+
+    Returns:
+        Token: Le jeton à passer à reset_recent_writer
+    """
+    return _recent_writer.set(recent)
+
+
+def reset_recent_writer(token: Token) -> None:
+    """Restaure le signalement précédent"""
+    _recent_writer.reset(token)
+
+
+def is_recent_writer() -> bool:
+    """Indique si le client de la requête en cours vient d'écrire"""
+    return _recent_writer.get()
+
+
+class ReadYourWritesTracker:
+    """
+    Mémorise les clients qui viennent d'écrire pour que leurs lectures suivantes
+    restent sur le primaire tant que les réplicas peuvent être en retard.
+    Le suivi est local au processus : ReadRoutingMiddleware le complète par un
+    cookie pour les lectures servies par un autre worker.
+    """
+
+    def __init__(self, window_seconds: float):
+        """
+        Initialise le suivi.
+
+        Args:
+            window_seconds: La durée pendant laquelle un client qui a écrit lit sur le primaire
+        """
+        self.window_seconds = window_seconds
+        self._writes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record_write(self, client_key: str) -> None:
+        """Enregistre une écriture du client"""
+        now = time.monotonic()
+        with self._lock:
+            self._writes[client_key] = now
+            # Purger les entrées expirées pour borner la mémoire
+            if len(self._writes) > 10000:
+                self._writes = {
+                    key: written_at for key, written_at in self._writes.items()
+                    if now - written_at < self.window_seconds
+                }
+
+    def wrote_recently(self, client_key: str) -> bool:
+        """Indique si le client a écrit pendant la fenêtre"""
+        written_at = self._writes.get(client_key)
+        return written_at is not None and time.monotonic() - written_at < self.window_seconds
+
+
+class _ReadSession:
+    """
+    Gestionnaire de contexte d'une session de lecture.
+
+    La connexion à un réplica est établie dès l'ouverture : si elle échoue, le
+    réplica est écarté et la même lecture repart sur le primaire au lieu d'échouer.
+    """
+
+    def __init__(self, factory: "ReadSessionFactory"):
+        self._factory = factory
+        self._session: Optional[AsyncSession] = None
+
+    async def __aenter__(self) -> AsyncSession:
+        registry = self._factory.registry
+        target = self._factory.target()
+        session = registry.get_session_factory(target)()
+
+        if target != PRIMARY:
+            try:
+                await session.connection()
+            except (exc.DBAPIError, OSError) as e:
+                logger.warning(f"Réplica '{target}' injoignable, lecture sur le primaire: {e}")
+                registry.mark_unavailable(target)
+                await session.close()
+                session = registry.get_session_factory(PRIMARY)()
+
+        self._session = session
+        return session
+
+    async def __aexit__(self, exc_type, exc_value, tb) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class ReadSessionFactory:
+    """
+    Factory de sessions pour les méthodes de lecture des repositories.
+    Ouvre une session sur un réplica quand le contexte l'autorise et qu'un
+    réplica est disponible, sur le primaire sinon (ou si le réplica ne répond pas).
+    """
+
+    def __init__(self, registry: Optional[EngineRegistry] = None):
+        """
+        Initialise la factory.
+
+        Args:
+            registry: Le registre des moteurs (registre global par défaut)
+        """
+        self.registry = registry or engine_registry
+
+    def target(self) -> str:
+        """Retourne le nom de la base sur laquelle lire"""
+        if not replica_reads_allowed():
+            return PRIMARY
+        return self.registry.pick_replica() or PRIMARY
+
+    def __call__(self) -> _ReadSession:
+        """Ouvre une session de lecture (à utiliser avec `async with`)"""
+        return _ReadSession(self)
+
+
+def select_read_factory(session_factory, read_session_factory=None):
+    """
+    Choisit la factory des lectures d'un repository.
+
+    Dans une unité de travail, les lectures restent dans sa transaction pour
+    voir ses propres écritures ; sans factory dédiée, elles suivent les écritures.
+    """
+    if read_session_factory is None or isinstance(session_factory, UnitOfWork):
+        return session_factory
+    return read_session_factory
+
+
+# Instance globale de la factory de lecture
+read_session_factory = ReadSessionFactory()
+
+
+def get_read_session_factory() -> ReadSessionFactory:
+    """Obtenir la factory de sessions de lecture partagée"""
+    return read_session_factory
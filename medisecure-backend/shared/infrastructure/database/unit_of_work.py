@@ -0,0 +1,134 @@
+# shared/infrastructure/database/unit_of_work.py
+from typing import Awaitable, Callable, List, Optional
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Clé posée dans session.info pour signaler qu'une session appartient à une unité de travail
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+class _BorrowedSession:
+    """
+    Gestionnaire de contexte prêtant la session de l'unité de travail
+    à un repository sans la fermer à la sortie.
+    """
+
+    def __init__(self, unit_of_work: "UnitOfWork"):
+        self._unit_of_work = unit_of_work
+
+    async def __aenter__(self) -> AsyncSession:
+        return self._unit_of_work.session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # La session reste ouverte : c'est l'unité de travail qui la ferme
+        return None
+
+
+class UnitOfWork:
+    """
+    Unité de travail : une seule session et une seule transaction partagées
+    par tous les repositories d'un cas d'utilisation, validées une seule fois.
+
+    L'instance s'utilise comme une factory de session : on la passe aux
+    repositories à la place de `session_factory`.
+
+    Exemple:
+        async with container.unit_of_work() as uow:
+            repository = container.patient_repository(session_factory=uow)
+            ...
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        """
+        Initialise l'unité de travail.
+
+        Args:
+            session_factory: La factory de session SQLAlchemy à utiliser
+        """
+        self.session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        """Session partagée, ouverte au premier accès"""
+        if self._session is None:
+            self._session = self.session_factory()
+            self._session.info[UNIT_OF_WORK_KEY] = self
+        return self._session
+
+    def __call__(self) -> _BorrowedSession:
+        """Prête la session partagée (compatible avec `async with session_factory()`)"""
+        return _BorrowedSession(self)
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.close()
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Enregistre une action à exécuter une fois la transaction validée
+        (ex. invalidation d'un cache). Elle est abandonnée en cas d'annulation.
+
+        Args:
+            callback: La coroutine à appeler après le commit
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """Valide la transaction en cours puis exécute les actions différées"""
+        if self._session is not None:
+            await self._session.commit()
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                # La transaction est validée : une action différée ne doit pas la faire échouer
+                logger.exception(f"Erreur lors d'une action après validation: {str(e)}")
+
+    async def rollback(self) -> None:
+        """Annule la transaction en cours et abandonne les actions différées"""
+        self._after_commit = []
+        if self._session is not None:
+            logger.debug("Annulation de l'unité de travail")
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        """Ferme la session partagée et rend la connexion au pool"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def is_managed(session: AsyncSession) -> bool:
+    """Indique si la session appartient à une unité de travail"""
+    return UNIT_OF_WORK_KEY in session.info
+
+
+async def commit_or_flush(session: AsyncSession) -> None:
+    """
+    Valide la session si elle est autonome, sinon se contente d'envoyer
+    les changements : le commit est alors laissé à l'unité de travail.
+
+    Args:
+        session: La session utilisée par le repository
+    """
+    if is_managed(session):
+        await session.flush()
+    else:
+        await session.commit()
@@ -8,6 +8,11 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.database.engine_registry import get_pool_stats
+from shared.infrastructure.services.password_hasher import get_password_hasher
+from shared.infrastructure.services.principal_cache import get_principal_cache
+from shared.infrastructure.services.outbox_worker import get_outbox_worker
+from patient_management.infrastructure.adapters.secondary.cached_patient_repository import get_patient_cache
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +129,59 @@ class HealthChecker:
         
         return HealthCheck("configuration", status, details)
     
+    def check_database_pool(self) -> HealthCheck:
+        """Vérifier l'état des pools de connexions à la base de données"""
+        pools = get_pool_stats()
+        status = HealthStatus.HEALTHY
+        
+        for stats in pools.values():
+            if "size" not in stats:
+                continue
+            
+            # Des timeouts ou un pool saturé indiquent une contention sur les connexions
+            capacity = stats["size"] + stats["max_overflow"]
+            if stats["timeouts"] > 0 or stats["checked_out"] >= capacity:
+                status = HealthStatus.DEGRADED
+        
+        return HealthCheck("database_pool", status, {"pools": pools})
+    
+    def check_password_hasher(self) -> HealthCheck:
+        """Vérifier l'état du pool de hachage des mots de passe"""
+        stats = get_password_hasher().stats()
+        
+        # Une file pleine ou des refus indiquent que les connexions dépassent la capacité de calcul
+        if stats["rejected"] > 0 or stats["queued"] >= stats["max_queue"]:
+            status = HealthStatus.DEGRADED
+        else:
+            status = HealthStatus.HEALTHY
+        
+        return HealthCheck("password_hasher", status, stats)
+    
+    def check_caches(self) -> HealthCheck:
+        """Vérifier l'état des caches d'enregistrements (utilisateurs, patients)"""
+        caches = {
+            "principal": get_principal_cache().stats(),
+            "patient": get_patient_cache().stats(),
+        }
+        
+        # Un stockage partagé injoignable renvoie toutes les lectures vers la base
+        status = HealthStatus.HEALTHY
+        if any(stats["backend_errors"] > 0 for stats in caches.values()):
+            status = HealthStatus.DEGRADED
+        
+        return HealthCheck("caches", status, {"caches": caches})
+    
+    def check_mailer(self) -> HealthCheck:
+        """Vérifier l'état du worker d'envoi des emails et du pool SMTP"""
+        stats = get_outbox_worker().stats()
+        
+        # Des reprises ou des abandons indiquent un serveur SMTP injoignable ou qui refuse les envois
+        status = HealthStatus.HEALTHY
+        if stats["retried"] > 0 or stats["failed"] > 0:
+            status = HealthStatus.DEGRADED
+        
+        return HealthCheck("mailer", status, stats)
+    
     def check_memory_and_performance(self) -> HealthCheck:
         """Vérifier la mémoire et les performances basiques"""
         try:
@@ -170,8 +228,18 @@ class HealthChecker:
         if session:
             db_check = await self.check_database(session)
             self.checks.append(db_check)
+            self.checks.append(self.check_database_pool())
+        
+        # Check 3: Pool de hachage des mots de passe
+        self.checks.append(self.check_password_hasher())
+        
+        # Check 4: Caches des utilisateurs et des patients
+        self.checks.append(self.check_caches())
+        
+        # Check 5: Envoi des emails
+        self.checks.append(self.check_mailer())
         
-        # Check 3: Système
+        # Check 6: Système
         system_check = self.check_memory_and_performance()
         self.checks.append(system_check)
         
@@ -0,0 +1,269 @@
+# shared/infrastructure/monitoring/metrics.py
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+import threading
+
+# Bornes des buckets de latence (secondes), du dixième de milliseconde à 10 s
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Bornes des buckets du nombre de requêtes SQL par requête HTTP
+QUERY_COUNT_BUCKETS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200)
+
+# Quantiles publiés pour chaque histogramme
+QUANTILES: Tuple[float, ...] = (0.5, 0.95, 0.99)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class LatencyHistogram:
+    """
+    Histogramme de latences à buckets fixes : mémoire constante quel que soit
+    le nombre d'observations. Les quantiles sont estimés par interpolation
+    linéaire dans le bucket qui les contient, comme histogram_quantile().
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # Un compteur par bucket, plus le dernier pour les valeurs au-delà de la plus grande borne
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Enregistre une durée"""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estime un quantile.
+
+        Args:
+            q: Le quantile recherché (entre 0 et 1)
+
+        Returns:
+            Optional[float]: La durée estimée, None sans observation
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.buckets):
+                    # Au-delà de la dernière borne : on ne peut que la renvoyer
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """
+    Registre en mémoire des latences par route et par étape (span) de traitement,
+    et des requêtes SQL par opération, publié au format texte de Prometheus.
+    """
+
+    def __init__(self, namespace: str = "medisecure"):
+        self.namespace = namespace
+        self._requests: Dict[Labels, LatencyHistogram] = {}
+        self._spans: Dict[Labels, LatencyHistogram] = {}
+        self._responses: Dict[Labels, int] = {}
+        self._request_queries: Dict[Labels, LatencyHistogram] = {}
+        self._over_query_budget: Dict[Labels, int] = {}
+        self._queries: Dict[Labels, LatencyHistogram] = {}
+        self._query_rows: Dict[Labels, int] = {}
+        self._slow_queries: Dict[Labels, int] = {}
+        self._lock = threading.Lock()
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        seconds: float,
+        spans: Dict[str, float],
+        queries: int = 0,
+        over_query_budget: bool = False
+    ) -> None:
+        """
+        Enregistre une requête terminée et la durée de chacune de ses étapes.
+
+        Args:
+            method: La méthode HTTP
+            route: Le gabarit de la route (ex. /api/patients/{patient_id})
+            status_code: Le code de la réponse
+            seconds: La durée totale de la requête
+            spans: La durée cumulée de chaque étape
+            queries: Le nombre de requêtes SQL émises
+            over_query_budget: Si ce nombre dépasse le budget par requête
+        """
+        route_labels = (("method", method), ("route", route))
+        status_labels = route_labels + (("status", str(status_code)),)
+        with self._lock:
+            self._histogram(self._requests, route_labels).observe(seconds)
+            self._responses[status_labels] = self._responses.get(status_labels, 0) + 1
+            for span, span_seconds in spans.items():
+                self._histogram(self._spans, route_labels + (("span", span),)).observe(span_seconds)
+            self._histogram(self._request_queries, route_labels, QUERY_COUNT_BUCKETS).observe(queries)
+            if over_query_budget:
+                self._over_query_budget[route_labels] = self._over_query_budget.get(route_labels, 0) + 1
+
+    def observe_query(self, operation: str, seconds: float, rows: int, slow: bool) -> None:
+        """
+        Enregistre une requête SQL exécutée.
+
+        Args:
+            operation: La méthode de repository qui l'a émise
+            seconds: La durée d'exécution
+            rows: Le nombre de lignes lues ou modifiées (négatif si inconnu)
+            slow: Si la requête dépasse le seuil des requêtes lentes
+        """
+        labels: Labels = (("operation", operation),)
+        with self._lock:
+            self._histogram(self._queries, labels).observe(seconds)
+            if rows > 0:
+                self._query_rows[labels] = self._query_rows.get(labels, 0) + rows
+            if slow:
+                self._slow_queries[labels] = self._slow_queries.get(labels, 0) + 1
+
+    @staticmethod
+    def _histogram(
+        histograms: Dict[Labels, LatencyHistogram],
+        labels: Labels,
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> LatencyHistogram:
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = histograms[labels] = LatencyHistogram(buckets)
+        return histogram
+
+    def quantiles(self, method: str, route: str, span: Optional[str] = None) -> Dict[float, Optional[float]]:
+        """
+        Retourne les quantiles publiés d'une route (ou de l'une de ses étapes).
+
+        Returns:
+            Dict[float, Optional[float]]: La durée estimée pour chaque quantile
+        """
+        labels: Labels = (("method", method), ("route", route))
+        with self._lock:
+            if span is None:
+                histogram = self._requests.get(labels)
+            else:
+                histogram = self._spans.get(labels + (("span", span),))
+            return {q: histogram.quantile(q) if histogram else None for q in QUANTILES}
+
+    def render_prometheus(self) -> str:
+        """
+        Sérialise le registre au format d'exposition texte de Prometheus (0.0.4).
+
+        Returns:
+            str: Les métriques
+        """
+        lines: List[str] = []
+        with self._lock:
+            self._render_counters(
+                lines, f"{self.namespace}_http_requests_total",
+                "Requêtes HTTP traitées, par route et par code de réponse", self._responses
+            )
+            self._render_histograms(
+                lines, f"{self.namespace}_http_request_duration_seconds",
+                "Durée des requêtes HTTP, par route", self._requests
+            )
+            self._render_histograms(
+                lines, f"{self.namespace}_request_span_duration_seconds",
+                "Durée des étapes de traitement des requêtes, par route", self._spans
+            )
+            self._render_histograms(
+                lines, f"{self.namespace}_request_sql_queries",
+                "Requêtes SQL émises par requête HTTP, par route", self._request_queries
+            )
+            self._render_counters(
+                lines, f"{self.namespace}_requests_over_query_budget_total",
+                "Requêtes HTTP ayant dépassé le budget de requêtes SQL (N+1 probable), par route",
+                self._over_query_budget
+            )
+            self._render_histograms(
+                lines, f"{self.namespace}_sql_query_duration_seconds",
+                "Durée des requêtes SQL, par opération", self._queries
+            )
+            self._render_counters(
+                lines, f"{self.namespace}_sql_rows_total",
+                "Lignes lues ou modifiées par les requêtes SQL, par opération", self._query_rows
+            )
+            self._render_counters(
+                lines, f"{self.namespace}_sql_slow_queries_total",
+                "Requêtes SQL au-delà du seuil des requêtes lentes, par opération", self._slow_queries
+            )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_counters(lines: List[str], name: str, description: str, counters: Dict[Labels, int]) -> None:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        for labels, count in sorted(counters.items()):
+            lines.append(f"{name}{_format_labels(labels)} {count}")
+
+    def _render_histograms(self, lines: List[str], name: str, description: str, histograms: Dict[Labels, LatencyHistogram]) -> None:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                cumulative += bucket_count
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', _format_value(bound)),))} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        # Quantiles estimés dans le processus (p50, p95, p99)
+        if name.endswith("_seconds"):
+            quantile_name = f"{name[:-len('_seconds')]}_quantile_seconds"
+        else:
+            quantile_name = f"{name}_quantile"
+        lines.append(f"# HELP {quantile_name} {description}, quantiles estimés dans le processus")
+        lines.append(f"# TYPE {quantile_name} gauge")
+        for labels, histogram in sorted(histograms.items()):
+            for q in QUANTILES:
+                value = histogram.quantile(q)
+                if value is not None:
+                    lines.append(f"{quantile_name}{_format_labels(labels + (('quantile', str(q)),))} {_format_value(value)}")
+
+    def clear(self) -> None:
+        """Vide le registre"""
+        with self._lock:
+            self._requests.clear()
+            self._spans.clear()
+            self._responses.clear()
+            self._request_queries.clear()
+            self._over_query_budget.clear()
+            self._queries.clear()
+            self._query_rows.clear()
+            self._slow_queries.clear()
+
+
+def _format_labels(labels: Labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
+
+
+# Registre global du processus
+_metrics_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Obtenir le registre des métriques du processus"""
+    return _metrics_registry
@@ -0,0 +1,61 @@
+# shared/infrastructure/monitoring/timed_route.py
+from typing import Any, Callable, Coroutine
+import asyncio
+import functools
+import time
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from shared.infrastructure.monitoring.timing import current_timer
+
+
+class TimedRoute(APIRoute):
+    """
+    Route FastAPI qui découpe le temps de traitement d'une requête en étapes :
+
+    - `dependencies` : lecture du corps et résolution des dépendances (Depends)
+    - `endpoint` : exécution de la fonction de la route (cas d'utilisation, repositories)
+    - `serialization` : validation du modèle de réponse et rendu JSON
+
+    La route résolue (gabarit, ex. /api/patients/{patient_id}) est
+    transmise au chronomètre de la requête pour l'agrégation par route.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, endpoint, **kwargs)
+        # Le handler FastAPI appelle dependant.call : on l'enveloppe sans toucher à l'endpoint exposé
+        call = self.dependant.call
+        if asyncio.iscoroutinefunction(call):
+            @functools.wraps(call)
+            async def timed_call(*args, **kwargs):
+                timer = current_timer()
+                if timer is None or timer.handler_started_at is None:
+                    return await call(*args, **kwargs)
+                started_at = time.perf_counter()
+                timer.add("dependencies", started_at - timer.handler_started_at)
+                try:
+                    return await call(*args, **kwargs)
+                finally:
+                    timer.endpoint_finished_at = time.perf_counter()
+                    timer.add("endpoint", timer.endpoint_finished_at - started_at)
+            self.dependant.call = timed_call
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        route = self.path_format
+
+        async def timed_handler(request: Request) -> Response:
+            timer = current_timer()
+            if timer is None:
+                return await handler(request)
+            timer.route = route
+            timer.handler_started_at = time.perf_counter()
+            timer.add("middleware", timer.handler_started_at - timer.started_at)
+            timer.endpoint_finished_at = None
+            response = await handler(request)
+            if timer.endpoint_finished_at is not None:
+                timer.add("serialization", time.perf_counter() - timer.endpoint_finished_at)
+            return response
+
+        return timed_handler
@@ -0,0 +1,147 @@
+# shared/infrastructure/monitoring/timing.py
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, Optional, Set, Type, TypeVar
+import functools
+import inspect
+import time
+
+T = TypeVar("T")
+
+
+class RequestTimer:
+    """
+    Chronométrage d'une requête : route résolue et durée cumulée de chaque étape.
+    Une étape imbriquée dans une étape du même nom n'est comptée qu'une fois.
+    """
+
+    __slots__ = (
+        "started_at", "handler_started_at", "endpoint_finished_at", "route", "spans",
+        "queries", "query_operations", "_active"
+    )
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        # Repères posés par TimedRoute autour du handler et de l'endpoint
+        self.handler_started_at: Optional[float] = None
+        self.endpoint_finished_at: Optional[float] = None
+        self.route: Optional[str] = None
+        self.spans: Dict[str, float] = {}
+        # Requêtes SQL émises, au total et par opération (méthode de repository)
+        self.queries = 0
+        self.query_operations: Dict[str, int] = {}
+        self._active: Set[str] = set()
+
+    def add(self, span: str, seconds: float) -> None:
+        """Ajoute une durée à une étape"""
+        self.spans[span] = self.spans.get(span, 0.0) + seconds
+
+    def record_query(self, operation: str, seconds: float) -> None:
+        """Compte une requête SQL et ajoute sa durée à l'étape `sql`"""
+        self.queries += 1
+        self.query_operations[operation] = self.query_operations.get(operation, 0) + 1
+        self.add("sql", seconds)
+
+
+# Chronomètre de la requête en cours (posé par TimingMiddleware)
+_current_timer: ContextVar[Optional[RequestTimer]] = ContextVar("request_timer", default=None)
+
+# Méthode de repository en cours d'exécution (ex. PostgresPatientRepository.get_by_id)
+_current_operation: ContextVar[Optional[str]] = ContextVar("repository_operation", default=None)
+
+
+def start_request_timer() -> Token:
+    """Démarre le chronométrage d'une requête dans le contexte courant"""
+    return _current_timer.set(RequestTimer())
+
+
+def stop_request_timer(token: Token) -> None:
+    """Termine le chronométrage démarré par start_request_timer"""
+    _current_timer.reset(token)
+
+
+def current_timer() -> Optional[RequestTimer]:
+    """Chronomètre de la requête en cours, None hors requête"""
+    return _current_timer.get()
+
+
+def current_operation() -> Optional[str]:
+    """Méthode de repository en cours d'exécution, None en dehors d'un repository"""
+    return _current_operation.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Mesure une étape de la requête en cours (sans effet hors requête).
+
+    Exemple:
+        with span("authentication"):
+            payload = verifier.verify(token)
+    """
+    timer = _current_timer.get()
+    if timer is None or name in timer._active:
+        yield
+        return
+
+    timer._active.add(name)
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, time.perf_counter() - started_at)
+        timer._active.discard(name)
+
+
+def timed_methods(span_name: str):
+    """
+    Décorateur de classe : mesure toutes les méthodes publiques asynchrones
+    (coroutines et générateurs asynchrones) sous l'étape `span_name`, et les
+    désigne comme opération courante pour l'instrumentation SQL.
+
+    Pour un générateur, seul le temps passé à produire les éléments est compté,
+    pas celui du consommateur.
+    """
+    def decorate(cls: Type[T]) -> Type[T]:
+        for attribute, method in list(vars(cls).items()):
+            if attribute.startswith("_"):
+                continue
+            operation = f"{cls.__name__}.{attribute}"
+            if inspect.iscoroutinefunction(method):
+                setattr(cls, attribute, _timed_coroutine(method, span_name, operation))
+            elif inspect.isasyncgenfunction(method):
+                setattr(cls, attribute, _timed_async_generator(method, span_name, operation))
+        return cls
+    return decorate
+
+
+def _timed_coroutine(method, span_name: str, operation: str):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = _current_operation.set(operation)
+        try:
+            with span(span_name):
+                return await method(*args, **kwargs)
+        finally:
+            _current_operation.reset(token)
+    return wrapper
+
+
+def _timed_async_generator(method, span_name: str, operation: str):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        generator = method(*args, **kwargs)
+        try:
+            while True:
+                token = _current_operation.set(operation)
+                try:
+                    with span(span_name):
+                        item = await generator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _current_operation.reset(token)
+                yield item
+        finally:
+            await generator.aclose()
+    return wrapper
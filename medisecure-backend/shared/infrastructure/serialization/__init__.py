@@ -0,0 +1,8 @@
+# shared/infrastructure/serialization/__init__.py
+"""
+Sérialisation JSON des réponses de l'API (orjson).
+"""
+
+from .json_response import ORJSONResponse, ResponseSerializer, dumps
+
+__all__ = ["ORJSONResponse", "ResponseSerializer", "dumps"]
@@ -0,0 +1,96 @@
+# shared/infrastructure/serialization/json_response.py
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+# Clés non textuelles (ex. entiers dans un JSONB) converties plutôt que refusées
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Types que orjson ne sérialise pas nativement"""
+    if isinstance(value, BaseModel):
+        return value.dict()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Type non sérialisable en JSON: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Sérialise un contenu en JSON avec orjson.
+
+    UUID, dates, énumérations et dataclasses sont pris en charge nativement,
+    dans le même format que l'encodeur de FastAPI (ISO 8601, valeur de l'énumération).
+
+    Args:
+        content: Le contenu à sérialiser
+
+    Returns:
+        bytes: Le JSON encodé en UTF-8
+    """
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    Réponse JSON rendue par orjson, classe de réponse par défaut de l'API.
+
+    Retournée directement par un endpoint, elle court-circuite la validation
+    du response_model par FastAPI : le contenu doit alors déjà avoir la forme
+    du DTO (voir ResponseSerializer).
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class ResponseSerializer:
+    """
+    Sérialiseur précompilé d'un DTO de réponse.
+
+    Les champs du DTO sont lus une fois pour toutes ; chaque objet (entité du
+    domaine ou ligne SQLAlchemy) est ensuite converti par un seul attrgetter,
+    sans construire ni valider de modèle Pydantic. Réservé aux données de
+    confiance issues des repositories, déjà conformes au DTO.
+
+    Exemple:
+        PATIENT_SERIALIZER = ResponseSerializer(PatientResponseDTO)
+        return ORJSONResponse({"patients": PATIENT_SERIALIZER.many(patients), ...})
+    """
+
+    def __init__(self, dto: Type[BaseModel]):
+        """
+        Initialise le sérialiseur.
+
+        Args:
+            dto: Le DTO de réponse dont les champs sont à produire
+        """
+        self.fields: Tuple[str, ...] = tuple(dto.__fields__)
+        getter = attrgetter(*self.fields)
+        if len(self.fields) == 1:
+            # attrgetter d'un seul champ renvoie la valeur, pas un tuple
+            self._values = lambda item: (getter(item),)
+        else:
+            self._values = getter
+
+    def one(self, item: Any) -> Dict[str, Any]:
+        """Convertit un objet en dictionnaire sérialisable"""
+        return dict(zip(self.fields, self._values(item)))
+
+    def many(self, items: Iterable[Any]) -> List[Dict[str, Any]]:
+        """Convertit une suite d'objets en dictionnaires sérialisables"""
+        fields, values = self.fields, self._values
+        return [dict(zip(fields, values(item))) for item in items]
+
+    def json_line(self, item: Any) -> bytes:
+        """Sérialise un objet en une ligne NDJSON"""
+        return dumps(self.one(item)) + b"\n"
@@ -0,0 +1,79 @@
+import logging
+from typing import List, Optional
+from uuid import uuid4
+
+from shared.domain.entities.outbox_email import OutboxEmail
+from shared.ports.secondary.email_outbox_repository_protocol import EmailOutboxRepositoryProtocol
+from shared.infrastructure.services.smtp_mailer import SmtpMailer
+from shared.infrastructure.services.outbox_worker import OutboxWorker
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class OutboxMailer(SmtpMailer):
+    """
+    Adaptateur secondaire pour l'envoi d'emails via la boîte d'envoi.
+    Implémente le port MailerProtocol.
+
+    `send_email` enregistre l'email et rend la main aussitôt : l'envoi SMTP
+    est fait en arrière-plan par OutboxWorker, avec reprises. True signifie
+    donc que l'email est accepté pour envoi. Avec un repository construit sur
+    l'unité de travail, l'email n'existe que si la transaction est validée.
+    """
+
+    def __init__(self, outbox_repository: EmailOutboxRepositoryProtocol, worker: Optional[OutboxWorker] = None):
+        """
+        Initialise le mailer.
+
+        Args:
+            outbox_repository: La boîte d'envoi
+            worker: Le worker à réveiller après chaque ajout (optionnel)
+        """
+        super().__init__()
+        self.outbox_repository = outbox_repository
+        self.worker = worker
+
+    async def send_email(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        html_body: Optional[str] = None,
+        attachments: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Ajoute un email à la boîte d'envoi.
+
+        Args:
+            to_email: L'adresse email du destinataire
+            subject: Le sujet de l'email
+            body: Le corps de l'email en texte brut
+            cc: Les adresses email en copie (optionnel)
+            bcc: Les adresses email en copie cachée (optionnel)
+            html_body: Le corps de l'email en HTML (optionnel)
+            attachments: Les pièces jointes (non prises en charge)
+
+        Returns:
+            bool: True si l'email a été accepté pour envoi, False sinon
+        """
+        email = OutboxEmail(
+            id=uuid4(),
+            to_email=to_email,
+            subject=subject,
+            body=body,
+            html_body=html_body,
+            cc=list(cc or []),
+            bcc=list(bcc or [])
+        )
+
+        try:
+            await self.outbox_repository.enqueue(email)
+        except Exception as e:
+            logger.error(f"Erreur lors de l'ajout de l'email à la boîte d'envoi: {str(e)}")
+            return False
+
+        if self.worker is not None:
+            self.worker.notify()
+        return True
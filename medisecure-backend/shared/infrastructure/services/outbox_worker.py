@@ -0,0 +1,207 @@
+# shared/infrastructure/services/outbox_worker.py
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+import smtplib
+import threading
+
+from shared.domain.entities.outbox_email import OutboxEmail
+from shared.ports.secondary.email_outbox_repository_protocol import EmailOutboxRepositoryProtocol
+from shared.adapters.secondary.postgres_email_outbox_repository import PostgresEmailOutboxRepository
+from shared.infrastructure.database.engine_registry import get_session_factory
+from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.services.smtp_mailer import SmtpConnectionPool, build_message, get_smtp_pool
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Délai maximum entre deux tentatives d'envoi
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """
+    Indique si un échec SMTP est définitif (code 5xx sur le message ou ses destinataires).
+    Un refus d'authentification relève de la configuration et reste réessayé.
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPAuthenticationError):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+
+class OutboxWorker:
+    """
+    Envoi en arrière-plan des emails de la boîte d'envoi.
+
+    Le worker réserve les emails dus par lots, les envoie sur le pool de
+    connexions SMTP puis enregistre le résultat. Un échec temporaire est
+    réessayé avec un délai exponentiel ; au-delà de `max_attempts`, ou sur
+    un refus définitif du serveur, l'email passe à l'état FAILED.
+    Plusieurs processus peuvent faire tourner un worker sur la même table.
+    """
+
+    def __init__(
+        self,
+        repository: EmailOutboxRepositoryProtocol,
+        pool: SmtpConnectionPool,
+        email_from: str,
+        batch_size: int = 50,
+        poll_seconds: float = 5,
+        lease_seconds: int = 120,
+        max_attempts: int = 6,
+        retry_base_seconds: int = 30
+    ):
+        """
+        Initialise le worker.
+
+        Args:
+            repository: La boîte d'envoi
+            pool: Le pool de connexions SMTP
+            email_from: L'adresse de l'expéditeur
+            batch_size: Le nombre maximum d'emails envoyés par lot
+            poll_seconds: L'intervalle de consultation de la boîte d'envoi lorsqu'elle est vide
+            lease_seconds: La durée de réservation d'un lot
+            max_attempts: Le nombre maximum de tentatives par email
+            retry_base_seconds: Le délai avant la première reprise, doublé à chaque échec
+        """
+        self.repository = repository
+        self.pool = pool
+        self.email_from = email_from
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._sent = 0
+        self._retried = 0
+        self._failed = 0
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        """Délai avant la tentative suivante, après `attempts` échecs"""
+        return min(timedelta(seconds=self.retry_base_seconds * 2 ** (attempts - 1)), MAX_RETRY_DELAY)
+
+    async def run_once(self) -> int:
+        """
+        Envoie un lot d'emails dus.
+
+        Returns:
+            int: Le nombre d'emails traités
+        """
+        emails = await self.repository.claim_due(self.batch_size, self.lease_seconds)
+        if not emails:
+            return 0
+
+        errors = await self.pool.send([
+            (
+                self.email_from,
+                email.recipients,
+                build_message(self.email_from, email.to_email, email.subject, email.body, email.cc, email.html_body)
+            )
+            for email in emails
+        ])
+
+        now = datetime.utcnow()
+        for email, error in zip(emails, errors):
+            if error is None:
+                email.mark_sent(now)
+                self._sent += 1
+            else:
+                self._record_failure(email, error, now)
+
+        await self.repository.save_results(emails)
+        return len(emails)
+
+    def _record_failure(self, email: OutboxEmail, error: Exception, now: datetime) -> None:
+        if is_permanent_failure(error) or email.attempts + 1 >= self.max_attempts:
+            email.mark_failed(str(error), now, retry_delay=None)
+            self._failed += 1
+            logger.error(f"Abandon de l'envoi de l'email {email.id} après {email.attempts} tentative(s): {error}")
+        else:
+            email.mark_failed(str(error), now, retry_delay=self.retry_delay(email.attempts + 1))
+            self._retried += 1
+            logger.warning(f"Échec de l'envoi de l'email {email.id}, nouvelle tentative à {email.next_attempt_at}: {error}")
+
+    def notify(self) -> None:
+        """Signale qu'un email vient d'être ajouté à la boîte d'envoi"""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Démarre la boucle d'envoi dans la boucle d'événements courante"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info("Worker d'envoi des emails démarré")
+
+    async def stop(self) -> None:
+        """Arrête la boucle d'envoi (le lot en cours sera repris après sa réservation)"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Erreur du worker d'envoi des emails: {e}")
+                processed = 0
+
+            # Lot complet : la boîte d'envoi contient sans doute d'autres emails dus
+            if processed >= self.batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne l'activité du worker et l'état du pool SMTP.
+
+        Returns:
+            Dict[str, Any]: Les statistiques du worker
+        """
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "sent": self._sent,
+            "retried": self._retried,
+            "failed": self._failed,
+            "smtp_pool": self.pool.stats(),
+        }
+
+
+# Instance globale, créée à la première utilisation
+_outbox_worker: Optional[OutboxWorker] = None
+_outbox_worker_lock = threading.Lock()
+
+
+def get_outbox_worker() -> OutboxWorker:
+    """Obtenir le worker d'envoi des emails partagé"""
+    global _outbox_worker
+    if _outbox_worker is None:
+        with _outbox_worker_lock:
+            if _outbox_worker is None:
+                mail = get_settings().mail
+                _outbox_worker = OutboxWorker(
+                    repository=PostgresEmailOutboxRepository(session_factory=get_session_factory()),
+                    pool=get_smtp_pool(),
+                    email_from=mail.email_from,
+                    batch_size=mail.outbox_batch_size,
+                    poll_seconds=mail.outbox_poll_seconds,
+                    lease_seconds=mail.outbox_lease_seconds,
+                    max_attempts=mail.outbox_max_attempts,
+                    retry_base_seconds=mail.outbox_retry_base_seconds
+                )
+    return _outbox_worker
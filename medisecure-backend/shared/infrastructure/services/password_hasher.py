@@ -0,0 +1,207 @@
+# shared/infrastructure/services/password_hasher.py
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import logging
+import threading
+import time
+
+import bcrypt
+
+from shared.infrastructure.config.settings import get_settings
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherOverloadedException(Exception):
+    """Exception levée lorsque la file d'attente du hachage des mots de passe est pleine"""
+    def __init__(self, pending: int):
+        self.pending = pending
+        super().__init__(f"Password hashing queue is full ({pending} pending operations)")
+
+
+@dataclass
+class PasswordHasherStatistics:
+    """Compteurs cumulés du pool de hachage"""
+    completed: int = 0
+    rejected: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    total_run_ms: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Temps d'attente moyen dans la file"""
+        if not self.completed:
+            return 0.0
+        return self.total_wait_ms / self.completed
+
+    @property
+    def avg_run_ms(self) -> float:
+        """Durée moyenne d'un calcul bcrypt"""
+        if not self.completed:
+            return 0.0
+        return self.total_run_ms / self.completed
+
+
+class PasswordHasher:
+    """
+    Hachage et vérification bcrypt sur un pool de threads dédié et borné.
+
+    bcrypt libère le GIL pendant le calcul : les threads du pool travaillent
+    en parallèle sans bloquer la boucle d'événements. Au-delà de `max_queue`
+    opérations en attente, les nouvelles demandes sont refusées immédiatement
+    plutôt que d'allonger la file (et le temps de réponse) sans limite.
+    """
+
+    def __init__(self, workers: int, max_queue: int, rounds: int):
+        """
+        Initialise le pool.
+
+        Args:
+            workers: Le nombre de threads de calcul
+            max_queue: Le nombre maximum d'opérations en attente d'un thread
+            rounds: Le coût bcrypt des nouveaux hash
+        """
+        self.workers = workers
+        self.max_queue = max_queue
+        self.rounds = rounds
+        self.statistics = PasswordHasherStatistics()
+        self._pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Pool de threads, créé au premier usage"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix="password-hasher"
+                    )
+        return self._executor
+
+    async def hash(self, password: str) -> str:
+        """
+        Hache un mot de passe sans bloquer la boucle d'événements.
+
+        Raises:
+            PasswordHasherOverloadedException: Si la file d'attente est pleine
+        """
+        return await asyncio.wrap_future(self._submit(_hash_password, password, self.rounds))
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Vérifie un mot de passe contre son hash sans bloquer la boucle d'événements.
+
+        Raises:
+            PasswordHasherOverloadedException: Si la file d'attente est pleine
+        """
+        return await asyncio.wrap_future(self._submit(_verify_password, plain_password, hashed_password))
+
+    def hash_blocking(self, password: str) -> str:
+        """Hache un mot de passe depuis du code synchrone (scripts)"""
+        return self._submit(_hash_password, password, self.rounds).result()
+
+    def verify_blocking(self, plain_password: str, hashed_password: str) -> bool:
+        """Vérifie un mot de passe depuis du code synchrone (scripts)"""
+        return self._submit(_verify_password, plain_password, hashed_password).result()
+
+    def _submit(self, function: Callable[..., Any], *args) -> Future:
+        """Confie un calcul au pool, ou le refuse si la file est pleine"""
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.statistics.rejected += 1
+                logger.warning(f"File de hachage pleine ({self._pending} opérations en cours), demande refusée")
+                raise PasswordHasherOverloadedException(self._pending)
+            self._pending += 1
+
+        submitted_at = time.perf_counter()
+        try:
+            return self.executor.submit(self._run, function, submitted_at, *args)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    def _run(self, function: Callable[..., Any], submitted_at: float, *args) -> Any:
+        """Exécute un calcul dans un thread du pool en mesurant l'attente et la durée"""
+        started_at = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            finished_at = time.perf_counter()
+            wait_ms = (started_at - submitted_at) * 1000
+            with self._lock:
+                self._pending -= 1
+                self.statistics.completed += 1
+                self.statistics.total_wait_ms += wait_ms
+                self.statistics.total_run_ms += (finished_at - started_at) * 1000
+                if wait_ms > self.statistics.max_wait_ms:
+                    self.statistics.max_wait_ms = wait_ms
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne l'état du pool : occupation, profondeur de file et temps mesurés.
+
+        Returns:
+            Dict[str, Any]: Les statistiques du pool
+        """
+        with self._lock:
+            pending = self._pending
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_progress": min(pending, self.workers),
+            "queued": max(0, pending - self.workers),
+            "completed": self.statistics.completed,
+            "rejected": self.statistics.rejected,
+            "avg_wait_ms": round(self.statistics.avg_wait_ms, 3),
+            "max_wait_ms": round(self.statistics.max_wait_ms, 3),
+            "avg_run_ms": round(self.statistics.avg_run_ms, 3),
+        }
+
+    def shutdown(self) -> None:
+        """Arrête les threads du pool après les calculs en cours"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def _hash_password(password: str, rounds: int) -> str:
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    except ValueError as e:
+        # Hash mal formé en base
+        logger.error(f"Erreur lors de la vérification du mot de passe: {e}")
+        return False
+
+
+# Instance globale, créée à la première utilisation
+_password_hasher: Optional[PasswordHasher] = None
+_password_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Obtenir le pool de hachage partagé"""
+    global _password_hasher
+    if _password_hasher is None:
+        with _password_hasher_lock:
+            if _password_hasher is None:
+                security = get_settings().security
+                _password_hasher = PasswordHasher(
+                    workers=security.password_hash_workers,
+                    max_queue=security.password_hash_max_queue,
+                    rounds=security.bcrypt_rounds
+                )
+    return _password_hasher
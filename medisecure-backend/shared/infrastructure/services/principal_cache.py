@@ -0,0 +1,155 @@
+# shared/infrastructure/services/principal_cache.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+import json
+import threading
+
+from shared.domain.entities.user import User
+from shared.domain.enums.roles import UserRole
+from shared.infrastructure.config.settings import get_settings
+from shared.infrastructure.services.record_cache import CacheBackend, RecordCache, get_cache_backend
+
+class PrincipalCache:
+    """
+    Cache des utilisateurs (identité, rôle, état du compte) consultés à chaque requête.
+
+    S'appuie sur un RecordCache : un niveau en mémoire du processus et un niveau
+    partagé optionnel. Les écritures sur un utilisateur suppriment ses entrées
+    dans les deux niveaux, qui refusent ensuite pendant `invalidation_window_seconds`
+    les valeurs lues sur un réplica encore en retard.
+    """
+
+    USER_PREFIX = "user:"
+    ROLE_PREFIX = "role:"
+
+    def __init__(
+        self,
+        ttl_seconds: int = 60,
+        max_entries: int = 1024,
+        backend: Optional[CacheBackend] = None,
+        invalidation_window_seconds: float = 0,
+        local_ttl_seconds: float = 2
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            ttl_seconds: La durée de vie d'une entrée
+            max_entries: Le nombre maximum d'entrées gardées en mémoire
+            backend: Le stockage partagé entre processus (optionnel)
+            invalidation_window_seconds: La durée pendant laquelle une entrée invalidée
+                n'accepte plus de valeur (désactivé si 0)
+            local_ttl_seconds: La durée de vie d'une entrée en mémoire quand un
+                stockage partagé est configuré
+        """
+        self.records = RecordCache(
+            "principal",
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            backend=backend,
+            invalidation_window_seconds=invalidation_window_seconds,
+            local_ttl_seconds=local_ttl_seconds
+        )
+
+    async def get_user(self, user_id: UUID) -> Tuple[bool, Optional[User]]:
+        """
+        Cherche un utilisateur dans le cache.
+
+        Returns:
+            Tuple[bool, Optional[User]]: (trouvé, utilisateur) ; un utilisateur
+            inexistant est mis en cache comme (True, None)
+        """
+        raw = await self.records.get(f"{self.USER_PREFIX}{user_id}")
+        if raw is None:
+            return False, None
+        value = json.loads(raw)
+        return True, _user_from_dict(value) if value is not None else None
+
+    async def set_user(self, user_id: UUID, user: Optional[User]) -> None:
+        """Met en cache un utilisateur (ou son absence)"""
+        value = _user_to_dict(user) if user else None
+        await self.records.set(f"{self.USER_PREFIX}{user_id}", json.dumps(value))
+
+    async def get_role(self, role: str) -> Tuple[bool, List[User]]:
+        """Cherche la liste des utilisateurs d'un rôle dans le cache"""
+        raw = await self.records.get(f"{self.ROLE_PREFIX}{role}")
+        if raw is None:
+            return False, []
+        return True, [_user_from_dict(item) for item in json.loads(raw)]
+
+    async def set_role(self, role: str, users: List[User]) -> None:
+        """Met en cache la liste des utilisateurs d'un rôle"""
+        await self.records.set(f"{self.ROLE_PREFIX}{role}", json.dumps([_user_to_dict(user) for user in users]))
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """
+        Supprime un utilisateur et toutes les listes par rôle : un changement
+        de rôle ou d'état modifie l'ancienne comme la nouvelle liste.
+        """
+        await self.records.delete(
+            f"{self.USER_PREFIX}{user_id}",
+            *[f"{self.ROLE_PREFIX}{role.value}" for role in UserRole]
+        )
+
+    def clear(self) -> None:
+        """Vide le niveau en mémoire"""
+        self.records.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne les compteurs du cache.
+
+        Returns:
+            Dict[str, Any]: Les statistiques du cache
+        """
+        return self.records.stats()
+
+
+def _user_to_dict(user: User) -> Dict[str, Any]:
+    return {
+        "id": str(user.id),
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "role": user.role.value,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    }
+
+
+def _user_from_dict(data: Dict[str, Any]) -> User:
+    return User(
+        id=UUID(data["id"]),
+        email=data["email"],
+        first_name=data["first_name"],
+        last_name=data["last_name"],
+        role=UserRole(data["role"]),
+        is_active=data["is_active"],
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        updated_at=datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None,
+    )
+
+
+# Instance globale, créée à la première utilisation
+_principal_cache: Optional[PrincipalCache] = None
+_principal_cache_lock = threading.Lock()
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Obtenir le cache des utilisateurs partagé par le processus"""
+    global _principal_cache
+    if _principal_cache is None:
+        with _principal_cache_lock:
+            if _principal_cache is None:
+                cache_settings = get_settings().cache
+                _principal_cache = PrincipalCache(
+                    ttl_seconds=cache_settings.principal_ttl_seconds,
+                    max_entries=cache_settings.principal_size,
+                    backend=get_cache_backend(),
+                    # Un compte désactivé ou un rôle changé ne doit pas revenir depuis un réplica en retard
+                    invalidation_window_seconds=get_settings().database.read_your_writes_seconds,
+                    local_ttl_seconds=cache_settings.local_ttl_seconds
+                )
+    return _principal_cache
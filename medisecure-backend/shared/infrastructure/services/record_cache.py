@@ -0,0 +1,365 @@
+# shared/infrastructure/services/record_cache.py
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import logging
+import math
+import threading
+import time
+
+from shared.infrastructure.config.settings import get_settings
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # Dépendance optionnelle : seul le stockage local est alors disponible
+    redis = None
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """
+    Stockage partagé entre processus pour les caches d'enregistrements.
+    Les valeurs sont des chaînes JSON ; une erreur du stockage ne doit jamais
+    faire échouer la requête, le cache se rabat alors sur la base.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Récupère une valeur, ou None si absente ou expirée"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Enregistre une valeur pour `ttl_seconds` secondes"""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Supprime des valeurs"""
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Stockage partagé de remplacement, local au processus (`memory://`).
+    Pour le développement et les tests, en l'absence de Redis.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._values[key]
+                return None
+            return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        with self._lock:
+            self._values[key] = (value, time.monotonic() + ttl_seconds)
+
+    async def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Stockage partagé dans Redis (nécessite le paquet `redis`)"""
+
+    def __init__(self, url: str):
+        if redis is None:
+            raise RuntimeError("The redis package is required for a shared record cache")
+        self.client = redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self.client.set(key, value, ex=ttl_seconds)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+
+class RecordCache:
+    """
+    Cache à deux niveaux d'enregistrements sérialisés en JSON.
+
+    Le premier niveau, en mémoire du processus, est un LRU borné en nombre
+    d'entrées et en octets, chaque entrée vivant au plus `ttl_seconds` ; il
+    répond sans aller-retour réseau. Le second niveau, optionnel, est partagé
+    entre les processus. Une invalidation n'efface que le niveau local du
+    processus qui écrit : avec un stockage partagé, les entrées locales vivent
+    donc au plus `local_ttl_seconds`, le retard maximal des autres processus. Les valeurs sont stockées sérialisées : chaque lecture
+    reconstruit un objet neuf que l'appelant peut modifier.
+
+    Avec `invalidation_window_seconds`, une clé invalidée refuse les nouvelles
+    valeurs pendant cette fenêtre : une lecture commencée avant l'invalidation,
+    ou servie par un réplica en retard, ne remet pas l'ancienne version en cache.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: int = 60,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        backend: Optional[CacheBackend] = None,
+        invalidation_window_seconds: float = 0,
+        local_ttl_seconds: float = 2
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            name: Le nom du cache, préfixe des clés du stockage partagé
+            ttl_seconds: La durée de vie d'une entrée
+            max_entries: Le nombre maximum d'entrées gardées en mémoire
+            max_bytes: La taille maximale des valeurs gardées en mémoire (sans limite si None)
+            backend: Le stockage partagé entre processus (optionnel)
+            invalidation_window_seconds: La durée pendant laquelle une clé invalidée
+                n'accepte plus de valeur (désactivé si 0)
+            local_ttl_seconds: La durée de vie d'une entrée en mémoire quand un
+                stockage partagé est configuré
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self.invalidation_window_seconds = invalidation_window_seconds
+        self.local_ttl_seconds = min(ttl_seconds, local_ttl_seconds) if backend is not None else ttl_seconds
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.backend_errors = 0
+        self.rejected_fills = 0
+        self._bytes = 0
+        self._invalidated: Dict[str, float] = {}
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Cherche une valeur dans le cache local puis dans le stockage partagé.
+
+        Args:
+            key: La clé de l'enregistrement
+
+        Returns:
+            Optional[str]: La valeur sérialisée, ou None si absente
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    self.local_hits += 1
+                    return value
+                self._remove(key)
+
+        if self.backend is not None:
+            try:
+                value = await self.backend.get(self._shared_key(key))
+            except Exception as e:
+                value = None
+                self._backend_failed("Lecture", e)
+            if value is not None:
+                self._store(key, value)
+                with self._lock:
+                    self.shared_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Enregistre une valeur sérialisée dans les deux niveaux, sauf si la clé
+        vient d'être invalidée (voir `invalidation_window_seconds`).
+        """
+        if await self._recently_invalidated(key):
+            with self._lock:
+                self.rejected_fills += 1
+            return
+
+        self._store(key, value)
+        if self.backend is not None:
+            try:
+                await self.backend.set(self._shared_key(key), value, self.ttl_seconds)
+            except Exception as e:
+                self._backend_failed("Écriture", e)
+
+        # Une invalidation arrivée pendant l'écriture l'emporte
+        if await self._recently_invalidated(key):
+            await self._discard(key)
+            with self._lock:
+                self.rejected_fills += 1
+
+    async def delete(self, *keys: str) -> None:
+        """Invalide des valeurs dans les deux niveaux"""
+        if self.invalidation_window_seconds > 0:
+            await self._mark_invalidated(keys)
+
+        with self._lock:
+            self.invalidations += 1
+        await self._discard(*keys)
+
+    def clear(self) -> None:
+        """Vide le niveau en mémoire"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne les compteurs et l'occupation du cache.
+
+        Returns:
+            Dict[str, Any]: Les statistiques du cache
+        """
+        with self._lock:
+            lookups = self.local_hits + self.shared_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "local_ttl_seconds": self.local_ttl_seconds,
+                "shared_backend": type(self.backend).__name__ if self.backend is not None else None,
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.local_hits + self.shared_hits) / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "rejected_fills": self.rejected_fills,
+                "backend_errors": self.backend_errors,
+            }
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def _invalidation_key(self, key: str) -> str:
+        return f"{self.name}:invalidated:{key}"
+
+    async def _discard(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._remove(key)
+
+        if self.backend is not None:
+            try:
+                await self.backend.delete(*[self._shared_key(key) for key in keys])
+            except Exception as e:
+                self._backend_failed("Invalidation", e)
+
+    async def _mark_invalidated(self, keys: Tuple[str, ...]) -> None:
+        # Les marques sont posées avant la suppression des valeurs
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                self._invalidated[key] = now
+            if len(self._invalidated) > self.max_entries:
+                self._invalidated = {
+                    key: marked_at for key, marked_at in self._invalidated.items()
+                    if now - marked_at < self.invalidation_window_seconds
+                }
+
+        if self.backend is not None:
+            ttl = max(1, math.ceil(self.invalidation_window_seconds))
+            for key in keys:
+                try:
+                    await self.backend.set(self._invalidation_key(key), "1", ttl)
+                except Exception as e:
+                    self._backend_failed("Invalidation", e)
+
+    async def _recently_invalidated(self, key: str) -> bool:
+        if self.invalidation_window_seconds <= 0:
+            return False
+
+        with self._lock:
+            marked_at = self._invalidated.get(key)
+        if marked_at is not None and time.monotonic() - marked_at < self.invalidation_window_seconds:
+            return True
+
+        if self.backend is not None:
+            try:
+                return await self.backend.get(self._invalidation_key(key)) is not None
+            except Exception as e:
+                self._backend_failed("Lecture", e)
+                # Dans le doute, on ne remplit pas le cache
+                return True
+        return False
+
+    def _store(self, key: str, value: str) -> None:
+        size = len(value)
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Trop volumineux pour le niveau local : seul le stockage partagé le garde
+                return
+            self._entries[key] = (value, time.monotonic() + self.local_ttl_seconds)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        # Appelé avec le verrou
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
+    def _backend_failed(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self.backend_errors += 1
+        logger.warning(f"{operation} du cache partagé '{self.name}' impossible: {error}")
+
+
+# Stockage partagé, créé à la première utilisation
+_cache_backend: Optional[CacheBackend] = None
+_cache_backend_lock = threading.Lock()
+
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    """
+    Obtenir le stockage partagé configuré par CACHE_URL (ou son ancien nom
+    PRINCIPAL_CACHE_URL) : `redis://...`,
+    `memory://` pour le remplacement local, ou aucun si l'URL est vide.
+    """
+    global _cache_backend
+    url = get_settings().cache.url
+    if not url:
+        return None
+    if _cache_backend is None:
+        with _cache_backend_lock:
+            if _cache_backend is None:
+                if url.startswith("memory://"):
+                    _cache_backend = InMemoryCacheBackend()
+                else:
+                    try:
+                        _cache_backend = RedisCacheBackend(url)
+                    except RuntimeError as e:
+                        logger.warning(f"Stockage partagé des caches désactivé, remplacement local utilisé: {e}")
+                        _cache_backend = InMemoryCacheBackend()
+    return _cache_backend
@@ -1,30 +1,321 @@
+import asyncio
+import logging
 import os
 import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from dotenv import load_dotenv
 
 from shared.ports.secondary.mailer_protocol import MailerProtocol
+from shared.infrastructure.config.settings import get_settings
 
 # Charger les variables d'environnement
 load_dotenv()
 
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Message prêt à l'envoi : expéditeur, destinataires de l'enveloppe, contenu MIME
+SmtpMessage = Tuple[str, List[str], str]
+
+
+def build_message(
+    email_from: str,
+    to_email: str,
+    subject: str,
+    body: str,
+    cc: Optional[List[str]] = None,
+    html_body: Optional[str] = None
+) -> str:
+    """
+    Construit le contenu MIME d'un email (texte brut et HTML optionnel).
+
+    Returns:
+        str: Le message sérialisé
+    """
+    message = MIMEMultipart("alternative")
+    message["Subject"] = subject
+    message["From"] = email_from
+    message["To"] = to_email
+    
+    # Ajouter les destinataires en copie
+    if cc:
+        message["Cc"] = ", ".join(cc)
+    
+    # Ajouter le corps en texte brut
+    message.attach(MIMEText(body, "plain"))
+    
+    # Ajouter le corps en HTML s'il est fourni
+    if html_body:
+        message.attach(MIMEText(html_body, "html"))
+    
+    return message.as_string()
+
+
+class SmtpConnectionPool:
+    """
+    Connexions SMTP authentifiées, réutilisées d'un envoi à l'autre.
+
+    smtplib est bloquant : les envois se font sur un pool de threads dédié
+    et la boucle d'événements n'attend que le résultat. Le pool compte autant
+    de threads que de connexions ; une connexion (TCP, STARTTLS, AUTH) n'est
+    ouverte qu'au premier besoin puis rendue au pool après chaque lot.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = True,
+        size: int = 2,
+        keepalive_seconds: int = 60,
+        timeout_seconds: int = 10
+    ):
+        """
+        Initialise le pool.
+
+        Args:
+            host: Le serveur SMTP
+            port: Le port du serveur SMTP
+            user: L'utilisateur SMTP (aucune authentification si absent)
+            password: Le mot de passe SMTP
+            starttls: Démarrer le chiffrement TLS après la connexion
+            size: Le nombre maximum de connexions (et de threads d'envoi)
+            keepalive_seconds: L'inactivité au-delà de laquelle une connexion est vérifiée avant réutilisation
+            timeout_seconds: Le délai d'attente des opérations réseau
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.size = size
+        self.keepalive_seconds = keepalive_seconds
+        self.timeout_seconds = timeout_seconds
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._sent = 0
+        self._failed = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Pool de threads d'envoi, créé au premier usage"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="smtp")
+        return self._executor
+
+    async def send(self, messages: Sequence[SmtpMessage]) -> List[Optional[Exception]]:
+        """
+        Envoie un lot de messages, réparti entre les connexions du pool.
+
+        Args:
+            messages: Les messages à envoyer
+
+        Returns:
+            List[Optional[Exception]]: Pour chaque message, None s'il a été accepté, l'erreur sinon
+        """
+        if not messages:
+            return []
+
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(messages) // self.size)
+        chunks = [messages[index:index + chunk_size] for index in range(0, len(messages), chunk_size)]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, self._send_chunk, chunk) for chunk in chunks
+        ))
+        return [error for chunk_results in results for error in chunk_results]
+
+    def _send_chunk(self, messages: Sequence[SmtpMessage]) -> List[Optional[Exception]]:
+        """Envoie des messages sur une seule connexion (dans un thread du pool)"""
+        try:
+            connection = self._acquire()
+        except (OSError, smtplib.SMTPException) as e:
+            # Serveur injoignable ou authentification refusée : tout le lot échoue
+            logger.warning(f"Connexion SMTP impossible ({self.host}:{self.port}): {e}")
+            self._count(failed=len(messages))
+            return [e] * len(messages)
+
+        results: List[Optional[Exception]] = []
+        error: Optional[Exception] = None
+        for sender, recipients, message in messages:
+            if connection is None:
+                # Plus de connexion : le reste du lot échoue avec l'erreur de reconnexion
+                results.append(error)
+                continue
+            connection, error = self._deliver(connection, sender, recipients, message)
+            results.append(error)
+
+        if connection is not None:
+            self._release(connection)
+        self._count(
+            sent=sum(1 for error in results if error is None),
+            failed=sum(1 for error in results if error is not None)
+        )
+        return results
+
+    def _deliver(
+        self,
+        connection: smtplib.SMTP,
+        sender: str,
+        recipients: List[str],
+        message: str
+    ) -> Tuple[Optional[smtplib.SMTP], Optional[Exception]]:
+        """Envoie un message ; retourne la connexion à utiliser ensuite et l'erreur éventuelle"""
+        error: Optional[Exception] = None
+        for _ in range(2):
+            try:
+                connection.sendmail(sender, recipients, message)
+                return connection, None
+            except smtplib.SMTPServerDisconnected as e:
+                # Connexion fermée par le serveur (inactivité, redémarrage) : une reprise sur une nouvelle connexion
+                error = e
+                self._close(connection)
+                try:
+                    connection = self._connect()
+                except (OSError, smtplib.SMTPException) as connect_error:
+                    logger.warning(f"Reconnexion SMTP impossible ({self.host}:{self.port}): {connect_error}")
+                    return None, connect_error
+            except (OSError, smtplib.SMTPException) as e:
+                # Message refusé par le serveur : la connexion reste utilisable
+                return connection, e
+        return connection, error
+
+    def _acquire(self) -> smtplib.SMTP:
+        """Prend une connexion inactive encore valide, ou en ouvre une nouvelle"""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                connection, released_at = self._idle.pop()
+            if time.monotonic() - released_at < self.keepalive_seconds:
+                return connection
+            try:
+                if connection.noop()[0] == 250:
+                    return connection
+            except (OSError, smtplib.SMTPException):
+                pass
+            self._close(connection)
+        return self._connect()
+
+    def _release(self, connection: smtplib.SMTP) -> None:
+        """Rend une connexion au pool"""
+        with self._lock:
+            self._idle.append((connection, time.monotonic()))
+
+    def _connect(self) -> smtplib.SMTP:
+        """Ouvre et authentifie une connexion SMTP"""
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout_seconds)
+        try:
+            if self.starttls:
+                connection.starttls()
+            if self.user:
+                connection.login(self.user, self.password or "")
+        except Exception:
+            self._close(connection)
+            raise
+        with self._lock:
+            self._opened += 1
+        logger.debug(f"Connexion SMTP ouverte vers {self.host}:{self.port}")
+        return connection
+
+    def _close(self, connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except (OSError, smtplib.SMTPException):
+            connection.close()
+
+    def _count(self, sent: int = 0, failed: int = 0) -> None:
+        with self._lock:
+            self._sent += sent
+            self._failed += failed
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retourne l'état du pool : connexions ouvertes, inactives et messages traités.
+
+        Returns:
+            Dict[str, int]: Les statistiques du pool
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "connections_opened": self._opened,
+                "sent": self._sent,
+                "failed": self._failed,
+            }
+
+    def close(self) -> None:
+        """Ferme les connexions inactives et arrête les threads d'envoi"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for connection, _ in idle:
+            self._close(connection)
+
+
+# Instance globale, créée à la première utilisation
+_smtp_pool: Optional[SmtpConnectionPool] = None
+_smtp_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SmtpConnectionPool:
+    """Obtenir le pool de connexions SMTP partagé"""
+    global _smtp_pool
+    if _smtp_pool is None:
+        with _smtp_pool_lock:
+            if _smtp_pool is None:
+                mail = get_settings().mail
+                _smtp_pool = SmtpConnectionPool(
+                    host=mail.smtp_host,
+                    port=mail.smtp_port,
+                    user=mail.smtp_user,
+                    password=mail.smtp_password,
+                    starttls=mail.smtp_starttls,
+                    size=mail.smtp_pool_size,
+                    keepalive_seconds=mail.smtp_keepalive_seconds,
+                    timeout_seconds=mail.smtp_timeout_seconds
+                )
+    return _smtp_pool
+
+
 class SmtpMailer(MailerProtocol):
     """
     Adaptateur secondaire pour l'envoi d'emails via SMTP.
     Implémente le port MailerProtocol.
+
+    L'envoi est immédiat, sur une connexion du pool partagé ; pour ne pas
+    attendre le serveur SMTP, passer par OutboxMailer.
     """
     
-    def __init__(self):
+    def __init__(self, pool: Optional[SmtpConnectionPool] = None):
         """
-        Initialise le mailer avec les paramètres SMTP depuis les variables d'environnement.
+        Initialise le mailer.
+
+        Args:
+            pool: Le pool de connexions SMTP (le pool partagé par défaut)
         """
-        self.smtp_host = os.getenv("SMTP_HOST", "smtp.example.com")
-        self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
-        self.smtp_user = os.getenv("SMTP_USER", "user@example.com")
-        self.smtp_password = os.getenv("SMTP_PASSWORD", "your_password_here")
-        self.email_from = os.getenv("EMAIL_FROM", "noreply@medisecure.com")
+        self.email_from = get_settings().mail.email_from
+        self._pool = pool
+    
+    @property
+    def pool(self) -> SmtpConnectionPool:
+        """Pool de connexions SMTP utilisé pour l'envoi"""
+        if self._pool is None:
+            self._pool = get_smtp_pool()
+        return self._pool
     
     async def send_email(
         self,
@@ -52,47 +343,19 @@ class SmtpMailer(MailerProtocol):
             bool: True si l'email a été envoyé avec succès, False sinon
         """
         try:
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = self.email_from
-            message["To"] = to_email
-            
-            # Ajouter les destinataires en copie
-            if cc:
-                message["Cc"] = ", ".join(cc)
+            message = build_message(self.email_from, to_email, subject, body, cc, html_body)
             
-            # Ajouter le corps en texte brut
-            part1 = MIMEText(body, "plain")
-            message.attach(part1)
+            # Préparer la liste complète des destinataires
+            recipients = [to_email, *(cc or []), *(bcc or [])]
             
-            # Ajouter le corps en HTML s'il est fourni
-            if html_body:
-                part2 = MIMEText(html_body, "html")
-                message.attach(part2)
-            
-            # Établir la connexion SMTP et envoyer l'email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                # Démarrer le chiffrement TLS
-                server.starttls()
-                
-                # Connexion au serveur SMTP
-                server.login(self.smtp_user, self.smtp_password)
-                
-                # Préparer la liste complète des destinataires
-                recipients = [to_email]
-                if cc:
-                    recipients.extend(cc)
-                if bcc:
-                    recipients.extend(bcc)
-                
-                # Envoyer l'email
-                server.sendmail(self.email_from, recipients, message.as_string())
-            
-            return True
-        
+            [error] = await self.pool.send([(self.email_from, recipients, message)])
         except Exception as e:
-            print(f"Erreur lors de l'envoi de l'email: {str(e)}")
+            error = e
+        
+        if error is not None:
+            logger.error(f"Erreur lors de l'envoi de l'email: {str(error)}")
             return False
+        return True
     
     async def send_password_reset(self, to_email: str, reset_token: str) -> bool:
         """
@@ -0,0 +1,164 @@
+# shared/infrastructure/services/smtp_sink.py
+from dataclasses import dataclass
+from typing import List, Optional, Set
+import logging
+import socketserver
+import threading
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReceivedEmail:
+    """Email reçu par le serveur local"""
+    sender: str
+    recipients: List[str]
+    data: str
+
+
+class SmtpSink:
+    """
+    Serveur SMTP local qui conserve les emails reçus au lieu de les distribuer.
+
+    Remplace le serveur SMTP réel en test et en développement
+    (SMTP_HOST=localhost, SMTP_STARTTLS=false, SMTP_USER vide). Il accepte
+    toute authentification et refuse (550) les destinataires de `rejected`.
+
+    Exemple:
+        with SmtpSink() as sink:
+            pool = SmtpConnectionPool("127.0.0.1", sink.port, starttls=False)
+            ...
+            assert sink.messages[0].recipients == [...]
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, rejected: Optional[Set[str]] = None):
+        """
+        Initialise le serveur.
+
+        Args:
+            host: L'adresse d'écoute
+            port: Le port d'écoute (0 : port libre choisi par le système)
+            rejected: Les adresses à refuser
+        """
+        self.host = host
+        self.requested_port = port
+        self.rejected = set(rejected or ())
+        self.messages: List[ReceivedEmail] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server: Optional[socketserver.ThreadingTCPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """Port effectivement écouté"""
+        if self._server is None:
+            return self.requested_port
+        return self._server.server_address[1]
+
+    def start(self) -> "SmtpSink":
+        """Démarre l'écoute dans un thread"""
+        sink = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                sink._handle(self.rfile, self.wfile)
+
+        self._server = socketserver.ThreadingTCPServer((self.host, self.requested_port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True)
+        self._thread.start()
+        logger.info(f"Serveur SMTP local à l'écoute sur {self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        """Arrête l'écoute"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "SmtpSink":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _handle(self, rfile, wfile) -> None:
+        """Dialogue SMTP minimal (RFC 5321) avec un client"""
+        def reply(line: str) -> None:
+            wfile.write(f"{line}\r\n".encode())
+            wfile.flush()
+
+        with self._lock:
+            self.connections += 1
+        sender, recipients = "", []
+        reply("220 medisecure-smtp-sink ESMTP")
+
+        while True:
+            raw = rfile.readline()
+            if not raw:
+                return
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            command = line[:4].upper()
+
+            if command == "EHLO":
+                reply("250-medisecure-smtp-sink")
+                reply("250 AUTH PLAIN LOGIN")
+            elif command == "HELO":
+                reply("250 medisecure-smtp-sink")
+            elif command == "AUTH":
+                reply("235 2.7.0 Authentication successful")
+            elif command == "MAIL":
+                sender, recipients = _address(line), []
+                reply("250 OK")
+            elif command == "RCPT":
+                recipient = _address(line)
+                if recipient in self.rejected:
+                    reply("550 5.1.1 Mailbox unavailable")
+                else:
+                    recipients.append(recipient)
+                    reply("250 OK")
+            elif command == "DATA":
+                reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    data_line = rfile.readline().decode("utf-8", "replace")
+                    if data_line in (".\r\n", ".\n", ""):
+                        break
+                    # Suppression du point de transparence
+                    lines.append(data_line[1:] if data_line.startswith("..") else data_line)
+                with self._lock:
+                    self.messages.append(ReceivedEmail(sender, recipients, "".join(lines)))
+                sender, recipients = "", []
+                reply("250 OK")
+            elif command in ("RSET", "NOOP"):
+                if command == "RSET":
+                    sender, recipients = "", []
+                reply("250 OK")
+            elif command == "QUIT":
+                reply("221 Bye")
+                return
+            else:
+                reply("502 Command not implemented")
+
+
+def _address(line: str) -> str:
+    """Extrait l'adresse d'une commande MAIL FROM:<...> ou RCPT TO:<...>"""
+    _, _, value = line.partition(":")
+    return value.strip().split(" ")[0].strip("<>")
+
+
+if __name__ == "__main__":
+    # Serveur local de développement : python -m shared.infrastructure.services.smtp_sink
+    import time
+
+    logging.basicConfig(level=logging.INFO)
+    with SmtpSink(port=1025) as running_sink:
+        received = 0
+        while True:
+            time.sleep(1)
+            for email in running_sink.messages[received:]:
+                logger.info(f"Email reçu de {email.sender} pour {', '.join(email.recipients)}")
+            received = len(running_sink.messages)
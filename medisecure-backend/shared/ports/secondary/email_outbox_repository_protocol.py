@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from typing import List
+from shared.domain.entities.outbox_email import OutboxEmail
+
+class EmailOutboxRepositoryProtocol(ABC):
+    """
+    Port secondaire pour la boîte d'envoi des emails.
+    Cette interface définit comment les emails en attente sont stockés et distribués aux workers.
+    """
+
+    @abstractmethod
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        """
+        Ajoute un email à la boîte d'envoi.
+
+        Args:
+            email: L'email à envoyer
+
+        Returns:
+            OutboxEmail: L'email enregistré
+        """
+        pass
+
+    @abstractmethod
+    async def claim_due(self, limit: int, lease_seconds: int) -> List[OutboxEmail]:
+        """
+        Réserve les emails dont l'envoi est dû, les plus anciens d'abord.
+        Les emails réservés sont repoussés de `lease_seconds` : un autre worker
+        ne les reprend que si celui-ci n'a pas enregistré le résultat à temps.
+
+        Args:
+            limit: Le nombre maximum d'emails à réserver
+            lease_seconds: La durée de la réservation
+
+        Returns:
+            List[OutboxEmail]: Les emails réservés
+        """
+        pass
+
+    @abstractmethod
+    async def save_results(self, emails: List[OutboxEmail]) -> None:
+        """
+        Enregistre l'issue des tentatives d'envoi (état, tentatives, prochaine date, erreur).
+
+        Args:
+            emails: Les emails traités
+        """
+        pass
+
+    @abstractmethod
+    async def count_pending(self) -> int:
+        """
+        Compte les emails en attente d'envoi.
+
+        Returns:
+            int: Le nombre d'emails en attente
+        """
+        pass
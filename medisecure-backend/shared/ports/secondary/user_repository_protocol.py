@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from shared.domain.entities.user import User
 
@@ -35,6 +35,19 @@ class UserRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_with_password_hash_by_email(self, email: str) -> Optional[Tuple[User, Optional[str]]]:
+        """
+        Récupère en une seule requête un utilisateur et le hash de son mot de passe.
+        
+        Args:
+            email: L'email de l'utilisateur à récupérer
+            
+        Returns:
+            Optional[Tuple[User, Optional[str]]]: L'utilisateur et son hash, ou None si non trouvé
+        """
+        pass
+    
     @abstractmethod
     async def create(self, user: User) -> User:
         """
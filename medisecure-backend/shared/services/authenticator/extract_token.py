@@ -1,22 +1,22 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+from jose import JWTError
 from typing import Dict, Any
-import os
-from dotenv import load_dotenv
 
-# Charger les variables d'environnement
-load_dotenv()
+from shared.services.authenticator.token_verifier import get_token_verifier
+from shared.infrastructure.monitoring.timing import span
 
 security = HTTPBearer()
 
 async def extract_token_payload(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> Dict[str, Any]:
     """
     Extrait et valide le payload du token JWT.
     
     Args:
+        request: La requête HTTP
         credentials: Les informations d'authentification HTTP
         
     Returns:
@@ -26,15 +26,15 @@ async def extract_token_payload(
         HTTPException: Si le token est invalide ou expiré
     """
     try:
-        # Récupérer le token
-        token = credentials.credentials
+        # Le middleware d'authentification a déjà vérifié ce même token
+        claims = getattr(request.state, "user", None)
+        if claims is None:
+            with span("authentication"):
+                claims = get_token_verifier().verify(credentials.credentials)
+            request.state.user = claims
         
-        # Décoder le token
-        payload = jwt.decode(
-            token, 
-            os.getenv("JWT_SECRET_KEY", "default_secret_key"), 
-            algorithms=[os.getenv("JWT_ALGORITHM", "HS256")]
-        )
+        # Copie : les claims de la requête restent intacts
+        payload = dict(claims)
         
         # Assurez-vous que le rôle est en majuscules pour la vérification ultérieure
         # Mais ne modifiez pas le payload original
@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import threading
+import time
+
+from jose import jwt
+
+from shared.infrastructure.config.settings import get_settings
+
+class TokenVerifier:
+    """
+    Vérification des tokens JWT avec un cache borné des tokens déjà vérifiés.
+
+    La clé et l'algorithme sont lus une seule fois. Un token vérifié est gardé
+    au plus `ttl_seconds`, et jamais au-delà de son expiration (`exp`) ; les
+    tokens invalides ne sont pas mis en cache.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, max_entries: int = 1024, ttl_seconds: float = 300):
+        """
+        Initialise le vérificateur.
+
+        Args:
+            secret_key: La clé de signature des tokens
+            algorithm: L'algorithme de signature
+            max_entries: Le nombre maximum de tokens gardés en cache
+            ttl_seconds: La durée maximale de conservation d'un token vérifié
+        """
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Vérifie un token et retourne ses claims.
+
+        Args:
+            token: Le token JWT
+
+        Returns:
+            Dict[str, Any]: Une copie des claims du token, modifiable par l'appelant
+
+        Raises:
+            JWTError: Si la signature est invalide ou le token expiré
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(digest)
+            if entry is not None:
+                claims, expires_at = entry
+                if now < expires_at:
+                    self._cache.move_to_end(digest)
+                    self.hits += 1
+                    return dict(claims)
+                del self._cache[digest]
+            self.misses += 1
+
+        claims = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+
+        expires_at = now + self.ttl_seconds
+        if isinstance(claims.get("exp"), (int, float)):
+            expires_at = min(expires_at, claims["exp"])
+
+        with self._lock:
+            self._cache[digest] = (claims, expires_at)
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        return dict(claims)
+
+    def clear(self) -> None:
+        """Vide le cache"""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne l'état du cache"""
+        return {
+            "entries": len(self._cache),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Instance globale, créée à la première utilisation
+_token_verifier: Optional[TokenVerifier] = None
+_token_verifier_lock = threading.Lock()
+
+
+def get_token_verifier() -> TokenVerifier:
+    """Obtenir le vérificateur de tokens partagé"""
+    global _token_verifier
+    if _token_verifier is None:
+        with _token_verifier_lock:
+            if _token_verifier is None:
+                security = get_settings().security
+                _token_verifier = TokenVerifier(
+                    secret_key=security.jwt_secret_key,
+                    algorithm=security.jwt_algorithm,
+                    max_entries=security.token_cache_size,
+                    ttl_seconds=security.token_cache_ttl_seconds
+                )
+    return _token_verifier
@@ -0,0 +1,60 @@
+# tests/unit/api/test_authentication_middleware.py
+
+import asyncio
+import time
+from jose import jwt
+
+from api.middlewares.authentication_middleware import AuthenticationMiddleware, EXEMPT_PATHS
+from shared.services.authenticator.token_verifier import TokenVerifier
+
+SECRET = "test-secret-key-with-at-least-32-characters"
+
+def test_exempt_paths_respect_segment_boundaries():
+    """Test la reconnaissance des chemins exemptés (exacts ou sous-arbres)"""
+    assert EXEMPT_PATHS.matches("/")
+    assert EXEMPT_PATHS.matches("/api/health/ready")
+    assert EXEMPT_PATHS.matches("/api/docs/oauth2-redirect")
+    assert EXEMPT_PATHS.matches("/api/auth/login")
+    assert not EXEMPT_PATHS.matches("/api/auth/me")
+    assert not EXEMPT_PATHS.matches("/api/healthz")
+    assert not EXEMPT_PATHS.matches("/api/patients")
+
+def test_valid_token_is_exposed_in_request_state():
+    """Test la pose des claims dans l'état de la requête, et le passage sans token"""
+    # Arrange
+    scopes = []
+
+    async def app(scope, receive, send):
+        scopes.append(scope)
+
+    middleware = AuthenticationMiddleware(app)
+    middleware.token_verifier = TokenVerifier(SECRET, "HS256", max_entries=2, ttl_seconds=300)
+    token = jwt.encode({"sub": "doctor@medisecure.com", "role": "doctor", "exp": int(time.time() + 60)}, SECRET, algorithm="HS256")
+
+    def scope_for(path, headers=()):
+        return {"type": "http", "method": "GET", "path": path, "headers": list(headers)}
+
+    # Act
+    asyncio.run(middleware(scope_for("/api/patients", [(b"authorization", f"Bearer {token}".encode())]), None, None))
+    asyncio.run(middleware(scope_for("/api/patients", [(b"authorization", b"Bearer invalid")]), None, None))
+    asyncio.run(middleware(scope_for("/api/health"), None, None))
+
+    # Assert
+    assert scopes[0]["state"]["user"]["role"] == "doctor"
+    assert "state" not in scopes[1]
+    assert "state" not in scopes[2]
+
+def test_preflight_is_answered_directly():
+    """Test la réponse immédiate aux requêtes CORS preflight"""
+    messages = []
+
+    async def app(scope, receive, send):
+        raise AssertionError("preflight must not reach the application")
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(AuthenticationMiddleware(app)({"type": "http", "method": "OPTIONS", "path": "/api/patients", "headers": []}, None, send))
+
+    assert [message["type"] for message in messages] == ["http.response.start", "http.response.body"]
+    assert messages[0]["status"] == 200
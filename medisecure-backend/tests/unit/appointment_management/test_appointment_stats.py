@@ -0,0 +1,45 @@
+# tests/unit/appointment_management/test_appointment_stats.py
+
+import asyncio
+from datetime import date, datetime, time
+from uuid import uuid4
+
+from appointment_management.application.usecases.get_appointment_stats_usecase import GetAppointmentStatsUseCase
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.services.availability_engine import WorkingHours
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+
+def test_stats_per_doctor_and_day():
+    """Test l'occupation, l'utilisation et le taux d'absence calculés depuis les agrégats"""
+    # Arrange : une journée de 4h (lundi 7 janvier 2030) pour un médecin
+    doctor_id = uuid4()
+    repository = InMemoryAppointmentRepository()
+    for hour, appointment_status, is_active in [
+        (8, AppointmentStatus.COMPLETED, True),
+        (9, AppointmentStatus.COMPLETED, True),
+        (10, AppointmentStatus.MISSED, True),
+        (11, AppointmentStatus.CANCELLED, True),
+        (11, AppointmentStatus.SCHEDULED, False),  # supprimé logiquement, jamais compté
+    ]:
+        asyncio.run(repository.create(Appointment(
+            id=uuid4(), patient_id=uuid4(), doctor_id=doctor_id,
+            start_time=datetime(2030, 1, 7, hour), end_time=datetime(2030, 1, 7, hour, 30),
+            status=appointment_status, is_active=is_active
+        )))
+    use_case = GetAppointmentStatsUseCase(repository, WorkingHours(start=time(8), end=time(12)))
+
+    # Act
+    response = asyncio.run(use_case.execute(date(2030, 1, 7), date(2030, 1, 13)))
+
+    # Assert
+    day = response.days[0]
+    assert day.counts == {"COMPLETED": 2, "MISSED": 1, "CANCELLED": 1}
+    assert (day.booked_minutes, day.working_minutes) == (90, 240)
+    assert day.occupancy_rate == 0.375
+    assert day.utilisation_rate == 0.25
+    assert day.no_show_rate == 0.3333
+
+    # Sur la semaine : cinq jours travaillés
+    doctor = response.doctors[0]
+    assert doctor.working_minutes == 5 * 240
+    assert doctor.occupancy_rate == 0.075
@@ -0,0 +1,100 @@
+# tests/unit/appointment_management/test_availability.py
+
+import asyncio
+import pytest
+from datetime import date, datetime, time
+from uuid import uuid4
+
+from appointment_management.application.usecases.get_doctor_availability_usecase import GetDoctorAvailabilityUseCase
+from appointment_management.application.usecases.find_clinic_availability_usecase import FindClinicAvailabilityUseCase
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.services.availability_engine import AvailabilityEngine, WorkingHours, merge_intervals
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
+from shared.domain.entities.user import User
+from shared.domain.enums.roles import UserRole
+
+MONDAY = date(2030, 1, 7)
+
+def at(day: int, hour: int, minute: int = 0) -> datetime:
+    """Heure du jour `day` de janvier 2030"""
+    return datetime(2030, 1, day, hour, minute)
+
+def test_merge_intervals():
+    """Test la fusion d'intervalles chevauchants ou contigus"""
+    intervals = [(at(7, 10), at(7, 11)), (at(7, 9), at(7, 9, 30)), (at(7, 9, 30), at(7, 9, 45)), (at(7, 10, 30), at(7, 10, 45))]
+    assert merge_intervals(intervals) == [(at(7, 9), at(7, 9, 45)), (at(7, 10), at(7, 11))]
+
+def test_free_slots_skip_busy_time_and_non_working_days():
+    """Test le calcul des créneaux libres sur une semaine"""
+    # Arrange
+    engine = AvailabilityEngine(WorkingHours(start=time(9), end=time(12)), slot_minutes=30)
+    busy = [(at(7, 9, 10), at(7, 10, 5)), (at(8, 11, 30), at(8, 13))]
+
+    # Act
+    days = engine.free_slots(busy, MONDAY, date(2030, 1, 13))
+
+    # Assert : samedi et dimanche ne sont pas travaillés
+    assert list(days) == [date(2030, 1, d) for d in range(7, 12)]
+    assert [start.time() for start, _ in days[MONDAY]] == [time(10, 30), time(11), time(11, 30)]
+    assert days[date(2030, 1, 8)][-1] == (at(8, 11), at(8, 11, 30))
+    assert len(days[date(2030, 1, 9)]) == 6
+
+def test_get_doctor_availability_ignores_cancelled_and_other_doctors():
+    """Test le cas d'utilisation avec un repository en mémoire"""
+    # Arrange
+    doctor_id = uuid4()
+    repository = InMemoryAppointmentRepository()
+    for doctor, start, end, appointment_status in [
+        (doctor_id, at(7, 8), at(7, 9), AppointmentStatus.SCHEDULED),
+        (doctor_id, at(7, 9), at(7, 10), AppointmentStatus.CANCELLED),
+        (uuid4(), at(7, 10), at(7, 11), AppointmentStatus.CONFIRMED),
+    ]:
+        asyncio.run(repository.create(Appointment(
+            id=uuid4(), patient_id=uuid4(), doctor_id=doctor,
+            start_time=start, end_time=end, status=appointment_status
+        )))
+    use_case = GetDoctorAvailabilityUseCase(repository, AvailabilityEngine(slot_minutes=60))
+
+    # Act
+    response = asyncio.run(use_case.execute(doctor_id, MONDAY, MONDAY))
+
+    # Assert
+    slots = response.days[0].slots
+    assert response.slot_minutes == 60
+    assert [slot.start_time.hour for slot in slots] == list(range(9, 18))
+
+def test_invalid_range_is_rejected():
+    """Test le refus d'une plage dont la fin précède le début"""
+    use_case = GetDoctorAvailabilityUseCase(InMemoryAppointmentRepository(), AvailabilityEngine())
+    with pytest.raises(ValueError):
+        asyncio.run(use_case.execute(uuid4(), MONDAY, date(2030, 1, 6)))
+
+def test_clinic_availability_ranks_earliest_slots_across_doctors():
+    """Test le classement des premiers créneaux d'une durée donnée parmi plusieurs médecins"""
+    # Arrange : le Dr Martin est pris jusqu'à 10h, le Dr Petit de 8h30 à 12h, le Dr Roux est inactif
+    user_repository = InMemoryUserRepository()
+    doctors = {}
+    for last_name, is_active in [("Martin", True), ("Petit", True), ("Roux", False)]:
+        doctor = User(id=uuid4(), email=f"{last_name.lower()}@medisecure.com", first_name="Dr", last_name=last_name,
+                      role=UserRole.DOCTOR, is_active=is_active)
+        asyncio.run(user_repository.create(doctor))
+        doctors[last_name] = doctor.id
+    appointment_repository = InMemoryAppointmentRepository()
+    for last_name, start, end in [("Martin", at(7, 8), at(7, 10)), ("Petit", at(7, 8, 30), at(7, 12))]:
+        asyncio.run(appointment_repository.create(Appointment(
+            id=uuid4(), patient_id=uuid4(), doctor_id=doctors[last_name], start_time=start, end_time=end
+        )))
+    use_case = FindClinicAvailabilityUseCase(appointment_repository, user_repository, AvailabilityEngine(slot_minutes=30))
+
+    # Act
+    response = asyncio.run(use_case.execute(MONDAY, MONDAY, duration_minutes=60, limit=3))
+
+    # Assert : 8h-8h30 est trop court pour le Dr Petit
+    assert response.doctors_considered == 2
+    assert [(slot.doctor_name, slot.start_time) for slot in response.slots] == [
+        ("Dr Martin", at(7, 10)),
+        ("Dr Martin", at(7, 10, 30)),
+        ("Dr Martin", at(7, 11)),
+    ]
+    assert all(slot.end_time - slot.start_time == at(7, 9) - at(7, 8) for slot in response.slots)
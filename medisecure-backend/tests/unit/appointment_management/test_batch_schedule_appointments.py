@@ -0,0 +1,98 @@
+# tests/unit/appointment_management/test_batch_schedule_appointments.py
+
+import asyncio
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+
+from appointment_management.application.dtos.appointment_dtos import AppointmentCreateDTO
+from appointment_management.application.usecases.batch_schedule_appointments_usecase import BatchScheduleAppointmentsUseCase
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.services.appointment_service import AppointmentService
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.primary.uuid_generator import UuidGenerator
+
+@pytest.fixture
+def doctor_id():
+    """Fixture pour l'ID du médecin"""
+    return uuid4()
+
+@pytest.fixture
+def patient():
+    """Fixture pour créer un patient de test"""
+    return Patient(
+        id=uuid4(),
+        first_name="John",
+        last_name="Doe",
+        date_of_birth=date(1980, 1, 1),
+        gender="male"
+    )
+
+@pytest.fixture
+def appointment_repository(doctor_id, patient):
+    """Fixture pour un repository contenant un rendez-vous de 9h à 9h30"""
+    repository = InMemoryAppointmentRepository()
+    asyncio.run(repository.create(Appointment(
+        id=uuid4(),
+        patient_id=patient.id,
+        doctor_id=doctor_id,
+        start_time=datetime(2030, 1, 7, 9, 0),
+        end_time=datetime(2030, 1, 7, 9, 30)
+    )))
+    return repository
+
+@pytest.fixture
+def use_case(appointment_repository, patient):
+    """Fixture pour créer le cas d'utilisation avec des repositories en mémoire"""
+    patient_repository = InMemoryPatientRepository()
+    asyncio.run(patient_repository.create(patient))
+    return BatchScheduleAppointmentsUseCase(
+        appointment_repository=appointment_repository,
+        patient_repository=patient_repository,
+        appointment_service=AppointmentService(),
+        id_generator=UuidGenerator()
+    )
+
+def booking(patient_id, doctor_id, start, end):
+    """Construit une demande de rendez-vous le 7 janvier 2030"""
+    return AppointmentCreateDTO(
+        patient_id=patient_id,
+        doctor_id=doctor_id,
+        start_time=datetime(2030, 1, 7, *start),
+        end_time=datetime(2030, 1, 7, *end)
+    )
+
+def test_batch_reports_each_item(use_case, appointment_repository, patient, doctor_id):
+    """Test les résultats par demande : conflits en base, dans le lot et patient inconnu"""
+    # Arrange
+    items = [
+        booking(patient.id, doctor_id, (9, 15), (9, 45)),   # chevauche le rendez-vous existant
+        booking(patient.id, doctor_id, (10, 0), (10, 30)),
+        booking(patient.id, doctor_id, (10, 15), (10, 45)), # chevauche la demande précédente
+        booking(uuid4(), doctor_id, (11, 0), (11, 30)),     # patient inconnu
+        booking(patient.id, doctor_id, (9, 30), (10, 0)),   # adjacent aux deux côtés
+        booking(patient.id, uuid4(), (9, 0), (9, 30))       # autre médecin
+    ]
+
+    # Act
+    result = asyncio.run(use_case.execute(items))
+
+    # Assert
+    assert [item.status for item in result.results] == [
+        "conflict", "created", "conflict", "patient_not_found", "created", "created"
+    ]
+    assert [item.index for item in result.results] == list(range(6))
+    assert (result.created, result.rejected) == (3, 3)
+    assert asyncio.run(appointment_repository.count()) == 4
+
+def test_batch_without_valid_item_creates_nothing(use_case, appointment_repository, doctor_id):
+    """Test qu'un lot sans demande recevable ne crée aucun rendez-vous"""
+    # Act
+    result = asyncio.run(use_case.execute([booking(uuid4(), doctor_id, (14, 0), (14, 30))]))
+
+    # Assert
+    assert result.created == 0
+    assert result.results[0].status == "patient_not_found"
+    assert asyncio.run(appointment_repository.count()) == 1
@@ -0,0 +1,67 @@
+# tests/unit/appointment_management/test_calendar_stream.py
+
+import asyncio
+import json
+from datetime import date, datetime
+from uuid import uuid4
+
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.infrastructure.adapters.primary.controllers.appointment_controller import appointment_to_json_line, calendar_json_chunks
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+
+def make_appointment(start: datetime, end: datetime, is_active: bool = True) -> Appointment:
+    """Construit un rendez-vous"""
+    return Appointment(id=uuid4(), patient_id=uuid4(), doctor_id=uuid4(), start_time=start, end_time=end, is_active=is_active)
+
+def test_stream_by_date_range_is_chronological_and_untruncated():
+    """Test la lecture en flux d'un mois chargé, sans la limite de 100 rendez-vous"""
+    # Arrange : 150 rendez-vous en février, un inactif et un en mars
+    repository = InMemoryAppointmentRepository()
+    for index in reversed(range(150)):
+        day, slot = divmod(index, 10)
+        start = datetime(2030, 2, day + 1, 8 + slot)
+        asyncio.run(repository.create(make_appointment(start, start.replace(minute=30))))
+    asyncio.run(repository.create(make_appointment(datetime(2030, 2, 20, 8), datetime(2030, 2, 20, 9), is_active=False)))
+    asyncio.run(repository.create(make_appointment(datetime(2030, 3, 1, 8), datetime(2030, 3, 1, 9))))
+
+    async def collect():
+        return [appointment async for appointment in repository.stream_by_date_range(date(2030, 2, 1), date(2030, 2, 28))]
+
+    # Act
+    appointments = asyncio.run(collect())
+
+    # Assert
+    assert len(appointments) == 150
+    assert [a.start_time for a in appointments] == sorted(a.start_time for a in appointments)
+
+def test_json_line_matches_response_fields():
+    """Test la sérialisation NDJSON d'un rendez-vous"""
+    appointment = make_appointment(datetime(2030, 2, 1, 8), datetime(2030, 2, 1, 8, 30))
+    line = appointment_to_json_line(appointment)
+
+    assert line.endswith(b"\n")
+    data = json.loads(line)
+    assert data["id"] == str(appointment.id)
+    assert data["status"] == "SCHEDULED"
+    assert data["start_time"] == "2030-02-01T08:00:00"
+
+def test_unpaged_calendar_is_sent_in_chunks():
+    """Test le corps JSON du calendrier complet, produit par morceaux"""
+    # Arrange
+    repository = InMemoryAppointmentRepository()
+    for day in range(1, 6):
+        asyncio.run(repository.create(make_appointment(datetime(2030, 2, day, 8), datetime(2030, 2, day, 9))))
+
+    async def collect():
+        appointments = repository.stream_by_date_range(date(2030, 2, 1), date(2030, 2, 28))
+        return [chunk async for chunk in calendar_json_chunks(appointments, batch_size=2)]
+
+    # Act
+    chunks = asyncio.run(collect())
+
+    # Assert : ouverture, trois lots, fermeture avec le total
+    assert len(chunks) == 5
+    data = json.loads(b"".join(chunks))
+    assert data["total"] == data["limit"] == 5
+    assert data["next_cursor"] is None
+    assert [item["start_time"][:10] for item in data["appointments"]] == [f"2030-02-0{day}" for day in range(1, 6)]
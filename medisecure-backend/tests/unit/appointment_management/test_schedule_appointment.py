@@ -0,0 +1,91 @@
+# tests/unit/appointment_management/test_schedule_appointment.py
+
+import asyncio
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+
+from appointment_management.application.dtos.appointment_dtos import AppointmentCreateDTO
+from appointment_management.application.usecases.schedule_appointment_usecase import ScheduleAppointmentUseCase
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
+from appointment_management.domain.services.appointment_service import AppointmentService
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.primary.uuid_generator import UuidGenerator
+
+@pytest.fixture
+def doctor_id():
+    """Fixture pour l'ID du médecin"""
+    return uuid4()
+
+@pytest.fixture
+def patient():
+    """Fixture pour créer un patient de test"""
+    return Patient(
+        id=uuid4(),
+        first_name="John",
+        last_name="Doe",
+        date_of_birth=date(1980, 1, 1),
+        gender="male"
+    )
+
+@pytest.fixture
+def appointment_repository(doctor_id, patient):
+    """Fixture pour un repository contenant un rendez-vous de 9h à 9h30"""
+    repository = InMemoryAppointmentRepository()
+    asyncio.run(repository.create(Appointment(
+        id=uuid4(),
+        patient_id=patient.id,
+        doctor_id=doctor_id,
+        start_time=datetime(2030, 1, 7, 9, 0),
+        end_time=datetime(2030, 1, 7, 9, 30)
+    )))
+    return repository
+
+@pytest.fixture
+def use_case(appointment_repository, patient):
+    """Fixture pour créer le cas d'utilisation avec des repositories en mémoire"""
+    patient_repository = InMemoryPatientRepository()
+    asyncio.run(patient_repository.create(patient))
+    return ScheduleAppointmentUseCase(
+        appointment_repository=appointment_repository,
+        patient_repository=patient_repository,
+        appointment_service=AppointmentService(),
+        id_generator=UuidGenerator()
+    )
+
+def booking(patient, doctor_id, start, end):
+    """Construit une demande de rendez-vous le 7 janvier 2030"""
+    return AppointmentCreateDTO(
+        patient_id=patient.id,
+        doctor_id=doctor_id,
+        start_time=datetime(2030, 1, 7, *start),
+        end_time=datetime(2030, 1, 7, *end)
+    )
+
+def test_overlapping_booking_is_refused(use_case, patient, doctor_id):
+    """Test le refus d'un créneau qui chevauche un rendez-vous existant"""
+    with pytest.raises(AppointmentConflictException):
+        asyncio.run(use_case.execute(booking(patient, doctor_id, (9, 15), (9, 45))))
+
+def test_adjacent_booking_is_accepted(use_case, patient, doctor_id):
+    """Test qu'un créneau qui commence à la fin du précédent est accepté"""
+    # Act
+    result = asyncio.run(use_case.execute(booking(patient, doctor_id, (9, 30), (10, 0))))
+
+    # Assert
+    assert result.start_time == datetime(2030, 1, 7, 9, 30)
+
+def test_cancelled_appointment_frees_the_slot(use_case, appointment_repository, patient, doctor_id):
+    """Test qu'un rendez-vous annulé ne bloque plus le créneau"""
+    # Arrange
+    for appointment in appointment_repository.appointments.values():
+        appointment.status = AppointmentStatus.CANCELLED
+
+    # Act
+    result = asyncio.run(use_case.execute(booking(patient, doctor_id, (9, 0), (9, 30))))
+
+    # Assert
+    assert result.status == AppointmentStatus.SCHEDULED.value
@@ -0,0 +1,180 @@
+import asyncio
+import pytest
+import time
+from dataclasses import replace
+from datetime import date, datetime
+from uuid import uuid4
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.cached_patient_repository import CachedPatientRepository
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.infrastructure.database.unit_of_work import UnitOfWork
+from shared.infrastructure.services.record_cache import RecordCache, InMemoryCacheBackend
+
+def make_patient(**overrides) -> Patient:
+    """Construit un patient complet"""
+    values = dict(
+        id=uuid4(),
+        first_name="Sophie",
+        last_name="Bernard",
+        date_of_birth=date(1985, 6, 15),
+        gender="female",
+        allergies={"pollen": True},
+        has_consent=True,
+        consent_date=datetime(2024, 1, 10, 9, 30)
+    )
+    values.update(overrides)
+    return Patient(**values)
+
+@pytest.fixture
+def inner_repository():
+    """Fixture pour le repository interrogé en cas d'absence dans le cache"""
+    return InMemoryPatientRepository()
+
+def test_reads_are_cached_and_writes_invalidate(inner_repository):
+    """Test le cache des lectures par ID, les copies rendues et l'invalidation à la mise à jour"""
+    # Arrange
+    patient = make_patient()
+    asyncio.run(inner_repository.create(patient))
+    cache = RecordCache("patient", ttl_seconds=60)
+    repository = CachedPatientRepository(inner_repository, cache)
+
+    # Act
+    first = asyncio.run(repository.get_by_id(patient.id))
+    first.allergies["latex"] = True  # modification locale, jamais visible des lectures suivantes
+    second = asyncio.run(repository.get_by_id(patient.id))
+
+    # Assert
+    assert second == patient
+    assert (cache.stats()["local_hits"], cache.stats()["misses"]) == (1, 1)
+
+    # Act : une mise à jour via le cache est visible aussitôt, y compris par une autre instance
+    second.update_contact_info(city="Lyon")
+    asyncio.run(repository.update(second))
+    other = CachedPatientRepository(inner_repository, cache)
+
+    # Assert
+    assert asyncio.run(other.get_by_id(patient.id)).city == "Lyon"
+
+def test_memory_cap_evicts_least_recently_used(inner_repository):
+    """Test la limite d'occupation mémoire du cache local"""
+    # Arrange
+    patients = [make_patient() for _ in range(3)]
+    for patient in patients:
+        asyncio.run(inner_repository.create(patient))
+    cache = RecordCache("patient", ttl_seconds=60, max_bytes=1500)
+    repository = CachedPatientRepository(inner_repository, cache)
+
+    # Act
+    for patient in patients:
+        asyncio.run(repository.get_by_id(patient.id))
+
+    # Assert
+    stats = cache.stats()
+    assert stats["bytes"] <= 1500
+    assert stats["evictions"] >= 1
+    assert stats["entries"] == 3 - stats["evictions"]
+
+def test_shared_backend_serves_other_processes(inner_repository):
+    """Test qu'un second processus lit le patient depuis le stockage partagé et voit sa suppression"""
+    # Arrange
+    patient = make_patient()
+    asyncio.run(inner_repository.create(patient))
+    backend = InMemoryCacheBackend()
+    first = CachedPatientRepository(inner_repository, RecordCache("patient", backend=backend))
+    second_cache = RecordCache("patient", backend=backend)
+    second = CachedPatientRepository(InMemoryPatientRepository(), second_cache)
+
+    # Act
+    asyncio.run(first.get_by_id(patient.id))
+
+    # Assert
+    assert asyncio.run(second.get_by_id(patient.id)) == patient
+    assert second_cache.stats()["shared_hits"] == 1
+
+    # Act
+    asyncio.run(first.delete(patient.id))
+    second_cache.clear()
+
+    # Assert
+    assert asyncio.run(second.get_by_id(patient.id)) is None
+
+def test_read_between_write_and_commit_does_not_leave_stale_row(inner_repository):
+    """Test qu'une lecture concurrente entre l'écriture et le commit ne laisse pas l'ancienne ligne en cache"""
+    # Arrange : inner_repository est la version validée, vue par les autres connexions
+    patient = make_patient(city="Paris")
+    asyncio.run(inner_repository.create(patient))
+    cache = RecordCache("patient", backend=InMemoryCacheBackend(), invalidation_window_seconds=5)
+    reader = CachedPatientRepository(inner_repository, cache)
+    transaction = InMemoryPatientRepository()
+    asyncio.run(transaction.create(replace(patient)))
+
+    async def scenario():
+        async with UnitOfWork(session_factory=None) as uow:
+            writer = CachedPatientRepository(transaction, cache, unit_of_work=uow)
+            await writer.update(replace(patient, city="Lyon"))
+
+            # Lecture d'une autre requête avant le commit : elle voit (et met en cache) Paris
+            assert (await reader.get_by_id(patient.id)).city == "Paris"
+
+            # Commit : la ligne validée change puis le cache est invalidé
+            await inner_repository.update(await transaction.get_by_id(patient.id))
+
+        stale_replica = InMemoryPatientRepository()
+        await stale_replica.create(replace(patient))
+        lagging = CachedPatientRepository(stale_replica, cache)
+        replica_read = await lagging.get_by_id(patient.id)
+        after_commit = await reader.get_by_id(patient.id)
+        return replica_read, after_commit
+
+    # Act
+    replica_read, after_commit = asyncio.run(scenario())
+
+    # Assert : le réplica en retard répond Paris sans remplir le cache, la suite lit Lyon
+    assert replica_read.city == "Paris"
+    assert after_commit.city == "Lyon"
+    assert cache.stats()["rejected_fills"] == 2  # aucun remplissage pendant la fenêtre
+    assert cache.stats()["entries"] == 0
+
+def test_rolled_back_write_keeps_cached_row(inner_repository):
+    """Test qu'une écriture annulée n'invalide pas le cache"""
+    # Arrange
+    patient = make_patient()
+    asyncio.run(inner_repository.create(patient))
+    cache = RecordCache("patient", invalidation_window_seconds=5)
+    reader = CachedPatientRepository(inner_repository, cache)
+    asyncio.run(reader.get_by_id(patient.id))
+
+    async def scenario():
+        uow = UnitOfWork(session_factory=None)
+        writer = CachedPatientRepository(InMemoryPatientRepository(), cache, unit_of_work=uow)
+        await writer.create(make_patient(id=patient.id))
+        await uow.rollback()
+
+    # Act
+    asyncio.run(scenario())
+
+    # Assert
+    assert asyncio.run(reader.get_by_id(patient.id)) == patient
+    assert cache.stats()["invalidations"] == 0
+
+def test_other_process_sees_invalidation_after_local_ttl(inner_repository):
+    """Test qu'un autre processus ne garde pas sa copie locale au-delà de local_ttl_seconds après une écriture"""
+    # Arrange : deux processus partageant le même stockage, chacun avec son niveau local
+    patient = make_patient(city="Paris")
+    asyncio.run(inner_repository.create(patient))
+    backend = InMemoryCacheBackend()
+    writer = CachedPatientRepository(inner_repository, RecordCache("patient", ttl_seconds=120, backend=backend))
+    reader_cache = RecordCache("patient", ttl_seconds=120, backend=backend, local_ttl_seconds=0.05)
+    reader = CachedPatientRepository(inner_repository, reader_cache)
+    asyncio.run(reader.get_by_id(patient.id))
+
+    # Act
+    asyncio.run(writer.update(replace(patient, city="Lyon")))
+    time.sleep(0.1)
+    after = asyncio.run(reader.get_by_id(patient.id))
+
+    # Assert : l'entrée locale a expiré et le stockage partagé a été invalidé
+    assert after.city == "Lyon"
+    assert reader_cache.stats()["local_ttl_seconds"] == 0.05
+    assert reader_cache.stats()["local_hits"] == 0
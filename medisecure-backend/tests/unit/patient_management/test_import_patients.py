@@ -0,0 +1,96 @@
+# tests/unit/patient_management/test_import_patients.py
+
+import asyncio
+import io
+import pytest
+import threading
+from datetime import date
+from uuid import uuid4
+
+from patient_management.application.usecases.import_patients_usecase import ImportPatientsUseCase
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.infrastructure.adapters.primary.patient_import_reader import read_patient_rows
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.primary.uuid_generator import UuidGenerator
+
+CSV_CONTENT = """first_name,last_name,date_of_birth,gender,email,allergies
+Sophie,Bernard,1985-06-15,female,sophie.bernard@example.com,"{""pollen"": true}"
+Pierre,Durand,1975-03-22,male,existing@example.com,
+,Sans Prénom,1990-01-01,male,,
+Léa,Petit,2015-05-05,female,lea.petit@example.com,
+Marc,Martin,not-a-date,male,marc.martin@example.com,
+Paul,Dubois,1980-02-02,male,sophie.bernard@example.com,
+Anne,Moreau,1970-07-07,female,,
+"""
+
+@pytest.fixture
+def patient_repository():
+    """Fixture pour un repository contenant déjà un patient"""
+    repository = InMemoryPatientRepository()
+    asyncio.run(repository.create(Patient(
+        id=uuid4(),
+        first_name="Existing",
+        last_name="Patient",
+        date_of_birth=date(1960, 1, 1),
+        gender="male",
+        email="existing@example.com"
+    )))
+    return repository
+
+@pytest.mark.parametrize("batch_size", [2, 5000])
+def test_import_patients_report(patient_repository, batch_size):
+    """Test l'import d'un CSV avec des lignes valides, invalides et en doublon"""
+    # Arrange
+    use_case = ImportPatientsUseCase(
+        patient_repository=patient_repository,
+        patient_service=PatientService(),
+        id_generator=UuidGenerator(),
+        batch_size=batch_size
+    )
+    rows = read_patient_rows(io.BytesIO(CSV_CONTENT.encode("utf-8")), "csv")
+
+    # Act
+    report = asyncio.run(use_case.execute(rows))
+
+    # Assert
+    assert report.total_rows == 7
+    assert report.imported == 2
+    assert report.rejected == 5
+    assert [error.row for error in report.errors] == [3, 4, 5, 6, 7]
+    assert "already exists" in report.errors[0].error
+    assert "first_name" in report.errors[1].error
+    assert "date_of_birth" in report.errors[3].error
+    assert report.errors[4].email == "sophie.bernard@example.com"
+
+    imported = asyncio.run(patient_repository.get_by_email("sophie.bernard@example.com"))
+    assert imported.first_name == "Sophie"
+    assert imported.allergies == {"pollen": True}
+    assert asyncio.run(patient_repository.count()) == 3
+
+def test_rows_are_read_off_the_event_loop(patient_repository):
+    """Test que la lecture et la validation des lots ne bloquent pas la boucle d'événements"""
+    # Arrange
+    reader_threads = set()
+
+    def rows():
+        for row in read_patient_rows(io.BytesIO(CSV_CONTENT.encode("utf-8")), "csv"):
+            reader_threads.add(threading.get_ident())
+            yield row
+
+    use_case = ImportPatientsUseCase(
+        patient_repository=patient_repository,
+        patient_service=PatientService(),
+        id_generator=UuidGenerator(),
+        batch_size=2
+    )
+
+    async def run():
+        return await use_case.execute(rows()), threading.get_ident()
+
+    # Act
+    report, loop_thread = asyncio.run(run())
+
+    # Assert
+    assert report.imported == 2
+    assert reader_threads and loop_thread not in reader_threads
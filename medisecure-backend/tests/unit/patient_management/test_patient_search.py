@@ -0,0 +1,32 @@
+import pytest
+
+from patient_management.infrastructure.adapters.secondary.patient_search import (
+    build_prefix_tsquery,
+    escape_like,
+    normalize_phone
+)
+
+@pytest.mark.parametrize("phone", ["06 12 34 56 78", "06.12.34.56.78", "+33 6 12 34 56 78", "0033612345678"])
+def test_normalize_phone(phone):
+    """Test que les différentes écritures d'un numéro donnent les mêmes chiffres"""
+    assert normalize_phone(phone) == "612345678"
+
+def test_normalize_phone_empty():
+    """Test la normalisation d'un numéro absent"""
+    assert normalize_phone(None) == ""
+    assert normalize_phone("n/a") == ""
+
+def test_build_prefix_tsquery():
+    """Test la construction d'une requête de préfixes"""
+    assert build_prefix_tsquery("Soph  Ber") == "soph:* & ber:*"
+    assert build_prefix_tsquery("Ben-Ahmed") == "ben:* & ahmed:*"
+    assert build_prefix_tsquery("Hélène") == "hélène:*"
+
+def test_build_prefix_tsquery_ignores_operators():
+    """Test que les opérateurs tsquery saisis par l'utilisateur sont ignorés"""
+    assert build_prefix_tsquery("dupont & !(martin)") == "dupont:* & martin:*"
+    assert build_prefix_tsquery("':*&|") is None
+
+def test_escape_like():
+    """Test l'échappement des caractères spéciaux de LIKE"""
+    assert escape_like("50%_a\\b") == "50\\%\\_a\\\\b"
@@ -0,0 +1,63 @@
+# tests/unit/patient_management/test_patient_summaries.py
+
+import asyncio
+from dataclasses import fields
+from datetime import date
+from uuid import uuid4
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import (
+    PostgresPatientRepository,
+    _SUMMARY_COLUMNS
+)
+from shared.domain.enums.count_mode import CountMode
+
+def make_patient(last_name: str) -> Patient:
+    """Construit un patient avec des informations médicales"""
+    return Patient(
+        id=uuid4(),
+        first_name="Jean",
+        last_name=last_name,
+        date_of_birth=date(1980, 5, 17),
+        gender="male",
+        email=f"{last_name.lower()}@example.com",
+        allergies={"pénicilline": True},
+        notes="Suivi cardiologique"
+    )
+
+def test_summary_query_reads_only_projected_columns():
+    """Test que la projection ne lit ni les colonnes médicales ni les colonnes de recherche"""
+    # Arrange
+    repository = PostgresPatientRepository(session_factory=None)
+
+    # Act
+    query = repository._search_query(select(*_SUMMARY_COLUMNS), "dup", None, None, None, 0, 20)
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    selected = sql.split("\nFROM")[0]
+
+    # Assert
+    assert [column.key for column in _SUMMARY_COLUMNS] == [field.name for field in fields(PatientSummary)]
+    for column in ("allergies", "chronic_diseases", "current_medications", "notes", "search_vector"):
+        assert column not in selected
+    assert "search_vector" in sql
+
+def test_in_memory_summary_page():
+    """Test la pagination des résumés de patients"""
+    # Arrange
+    repository = InMemoryPatientRepository()
+    for last_name in ["Martin", "Dupont", "Bernard"]:
+        asyncio.run(repository.create(make_patient(last_name)))
+
+    # Act
+    first = asyncio.run(repository.list_summary_page(limit=2, count=CountMode.EXACT))
+    second = asyncio.run(repository.list_summary_page(cursor=first.next_cursor, limit=2))
+
+    # Assert
+    assert [summary.last_name for summary in first.items + second.items] == ["Bernard", "Dupont", "Martin"]
+    assert first.total == 3 and second.next_cursor is None
+    assert isinstance(first.items[0], PatientSummary)
+    assert not hasattr(first.items[0], "allergies")
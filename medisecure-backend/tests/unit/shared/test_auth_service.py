@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+from uuid import uuid4
+
+from shared.application.services.auth_service import AuthenticationService
+from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
+from shared.domain.entities.user import User
+from shared.domain.enums.roles import UserRole
+from shared.infrastructure.services.password_hasher import PasswordHasher
+
+PASSWORD = "Doctor123!"
+
+@pytest.fixture
+def password_hasher():
+    """Fixture pour un pool de hachage avec un coût bcrypt minimal"""
+    hasher = PasswordHasher(workers=1, max_queue=4, rounds=4)
+    yield hasher
+    hasher.shutdown()
+
+@pytest.fixture
+def user_repository(password_hasher):
+    """Fixture pour un repository contenant un médecin actif et un médecin inactif"""
+    repository = InMemoryUserRepository()
+    for email, is_active in [("doctor@medisecure.com", True), ("former@medisecure.com", False)]:
+        user = User(
+            id=uuid4(),
+            email=email,
+            first_name="Jean",
+            last_name="Martin",
+            role=UserRole.DOCTOR,
+            is_active=is_active
+        )
+        asyncio.run(repository.create(user))
+        repository.password_hashes[user.id] = password_hasher.hash_blocking(PASSWORD)
+    return repository
+
+@pytest.fixture
+def auth_service(user_repository, password_hasher):
+    """Fixture pour le service d'authentification"""
+    return AuthenticationService(user_repository, password_hasher=password_hasher)
+
+def test_login_returns_token(auth_service):
+    """Test une connexion réussie"""
+    response = asyncio.run(auth_service.login("doctor@medisecure.com", PASSWORD))
+    assert response.access_token
+    assert response.user.email == "doctor@medisecure.com"
+
+@pytest.mark.parametrize("email, password", [
+    ("doctor@medisecure.com", "wrong_password"),
+    ("former@medisecure.com", PASSWORD),
+    ("unknown@medisecure.com", PASSWORD),
+])
+def test_login_is_refused(auth_service, email, password):
+    """Test le refus d'un mauvais mot de passe, d'un compte inactif ou inconnu"""
+    assert asyncio.run(auth_service.login(email, password)) is None
@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+from uuid import uuid4
+
+from shared.adapters.secondary.cached_user_repository import CachedUserRepository
+from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
+from shared.domain.entities.user import User
+from shared.domain.enums.roles import UserRole
+from shared.infrastructure.services.principal_cache import PrincipalCache
+from shared.infrastructure.services.record_cache import InMemoryCacheBackend
+
+@pytest.fixture
+def user():
+    """Fixture pour un médecin"""
+    return User(id=uuid4(), email="doctor@medisecure.com", first_name="Jean", last_name="Martin", role=UserRole.DOCTOR)
+
+@pytest.fixture
+def inner_repository(user):
+    """Fixture pour le repository interrogé en cas d'absence dans le cache"""
+    repository = InMemoryUserRepository()
+    asyncio.run(repository.create(user))
+    return repository
+
+def test_reads_are_cached_and_writes_invalidate(inner_repository, user):
+    """Test qu'une lecture répétée ne touche pas le repository et qu'une mise à jour est visible aussitôt"""
+    # Arrange
+    cache = PrincipalCache(ttl_seconds=60)
+    repository = CachedUserRepository(inner_repository, cache)
+
+    # Act
+    asyncio.run(repository.get_by_id(user.id))
+    asyncio.run(repository.list_by_role("doctor"))
+    inner_repository.users[user.id].is_active = False  # modification hors du cache
+    cached = asyncio.run(repository.get_by_id(user.id))
+
+    # Assert
+    stats = cache.stats()
+    assert cached.is_active is True
+    assert (stats["local_hits"], stats["misses"]) == (1, 2)
+
+    # Act : une écriture via le cache invalide l'utilisateur et les listes par rôle
+    asyncio.run(repository.update(User(**{**user.__dict__, "role": UserRole.NURSE})))
+
+    # Assert
+    assert asyncio.run(repository.get_by_id(user.id)).role == UserRole.NURSE
+    assert asyncio.run(repository.list_by_role("doctor")) == []
+
+def test_shared_backend_serves_other_processes(inner_repository, user):
+    """Test qu'un second processus lit l'utilisateur depuis le stockage partagé"""
+    # Arrange
+    backend = InMemoryCacheBackend()
+    first = CachedUserRepository(inner_repository, PrincipalCache(backend=backend))
+    other_cache = PrincipalCache(backend=backend)
+    second = CachedUserRepository(InMemoryUserRepository(), other_cache)
+
+    # Act
+    asyncio.run(first.get_by_id(user.id))
+    found = asyncio.run(second.get_by_id(user.id))
+
+    # Assert
+    assert found.email == user.email
+    assert other_cache.stats()["shared_hits"] == 1
+
+    # Act : la suppression efface aussi le stockage partagé
+    asyncio.run(first.delete(user.id))
+    other_cache.clear()
+
+    # Assert
+    assert asyncio.run(second.get_by_id(user.id)) is None
+
+def test_lagging_replica_read_after_invalidation_is_not_cached(inner_repository, user):
+    """Test qu'une lecture sur un réplica en retard ne remet pas l'ancien utilisateur en cache"""
+    # Arrange
+    cache = PrincipalCache(ttl_seconds=60, invalidation_window_seconds=5)
+    primary = CachedUserRepository(inner_repository, cache)
+    stale_replica = InMemoryUserRepository()
+    asyncio.run(stale_replica.create(User(**user.__dict__)))
+    lagging = CachedUserRepository(stale_replica, cache)
+    asyncio.run(primary.get_by_id(user.id))
+
+    # Act : désactivation, puis lecture servie par le réplica qui ne la voit pas encore
+    asyncio.run(primary.update(User(**{**user.__dict__, "is_active": False})))
+    replica_read = asyncio.run(lagging.get_by_id(user.id))
+    after = asyncio.run(primary.get_by_id(user.id))
+
+    # Assert
+    assert replica_read.is_active is True
+    assert after.is_active is False
+    assert cache.stats()["rejected_fills"] == 2
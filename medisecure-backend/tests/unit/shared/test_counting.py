@@ -0,0 +1,34 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from shared.domain.enums.count_mode import CountMode
+from shared.infrastructure.database.counting import total_column
+from shared.infrastructure.database.models.patient_model import PatientModel
+
+def compile_sql(expression):
+    """Compile une expression SQLAlchemy pour PostgreSQL"""
+    return str(expression.compile(dialect=postgresql.dialect()))
+
+def count_query():
+    """Requête count(*) exacte sur les patients"""
+    return select(func.count()).select_from(PatientModel)
+
+def test_no_total_requested():
+    """Test qu'aucune sous-requête n'est produite sans comptage"""
+    assert total_column(count_query(), "patients", CountMode.NONE) is None
+
+def test_exact_total():
+    """Test le comptage exact"""
+    sql = compile_sql(total_column(count_query(), "patients", CountMode.EXACT))
+    assert "count(*)" in sql
+
+def test_estimated_total():
+    """Test l'estimation à partir des statistiques PostgreSQL"""
+    sql = compile_sql(total_column(count_query(), "patients", CountMode.ESTIMATED))
+    assert "pg_class.reltuples" in sql
+    assert "count(*)" not in sql
+
+def test_estimated_total_on_filtered_list_stays_exact():
+    """Test que l'estimation n'est pas utilisée pour une liste filtrée"""
+    sql = compile_sql(total_column(count_query(), "patients", CountMode.ESTIMATED, filtered=True))
+    assert "count(*)" in sql
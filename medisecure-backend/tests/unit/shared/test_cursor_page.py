@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from datetime import date, datetime
+from uuid import UUID, uuid4
+
+from shared.domain.entities.cursor_page import CursorPage, encode_cursor, decode_cursor
+from shared.domain.exceptions.shared_exceptions import InvalidCursorException
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+
+def test_cursor_round_trip():
+    """Test l'encodage puis le décodage d'une clé de tri"""
+    # Arrange
+    start_time = datetime(2025, 3, 14, 9, 30)
+    appointment_id = uuid4()
+
+    # Act
+    cursor = encode_cursor(start_time, appointment_id)
+    values = decode_cursor(cursor, datetime.fromisoformat, UUID)
+
+    # Assert
+    assert "=" not in cursor
+    assert values == [start_time, appointment_id]
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("Dupont"), encode_cursor("Dupont", "not-a-uuid")])
+def test_invalid_cursor(cursor):
+    """Test le rejet d'un curseur mal formé"""
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, str, UUID)
+
+def test_from_rows_next_cursor():
+    """Test que le curseur suivant n'est produit que si une ligne supplémentaire existe"""
+    # Act
+    full_page = CursorPage.from_rows([1, 2, 3], 2, key=lambda row: (row,), mapper=str)
+    last_page = CursorPage.from_rows([1, 2], 2, key=lambda row: (row,), mapper=str)
+
+    # Assert
+    assert full_page.items == ["1", "2"]
+    assert decode_cursor(full_page.next_cursor, int) == [2]
+    assert last_page.next_cursor is None
+
+def test_in_memory_patient_pages():
+    """Test le parcours complet des patients page par page"""
+    # Arrange
+    repository = InMemoryPatientRepository()
+    for last_name in ["Martin", "Bernard", "Dubois", "Martin", "Petit"]:
+        patient = Patient(
+            id=uuid4(),
+            first_name="Jean",
+            last_name=last_name,
+            date_of_birth=date(1980, 1, 1),
+            gender="male"
+        )
+        asyncio.run(repository.create(patient))
+
+    # Act
+    seen = []
+    cursor = None
+    while True:
+        page = asyncio.run(repository.list_page(cursor, limit=2))
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    # Assert
+    assert [patient.last_name for patient in seen] == ["Bernard", "Dubois", "Martin", "Martin", "Petit"]
+    assert len({patient.id for patient in seen}) == 5
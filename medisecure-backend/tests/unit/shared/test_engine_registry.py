@@ -0,0 +1,59 @@
+import pytest
+
+from shared.infrastructure.config.settings import Settings
+from shared.infrastructure.database.engine_registry import (
+    EngineRegistry,
+    InstrumentedAsyncQueuePool,
+    PoolStatistics
+)
+
+@pytest.fixture
+def registry():
+    """Fixture pour créer un registre de moteurs isolé"""
+    settings = Settings()
+    settings.testing = False
+    return EngineRegistry(settings)
+
+def test_engine_is_shared(registry):
+    """Test qu'un seul moteur est créé par base de données"""
+    # Act
+    first = registry.get_engine()
+    second = registry.get_engine()
+
+    # Assert
+    assert first is second
+    assert isinstance(first.pool, InstrumentedAsyncQueuePool)
+    assert registry.get_session_factory() is registry.get_session_factory()
+
+def test_unknown_engine_name(registry):
+    """Test qu'un nom de base inconnu est refusé"""
+    with pytest.raises(KeyError):
+        registry.get_engine("unknown")
+
+def test_pool_stats(registry):
+    """Test l'exposition des statistiques du pool"""
+    # Arrange
+    registry.get_engine()
+
+    # Act
+    stats = registry.pool_stats()["primary"]
+
+    # Assert
+    assert stats["checked_out"] == 0
+    assert stats["overflow"] == -registry.settings.database.pool_size
+    assert stats["timeouts"] == 0
+    assert stats["max_wait_ms"] == 0
+
+def test_pool_statistics_record_wait():
+    """Test l'agrégation des temps d'attente"""
+    # Arrange
+    statistics = PoolStatistics()
+
+    # Act
+    statistics.record_wait(2.0)
+    statistics.record_wait(4.0)
+
+    # Assert
+    assert statistics.checkouts == 2
+    assert statistics.avg_wait_ms == 3.0
+    assert statistics.max_wait_ms == 4.0
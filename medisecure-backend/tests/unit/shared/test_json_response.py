@@ -0,0 +1,48 @@
+# tests/unit/shared/test_json_response.py
+
+import json
+from datetime import date, datetime, timezone
+from uuid import uuid4
+from fastapi.encoders import jsonable_encoder
+
+from patient_management.application.dtos.patient_dtos import PatientResponseDTO
+from patient_management.domain.entities.patient import Patient
+from shared.infrastructure.serialization import ORJSONResponse, ResponseSerializer
+
+def make_patient() -> Patient:
+    """Construit un patient avec des informations médicales JSONB"""
+    return Patient(
+        id=uuid4(),
+        first_name="Jean",
+        last_name="Dupont",
+        date_of_birth=date(1980, 5, 17),
+        gender="male",
+        email="jean.dupont@example.com",
+        allergies={"pénicilline": {"sévérité": "haute"}, "arachide": True},
+        chronic_diseases={"asthme": {"depuis": 1995}},
+        current_medications={"ventoline": ["100 µg", "2 fois par jour"]},
+        has_consent=True,
+        gdpr_consent=True,
+        consent_date=datetime(2024, 1, 2, 10, 30, 15, 123456, tzinfo=timezone.utc)
+    )
+
+def test_serializer_matches_validated_dto_output():
+    """Test que le chemin rapide produit le même JSON que la validation Pydantic"""
+    # Arrange
+    patient = make_patient()
+    serializer = ResponseSerializer(PatientResponseDTO)
+
+    # Act
+    fast = ORJSONResponse({"patients": serializer.many([patient]), "total": 1}).body
+
+    # Assert
+    expected = jsonable_encoder({"patients": [PatientResponseDTO.from_orm(patient)], "total": 1})
+    assert json.loads(fast) == expected
+    assert set(serializer.one(patient)) == set(PatientResponseDTO.__fields__)
+
+def test_json_line_is_newline_terminated():
+    """Test la sérialisation d'une ligne NDJSON"""
+    line = ResponseSerializer(PatientResponseDTO).json_line(make_patient())
+
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert json.loads(line)["allergies"]["pénicilline"] == {"sévérité": "haute"}
@@ -0,0 +1,71 @@
+# tests/unit/shared/test_outbox_mailer.py
+
+import asyncio
+from datetime import datetime
+
+from shared.adapters.secondary.in_memory_email_outbox_repository import InMemoryEmailOutboxRepository
+from shared.domain.entities.outbox_email import OutboxEmailStatus
+from shared.infrastructure.services.outbox_mailer import OutboxMailer
+from shared.infrastructure.services.outbox_worker import OutboxWorker
+from shared.infrastructure.services.smtp_mailer import SmtpConnectionPool
+from shared.infrastructure.services.smtp_sink import SmtpSink
+
+def make_worker(repository: InMemoryEmailOutboxRepository, port: int) -> OutboxWorker:
+    """Worker branché sur le serveur SMTP local"""
+    pool = SmtpConnectionPool("127.0.0.1", port, user="worker", password="secret", starttls=False, size=1)
+    return OutboxWorker(repository, pool, email_from="noreply@medisecure.com", max_attempts=3, retry_base_seconds=30)
+
+def test_outbox_emails_are_sent_in_batch_over_one_connection():
+    """Test l'envoi différé d'un lot d'emails sur une connexion authentifiée réutilisée"""
+    repository = InMemoryEmailOutboxRepository()
+    mailer = OutboxMailer(repository)
+
+    with SmtpSink() as sink:
+        worker = make_worker(repository, sink.port)
+
+        async def scenario():
+            # Arrange : l'appelant rend la main sans contacter le serveur SMTP
+            for index in range(3):
+                assert await mailer.send_email(f"patient{index}@example.com", "Rappel", "Votre rendez-vous", bcc=["audit@medisecure.com"])
+            assert sink.messages == []
+
+            # Act
+            processed = await worker.run_once()
+            await worker.run_once()
+            return processed
+
+        processed = asyncio.run(scenario())
+        worker.pool.close()
+
+    # Assert
+    assert processed == 3
+    assert sink.connections == 1
+    assert [email.recipients for email in sink.messages] == [
+        [f"patient{index}@example.com", "audit@medisecure.com"] for index in range(3)
+    ]
+    assert all(email.status == OutboxEmailStatus.SENT for email in repository.emails.values())
+
+def test_failures_are_retried_or_abandoned():
+    """Test la reprise différée d'un échec temporaire et l'abandon d'un destinataire refusé"""
+    repository = InMemoryEmailOutboxRepository()
+    mailer = OutboxMailer(repository)
+
+    with SmtpSink(rejected={"unknown@example.com"}) as sink:
+        port = sink.port
+        worker = make_worker(repository, port)
+        asyncio.run(mailer.send_email("unknown@example.com", "Rappel", "Votre rendez-vous"))
+        asyncio.run(worker.run_once())
+        worker.pool.close()
+
+    # Serveur arrêté : échec temporaire
+    worker = make_worker(repository, port)
+    asyncio.run(mailer.send_email("patient@example.com", "Rappel", "Votre rendez-vous"))
+    asyncio.run(worker.run_once())
+
+    emails = {email.to_email: email for email in repository.emails.values()}
+    assert emails["unknown@example.com"].status == OutboxEmailStatus.FAILED
+    assert emails["unknown@example.com"].attempts == 1
+    retried = emails["patient@example.com"]
+    assert (retried.status, retried.attempts) == (OutboxEmailStatus.PENDING, 1)
+    assert retried.next_attempt_at > datetime.utcnow()
+    assert asyncio.run(repository.count_pending()) == 1
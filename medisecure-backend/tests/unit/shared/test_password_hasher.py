@@ -0,0 +1,41 @@
+import asyncio
+import threading
+import pytest
+
+from shared.infrastructure.services.password_hasher import PasswordHasher, PasswordHasherOverloadedException
+
+@pytest.fixture
+def hasher():
+    """Fixture pour un pool de hachage avec un coût bcrypt minimal"""
+    hasher = PasswordHasher(workers=1, max_queue=1, rounds=4)
+    yield hasher
+    hasher.shutdown()
+
+def test_hash_and_verify(hasher):
+    """Test le hachage puis la vérification sur le pool"""
+    # Act
+    hashed = asyncio.run(hasher.hash("Admin123!"))
+
+    # Assert
+    assert asyncio.run(hasher.verify("Admin123!", hashed)) is True
+    assert asyncio.run(hasher.verify("wrong_password", hashed)) is False
+    assert hasher.verify_blocking("Admin123!", "not-a-bcrypt-hash") is False
+    assert hasher.stats()["completed"] == 4
+
+def test_full_queue_is_rejected(hasher):
+    """Test le refus immédiat d'une demande lorsque le thread et la file sont occupés"""
+    # Arrange : un calcul bloque l'unique thread, un second occupe l'unique place de la file
+    release = threading.Event()
+    running = hasher._submit(release.wait)
+    queued = hasher._submit(release.wait)
+
+    # Act / Assert
+    with pytest.raises(PasswordHasherOverloadedException):
+        hasher.hash_blocking("Admin123!")
+    stats = hasher.stats()
+    assert (stats["in_progress"], stats["queued"], stats["rejected"]) == (1, 1, 1)
+
+    release.set()
+    running.result()
+    queued.result()
+    assert hasher.stats()["queued"] == 0
@@ -0,0 +1,67 @@
+# tests/unit/shared/test_query_instrumentation.py
+
+import logging
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+
+from api.middlewares.timing_middleware import TimingMiddleware
+from shared.infrastructure.database.query_instrumentation import QueryInstrumentation, normalize_sql
+from shared.infrastructure.monitoring.metrics import MetricsRegistry
+from shared.infrastructure.monitoring.timed_route import TimedRoute
+from shared.infrastructure.monitoring.timing import timed_methods
+from tests.unit.shared.test_request_timing import call
+
+engine = create_engine("sqlite://")
+with engine.begin() as connection:
+    connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    connection.execute(text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+
+@timed_methods("repository")
+class ItemRepository:
+    """Repository factice sur une base SQLite en mémoire"""
+
+    async def list_ids(self) -> list:
+        with engine.connect() as connection:
+            return list(connection.execute(text("SELECT id FROM items")).scalars())
+
+    async def get_name(self, item_id: int) -> str:
+        with engine.connect() as connection:
+            return connection.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id}).scalar()
+
+def test_normalize_sql_hides_values():
+    """Test la normalisation des requêtes pour les logs"""
+    statement = "SELECT * FROM patients WHERE id = $1::UUID AND last_name = 'Dupont'\n  AND status IN ($2, $3, $4) LIMIT 101"
+
+    assert normalize_sql(statement) == "SELECT * FROM patients WHERE id = ? AND last_name = ? AND status IN (...) LIMIT ?"
+
+def test_queries_are_attributed_and_n_plus_one_is_reported(caplog):
+    """Test l'attribution des requêtes aux repositories et la détection d'un N+1"""
+    # Arrange
+    registry = MetricsRegistry()
+    QueryInstrumentation(registry, slow_query_ms=0).install(engine)
+
+    app = FastAPI()
+    app.router.route_class = TimedRoute
+
+    @app.get("/items")
+    async def list_items():
+        repository = ItemRepository()
+        return [await repository.get_name(item_id) for item_id in await repository.list_ids()]
+
+    asgi = TimingMiddleware(app, registry, max_queries=3)
+
+    # Act
+    with caplog.at_level(logging.WARNING):
+        assert call(asgi, "/items")[0]["status"] == 200
+
+    # Assert
+    assert "4 requêtes SQL pour GET /items (budget 3), N+1 probable : ItemRepository.get_name x3" in caplog.text
+    assert "SELECT name FROM items WHERE id = ?" in caplog.text
+
+    text_metrics = registry.render_prometheus()
+    assert 'medisecure_sql_query_duration_seconds_count{operation="ItemRepository.get_name"} 3' in text_metrics
+    assert 'medisecure_sql_query_duration_seconds_count{operation="ItemRepository.list_ids"} 1' in text_metrics
+    assert 'medisecure_sql_slow_queries_total{operation="ItemRepository.get_name"} 3' in text_metrics
+    assert 'medisecure_request_sql_queries_sum{method="GET",route="/items"} 4.0' in text_metrics
+    assert 'medisecure_requests_over_query_budget_total{method="GET",route="/items"} 1' in text_metrics
+    assert registry.quantiles("GET", "/items", span="sql")[0.5] is not None
@@ -0,0 +1,28 @@
+import json
+
+from shared.infrastructure.database.query_plans import find_seq_scans
+
+def test_find_seq_scans_in_nested_plan():
+    """Test la détection des parcours séquentiels dans un plan imbriqué"""
+    # Arrange
+    plan = [{
+        "Plan": {
+            "Node Type": "Limit",
+            "Plans": [{
+                "Node Type": "Nested Loop",
+                "Plans": [
+                    {"Node Type": "Index Scan", "Relation Name": "appointments", "Index Name": "idx_appointments_doctor_start"},
+                    {"Node Type": "Seq Scan", "Relation Name": "patients"}
+                ]
+            }]
+        }
+    }]
+
+    # Act / Assert
+    assert find_seq_scans(plan) == ["patients"]
+    assert find_seq_scans(json.dumps(plan)) == ["patients"]
+
+def test_index_only_plan_is_not_flagged():
+    """Test qu'un plan servi par un index n'est pas signalé"""
+    plan = [{"Plan": {"Node Type": "Index Scan", "Relation Name": "patients", "Index Name": "idx_patients_last_name"}}]
+    assert find_seq_scans(plan) == []
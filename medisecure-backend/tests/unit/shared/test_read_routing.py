@@ -0,0 +1,184 @@
+import asyncio
+
+from api.middlewares.read_routing_middleware import ReadRoutingMiddleware
+from shared.infrastructure.config.settings import Settings, DatabaseSettings
+from shared.infrastructure.database.engine_registry import EngineRegistry, PRIMARY
+from shared.infrastructure.database.read_routing import (
+    ReadSessionFactory,
+    ReadYourWritesTracker,
+    allow_replica_reads,
+    replica_reads_allowed,
+    reset_replica_reads,
+    select_read_factory
+)
+from shared.infrastructure.database.unit_of_work import UnitOfWork
+
+REPLICA_URLS = "postgresql://reader@replica-1:5432/medisecure, postgresql://reader@replica-2:5432/medisecure"
+
+def registry(replica_urls: str = REPLICA_URLS) -> EngineRegistry:
+    """Construit un registre avec des réplicas configurés (aucun moteur n'est créé)"""
+    return EngineRegistry(Settings(database=DatabaseSettings(replica_urls=replica_urls)))
+
+def test_replica_urls_are_normalized():
+    """Test la lecture de la liste des réplicas"""
+    urls = registry()._urls()
+    assert urls["replica_1"].startswith("postgresql+asyncpg://reader@replica-1")
+    assert set(urls) == {PRIMARY, "replica_1", "replica_2"}
+
+def test_reads_go_to_primary_outside_get_requests():
+    """Test que les lectures restent sur le primaire sans autorisation du contexte"""
+    assert ReadSessionFactory(registry()).target() == PRIMARY
+
+def test_reads_rotate_over_replicas():
+    """Test la répartition des lectures autorisées entre les réplicas"""
+    factory = ReadSessionFactory(registry())
+    token = allow_replica_reads()
+    try:
+        targets = {factory.target() for _ in range(4)}
+    finally:
+        reset_replica_reads(token)
+    assert targets == {"replica_1", "replica_2"}
+
+def test_reads_fall_back_to_primary_without_replica():
+    """Test le repli sur le primaire lorsqu'aucun réplica n'est configuré"""
+    factory = ReadSessionFactory(registry(replica_urls=""))
+    token = allow_replica_reads()
+    try:
+        assert factory.target() == PRIMARY
+    finally:
+        reset_replica_reads(token)
+
+def test_read_your_writes_window():
+    """Test qu'un client qui vient d'écrire est signalé pendant la fenêtre seulement"""
+    tracker = ReadYourWritesTracker(window_seconds=60)
+    tracker.record_write("client-a")
+    assert tracker.wrote_recently("client-a")
+    assert not tracker.wrote_recently("client-b")
+    assert not ReadYourWritesTracker(window_seconds=0).wrote_recently("client-a")
+
+def test_unit_of_work_keeps_its_reads():
+    """Test que les lectures d'une unité de travail restent dans sa transaction"""
+    uow = UnitOfWork(session_factory=None)
+    replica_factory = object()
+    assert select_read_factory(uow, replica_factory) is uow
+    assert select_read_factory("primary", replica_factory) is replica_factory
+    assert select_read_factory("primary") == "primary"
+
+class FakeSession:
+    """Session factice : la connexion échoue sur une base injoignable"""
+
+    def __init__(self, name: str, reachable: bool):
+        self.name = name
+        self.reachable = reachable
+        self.closed = False
+
+    async def connection(self):
+        if not self.reachable:
+            raise ConnectionRefusedError(f"{self.name} unreachable")
+
+    async def close(self):
+        self.closed = True
+
+class FakeRegistry(EngineRegistry):
+    """Registre dont les sessions sont factices ; replica_1 est injoignable"""
+
+    def __init__(self):
+        super().__init__(Settings(database=DatabaseSettings(replica_urls="postgresql://reader@replica-1:5432/medisecure")))
+        self.sessions = []
+
+    def get_session_factory(self, name: str = PRIMARY):
+        def open_session():
+            session = FakeSession(name, reachable=name == PRIMARY)
+            self.sessions.append(session)
+            return session
+        return open_session
+
+def test_unreachable_replica_falls_back_to_primary():
+    """Test qu'une lecture dont le réplica ne répond pas repart sur le primaire"""
+    # Arrange
+    registry = FakeRegistry()
+    factory = ReadSessionFactory(registry)
+
+    async def read():
+        async with factory() as session:
+            return session.name
+
+    # Act
+    token = allow_replica_reads()
+    try:
+        first, second = asyncio.run(read()), asyncio.run(read())
+    finally:
+        reset_replica_reads(token)
+
+    # Assert : la lecture en cours aboutit, les suivantes évitent le réplica écarté
+    assert (first, second) == (PRIMARY, PRIMARY)
+    assert [session.name for session in registry.sessions] == ["replica_1", PRIMARY, PRIMARY]
+    assert all(session.closed for session in registry.sessions)
+
+def test_middleware_keeps_recent_writers_on_primary():
+    """Test que le middleware ASGI renvoie sur le primaire les lectures d'un client qui vient d'écrire"""
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(replica_reads_allowed())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = ReadRoutingMiddleware(app, window_seconds=60)
+
+    async def request(method: str, token: bytes):
+        scope = {"type": "http", "method": method, "path": "/api/patients/", "client": ("10.0.0.1", 1234),
+                 "headers": [(b"authorization", b"Bearer " + token)]}
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            pass
+
+        await middleware(scope, receive, send)
+
+    asyncio.run(request("GET", b"a"))
+    asyncio.run(request("POST", b"a"))
+    asyncio.run(request("GET", b"a"))
+    asyncio.run(request("GET", b"b"))
+
+    assert seen == [True, False, False, True]
+
+def test_write_cookie_routes_reads_on_another_worker():
+    """Test qu'une lecture arrivée sur un autre worker après une écriture reste sur le primaire"""
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(replica_reads_allowed())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    # Deux workers : chacun son suivi en mémoire
+    writer_worker = ReadRoutingMiddleware(app, window_seconds=60)
+    reader_worker = ReadRoutingMiddleware(app, window_seconds=60)
+
+    async def request(middleware, method: str, cookie: bytes = b""):
+        headers = [(b"authorization", b"Bearer a")]
+        if cookie:
+            headers.append((b"cookie", cookie))
+        scope = {"type": "http", "method": method, "path": "/api/patients/", "client": ("10.0.0.1", 1234),
+                 "headers": headers}
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        await middleware(scope, receive, send)
+        return dict(sent[0]["headers"]).get(b"set-cookie", b"")
+
+    set_cookie = asyncio.run(request(writer_worker, "PUT"))
+    cookie = set_cookie.split(b";")[0]
+    asyncio.run(request(reader_worker, "GET", cookie))
+    asyncio.run(request(reader_worker, "GET", b"medisecure_last_write=1000.0"))
+
+    assert cookie.startswith(b"medisecure_last_write=")
+    assert seen == [False, False, True]
@@ -0,0 +1,83 @@
+# tests/unit/shared/test_request_timing.py
+
+import asyncio
+from fastapi import FastAPI
+
+from api.middlewares.timing_middleware import TimingMiddleware
+from shared.infrastructure.monitoring.metrics import LatencyHistogram, MetricsRegistry
+from shared.infrastructure.monitoring.timed_route import TimedRoute
+from shared.infrastructure.monitoring.timing import timed_methods
+
+@timed_methods("repository")
+class SlowRepository:
+    """Repository factice : 20 ms par lecture"""
+
+    async def get(self, item_id: int) -> dict:
+        await asyncio.sleep(0.02)
+        return await self.describe(item_id)
+
+    async def describe(self, item_id: int) -> dict:
+        # Appel imbriqué : ne doit pas être compté deux fois
+        await asyncio.sleep(0.01)
+        return {"id": item_id}
+
+def call(app, path: str) -> list:
+    """Exécute une requête GET directement sur l'application ASGI"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [], "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+def test_request_spans_are_aggregated_per_route():
+    """Test le découpage d'une requête en étapes et l'agrégation par gabarit de route"""
+    # Arrange
+    app = FastAPI()
+    app.router.route_class = TimedRoute
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return await SlowRepository().get(item_id)
+
+    registry = MetricsRegistry()
+    asgi = TimingMiddleware(app, registry)
+
+    # Act
+    for item_id in range(3):
+        assert call(asgi, f"/items/{item_id}")[0]["status"] == 200
+    assert call(asgi, "/unknown")[0]["status"] == 404
+
+    # Assert
+    repository = registry.quantiles("GET", "/items/{item_id}", span="repository")[0.5]
+    endpoint = registry.quantiles("GET", "/items/{item_id}", span="endpoint")[0.5]
+    assert 0.025 <= repository < 0.05
+    assert endpoint >= repository
+    assert registry.quantiles("GET", "/items/{item_id}", span="serialization")[0.5] is not None
+
+    text = registry.render_prometheus()
+    assert 'medisecure_http_requests_total{method="GET",route="/items/{item_id}",status="200"} 3' in text
+    assert 'medisecure_http_requests_total{method="GET",route="<unmatched>",status="404"} 1' in text
+    assert 'medisecure_http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 3' in text
+    assert '# TYPE medisecure_request_span_duration_seconds histogram' in text
+    assert 'medisecure_request_span_duration_quantile_seconds{method="GET",route="/items/{item_id}",span="repository",quantile="0.99"}' in text
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    """Test l'estimation des quantiles à partir des buckets"""
+    histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.4))
+    for seconds in [0.05] * 50 + [0.15] * 45 + [0.3] * 4 + [1.0]:
+        histogram.observe(seconds)
+
+    assert histogram.quantile(0.5) == 0.1
+    assert abs(histogram.quantile(0.95) - 0.2) < 1e-9
+    assert 0.2 < histogram.quantile(0.99) <= 0.4
+    assert LatencyHistogram().quantile(0.5) is None
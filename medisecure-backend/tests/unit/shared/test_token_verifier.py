@@ -0,0 +1,56 @@
+import time
+import pytest
+from jose import jwt, JWTError
+
+from shared.services.authenticator.token_verifier import TokenVerifier
+
+SECRET = "test-secret-key-with-at-least-32-characters"
+
+def make_token(expires_in: float, **claims) -> str:
+    """Construit un token signé expirant dans `expires_in` secondes"""
+    return jwt.encode({"sub": "doctor@medisecure.com", "exp": int(time.time() + expires_in), **claims}, SECRET, algorithm="HS256")
+
+@pytest.fixture
+def verifier():
+    """Fixture pour un vérificateur avec un petit cache"""
+    return TokenVerifier(SECRET, "HS256", max_entries=2, ttl_seconds=300)
+
+def test_verified_token_is_cached(verifier):
+    """Test qu'un token n'est vérifié qu'une fois, et que les claims rendus sont des copies"""
+    # Arrange
+    token = make_token(60, role="doctor")
+
+    # Act
+    first = verifier.verify(token)
+    first["role"] = "ADMIN"
+    second = verifier.verify(token)
+
+    # Assert
+    assert second["role"] == "doctor"
+    assert (verifier.hits, verifier.misses) == (1, 1)
+
+def test_cache_never_outlives_exp(verifier):
+    """Test qu'un token mis en cache est refusé après son expiration"""
+    # Arrange
+    token = make_token(1)
+    verifier.verify(token)
+
+    # Act / Assert
+    time.sleep(2)
+    with pytest.raises(JWTError):
+        verifier.verify(token)
+
+def test_invalid_tokens_are_rejected_and_not_cached(verifier):
+    """Test le refus d'un token signé avec une autre clé"""
+    token = jwt.encode({"sub": "x", "exp": int(time.time() + 60)}, "another-secret-key-of-32-characters!", algorithm="HS256")
+    for _ in range(2):
+        with pytest.raises(JWTError):
+            verifier.verify(token)
+    assert verifier.stats()["entries"] == 0
+
+def test_cache_is_bounded(verifier):
+    """Test l'éviction des tokens les moins récemment utilisés"""
+    tokens = [make_token(60, n=n) for n in range(3)]
+    for token in tokens:
+        verifier.verify(token)
+    assert verifier.stats()["entries"] == 2
@@ -0,0 +1,102 @@
+import asyncio
+import pytest
+
+from shared.infrastructure.database.unit_of_work import UnitOfWork, commit_or_flush
+
+class FakeSession:
+    """Session factice qui compte les appels"""
+    def __init__(self):
+        self.info = {}
+        self.commits = 0
+        self.flushes = 0
+        self.rollbacks = 0
+        self.closed = False
+
+    async def commit(self):
+        self.commits += 1
+
+    async def flush(self):
+        self.flushes += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def close(self):
+        self.closed = True
+
+class FakeSessionFactory:
+    """Factory factice qui mémorise les sessions créées"""
+    def __init__(self):
+        self.sessions = []
+
+    def __call__(self):
+        session = FakeSession()
+        self.sessions.append(session)
+        return session
+
+@pytest.fixture
+def session_factory():
+    """Fixture pour créer une factory de sessions factice"""
+    return FakeSessionFactory()
+
+def test_repositories_share_one_session(session_factory):
+    """Test que tous les emprunts utilisent la même session et un seul commit"""
+    async def scenario():
+        async with UnitOfWork(session_factory) as uow:
+            async with uow() as first:
+                await commit_or_flush(first)
+            async with uow() as second:
+                await commit_or_flush(second)
+        return first, second
+
+    # Act
+    first, second = asyncio.run(scenario())
+
+    # Assert
+    assert first is second
+    assert len(session_factory.sessions) == 1
+    assert first.flushes == 2
+    assert first.commits == 1
+    assert first.closed is True
+
+def test_rollback_on_error(session_factory):
+    """Test l'annulation de la transaction en cas d'erreur"""
+    async def scenario():
+        async with UnitOfWork(session_factory) as uow:
+            async with uow():
+                pass
+            raise ValueError("échec")
+
+    # Act
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+    # Assert
+    session = session_factory.sessions[0]
+    assert session.rollbacks == 1
+    assert session.commits == 0
+    assert session.closed is True
+
+def test_unused_unit_of_work_opens_no_session(session_factory):
+    """Test qu'aucune connexion n'est ouverte si aucun repository n'est utilisé"""
+    async def scenario():
+        async with UnitOfWork(session_factory):
+            pass
+
+    # Act
+    asyncio.run(scenario())
+
+    # Assert
+    assert session_factory.sessions == []
+
+def test_standalone_session_is_committed():
+    """Test qu'une session hors unité de travail est validée directement"""
+    # Arrange
+    session = FakeSession()
+
+    # Act
+    asyncio.run(commit_or_flush(session))
+
+    # Assert
+    assert session.commits == 1
+    assert session.flushes == 0